@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 
 class Settings:
@@ -35,5 +35,57 @@ class Settings:
             else:  # dev
                 self.database_url = "sqlite:///./data/app_dev.db"
 
+        # LLM 응답 캐시 설정 (TTL: 초 단위, 최대 개수 초과 시 LRU 제거)
+        self.llm_cache_ttl_seconds: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+        self.llm_cache_max_entries: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500"))
+
+        # LLM 프롬프트 토큰 예산 (초과 시 우선순위가 낮은 섹션부터 생략)
+        self.llm_prompt_token_budget: int = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET", "3000"))
+
+        # LLM 제공업체 호출 정책 (마감 시간, 페일오버, 헤징)
+        self.llm_call_deadline_seconds: float = float(os.getenv("LLM_CALL_DEADLINE_SECONDS", "60"))
+        self.llm_fallback_enabled: bool = os.getenv("LLM_FALLBACK_ENABLED", "true").lower() in ("true", "1", "yes")
+        self.llm_hedge_enabled: bool = os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("true", "1", "yes")
+        self.llm_hedge_percentile: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95"))
+        self.llm_hedge_min_samples: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+        # LLM API 주소 (로컬 스텁 서버나 프록시 사용 시 지정, 미지정 시 공식 주소)
+        self.openai_base_url: Optional[str] = os.getenv("OPENAI_BASE_URL") or None
+        self.claude_base_url: Optional[str] = os.getenv("CLAUDE_BASE_URL") or None
+
+        # 완료 회고 이미지 업로드 설정 (최대 크기, WebP 렌디션 너비, 변환 워커 수)
+        self.upload_max_bytes: int = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+        self.image_rendition_widths: List[int] = [
+            int(width) for width in os.getenv("IMAGE_RENDITION_WIDTHS", "320,640,1280").split(",") if width.strip()
+        ]
+        self.image_worker_count: int = int(os.getenv("IMAGE_WORKER_COUNT", "2"))
+
+        # 템플릿 바이트코드 캐시 (디렉터리 미지정 시 시스템 임시 디렉터리 사용)
+        self.template_bytecode_cache: bool = os.getenv("TEMPLATE_BYTECODE_CACHE", "true").lower() in ("true", "1", "yes")
+        self.template_cache_dir: Optional[str] = os.getenv("TEMPLATE_CACHE_DIR") or None
+
+        # 실시간 채널(SSE, 동기화 웹소켓) keep-alive 주기 (초)
+        self.sse_heartbeat_seconds: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+        # 변경 기록(change_log) 압축·보관 기간 (일)
+        self.change_log_compact_after_days: int = int(os.getenv("CHANGE_LOG_COMPACT_AFTER_DAYS", "7"))
+        self.change_log_retention_days: int = int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "90"))
+
+        # SQL 실행 계측 (이보다 오래 걸린 SQL은 실행 계획과 함께 로그, /debug/queries에 보관할 최근 요청 수)
+        self.slow_query_ms: float = float(os.getenv("SLOW_QUERY_MS", "200"))
+        self.query_stats_history: int = int(os.getenv("QUERY_STATS_HISTORY", "50"))
+
+        # 준비 상태 검사 (/health/ready 결과 재사용 시간, 검사별 제한 시간, 최소 여유 디스크, 연결 풀 포화 기준)
+        self.health_cache_ttl_seconds: float = float(os.getenv("HEALTH_CACHE_TTL_SECONDS", "5"))
+        self.health_check_timeout_seconds: float = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "2"))
+        self.health_min_free_disk_mb: int = int(os.getenv("HEALTH_MIN_FREE_DISK_MB", "100"))
+        self.health_pool_saturation_ratio: float = float(os.getenv("HEALTH_POOL_SATURATION_RATIO", "0.9"))
+
+        # 요청 프로파일링 (표본 비율 0~1, 스택 샘플링 주기, 저장 위치, 보관할 최근 프로파일 수)
+        self.profile_sample_rate: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+        self.profile_interval_ms: float = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+        self.profile_dir: str = os.getenv("PROFILE_DIR", "./data/profiles")
+        self.profile_max_files: int = int(os.getenv("PROFILE_MAX_FILES", "50"))
+
 
 settings = Settings()
@@ -0,0 +1,166 @@
+"""
+앱 내부 이벤트 버스
+
+- 서비스의 변경 작업(할일/메모 생성·수정·삭제)이 커밋 후 이벤트를 발행합니다.
+- SSE 엔드포인트(/api/daily/events)가 구독자별 큐에서 이벤트를 꺼내 브라우저로 보냅니다.
+- 이벤트에는 증가하는 id가 붙고 최근 이벤트는 보관되어, 재연결 시 Last-Event-ID 이후부터 다시 보낼 수 있습니다.
+- 발행은 어느 스레드에서 호출해도 되며, 전달은 구독자의 이벤트 루프에서 이루어집니다.
+- 느린 구독자의 큐가 가득 차면 이벤트를 버리고 overflowed로 표시합니다 (클라이언트는 전체 갱신).
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from starlette.requests import Request
+
+HISTORY_SIZE = 200
+SUBSCRIBER_QUEUE_SIZE = 100
+RESYNC_EVENT = "resync"  # 놓친 이벤트가 있어 전체 갱신이 필요함
+
+
+@dataclass(frozen=True)
+class Event:
+    """발행된 이벤트"""
+    id: int
+    type: str
+    data: Dict[str, Any]
+
+    def to_sse(self) -> str:
+        """SSE 메시지 형식으로 변환"""
+        payload = json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """구독자 하나의 이벤트 큐"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def _deliver(self, event: Event) -> None:
+        """구독자의 이벤트 루프에서 실행"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """다음 이벤트 (timeout 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """프로세스 내 발행/구독 이벤트 버스"""
+
+    def __init__(self, history_size: int = HISTORY_SIZE, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._history: deque = deque(maxlen=history_size)
+        self._subscribers: Set[Subscription] = set()
+        self._queue_size = queue_size
+
+    @property
+    def last_event_id(self) -> int:
+        return self._last_id
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> Event:
+        """이벤트 발행 (모든 구독자에게 전달)"""
+        with self._lock:
+            self._last_id += 1
+            event = Event(self._last_id, event_type, data)
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # 구독자의 이벤트 루프가 이미 종료됨
+                self.unsubscribe(subscription)
+        return event
+
+    def subscribe(self) -> Subscription:
+        """현재 이벤트 루프에서 구독 시작"""
+        subscription = Subscription(asyncio.get_running_loop(), self._queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def events_since(self, last_id: int) -> Optional[List[Event]]:
+        """last_id 이후 이벤트 (보관 범위를 벗어났으면 None)"""
+        with self._lock:
+            history = list(self._history)
+        if last_id > self._last_id:
+            # 서버 재시작 등으로 id가 초기화됨
+            return None
+        if last_id == self._last_id:
+            return []
+        if not history or history[0].id > last_id + 1:
+            return None
+        return [event for event in history if event.id > last_id]
+
+
+event_bus = EventBus()
+
+
+async def stream_events(
+    request: Request,
+    bus: EventBus = event_bus,
+    last_event_id: Optional[int] = None,
+    heartbeat_seconds: float = 15.0,
+) -> AsyncIterator[str]:
+    """SSE 응답 본문 생성기
+
+    재연결(Last-Event-ID)이면 놓친 이벤트를 먼저 보내고, 보관 범위를 벗어났거나
+    큐가 넘쳤으면 resync 이벤트를 보냅니다. 이벤트가 없으면 주기적으로 keep-alive 주석을 보냅니다.
+    """
+    subscription = bus.subscribe()
+    try:
+        yield "retry: 3000\n\n"
+
+        last_sent = 0
+        if last_event_id is not None:
+            missed = bus.events_since(last_event_id)
+            if missed is None:
+                last_sent = bus.last_event_id
+                yield Event(last_sent, RESYNC_EVENT, {}).to_sse()
+            else:
+                last_sent = last_event_id
+                for event in missed:
+                    last_sent = event.id
+                    yield event.to_sse()
+
+        while not await request.is_disconnected():
+            if subscription.overflowed:
+                subscription.overflowed = False
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                last_sent = bus.last_event_id
+                yield Event(last_sent, RESYNC_EVENT, {}).to_sse()
+                continue
+
+            event = await subscription.get(heartbeat_seconds)
+            if event is None:
+                yield ": keep-alive\n\n"
+            elif event.id > last_sent:  # 재전송한 이벤트와 중복 제외
+                last_sent = event.id
+                yield event.to_sse()
+    finally:
+        bus.unsubscribe(subscription)
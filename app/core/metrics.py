@@ -0,0 +1,220 @@
+"""
+운영 메트릭 수집 (Prometheus 텍스트 형식으로 /metrics에서 노출)
+
+- MetricsMiddleware(순수 ASGI)가 요청마다 라우트 템플릿별 지연 시간 히스토그램, 상태 코드별 요청 수,
+  처리 중인 요청 수를 기록합니다. 미들웨어는 이벤트 루프 스레드에서만 실행되므로
+  락 없이 정수 증가만 합니다 (요청당 perf_counter 2회 + bisect 1회).
+- LLM 토큰 사용량과 업로드 바이트도 비동기 경로(이벤트 루프)에서 같은 방식으로 누적합니다.
+- 렌더링(수집)은 /metrics 요청 시에만 하며, LLM 지연 시간·캐시 적중률·DB 풀 사용량은
+  그때 각 서비스의 기존 통계에서 읽습니다 (app/services/metrics_service.py).
+"""
+
+import bisect
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# HTTP 요청 지연 시간 히스토그램 버킷 경계 (초)
+HTTP_LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# 라우트에 매칭되지 않은 요청(404, 정적 파일 등)의 라우트 라벨 (경로별 라벨 폭증 방지)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self, buckets: Sequence[float] = HTTP_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """지연 시간 기록"""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p(0~1) 백분위수의 버킷 상한 (기록이 없거나 +Inf 버킷이면 None)"""
+        if not self.count:
+            return None
+        target = p * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return self.buckets[index] if index < len(self.buckets) else None
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "buckets": {str(b): c for b, c in zip(self.buckets, self.counts)},
+            "inf": self.counts[-1],
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+        }
+
+
+class _Registry:
+    """앱 전역 메트릭 값 (이벤트 루프 스레드에서만 갱신)"""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.in_flight = 0
+        self.request_latency: Dict[Tuple[str, str], LatencyHistogram] = {}  # (메서드, 라우트): 히스토그램
+        self.requests: Dict[Tuple[str, str, int], int] = {}  # (메서드, 라우트, 상태 코드): 횟수
+        self.llm_tokens: Dict[Tuple[str, str], int] = {}  # (제공업체, prompt|completion): 토큰 수
+        self.upload_bytes = 0
+        self.uploads = 0
+        self.upload_dedup_hits = 0  # 같은 내용이 이미 있어 변환 없이 재사용한 업로드
+
+
+registry = _Registry()
+
+
+def observe_request(method: str, route: str, status_code: int, seconds: float) -> None:
+    """요청 하나의 지연 시간과 결과 기록"""
+    key = (method, route)
+    histogram = registry.request_latency.get(key)
+    if histogram is None:
+        histogram = registry.request_latency[key] = LatencyHistogram()
+    histogram.observe(seconds)
+    count_key = (method, route, status_code)
+    registry.requests[count_key] = registry.requests.get(count_key, 0) + 1
+
+
+def record_llm_tokens(provider: str, prompt_tokens: int, completion_tokens: int) -> None:
+    """LLM 호출 한 번의 토큰 사용량 누적"""
+    for kind, tokens in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+        key = (provider, kind)
+        registry.llm_tokens[key] = registry.llm_tokens.get(key, 0) + (tokens or 0)
+
+
+def record_upload(size: int, deduplicated: bool) -> None:
+    """저장한 업로드 한 건 기록"""
+    registry.uploads += 1
+    registry.upload_bytes += size
+    if deduplicated:
+        registry.upload_dedup_hits += 1
+
+
+class MetricsMiddleware:
+    """요청 지연 시간·처리 중 요청 수 기록 (BaseHTTPMiddleware 대신 순수 ASGI로 오버헤드 최소화)
+
+    라우트 라벨은 매칭된 라우트의 경로 템플릿(/journeys/{journey_id})입니다.
+    SSE처럼 오래 열린 응답은 스트림이 끝날 때까지 처리 중으로 셉니다.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        registry.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            registry.in_flight -= 1
+            route = scope.get("route")
+            observe_request(
+                scope["method"], getattr(route, "path", None) or UNMATCHED_ROUTE,
+                status_code, time.perf_counter() - started
+            )
+
+
+# === Prometheus 텍스트 형식 ===
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PrometheusWriter:
+    """Prometheus 텍스트 형식(0.0.4) 작성기"""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def header(self, name: str, metric_type: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None) -> None:
+        self.lines.append(f"{name}{_labels(labels or {})} {_number(value)}")
+
+    def metric(self, name: str, metric_type: str, help_text: str,
+               samples: Iterable[Tuple[Dict[str, Any], float]]) -> None:
+        """라벨별 값이 있는 counter/gauge"""
+        self.header(name, metric_type, help_text)
+        for labels, value in samples:
+            self.sample(name, value, labels)
+
+    def histogram(self, name: str, help_text: str,
+                  histograms: Iterable[Tuple[Dict[str, Any], LatencyHistogram]]) -> None:
+        """누적 버킷(_bucket), 합계(_sum), 개수(_count)"""
+        self.header(name, "histogram", help_text)
+        for labels, histogram in histograms:
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                cumulative += bucket_count
+                self.sample(f"{name}_bucket", cumulative, {**labels, "le": _number(float(bound))})
+            self.sample(f"{name}_bucket", histogram.count, {**labels, "le": "+Inf"})
+            self.sample(f"{name}_sum", histogram.total, labels)
+            self.sample(f"{name}_count", histogram.count, labels)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def write_app_metrics(writer: PrometheusWriter) -> None:
+    """미들웨어·업로드·토큰 메트릭 작성"""
+    writer.histogram(
+        "http_request_duration_seconds", "요청 처리 시간 (라우트 템플릿별)",
+        [({"method": method, "route": route}, histogram)
+         for (method, route), histogram in sorted(registry.request_latency.items())],
+    )
+    writer.metric(
+        "http_requests_total", "counter", "요청 수 (라우트 템플릿·상태 코드별)",
+        [({"method": method, "route": route, "status": status}, count)
+         for (method, route, status), count in sorted(registry.requests.items())],
+    )
+    writer.metric("http_requests_in_flight", "gauge", "처리 중인 요청 수", [({}, registry.in_flight)])
+    writer.metric(
+        "llm_tokens_total", "counter", "LLM 토큰 사용량 (캐시 적중 제외)",
+        [({"provider": provider, "type": kind}, tokens)
+         for (provider, kind), tokens in sorted(registry.llm_tokens.items())],
+    )
+    writer.metric("upload_bytes_total", "counter", "저장한 업로드 바이트", [({}, registry.upload_bytes)])
+    writer.metric("uploads_total", "counter", "저장한 업로드 수", [({}, registry.uploads)])
+    writer.metric(
+        "upload_dedup_hits_total", "counter", "같은 내용이 이미 있어 재사용한 업로드 수",
+        [({}, registry.upload_dedup_hits)],
+    )
@@ -0,0 +1,256 @@
+"""
+요청 단위 프로파일링 (선택 실행)
+
+- dev에서는 X-Profile: 1 헤더나 ?profile=1 쿼리로, 모든 환경에서는 settings.profile_sample_rate 비율로
+  요청을 골라 프로파일링합니다. 고르지 않은 요청은 난수 1회 외에 비용이 없습니다.
+- 프로파일링 중에는 샘플링 스레드가 settings.profile_interval_ms마다 모든 스레드의 호출 스택을 읽고,
+  app 패키지 프레임이 있는 스택(이벤트 루프나 스레드풀에서 요청 코드를 실행 중인 스택)만 남깁니다.
+  동시에 처리 중인 다른 요청의 스택이 섞일 수 있으므로 부하가 적을 때의 결과가 정확합니다.
+- 결과에는 전체 시간, DB 시간(app/core/query_stats.py), 템플릿 렌더링 시간(app/core/timing.py),
+  자체/누적 샘플이 많은 함수와 자주 나온 스택(folded 형식)이 들어갑니다.
+- 결과는 settings.profile_dir에 JSON 파일로 쓰며 최근 settings.profile_max_files개만 남깁니다 (링 버퍼).
+  응답의 X-Profile-Id 헤더로 /debug/profiles/{id} (dev 전용)에서 조회합니다.
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from . import query_stats, timing
+from .config import settings
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY_FLAG = "profile=1"
+
+TOP_FUNCTIONS = 25  # 자체/누적 샘플 상위 함수 수
+TOP_STACKS = 20  # 자주 나온 스택 수
+MAX_STACK_DEPTH = 64
+MAX_SAMPLES = 20000  # SSE처럼 오래 열린 요청의 샘플 상한
+
+APP_DIR = str(Path(__file__).resolve().parents[1])
+
+_PROFILE_ID = re.compile(r"^[0-9]{20}-[0-9a-f]{8}$")
+
+Frame = Tuple[str, int, str]  # (파일, 줄, 함수)
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(APP_DIR):
+        return "app" + filename[len(APP_DIR):]
+    # 라이브러리 프레임은 site-packages 이후 경로만 표시
+    return filename.split("site-packages" + os.sep)[-1]
+
+
+def _frame_label(frame: Frame) -> str:
+    filename, lineno, name = frame
+    return f"{name} ({_short_path(filename)}:{lineno})"
+
+
+class StackSampler:
+    """샘플링 스레드 (시작한 뒤 stop()까지 app 프레임이 있는 스택을 모음)"""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self.interval_seconds = interval_seconds
+        self.samples: Counter = Counter()  # 스택(루트→말단 프레임 튜플): 횟수
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds) and self.sample_count < MAX_SAMPLES:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack: List[Frame] = []
+                in_app = False
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    code = frame.f_code
+                    stack.append((code.co_filename, frame.f_lineno, code.co_name))
+                    in_app = in_app or code.co_filename.startswith(APP_DIR)
+                    frame = frame.f_back
+                if in_app:
+                    self.samples[tuple(reversed(stack))] += 1
+                    self.sample_count += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """상위 함수와 스택"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.samples.items():
+            self_counts[_frame_label(stack[-1])] += count
+            # 누적은 app 함수만 (줄 번호 없이 함수 단위, 재귀 호출은 한 번만)
+            for label in {f"{name} ({_short_path(filename)})"
+                          for filename, _, name in stack if filename.startswith(APP_DIR)}:
+                total_counts[label] += count
+
+        def top(counter: Counter) -> List[Dict[str, Any]]:
+            return [
+                {"frame": label, "samples": count, "percent": round(count / self.sample_count * 100, 1)}
+                for label, count in counter.most_common(TOP_FUNCTIONS)
+            ]
+
+        return {
+            "samples": self.sample_count,
+            "interval_ms": round(self.interval_seconds * 1000, 1),
+            "self": top(self_counts),
+            "cumulative": top(total_counts),
+            "stacks": [
+                {"stack": ";".join(_frame_label(frame) for frame in stack), "samples": count}
+                for stack, count in self.samples.most_common(TOP_STACKS)
+            ],
+        }
+
+
+# === 링 버퍼 저장소 ===
+
+def _profile_dir() -> Path:
+    return Path(settings.profile_dir)
+
+
+def save_profile(profile: Dict[str, Any]) -> None:
+    """프로파일 저장 후 오래된 파일 정리 (최근 settings.profile_max_files개 유지)"""
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    temp_path = directory / f".{profile['id']}.tmp"
+    temp_path.write_text(json.dumps(profile, ensure_ascii=False), encoding="utf-8")
+    os.replace(temp_path, directory / f"{profile['id']}.json")
+
+    # id가 시각으로 시작하므로 이름순 = 시간순
+    files = sorted(directory.glob("*.json"))
+    for old in files[:max(len(files) - settings.profile_max_files, 0)]:
+        old.unlink(missing_ok=True)
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """저장된 프로파일 요약 (최신순)"""
+    directory = _profile_dir()
+    if not directory.exists():
+        return []
+    summaries = []
+    for path in sorted(directory.glob("*.json"), reverse=True):
+        try:
+            profile = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue  # 정리 중 삭제된 파일
+        summary = {key: profile.get(key) for key in (
+            "id", "created_at", "method", "path", "status_code", "trigger", "duration_ms", "db", "template_ms"
+        )}
+        summary["samples"] = profile.get("profile", {}).get("samples")
+        summaries.append(summary)
+    return summaries
+
+
+def load_profile(profile_id: str) -> Optional[Dict[str, Any]]:
+    """프로파일 하나 (없거나 id 형식이 아니면 None)"""
+    if not _PROFILE_ID.match(profile_id):
+        return None
+    path = _profile_dir() / f"{profile_id}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def reset() -> None:
+    """저장된 프로파일 모두 삭제 (테스트용)"""
+    directory = _profile_dir()
+    if directory.exists():
+        for path in directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+# === 미들웨어 ===
+
+def _trigger(scope) -> Optional[str]:
+    """프로파일링 여부와 이유 (header, query, sample) / 하지 않으면 None"""
+    if settings.app_env == "dev":
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER and value in (b"1", b"true"):
+                return "header"
+        if PROFILE_QUERY_FLAG in scope.get("query_string", b"").decode("latin-1").split("&"):
+            return "query"
+    if settings.profile_sample_rate > 0 and random.random() < settings.profile_sample_rate:
+        return "sample"
+    return None
+
+
+class ProfilingMiddleware:
+    """고른 요청만 프로파일링하여 저장 (순수 ASGI, 고르지 않은 요청은 그대로 통과)"""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(("/debug/", "/static/")):
+            await self.app(scope, receive, send)
+            return
+        trigger = _trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        status_code = 500
+
+        async def send_with_profile_id(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        query_stats_at_start = query_stats.get_current_stats()
+        db_count = query_stats_at_start.count if query_stats_at_start else 0
+        db_seconds = query_stats_at_start.total_seconds if query_stats_at_start else 0.0
+        # ServerTimingMiddleware 안쪽이면 그 집계를 함께 사용
+        timings, token = timing.get_current(), None
+        if timings is None:
+            timings, token = timing.begin()
+        sampler = StackSampler(settings.profile_interval_ms / 1000)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            duration = time.perf_counter() - started
+            if token is not None:
+                timing.end(token)
+            stats = query_stats.get_current_stats()
+            route = scope.get("route")
+            profile = {
+                "id": profile_id,
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status_code": status_code,
+                "trigger": trigger,
+                "duration_ms": round(duration * 1000, 1),
+                "db": {
+                    "queries": (stats.count - db_count) if stats else 0,
+                    "ms": round(((stats.total_seconds - db_seconds) if stats else 0.0) * 1000, 1),
+                },
+                "template_ms": timings.total_ms("template"),
+                "spans": timings.to_dict(),
+                "profile": sampler.summary(),
+            }
+            await run_in_threadpool(save_profile, profile)
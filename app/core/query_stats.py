@@ -0,0 +1,186 @@
+"""
+SQL 실행 계측
+
+- 모든 엔진의 커서 실행 전후 이벤트로 SQL 실행 횟수, DB 시간, 정규화한 SQL 지문을 모읍니다.
+- 요청마다 begin_request()로 집계를 시작하면 그 요청(스레드풀로 넘어간 동기 엔드포인트 포함)에서
+  실행된 SQL이 RequestQueryStats에 쌓입니다. 미들웨어가 X-DB-Queries, X-DB-Time 헤더로 내보냅니다.
+- 지문은 리터럴과 바인드 값을 ?로 바꾸고 IN 목록을 하나로 줄인 SQL입니다. 같은 지문이 한 요청에서
+  여러 번 나오면 N+1 후보입니다.
+- settings.slow_query_ms 이상 걸린 SELECT는 실행 계획(EXPLAIN)과 함께 경고 로그로 남깁니다.
+- 최근 요청 요약과 지문별 누적 통계는 메모리에만 보관하며 /debug/queries (dev 전용)에서 조회합니다.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+TOP_FINGERPRINTS = 20  # /debug/queries에 보여줄 지문 수 (누적 시간순)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"(?<!:):\w+|%\(\w+\)s|\$\d+|%s")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)+\s*\?\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """SQL 지문 (값과 IN 목록 길이가 달라도 같은 쿼리는 같은 지문)"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _NAMED_PARAM.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    # __[POSTCOMPILE_x] 등으로 펼쳐진 IN 목록도 한 개로 줄임
+    return _IN_LIST.sub("IN (?)", normalized)
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 SQL 집계"""
+
+    __slots__ = ("count", "total_seconds", "fingerprints")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.fingerprints: Dict[str, List[float]] = {}  # 지문: [횟수, 총 시간(초)]
+
+    def record(self, statement_fingerprint: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        entry = self.fingerprints.get(statement_fingerprint)
+        if entry is None:
+            self.fingerprints[statement_fingerprint] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total_seconds * 1000, 1)
+
+    def repeated(self) -> List[Dict[str, Any]]:
+        """한 요청에서 두 번 이상 실행된 지문 (N+1 후보, 횟수 내림차순)"""
+        return [
+            {"fingerprint": fp, "count": int(count), "total_ms": round(seconds * 1000, 1)}
+            for fp, (count, seconds) in sorted(self.fingerprints.items(), key=lambda item: -item[1][0])
+            if count > 1
+        ]
+
+
+_current: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+# 지문별 누적 통계와 최근 요청 요약 (여러 스레드에서 갱신)
+_lock = threading.Lock()
+_totals: Dict[str, List[float]] = {}  # 지문: [횟수, 총 시간(초), 최대 시간(초)]
+_recent_requests: deque = deque(maxlen=settings.query_stats_history)
+
+
+def begin_request() -> Tuple[RequestQueryStats, Token]:
+    """현재 컨텍스트(요청)의 SQL 집계 시작"""
+    stats = RequestQueryStats()
+    return stats, _current.set(stats)
+
+
+def end_request(stats: RequestQueryStats, token: Token, method: str, path: str, status_code: int) -> None:
+    """SQL 집계를 끝내고 최근 요청 목록에 요약을 남김 (SQL을 실행하지 않은 요청은 남기지 않음)"""
+    _current.reset(token)
+    if stats.count:
+        _recent_requests.append({
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "queries": stats.count,
+            "db_ms": stats.total_ms,
+            "repeated": stats.repeated(),
+        })
+
+
+def get_current_stats() -> Optional[RequestQueryStats]:
+    """현재 요청의 SQL 집계 (요청 밖이면 None)"""
+    return _current.get()
+
+
+def get_debug_snapshot() -> Dict[str, Any]:
+    """/debug/queries 응답 (최근 요청은 최신순, 지문은 누적 시간순)"""
+    with _lock:
+        totals = sorted(_totals.items(), key=lambda item: -item[1][1])[:TOP_FINGERPRINTS]
+    return {
+        "slow_query_ms": settings.slow_query_ms,
+        "recent_requests": list(reversed(_recent_requests)),
+        "top_fingerprints": [
+            {
+                "fingerprint": fp,
+                "count": int(count),
+                "total_ms": round(seconds * 1000, 1),
+                "max_ms": round(max_seconds * 1000, 1),
+            }
+            for fp, (count, seconds, max_seconds) in totals
+        ],
+    }
+
+
+def reset() -> None:
+    """누적 통계와 최근 요청 비우기 (테스트용)"""
+    with _lock:
+        _totals.clear()
+        _recent_requests.clear()
+
+
+def _explain(conn, cursor, statement: str, parameters) -> str:
+    """실행 계획 문자열 (같은 DBAPI 연결에서 실행, 이벤트를 다시 타지 않음)"""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    plan_cursor = cursor.connection.cursor()
+    try:
+        plan_cursor.execute(prefix + statement, parameters)
+        return "\n".join(" | ".join(str(col) for col in row) for row in plan_cursor.fetchall())
+    finally:
+        plan_cursor.close()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start_times = conn.info.get("query_start_times")
+    if not start_times:
+        return
+    seconds = time.perf_counter() - start_times.pop()
+    statement_fingerprint = fingerprint(statement)
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement_fingerprint, seconds)
+
+    with _lock:
+        entry = _totals.get(statement_fingerprint)
+        if entry is None:
+            _totals[statement_fingerprint] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+    if seconds * 1000 >= settings.slow_query_ms:
+        plan = "(실행 계획 없음)"
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            try:
+                plan = _explain(conn, cursor, statement, parameters)
+            except Exception as e:
+                plan = f"(실행 계획 조회 실패: {e})"
+        logger.warning("느린 SQL %.1fms: %s\n%s", seconds * 1000, statement_fingerprint, plan)
@@ -0,0 +1,117 @@
+"""
+정적 파일 지문(fingerprint)과 장기 캐시 헤더
+
+- 템플릿은 asset_url('js/main.js')로 내용 해시가 들어간 주소(/static/js/main.<해시>.js)를 출력합니다.
+- 지문이 현재 파일 내용과 일치하는 요청과 업로드 파일(내용 해시 이름)은
+  Cache-Control: immutable, max-age=1년으로 응답하여 재방문 시 정적 파일 요청이 발생하지 않습니다.
+- 파일을 수정하면 해시가 바뀌어 새 주소가 나가므로 빌드 단계 없이 서버 기동 시 지문을 계산합니다.
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+STATIC_DIR = Path("app/static")
+STATIC_URL_PREFIX = "/static"
+
+# 지문을 붙이는 디렉터리 (업로드는 이미 내용 해시 이름이므로 제외)
+FINGERPRINT_DIRS = ("css", "js")
+FINGERPRINT_LENGTH = 12
+
+# 업로드 파일은 같은 이름으로 덮어쓰지 않으므로 영구 캐시
+IMMUTABLE_PREFIXES = ("uploads/",)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_FINGERPRINT_PATTERN = re.compile(rf"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{{{FINGERPRINT_LENGTH}}})(?P<suffix>\.[^./]+)$")
+
+# 상대 경로 -> (수정 시각, 크기, 해시)
+_manifest: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _file_fingerprint(relative_path: str) -> Optional[str]:
+    """파일 내용 해시 (수정 시각/크기가 그대로면 계산해 둔 값 사용)"""
+    full_path = STATIC_DIR / relative_path
+    try:
+        stat_result = full_path.stat()
+    except OSError:
+        return None
+
+    cached = _manifest.get(relative_path)
+    if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256(full_path.read_bytes()).hexdigest()[:FINGERPRINT_LENGTH]
+    _manifest[relative_path] = (stat_result.st_mtime_ns, stat_result.st_size, digest)
+    return digest
+
+
+def build_asset_manifest() -> Dict[str, str]:
+    """정적 파일 지문 미리 계산 (서버 시작 시 호출)
+
+    Returns:
+        상대 경로 -> 지문이 붙은 상대 경로
+    """
+    manifest = {}
+    for directory in FINGERPRINT_DIRS:
+        base = STATIC_DIR / directory
+        if not base.exists():
+            continue
+        for file_path in sorted(base.rglob("*")):
+            if not file_path.is_file():
+                continue
+            relative_path = file_path.relative_to(STATIC_DIR).as_posix()
+            manifest[relative_path] = fingerprinted_path(relative_path)
+    return manifest
+
+
+def fingerprinted_path(relative_path: str) -> str:
+    """'js/main.js' -> 'js/main.<해시>.js' (파일이 없으면 그대로 반환)"""
+    relative_path = relative_path.lstrip("/")
+    fingerprint = _file_fingerprint(relative_path)
+    if fingerprint is None:
+        return relative_path
+
+    path = Path(relative_path)
+    return path.with_name(f"{path.stem}.{fingerprint}{path.suffix}").as_posix()
+
+
+def asset_url(relative_path: str) -> str:
+    """템플릿용 정적 파일 주소 (예: asset_url('js/main.js'))"""
+    return f"{STATIC_URL_PREFIX}/{fingerprinted_path(relative_path)}"
+
+
+def split_fingerprint(relative_path: str) -> Tuple[str, Optional[str]]:
+    """'js/main.<해시>.js' -> ('js/main.js', 해시), 지문이 없으면 (경로, None)"""
+    match = _FINGERPRINT_PATTERN.match(relative_path)
+    if not match:
+        return relative_path, None
+    return f"{match['stem']}{match['suffix']}", match["hash"]
+
+
+class CachedStaticFiles(StaticFiles):
+    """지문이 붙은 주소를 원본 파일로 연결하고 장기 캐시 헤더를 붙이는 StaticFiles"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        relative_path = Path(path).as_posix()
+        original, fingerprint = split_fingerprint(relative_path)
+
+        if fingerprint is not None and (STATIC_DIR / original).is_file() and not (STATIC_DIR / relative_path).is_file():
+            response = await super().get_response(os.path.normpath(original), scope)
+            # 예전 지문으로 요청하면 현재 파일을 주되 장기 캐시하지 않음
+            if fingerprint == _file_fingerprint(original):
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            else:
+                response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        response = await super().get_response(path, scope)
+        if relative_path.startswith(IMMUTABLE_PREFIXES):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,81 @@
+"""
+공유 Jinja2 템플릿 환경
+
+- main.py와 라우터들이 같은 환경을 사용하여 템플릿을 한 번만 파싱/캐시합니다.
+- 컴파일 결과는 파일 시스템 바이트코드 캐시에 저장되어 서버 재시작 시 다시 컴파일하지 않습니다.
+- 개발 환경(dev)에서만 템플릿 파일 변경을 확인(auto_reload)합니다.
+- 서버 시작 시 precompile_templates()로 모든 템플릿을 미리 컴파일합니다.
+- 렌더링 시간은 요청별 "template" 단계로 집계됩니다 (app/core/timing.py).
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from . import timing
+from .config import settings
+from .static_assets import asset_url
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = "app/templates"
+
+
+def create_bytecode_cache() -> Optional[BytecodeCache]:
+    """바이트코드 캐시 생성 (TEMPLATE_CACHE_DIR 미지정 시 시스템 임시 디렉터리 사용)"""
+    if not settings.template_bytecode_cache:
+        return None
+    if settings.template_cache_dir:
+        Path(settings.template_cache_dir).mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(settings.template_cache_dir)
+    return FileSystemBytecodeCache()
+
+
+class TimedTemplate(Template):
+    """렌더링 시간을 요청별 시간 집계에 남기는 템플릿"""
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        with timing.span("template"):
+            return super().render(*args, **kwargs)
+
+
+def create_environment(bytecode_cache: Optional[BytecodeCache] = None) -> Environment:
+    """템플릿 환경 생성 (전역 변수 포함)"""
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(),
+        auto_reload=settings.app_env == "dev",
+        bytecode_cache=bytecode_cache,
+    )
+    env.template_class = TimedTemplate
+
+    # 템플릿 전역 변수 설정 - 모든 템플릿에서 환경 정보 사용 가능
+    env.globals.update({
+        "app_env": settings.app_env,
+        "is_dev": settings.app_env == "dev",
+        "database_url": settings.database_url,
+        "asset_url": asset_url,
+    })
+    return env
+
+
+def precompile_templates(env: Optional[Environment] = None) -> int:
+    """모든 템플릿을 미리 컴파일하여 메모리/바이트코드 캐시에 적재
+
+    Returns:
+        컴파일한 템플릿 수
+    """
+    env = env or templates.env
+    started = time.perf_counter()
+    names = env.list_templates(filter_func=lambda name: name.endswith(".html"))
+    for name in names:
+        env.get_template(name)
+    logger.info(f"템플릿 {len(names)}개 사전 컴파일 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+    return len(names)
+
+
+templates = Jinja2Templates(env=create_environment(create_bytecode_cache()))
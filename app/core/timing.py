@@ -0,0 +1,178 @@
+"""
+요청 단계별 시간 집계 (Server-Timing 헤더, 요청 프로파일)
+
+- ServerTimingMiddleware가 요청마다 집계를 시작하고, span(이름) 블록이 걸린 시간을 이름별로 누적합니다.
+  스레드풀로 넘어간 동기 코드도 컨텍스트를 복사하므로 같은 집계에 쌓입니다.
+- 단계 시간에서 그 안에서 실행된 SQL 시간(app/core/query_stats.py)은 빼고, DB 시간은 db 단계로 따로 보여줍니다.
+  같은 이름의 span이 중첩되면(서비스 메서드가 다른 서비스 메서드 호출) 바깥 span만 셉니다.
+- 응답 헤더 예: Server-Timing: db;desc="DB (5)";dur=1.6, service;desc="Service";dur=3.2,
+  template;desc="Template";dur=2.6, serialization;desc="Serialization";dur=0.1, total;desc="Total";dur=9.8
+- 집계 중이 아니면 span()은 아무것도 하지 않습니다 (contextvar 조회 1회).
+"""
+
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from fastapi.responses import JSONResponse
+
+from . import query_stats
+
+# Server-Timing에 내보낼 단계와 표시 이름 (순서대로)
+STAGE_LABELS: Dict[str, str] = {
+    "service": "Service",
+    "template": "Template",
+    "serialization": "Serialization",
+}
+
+ClassT = TypeVar("ClassT", bound=type)
+
+
+class RequestTimings:
+    """요청 하나의 단계별 시간"""
+
+    __slots__ = ("spans", "active")
+
+    def __init__(self) -> None:
+        self.spans: Dict[str, List[float]] = {}  # 이름: [횟수, 총 시간(초), 그중 SQL 시간(초)]
+        self.active: Set[str] = set()  # 실행 중인 span 이름 (중첩된 같은 이름은 세지 않음)
+
+    def add(self, name: str, seconds: float, db_seconds: float = 0.0) -> None:
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [1, seconds, db_seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += db_seconds
+
+    def total_ms(self, name: str) -> float:
+        """name 단계 시간 (SQL 시간 제외)"""
+        entry = self.spans.get(name)
+        return round(max(entry[1] - entry[2], 0.0) * 1000, 1) if entry else 0.0
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {"count": int(count), "ms": self.total_ms(name), "db_ms": round(db_seconds * 1000, 1)}
+            for name, (count, _, db_seconds) in self.spans.items()
+        }
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def begin() -> Tuple[RequestTimings, Token]:
+    """현재 컨텍스트의 시간 집계 시작"""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end(token: Token) -> None:
+    """시간 집계 종료"""
+    _current.reset(token)
+
+
+def get_current() -> Optional[RequestTimings]:
+    """현재 요청의 시간 집계 (집계 중이 아니면 None)"""
+    return _current.get()
+
+
+def _db_seconds() -> float:
+    stats = query_stats.get_current_stats()
+    return stats.total_seconds if stats is not None else 0.0
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """블록 실행 시간을 현재 요청의 name 단계에 누적"""
+    timings = _current.get()
+    if timings is None or name in timings.active:
+        yield
+        return
+    timings.active.add(name)
+    db_started = _db_seconds()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.active.discard(name)
+        timings.add(name, time.perf_counter() - started, _db_seconds() - db_started)
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """함수 실행을 span(name)으로 감싸는 데코레이터"""
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def timed_methods(name: str) -> Callable[[ClassT], ClassT]:
+    """클래스의 공개 정적 메서드(동기)를 모두 span(name)으로 감싸는 클래스 데코레이터"""
+    def decorator(cls: ClassT) -> ClassT:
+        for attr, value in list(vars(cls).items()):
+            if (
+                not attr.startswith("_")
+                and isinstance(value, staticmethod)
+                and not inspect.iscoroutinefunction(value.__func__)
+            ):
+                setattr(cls, attr, staticmethod(timed(name)(value.__func__)))
+        return cls
+    return decorator
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON 직렬화 시간을 serialization 단계로 집계하는 응답 (앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        with span("serialization"):
+            return super().render(content)
+
+
+def server_timing_header(timings: RequestTimings, total_seconds: float) -> str:
+    """Server-Timing 헤더 값"""
+    metrics = []
+    stats = query_stats.get_current_stats()
+    if stats is not None:
+        metrics.append(f'db;desc="DB ({stats.count})";dur={stats.total_ms}')
+    for name, label in STAGE_LABELS.items():
+        if name in timings.spans:
+            metrics.append(f'{name};desc="{label}";dur={timings.total_ms(name)}')
+    metrics.append(f'total;desc="Total";dur={round(total_seconds * 1000, 1)}')
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """요청마다 단계별 시간을 모아 Server-Timing 헤더로 내보냄 (순수 ASGI)
+
+    SQL 집계(db_query_stats_middleware) 안쪽에 두어야 db 단계가 채워집니다.
+    헤더는 응답 시작 시점까지의 시간이므로 스트리밍 응답(SSE)은 첫 응답까지의 시간입니다.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = begin()
+        started = time.perf_counter()
+
+        async def send_with_server_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                header = server_timing_header(timings, time.perf_counter() - started)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            end(token)
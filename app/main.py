@@ -1,11 +1,11 @@
 from fastapi import FastAPI, Request, HTTPException, Depends, Query
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import case, func, or_, select
 from typing import Union, Optional
+from datetime import date
 from dotenv import load_dotenv
+import json
 import logging
 
 # .env 파일 로드 (환경변수 설정)
@@ -14,18 +14,37 @@ load_dotenv()
 from .routers import daily  # 일상 Todo만 사용, 기존 복잡한 구조는 임시로 비활성화
 from .routers import reflections  # 일일 회고 시스템
 from .routers import journeys
-from .core.database import get_db
+from .routers import sync  # 다중 기기 동기화 (변경 기록 웹소켓)
+from .core.database import engine, get_db
 from .core.config import settings
+from .core.static_assets import CachedStaticFiles, build_asset_manifest
+from .core.templates import templates, precompile_templates
+from .core import query_stats
+from .core.metrics import MetricsMiddleware
+from .core import profiling
+from .core.profiling import ProfilingMiddleware
+from .core.timing import ServerTimingMiddleware, TimedJSONResponse
 from .models.journey import Journey
-from .models.todo import Todo, DailyTodo
+from .models.todo import DailyTodo
+from .models.journey_todo import journey_todos
 from .services.daily_todo_service import DailyTodoService
-from .core.timezone import get_current_date, format_date_for_display
+from .services.daily_memo_service import DailyMemoService
+from .services.reflection_history_service import ReflectionHistoryService
+from .services.change_log_service import ChangeLogService
+from .services.journey_service import JourneyService
+from .services.health_service import HealthService
+from .services.metrics_service import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsService
+from .core.timezone import get_current_date, format_date_for_display, format_time_for_display
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Daily Flow - 일상 흐름 관리", version="1.0.0")
+app = FastAPI(
+    title="Daily Flow - 일상 흐름 관리",
+    version="1.0.0",
+    default_response_class=TimedJSONResponse,  # JSON 직렬화 시간을 Server-Timing에 포함
+)
 
 # 앱 시작 시 환경 정보 출력
 @app.on_event("startup")
@@ -35,25 +54,49 @@ async def startup_event():
     logger.info(f"📍 환경: {settings.app_env.upper()}")
     logger.info(f"🗄️  데이터베이스: {settings.database_url}")
     logger.info(f"🐛 디버그 모드: {settings.debug}")
+    logger.info(f"📦 정적 파일 지문: {len(build_asset_manifest())}개")
+    logger.info(f"🧩 템플릿 사전 컴파일: {precompile_templates()}개")
     logger.info("=" * 60)
 
+# 선택한 요청만 프로파일링 (SQL 집계 안쪽에서 실행되어 요청의 DB 시간을 함께 기록)
+app.add_middleware(ProfilingMiddleware)
+
+# 단계별 시간(DB, 서비스, 템플릿, 직렬화)을 Server-Timing 헤더로 (app/core/timing.py)
+app.add_middleware(ServerTimingMiddleware)
+
+# 요청별 SQL 실행 횟수·DB 시간 (app/core/query_stats.py)
+@app.middleware("http")
+async def db_query_stats_middleware(request: Request, call_next):
+    stats, token = query_stats.begin_request()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        route = request.scope.get("route")
+        query_stats.end_request(
+            stats, token, request.method, getattr(route, "path", request.url.path), status_code
+        )
+    response.headers["X-DB-Queries"] = str(stats.count)
+    response.headers["X-DB-Time"] = f"{stats.total_ms:.1f}"
+    return response
+
+# 라우트별 지연 시간·처리 중 요청 수 (가장 바깥 미들웨어, /metrics로 노출)
+app.add_middleware(MetricsMiddleware)
+
 # API 라우터 등록
 app.include_router(daily.router)  # 일상 Todo API (메인)
 app.include_router(reflections.router)  # 일일 회고 API
 app.include_router(reflections.page_router)  # 일일 회고 페이지
 app.include_router(journeys.router, prefix="/api")  # 여정 API
+app.include_router(sync.router)  # 동기화 웹소켓
 # TODO API는 daily.router로 대체됨
 
 # 정적 파일 및 템플릿 설정
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
-templates = Jinja2Templates(directory="app/templates")
+# 지문이 붙은 정적 파일과 업로드 파일은 장기 캐시 (app/core/static_assets.py)
+app.mount("/static", CachedStaticFiles(directory="app/static"), name="static")
+# 템플릿 환경은 라우터들과 공유 (app/core/templates.py)
 
-# 템플릿 전역 변수 설정 - 모든 템플릿에서 환경 정보 사용 가능
-templates.env.globals.update({
-    "app_env": settings.app_env,
-    "is_dev": settings.app_env == "dev",
-    "database_url": settings.database_url
-})
 
 # 모든 템플릿에 공통 컨텍스트 추가하는 헬퍼 함수
 def add_common_context(context: dict) -> dict:
@@ -101,6 +144,44 @@ async def internal_error_handler(request: Request, exc: Exception) -> Union[JSON
     )
 
 
+# 페이지 렌더링 헬퍼
+def _annotate_overdue(todo: DailyTodo, today: date) -> DailyTodo:
+    """할일에 경과일/지연 상태 표시 정보 추가"""
+    days_overdue = (today - todo.created_date).days
+
+    # 지연 상태 계산
+    if todo.scheduled_date and todo.scheduled_date > today:
+        overdue_status = "scheduled"
+    elif days_overdue == 0:
+        overdue_status = "today"
+    elif days_overdue > 0:
+        overdue_status = "overdue"
+    else:
+        overdue_status = "today"
+
+    # 경과일 텍스트 생성
+    if days_overdue == 0:
+        overdue_text = ""
+    elif days_overdue == 1:
+        overdue_text = "1일 지남"
+    else:
+        overdue_text = f"{days_overdue}일 지남"
+
+    todo.days_overdue = days_overdue
+    todo.overdue_status = overdue_status
+    todo.overdue_text = overdue_text
+    return todo
+
+
+def _today_memo_items(db: Session, today: date) -> list:
+    """메모 패널 표시용 오늘의 메모 목록 (최신순)"""
+    memos = DailyMemoService.get_memos_by_date(db, today)
+    return [
+        {"id": memo.id, "content": memo.content, "created_time": format_time_for_display(memo.created_at)}
+        for memo in sorted(memos, key=lambda memo: memo.created_at, reverse=True)
+    ]
+
+
 # 페이지 라우터들
 @app.get("/", response_class=HTMLResponse)
 async def daily_todo_page(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
@@ -118,39 +199,15 @@ async def daily_todo_page(request: Request, db: Session = Depends(get_db)) -> HT
         today_str = format_date_for_display(today)
 
         # 각 할일에 경과일 정보 추가
-        enhanced_todos = []
-        for todo in today_todos:
-            days_overdue = (today - todo.created_date).days
-
-            # 지연 상태 계산
-            if todo.scheduled_date and todo.scheduled_date > today:
-                overdue_status = "scheduled"
-            elif days_overdue == 0:
-                overdue_status = "today"
-            elif days_overdue > 0:
-                overdue_status = "overdue"
-            else:
-                overdue_status = "today"
-
-            # 경과일 텍스트 생성
-            if days_overdue == 0:
-                overdue_text = ""
-            elif days_overdue == 1:
-                overdue_text = "1일 지남"
-            else:
-                overdue_text = f"{days_overdue}일 지남"
-
-            # 할일 객체에 추가 정보 설정
-            todo.days_overdue = days_overdue
-            todo.overdue_status = overdue_status
-            todo.overdue_text = overdue_text
-            enhanced_todos.append(todo)
+        enhanced_todos = [_annotate_overdue(todo, today) for todo in today_todos]
 
         context = {
             "request": request,
             "today_todos": enhanced_todos,
             "summary": summary,
+            "memos": _today_memo_items(db, today),
             "today_date": today_str,
+            "today_iso": today.isoformat(),
             "page_title": "오늘의 할 일",
         }
 
@@ -161,6 +218,66 @@ async def daily_todo_page(request: Request, db: Session = Depends(get_db)) -> HT
         raise HTTPException(status_code=500, detail=f"오늘의 할 일 페이지 로딩 중 오류: {str(e)}")
 
 
+# 오늘의 할 일 화면 조각 (변경된 부분만 다시 렌더링)
+@app.get("/fragments/daily/summary", response_class=HTMLResponse)
+async def daily_summary_fragment(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+    """오늘의 진행상황 카드"""
+    return templates.TemplateResponse(
+        request=request,
+        name="partials/daily/summary_card.html",
+        context={"summary": DailyTodoService.get_today_summary(db)}
+    )
+
+
+@app.get("/fragments/daily/todos", response_class=HTMLResponse)
+async def daily_todo_list_fragment(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+    """오늘의 할일 목록"""
+    today = get_current_date()
+    today_todos = [_annotate_overdue(todo, today) for todo in DailyTodoService.get_today_todos(db)]
+    return templates.TemplateResponse(
+        request=request, name="partials/daily/todo_list.html", context={"today_todos": today_todos}
+    )
+
+
+@app.get("/fragments/daily/todos/{todo_id}", response_class=HTMLResponse)
+async def daily_todo_item_fragment(request: Request, todo_id: int, db: Session = Depends(get_db)) -> HTMLResponse:
+    """할일 항목 하나"""
+    todo = DailyTodoService.get_todo_by_id(db, todo_id)
+    if not todo:
+        raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다")
+
+    return templates.TemplateResponse(
+        request=request,
+        name="partials/daily/todo_item.html",
+        context={"todo": _annotate_overdue(todo, get_current_date())}
+    )
+
+
+@app.get("/fragments/daily/memos", response_class=HTMLResponse)
+async def daily_memo_panel_fragment(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+    """오늘의 메모 패널"""
+    return templates.TemplateResponse(
+        request=request,
+        name="partials/daily/memo_panel.html",
+        context={"memos": _today_memo_items(db, get_current_date())}
+    )
+
+
+def _build_journey_data(db: Session, journeys: list) -> list:
+    """여정 목록 카드 데이터 (여정별 할일 개수와 진행률, 개수는 통합 뷰에서 쿼리 1회로 집계)"""
+    todo_counts = JourneyService.get_todo_counts(db, [journey.id for journey in journeys])
+    journey_data = []
+    for journey in journeys:
+        total_todos, completed_todos = todo_counts.get(journey.id, (0, 0))
+        journey_data.append({
+            'journey': journey,
+            'actual_progress': round(completed_todos / total_todos * 100, 1) if total_todos else 0.0,
+            'total_todos': total_todos,
+            'completed_todos': completed_todos
+        })
+    return journey_data
+
+
 @app.get("/journeys", response_class=HTMLResponse)
 async def journey_management_page(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
     """통합 여정 관리 페이지"""
@@ -169,21 +286,7 @@ async def journey_management_page(request: Request, db: Session = Depends(get_db
         journeys = db.query(Journey).order_by(Journey.status, Journey.start_date).all()
 
         # 각 여정의 실시간 진행률 및 할일 개수 계산
-        journey_data = []
-        for journey in journeys:
-            # 여정별 할일 개수 계산 (Todo와 DailyTodo 모두 포함)
-            journey_todos = db.query(Todo).filter(Todo.journey_id == journey.id).all()
-            journey_daily_todos = db.query(DailyTodo).filter(DailyTodo.journey_id == journey.id).all()
-            total_todos = len(journey_todos) + len(journey_daily_todos)
-            completed_todos = len([t for t in journey_todos if t.is_completed]) + len([t for t in journey_daily_todos if t.is_completed])
-
-            actual_progress = journey.calculate_actual_progress()
-            journey_data.append({
-                'journey': journey,
-                'actual_progress': actual_progress,
-                'total_todos': total_todos,
-                'completed_todos': completed_todos
-            })
+        journey_data = _build_journey_data(db, journeys)
 
         # 통계 계산
         from .models.journey import JourneyStatus
@@ -193,14 +296,14 @@ async def journey_management_page(request: Request, db: Session = Depends(get_db
             .count()
         )
 
-        # 전체 할일 개수 계산 (미완료)
-        pending_todos_count = db.query(Todo).filter(Todo.is_completed == False).count()
-        pending_daily_todos_count = db.query(DailyTodo).filter(DailyTodo.is_completed == False).count()
-        total_pending_todos = pending_todos_count + pending_daily_todos_count
-
-        # 전체 할일 개수 계산 (전체)
-        total_todos = db.query(Todo).count() + db.query(DailyTodo).count()
-        total_completed_todos = db.query(Todo).filter(Todo.is_completed == True).count() + db.query(DailyTodo).filter(DailyTodo.is_completed == True).count()
+        # 전체 할일 개수 계산 (Todo와 DailyTodo 모두 포함, 여정 미연결 할일도 포함)
+        total_todos, total_completed_todos = db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case((journey_todos.c.is_completed == True, 1), else_=0)), 0),
+            )
+        ).one()
+        total_pending_todos = total_todos - total_completed_todos
 
         context = {
             "request": request,
@@ -244,43 +347,17 @@ async def journey_detail_page(
         if not journey:
             raise HTTPException(status_code=404, detail="여정을 찾을 수 없습니다")
 
-        # 해당 여정의 TODO 목록 조회 (Todo와 DailyTodo 모두)
-        legacy_todos = db.query(Todo).filter(Todo.journey_id == journey_id).all()
-        daily_todos = db.query(DailyTodo).filter(DailyTodo.journey_id == journey_id).all()
-
-        # 두 테이블의 데이터를 합쳐서 통합된 목록 생성
+        # 해당 여정의 TODO 목록 조회 (Todo와 DailyTodo 통합 뷰)
+        # 기존 Todo는 category를 'legacy'로 두어 템플릿이 카테고리·시간 표시를 숨김 (통합 전 화면과 동일)
         todos = []
-
-        # 기존 Todo 데이터 추가
-        for todo in legacy_todos:
-            todos.append({
-                'id': todo.id,
-                'title': todo.title,
-                'description': todo.description,
-                'is_completed': todo.is_completed,
-                'completed_at': todo.completed_at,
-                'created_at': todo.created_at,
-                'category': 'legacy',  # 구분용
-                'estimated_time': None,
-                'actual_time': None,
-                'priority': 'medium',  # 기본값
-                'source': 'todo'
-            })
-
-        # DailyTodo 데이터 추가
-        for todo in daily_todos:
+        for todo in JourneyService.get_journey_todos(db, journey_id):
+            is_legacy = todo['source'] == 'todo'
             todos.append({
-                'id': todo.id,
-                'title': todo.title,
-                'description': todo.description,
-                'is_completed': todo.is_completed,
-                'completed_at': todo.completed_at,
-                'created_at': todo.created_at,
-                'category': todo.category.value if todo.category else '기타',
-                'estimated_time': todo.estimated_minutes,
-                'actual_time': todo.actual_minutes,
+                **todo,
+                'category': 'legacy' if is_legacy else (todo['category'] or '기타'),
+                'estimated_time': None if is_legacy else todo['estimated_minutes'],
+                'actual_time': None if is_legacy else todo['actual_minutes'],
                 'priority': 'medium',  # 기본값 (DailyTodo에는 priority 없음)
-                'source': 'daily_todo'
             })
 
         completed_todos_count = len([t for t in todos if t['is_completed']])
@@ -344,28 +421,11 @@ async def search(
                 .all()
             )
 
-            # TODO 검색 (제목, 설명에서)
-            todos = (
-                db.query(Todo)
-                .filter(
-                    or_(
-                        Todo.title.ilike(search_query),
-                        Todo.description.ilike(search_query),
-                    )
-                )
-                .limit(5)
-                .all()
-            )
-
-            # 검색 결과 구성 (할일 개수 기반)
+            # 검색 결과 구성 (할일 개수 기반, 여정별 개수는 쿼리 1회)
+            todo_counts = JourneyService.get_todo_counts(db, [m.id for m in journeys])
             journey_search_results = []
             for m in journeys:
-                # 여정별 할일 개수 계산
-                m_todos = db.query(Todo).filter(Todo.journey_id == m.id).all()
-                m_daily_todos = db.query(DailyTodo).filter(DailyTodo.journey_id == m.id).all()
-                total_todos = len(m_todos) + len(m_daily_todos)
-                completed_todos = len([t for t in m_todos if t.is_completed]) + len([t for t in m_daily_todos if t.is_completed])
-
+                total_todos, completed_todos = todo_counts.get(m.id, (0, 0))
                 journey_search_results.append({
                     "id": m.id,
                     "title": m.title,
@@ -376,15 +436,16 @@ async def search(
 
             search_results["journeys"] = journey_search_results
 
+            # TODO 검색 (제목, 설명에서 - Todo와 DailyTodo 모두)
             search_results["todos"] = [
                 {
-                    "id": t.id,
-                    "title": t.title,
-                    "description": t.description,
-                    "is_completed": t.is_completed,
-                    "journey_title": t.journey.title if t.journey else "없음",
+                    "id": t["id"],
+                    "title": t["title"],
+                    "description": t["description"],
+                    "is_completed": t["is_completed"],
+                    "journey_title": t["journey_title"] or "없음",
                 }
-                for t in todos
+                for t in JourneyService.search_todos(db, q.strip(), limit=5)
             ]
 
         return templates.TemplateResponse(
@@ -405,6 +466,24 @@ async def search(
         )
 
 
+def _resolve_week_monday(week_start: Optional[str], today: date) -> date:
+    """주간 시작일 파라미터를 해당 주 월요일로 변환 (없거나 잘못되면 이번 주)"""
+    from datetime import timedelta
+
+    if week_start:
+        try:
+            target_date = date.fromisoformat(week_start)
+            return target_date - timedelta(days=target_date.weekday())
+        except ValueError:
+            pass
+    return today - timedelta(days=today.weekday())
+
+
+def _build_week_context(db: Session, monday: date, today: date) -> dict:
+    """주간 요약/일별 아코디언 렌더링 데이터 (날짜별 집계만, 상세는 펼칠 때 조회)"""
+    return {"monday": monday, **ReflectionHistoryService.get_week_aggregates(db, monday, today)}
+
+
 @app.get("/reflection-history", response_class=HTMLResponse)
 async def reflection_history_page(
     request: Request,
@@ -413,122 +492,32 @@ async def reflection_history_page(
 ) -> HTMLResponse:
     """회고 히스토리 통합 페이지"""
     try:
-        # 주간 통계 계산
-        from datetime import date, timedelta
+        from datetime import timedelta
         today = get_current_date()
-
-        # 특정 주가 지정되었으면 해당 주, 아니면 이번 주
-        if week_start:
-            try:
-                target_date = date.fromisoformat(week_start)
-                monday = target_date - timedelta(days=target_date.weekday())
-            except ValueError:
-                monday = today - timedelta(days=today.weekday())
-        else:
-            monday = today - timedelta(days=today.weekday())
-
+        monday = _resolve_week_monday(week_start, today)
         week_dates = [monday + timedelta(days=i) for i in range(7)]
-
-        # 이번 주의 일별 할일 통계 및 회고 데이터 (회고 기반 완료율 우선 사용)
-        from .models.daily_reflection import DailyReflection
-        weekly_stats = []
-        total_satisfaction = 0
-        total_energy = 0
-        reflection_count = 0
-
-        for day in week_dates:
-            # 해당 날짜의 회고 데이터 확인
-            reflection = db.query(DailyReflection).filter(DailyReflection.reflection_date == day).first()
-
-            # 해당 날짜의 할일 목록 (아코디언에서 표시용) - created_date 기준
-            day_todos = db.query(DailyTodo).filter(DailyTodo.created_date == day).all()
-
-            if reflection:
-                # 회고가 있으면 회고 시점의 정확한 데이터 사용 (소급 적용 방지)
-                total = reflection.total_todos
-                completed = reflection.completed_todos
-                completion_rate = reflection.completion_rate
-
-                # 만족도, 에너지 통계용
-                if reflection.satisfaction_score:
-                    total_satisfaction += reflection.satisfaction_score
-                    reflection_count += 1
-                if reflection.energy_level:
-                    total_energy += reflection.energy_level
-            else:
-                # 회고가 없으면 실시간 계산
-                # 오늘인 경우 DailyTodoService의 로직 사용 (자동 이월 포함)
-                if day == today:
-                    summary = DailyTodoService.get_today_summary(db)
-                    total = summary["total"]
-                    completed = summary["completed"]
-                    completion_rate = summary["completion_rate"]
-                else:
-                    # 과거 날짜는 created_date 기준으로만 계산 (변경 없음)
-                    completed = len([t for t in day_todos if t.is_completed])
-                    total = len(day_todos)
-                    completion_rate = (completed / total * 100) if total > 0 else 0
-
-            weekly_stats.append({
-                "date": day,
-                "day_name": day.strftime("%a"),
-                "day_korean": ["월", "화", "수", "목", "금", "토", "일"][day.weekday()],
-                "total_todos": total,
-                "completed_todos": completed,
-                "completion_rate": completion_rate,
-                "is_today": day == today,
-                "has_reflection": reflection is not None,
-                "reflection": reflection,
-                "todos": day_todos,
-                "satisfaction_score": reflection.satisfaction_score if reflection else None,
-                "energy_level": reflection.energy_level if reflection else None,
-                "reflection_text": reflection.reflection_text if reflection else None
-            })
+        week_context = _build_week_context(db, monday, today)
 
         # 주간 여정 진행률 (실시간 계산)
         from .models.journey import JourneyStatus
         journeys = db.query(Journey).filter(Journey.status.in_([JourneyStatus.ACTIVE, JourneyStatus.PLANNING])).all()
 
         # 각 여정의 실시간 진행률 및 할일 개수 계산
-        journey_data = []
-        for journey in journeys:
-            # 여정별 할일 개수 계산 (Todo와 DailyTodo 모두 포함)
-            journey_todos = db.query(Todo).filter(Todo.journey_id == journey.id).all()
-            journey_daily_todos = db.query(DailyTodo).filter(DailyTodo.journey_id == journey.id).all()
-            total_todos = len(journey_todos) + len(journey_daily_todos)
-            completed_todos = len([t for t in journey_todos if t.is_completed]) + len([t for t in journey_daily_todos if t.is_completed])
-
-            actual_progress = journey.calculate_actual_progress()
-            journey_data.append({
-                'journey': journey,
-                'actual_progress': actual_progress,
-                'total_todos': total_todos,
-                'completed_todos': completed_todos
-            })
+        journey_data = _build_journey_data(db, journeys)
 
         # 네비게이션 정보
         prev_monday = monday - timedelta(days=7)
         next_monday = monday + timedelta(days=7)
 
-        # 주간 평균 계산
-        avg_satisfaction = (total_satisfaction / reflection_count) if reflection_count > 0 else 0
-        avg_energy = (total_energy / reflection_count) if reflection_count > 0 else 0
-
         context = {
             "request": request,
-            "weekly_stats": weekly_stats,
+            **week_context,
             "journey_data": journey_data,
             "current_week": f"{monday.strftime('%Y년 %m월 %d일')} - {week_dates[-1].strftime('%m월 %d일')}",
             "today": today,
-            "monday": monday,
             "prev_monday": prev_monday,
             "next_monday": next_monday,
             "is_current_week": monday <= today <= week_dates[-1],
-            "week_averages": {
-                "avg_satisfaction": avg_satisfaction,
-                "avg_energy": avg_energy,
-                "reflection_count": reflection_count
-            }
         }
 
         return templates.TemplateResponse(
@@ -538,114 +527,79 @@ async def reflection_history_page(
         raise HTTPException(status_code=500, detail=f"회고 히스토리 페이지 로딩 중 오류: {str(e)}")
 
 
+# 회고 히스토리 화면 조각
+@app.get("/fragments/reflection-history/week", response_class=HTMLResponse)
+async def reflection_week_accordion_fragment(
+    request: Request,
+    week_start: Optional[str] = Query(None, description="주간 시작일 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db)
+) -> HTMLResponse:
+    """주간 일별 아코디언"""
+    today = get_current_date()
+    context = _build_week_context(db, _resolve_week_monday(week_start, today), today)
+    return templates.TemplateResponse(
+        request=request, name="partials/reflections/week_accordion.html", context=context
+    )
+
+
+@app.get("/fragments/reflection-history/summary", response_class=HTMLResponse)
+async def reflection_week_summary_fragment(
+    request: Request,
+    week_start: Optional[str] = Query(None, description="주간 시작일 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db)
+) -> HTMLResponse:
+    """주간 요약 카드"""
+    today = get_current_date()
+    context = _build_week_context(db, _resolve_week_monday(week_start, today), today)
+    return templates.TemplateResponse(
+        request=request, name="partials/reflections/week_summary.html", context=context
+    )
+
+
+@app.get("/api/reflection-week/{week_start}")
+async def get_week_reflection_details(
+    week_start: str,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """주간 7일의 회고 및 할일 상세를 한 번에 조회 (아코디언용)
+
+    할일·회고 테이블의 마지막 변경 기록(change_log seq)을 ETag로 쓰므로
+    변경이 없으면 상세를 조회하지 않고 304로 응답합니다.
+    """
+    from datetime import timedelta
+
+    try:
+        target_date = date.fromisoformat(week_start)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 날짜 형식입니다.")
+
+    # 주 중간 날짜가 와도 해당 주 월요일 기준으로 조회
+    monday = target_date - timedelta(days=target_date.weekday())
+    last_seq = ChangeLogService.get_last_seq(db, ["daily_todos", "daily_reflections"])
+    etag = f'W/"week-{monday.isoformat()}-{last_seq}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    days = ReflectionHistoryService.get_day_details(db, monday, monday + timedelta(days=6))
+    body = json.dumps({"week_start": monday.isoformat(), "days": days}, ensure_ascii=False, sort_keys=True)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/api/reflection-day/{date_str}")
 async def get_day_reflection_detail(
     date_str: str,
     db: Session = Depends(get_db)
 ):
-    """특정 날짜의 회고 및 할일 상세 정보 조회 (아코디언용)"""
+    """특정 날짜의 회고 및 할일 상세 정보 조회 (모달용)"""
     try:
-        from datetime import date
-        from .models.daily_reflection import DailyReflection
-
-        # 날짜 파싱
         target_date = date.fromisoformat(date_str)
-
-        # 회고 데이터 조회
-        reflection = db.query(DailyReflection).filter(
-            DailyReflection.reflection_date == target_date
-        ).first()
-
-        # 할일 목록 조회
-        day_todos = db.query(DailyTodo).filter(
-            DailyTodo.created_date == target_date
-        ).all()
-
-        # 할일을 완료/미완료로 분류하고 소급 완료 여부 확인
-        completed_todos = [todo for todo in day_todos if todo.is_completed]
-        pending_todos = [todo for todo in day_todos if not todo.is_completed]
-
-        # 회고가 있는 경우 소급 완료된 할일 구분
-        retroactively_completed = []
-        completed_on_time = []
-
-        if reflection:
-            # 회고 시점 기준 완료된 할일 수와 현재 완료된 할일 수 비교
-            reflection_completed_count = reflection.completed_todos
-            current_completed_count = len(completed_todos)
-
-            if current_completed_count > reflection_completed_count:
-                # 소급 완료된 할일이 있음
-                # 완료 시점으로 구분 (회고 생성일 이후 완료된 것들)
-                reflection_created_date = reflection.created_at.date() if reflection.created_at else target_date
-
-                for todo in completed_todos:
-                    if todo.completed_at:
-                        todo_completed_date = todo.completed_at.date()
-                        if todo_completed_date > reflection_created_date:
-                            retroactively_completed.append(todo)
-                        else:
-                            completed_on_time.append(todo)
-                    else:
-                        # completed_at이 없는 경우 회고 시점 완료로 간주
-                        completed_on_time.append(todo)
-            else:
-                completed_on_time = completed_todos
-        else:
-            completed_on_time = completed_todos
-
-        return {
-            "date": date_str,
-            "has_reflection": reflection is not None,
-            "reflection": {
-                "id": reflection.id if reflection else None,
-                "reflection_text": reflection.reflection_text if reflection else None,
-                "satisfaction_score": reflection.satisfaction_score if reflection else None,
-                "energy_level": reflection.energy_level if reflection else None,
-                "completion_rate": reflection.completion_rate if reflection else None,
-                "total_todos": reflection.total_todos if reflection else len(day_todos),
-                "completed_todos": reflection.completed_todos if reflection else len(completed_todos),
-                "created_at": reflection.created_at.isoformat() if reflection and reflection.created_at else None,
-            },
-            "todos": {
-                "completed_on_time": [
-                    {
-                        "id": todo.id,
-                        "title": todo.title,
-                        "category": todo.category.value,
-                        "completion_reflection": todo.completion_reflection,
-                        "completion_image_path": todo.completion_image_path,
-                        "journey_id": todo.journey_id,
-                        "completed_at": todo.completed_at.isoformat() if todo.completed_at else None,
-                    }
-                    for todo in completed_on_time
-                ],
-                "retroactively_completed": [
-                    {
-                        "id": todo.id,
-                        "title": todo.title,
-                        "category": todo.category.value,
-                        "completion_reflection": todo.completion_reflection,
-                        "completion_image_path": todo.completion_image_path,
-                        "journey_id": todo.journey_id,
-                        "completed_at": todo.completed_at.isoformat() if todo.completed_at else None,
-                    }
-                    for todo in retroactively_completed
-                ],
-                "pending": [
-                    {
-                        "id": todo.id,
-                        "title": todo.title,
-                        "category": todo.category.value,
-                        "journey_id": todo.journey_id
-                    }
-                    for todo in pending_todos
-                ]
-            }
-        }
-
     except ValueError:
         raise HTTPException(status_code=400, detail="잘못된 날짜 형식입니다.")
+
+    try:
+        return ReflectionHistoryService.get_day_details(db, target_date, target_date)[target_date.isoformat()]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 조회 중 오류: {str(e)}")
 
@@ -665,7 +619,53 @@ async def redirect_to_reflection_history(
         return RedirectResponse(url="/reflection-history", status_code=301)
 
 
+@app.get("/debug/queries")
+async def debug_queries() -> dict:
+    """최근 요청별 SQL 실행 횟수·DB 시간과 지문별 누적 통계 (dev 전용)"""
+    if settings.app_env != "dev":
+        raise HTTPException(status_code=404, detail="Not Found")
+    return query_stats.get_debug_snapshot()
+
+
+@app.get("/debug/profiles")
+def debug_profiles() -> list:
+    """저장된 요청 프로파일 목록 (최신순, dev 전용)"""
+    if settings.app_env != "dev":
+        raise HTTPException(status_code=404, detail="Not Found")
+    return profiling.list_profiles()
+
+
+@app.get("/debug/profiles/{profile_id}")
+def debug_profile_detail(profile_id: str) -> dict:
+    """요청 프로파일 하나 (dev 전용)"""
+    if settings.app_env != "dev":
+        raise HTTPException(status_code=404, detail="Not Found")
+    profile = profiling.load_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다")
+    return profile
+
+
+@app.get("/metrics")
+async def metrics_endpoint(db: Session = Depends(get_db)) -> Response:
+    """Prometheus 텍스트 형식 메트릭"""
+    return Response(content=MetricsService.render(db, engine), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/health")
 async def health_check() -> dict:
-    """헬스 체크 엔드포인트"""
+    """헬스 체크 엔드포인트 (의존 자원은 확인하지 않음, 배포 점검은 /health/ready 사용)"""
     return {"status": "healthy", "message": "서버가 정상적으로 작동 중입니다."}
+
+
+@app.get("/health/live")
+async def liveness_check() -> dict:
+    """생존 확인 (이벤트 루프가 응답하면 성공, DB 등 외부 자원은 확인하지 않음)"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check() -> JSONResponse:
+    """준비 상태 확인 (하나라도 실패하면 503, 결과는 짧은 시간 동안 재사용)"""
+    result = await HealthService.get_readiness(engine)
+    return JSONResponse(content=result, status_code=200 if result["status"] == "ready" else 503)
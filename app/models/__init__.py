@@ -1,5 +1,9 @@
 from .journey import Journey, JourneyStatus
 from .todo import Todo, DailyTodo, TodoCategory
+from .daily_reflection import DailyReflection
+from .postpone_event import PostponeEvent
+from .reflection_todo_snapshot import ReflectionTodoSnapshot
+from .journey_todo import journey_todos
 
 __all__ = [
     "Journey",
@@ -7,4 +11,8 @@ __all__ = [
     "Todo",
     "DailyTodo",
     "TodoCategory",
+    "DailyReflection",
+    "PostponeEvent",
+    "ReflectionTodoSnapshot",
+    "journey_todos",
 ]
@@ -0,0 +1,33 @@
+"""
+변경 기록 모델
+
+모든 테이블의 생성·수정·삭제를 순서 번호(seq)와 함께 추가 전용으로 기록합니다.
+값은 저장하지 않고 (테이블, 기본키, 변경 종류, 수정된 컬럼, 시간)만 남기므로 행이 작으며,
+동기화(/ws/sync), 캐시 무효화, ETag, 감사 기록이 테이블을 다시 훑지 않고
+"seq N 이후 무엇이 바뀌었나"만 물어볼 수 있습니다.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+
+from app.core.database import Base
+
+
+class ChangeLog(Base):
+    """변경 기록 모델"""
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_row", "table_name", "row_id"),
+        Index("ix_change_log_table_seq", "table_name", "seq"),
+        {"sqlite_autoincrement": True},  # 기록을 지워도 seq를 재사용하지 않음
+    )
+
+    seq = Column(Integer, primary_key=True, autoincrement=True, comment="변경 순서 번호")
+    table_name = Column(String(50), nullable=False, comment="테이블 이름")
+    row_id = Column(Integer, nullable=False, comment="행 기본키")
+    op = Column(String(10), nullable=False, comment="변경 종류 (insert, update, delete)")
+    version = Column(Integer, nullable=True, comment="변경 후 row_version (동기화 대상 테이블만)")
+    changed_columns = Column(JSON(none_as_null=True), nullable=True, comment="수정된 컬럼 이름 목록 (생성·삭제는 NULL)")
+    created_at = Column(DateTime, nullable=False, index=True, comment="기록 시간 (UTC)")
+
+    def __repr__(self) -> str:
+        return f"<ChangeLog(seq={self.seq}, {self.op} {self.table_name}#{self.row_id})>"
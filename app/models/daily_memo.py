@@ -34,6 +34,7 @@ class DailyMemo(Base):
         onupdate=func.now(),
         comment="수정 시간"
     )
+    row_version = Column(Integer, nullable=False, default=0, server_default="0", index=True, comment="동기화 버전 (변경마다 전역 카운터에서 할당)")
 
     def __repr__(self) -> str:
         """메모 문자열 표현"""
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, Text, Date, DateTime, Float, JSON
+from sqlalchemy import Column, Integer, Boolean, Text, Date, DateTime, Float, JSON
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -15,9 +16,10 @@ class DailyReflection(Base):
     total_todos = Column(Integer, default=0, comment="총 할 일 개수")
     completed_todos = Column(Integer, default=0, comment="완료한 할 일 개수")
     completion_rate = Column(Float, default=0.0, comment="완료율 (%)")
-
-    # 할일 목록 상세 정보 (JSON 형태로 저장)
-    todos_snapshot = Column(JSON, nullable=True, comment="회고 시점의 할일 목록 스냅샷")
+    stats_dirty = Column(
+        Boolean, nullable=False, default=True, server_default="1",
+        comment="회고 이후 그날 할일이 바뀌어 통계·스냅샷 재계산이 필요한지 여부"
+    )
 
     # 감정/만족도 점수 (1-5)
     satisfaction_score = Column(Integer, nullable=True, comment="만족도 점수 (1-5)")
@@ -27,9 +29,27 @@ class DailyReflection(Base):
     generated_blog_content = Column(Text, nullable=True, comment="LLM이 생성한 블로그 글 내용")
     blog_generation_prompt = Column(Text, nullable=True, comment="블로그 글 생성에 사용된 프롬프트")
     blog_generated_at = Column(DateTime(timezone=True), nullable=True, comment="블로그 글 생성 시간")
+    blog_prompt_metadata = Column(JSON, nullable=True, comment="블로그 프롬프트 토큰 추정 메타데이터")
 
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="생성 시간")
     updated_at = Column(DateTime(timezone=True), nullable=True, onupdate=func.now(), comment="수정 시간")
+    row_version = Column(Integer, nullable=False, default=0, server_default="0", index=True, comment="동기화 버전 (변경마다 전역 카운터에서 할당)")
+
+    # 회고 시점의 할일 목록 (reflection_todo_snapshots)
+    todo_snapshots = relationship(
+        "ReflectionTodoSnapshot",
+        back_populates="reflection",
+        cascade="all, delete-orphan",
+        order_by="ReflectionTodoSnapshot.id",
+    )
+
+    @property
+    def todos_snapshot(self) -> dict:
+        """회고 시점의 할일 목록 ({"completed": [...], "incomplete": [...]})"""
+        snapshot = {"completed": [], "incomplete": []}
+        for item in self.todo_snapshots:
+            snapshot[item.state].append(item.to_dict())
+        return snapshot
 
     def __repr__(self):
         return f"<DailyReflection(date={self.reflection_date}, completion_rate={self.completion_rate}%)>"
\ No newline at end of file
@@ -48,6 +48,7 @@ class Journey(Base):
         onupdate=func.now(),
         comment="수정일시",
     )
+    row_version = Column(Integer, nullable=False, default=0, server_default="0", index=True, comment="동기화 버전 (변경마다 전역 카운터에서 할당)")
 
     # Relationships
     todos = relationship(
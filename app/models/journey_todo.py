@@ -0,0 +1,52 @@
+"""
+여정 할일 통합 조회 뷰
+
+기존 todos 테이블과 daily_todos 테이블을 UNION ALL로 묶은 읽기 전용 뷰(journey_todos)입니다.
+source 컬럼으로 출처(todo, daily_todo)를 구분하고 시간 컬럼은 분 단위 이름으로 맞춥니다.
+여정 화면과 진행률 계산은 두 모델을 따로 조회하지 않고 이 뷰 하나로 조회합니다.
+(journey_id 조건은 각 테이블의 journey_id 인덱스로 내려가 처리됩니다)
+"""
+
+from sqlalchemy import DDL, Boolean, Column, DateTime, Integer, MetaData, String, Table, Text, Enum as SQLEnum, event
+
+from app.core.database import Base
+from .todo import TodoCategory
+
+SOURCE_TODO = "todo"
+SOURCE_DAILY_TODO = "daily_todo"
+
+VIEW_NAME = "journey_todos"
+
+# 마이그레이션(add_journey_todos_view)에도 같은 정의가 있으므로 함께 수정해야 합니다
+VIEW_SELECT = f"""
+SELECT id, '{SOURCE_TODO}' AS source, journey_id, title, description, category,
+       is_completed, completed_at, created_at,
+       estimated_time AS estimated_minutes, actual_time AS actual_minutes
+FROM todos
+UNION ALL
+SELECT id, '{SOURCE_DAILY_TODO}' AS source, journey_id, title, description, category,
+       is_completed, completed_at, created_at,
+       estimated_minutes, actual_minutes
+FROM daily_todos
+"""
+
+# 뷰는 Base.metadata에 넣지 않음 (create_all이 테이블로 만들지 않도록 별도 MetaData 사용)
+journey_todos = Table(
+    VIEW_NAME,
+    MetaData(),
+    Column("id", Integer),
+    Column("source", String(20)),
+    Column("journey_id", Integer),
+    Column("title", String(200)),
+    Column("description", Text),
+    Column("category", SQLEnum(TodoCategory)),
+    Column("is_completed", Boolean),
+    Column("completed_at", DateTime(timezone=True)),
+    Column("created_at", DateTime(timezone=True)),
+    Column("estimated_minutes", Integer),
+    Column("actual_minutes", Integer),
+)
+
+# create_all/drop_all (테스트 DB 등)에서도 뷰를 함께 만들고 지움
+event.listen(Base.metadata, "after_create", DDL(f"CREATE VIEW IF NOT EXISTS {VIEW_NAME} AS {VIEW_SELECT}"))
+event.listen(Base.metadata, "before_drop", DDL(f"DROP VIEW IF EXISTS {VIEW_NAME}"))
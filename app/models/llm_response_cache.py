@@ -0,0 +1,42 @@
+"""
+LLM 응답 캐시 모델
+
+프롬프트 해시를 키로 LLM 응답을 저장하여 동일한 프롬프트에 대한
+API 재호출을 방지합니다. TTL과 최대 개수(LRU)로 크기가 제한됩니다.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+
+from app.core.database import Base
+
+
+class LLMResponseCache(Base):
+    """LLM 프롬프트/응답 캐시 모델"""
+    __tablename__ = "llm_response_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    prompt_hash = Column(String(64), nullable=False, unique=True, index=True, comment="프롬프트 해시 (SHA-256)")
+
+    # 요청 정보
+    provider = Column(String(20), nullable=False, comment="LLM 제공업체")
+    model = Column(String(100), nullable=False, comment="사용된 모델")
+    parameters = Column(JSON, nullable=True, comment="호출 파라미터 (temperature, max_tokens 등)")
+
+    # 응답 정보
+    response = Column(Text, nullable=False, comment="LLM 응답 내용")
+    prompt_tokens = Column(Integer, default=0, comment="프롬프트 토큰 수")
+    completion_tokens = Column(Integer, default=0, comment="응답 토큰 수")
+
+    # 캐시 관리
+    hit_count = Column(Integer, default=0, comment="캐시 적중 횟수")
+    created_at = Column(DateTime, nullable=False, comment="생성 시간 (UTC)")
+    last_accessed_at = Column(DateTime, nullable=False, index=True, comment="마지막 접근 시간 (UTC, LRU 기준)")
+    expires_at = Column(DateTime, nullable=False, comment="만료 시간 (UTC)")
+
+    def __repr__(self) -> str:
+        return f"<LLMResponseCache(hash={self.prompt_hash[:12]}, provider={self.provider}, hits={self.hit_count})>"
+
+    @property
+    def total_tokens(self) -> int:
+        """프롬프트 + 응답 토큰 수"""
+        return (self.prompt_tokens or 0) + (self.completion_tokens or 0)
@@ -0,0 +1,42 @@
+"""
+미루기 기록 모델
+
+할일을 사유와 함께 미룰 때마다 한 행씩 추가합니다.
+할일별 이력 조회(todo_id)와 기간별 집계(from_date, 사유별·할일별 통계)를 SQL로 처리할 수 있도록
+할일 행의 JSON 텍스트 대신 별도 테이블에 둡니다.
+"""
+
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+class PostponeEvent(Base):
+    """미루기 기록 모델"""
+    __tablename__ = "postpone_events"
+    __table_args__ = (
+        Index("ix_postpone_events_todo_id", "todo_id", "id"),
+        Index("ix_postpone_events_from_date", "from_date"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    todo_id = Column(Integer, ForeignKey("daily_todos.id", ondelete="CASCADE"), nullable=False, comment="미룬 할일 ID")
+    from_date = Column(Date, nullable=False, comment="미루기 전 날짜")
+    to_date = Column(Date, nullable=False, comment="미룬 날짜")
+    reason = Column(String(100), nullable=False, comment="미루기 사유")
+    postponed_at = Column(DateTime, nullable=False, comment="미룬 시간 (UTC)")
+
+    todo = relationship("DailyTodo", back_populates="postpone_events")
+
+    def to_dict(self) -> dict:
+        """이력 항목 (기존 postpone_history JSON과 같은 형식)"""
+        return {
+            "from_date": self.from_date.isoformat(),
+            "to_date": self.to_date.isoformat(),
+            "reason": self.reason,
+            "postponed_at": self.postponed_at.isoformat(),
+        }
+
+    def __repr__(self) -> str:
+        return f"<PostponeEvent(todo_id={self.todo_id}, {self.from_date} -> {self.to_date})>"
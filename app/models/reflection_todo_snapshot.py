@@ -0,0 +1,60 @@
+"""
+회고 할일 스냅샷 모델
+
+회고를 저장할 때 그날 집계에 포함된 할일을 한 행씩 기록합니다.
+할일이 나중에 수정·삭제되어도 회고 시점의 제목과 상태가 남으며,
+"회고한 날 완료한 할일" 같은 조회를 JSON 해석 없이 인덱스 조인으로 처리합니다.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+STATE_COMPLETED = "completed"
+STATE_INCOMPLETE = "incomplete"
+
+
+class ReflectionTodoSnapshot(Base):
+    """회고 시점의 할일 스냅샷"""
+    __tablename__ = "reflection_todo_snapshots"
+    __table_args__ = (
+        Index("ix_reflection_todo_snapshots_reflection", "reflection_id", "state"),
+        Index("ix_reflection_todo_snapshots_todo_id", "todo_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    reflection_id = Column(
+        Integer, ForeignKey("daily_reflections.id", ondelete="CASCADE"), nullable=False, comment="회고 ID"
+    )
+    # 할일이 삭제되어도 스냅샷은 남도록 외래키를 두지 않음
+    todo_id = Column(Integer, nullable=True, comment="할일 ID")
+    state = Column(String(20), nullable=False, comment="회고 시점 상태 (completed, incomplete)")
+    title = Column(String(200), nullable=False, comment="회고 시점 할일 제목")
+    category = Column(String(20), nullable=True, comment="회고 시점 카테고리")
+    completed_at = Column(DateTime(timezone=True), nullable=True, comment="완료 시각")
+    estimated_minutes = Column(Integer, nullable=True, comment="예상 소요시간 (분)")
+    actual_minutes = Column(Integer, nullable=True, comment="실제 소요시간 (분)")
+
+    reflection = relationship("DailyReflection", back_populates="todo_snapshots")
+
+    def to_dict(self) -> dict:
+        """회고 API의 todos_snapshot 항목 형식"""
+        if self.state == STATE_COMPLETED:
+            return {
+                "id": self.todo_id,
+                "title": self.title,
+                "category": self.category,
+                "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+                "estimated_minutes": self.estimated_minutes,
+                "actual_minutes": self.actual_minutes,
+            }
+        return {
+            "id": self.todo_id,
+            "title": self.title,
+            "category": self.category,
+            "estimated_minutes": self.estimated_minutes,
+        }
+
+    def __repr__(self) -> str:
+        return f"<ReflectionTodoSnapshot(reflection_id={self.reflection_id}, todo_id={self.todo_id}, {self.state})>"
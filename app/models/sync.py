@@ -0,0 +1,36 @@
+"""
+동기화 상태 모델
+
+- SyncState: row_version을 할당하는 전역 카운터 (한 행)
+- SyncTombstone: 삭제된 행의 기록. 클라이언트 복제본이 삭제를 반영할 수 있도록
+  /api/sync 응답에 row_version과 함께 포함됩니다.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.core.database import Base
+
+
+class SyncState(Base):
+    """전역 동기화 버전 카운터"""
+    __tablename__ = "sync_state"
+
+    id = Column(Integer, primary_key=True, comment="항상 1")
+    version = Column(Integer, nullable=False, default=0, comment="마지막으로 할당한 row_version")
+
+    def __repr__(self) -> str:
+        return f"<SyncState(version={self.version})>"
+
+
+class SyncTombstone(Base):
+    """삭제된 행 기록"""
+    __tablename__ = "sync_tombstones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(50), nullable=False, comment="엔티티 종류 (todo, memo, reflection, journey)")
+    entity_id = Column(Integer, nullable=False, comment="삭제된 행 ID")
+    row_version = Column(Integer, nullable=False, index=True, comment="삭제 시 할당한 동기화 버전")
+    deleted_at = Column(DateTime, nullable=False, comment="삭제 시간 (UTC)")
+
+    def __repr__(self) -> str:
+        return f"<SyncTombstone({self.entity}#{self.entity_id} v{self.row_version})>"
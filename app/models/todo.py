@@ -9,6 +9,7 @@ from sqlalchemy import (
     Date,
     ForeignKey,
     Integer,
+    JSON,
     String,
     Text,
     Enum as SQLEnum,
@@ -60,6 +61,9 @@ class DailyTodo(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True, comment="완료 시각")
     completion_reflection = Column(Text, nullable=True, comment="완료 후 회고")
     completion_image_path = Column(String(500), nullable=True, comment="완료 회고 이미지 경로")
+    completion_image_renditions = Column(
+        JSON, nullable=True, comment="완료 회고 이미지 WebP 렌디션 경로 (너비: 경로)"
+    )
 
     # 날짜 관련
     created_date = Column(Date, default=func.current_date(), comment="생성 날짜")
@@ -74,15 +78,20 @@ class DailyTodo(Base):
 
     # 미루기 관련
     postpone_count = Column(Integer, default=0, comment="미루기 횟수")
-    postpone_history = Column(Text, nullable=True, comment="미루기 히스토리 (JSON)")
 
     # 여정 연결
     journey_id = Column(
-        Integer, ForeignKey("journeys.id"), nullable=True, comment="연관 여정 ID"
+        Integer, ForeignKey("journeys.id"), nullable=True, index=True, comment="연관 여정 ID"
     )
 
+    # 동기화 (/api/sync)
+    row_version = Column(Integer, nullable=False, default=0, server_default="0", index=True, comment="동기화 버전 (변경마다 전역 카운터에서 할당)")
+
     # Relationships
     journey = relationship("Journey", back_populates="daily_todos")
+    postpone_events = relationship(
+        "PostponeEvent", back_populates="todo", cascade="all, delete-orphan", order_by="PostponeEvent.id"
+    )
 
     # 프로젝트 연결 (선택적) - 일상 관리에서는 사용하지 않음
     # project_id = Column(
@@ -97,6 +106,18 @@ class DailyTodo(Base):
         """오늘 생성된 할 일인지 확인"""
         return self.created_date == get_current_date()
 
+    @property
+    def completion_image_srcset(self) -> str:
+        """완료 회고 이미지 렌디션의 srcset 속성값 ("경로 320w, 경로 640w")"""
+        if not self.completion_image_renditions:
+            return ""
+        return ", ".join(
+            f"{path} {width}w"
+            for width, path in sorted(
+                self.completion_image_renditions.items(), key=lambda item: int(item[0])
+            )
+        )
+
     def complete(self) -> None:
         """할 일 완료 처리"""
         self.is_completed = True
@@ -143,7 +164,7 @@ class Todo(Base):
 
     # 여정 연결
     journey_id = Column(
-        Integer, ForeignKey("journeys.id"), nullable=True, comment="여정 ID"
+        Integer, ForeignKey("journeys.id"), nullable=True, index=True, comment="여정 ID"
     )
 
     # Relationships
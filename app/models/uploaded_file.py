@@ -0,0 +1,30 @@
+"""
+업로드 파일 저장소 모델
+
+업로드 내용의 SHA-256 해시로 파일을 식별하여 같은 이미지를 다시 올려도
+한 벌만 저장합니다. 참조 수(ref_count)가 0이 된 항목은 gc-uploads 명령이
+파일과 함께 정리합니다.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+
+from app.core.database import Base
+
+
+class UploadedFile(Base):
+    """내용 해시 기반 업로드 파일 모델"""
+    __tablename__ = "uploaded_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), nullable=True, unique=True, index=True, comment="업로드 내용 해시 (SHA-256, 기존 파일은 NULL)")
+    path = Column(String(500), nullable=False, unique=True, index=True, comment="원본 이미지 웹 경로")
+    renditions = Column(JSON, nullable=True, comment="WebP 렌디션 경로 (너비: 경로)")
+    size_bytes = Column(Integer, nullable=True, comment="업로드 크기 (bytes)")
+
+    # 참조 관리
+    ref_count = Column(Integer, nullable=False, default=0, index=True, comment="참조 중인 할일 수")
+    created_at = Column(DateTime, nullable=False, comment="생성 시간 (UTC)")
+    released_at = Column(DateTime, nullable=True, comment="마지막 참조 해제 시간 (UTC)")
+
+    def __repr__(self) -> str:
+        return f"<UploadedFile(path={self.path}, refs={self.ref_count})>"
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, UploadFile, File, Query
+from fastapi import APIRouter, Depends, HTTPException, Form, UploadFile, File, Query, Header, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from pydantic import BaseModel
-import uuid
-from pathlib import Path
 
+from ..core.config import settings
 from ..core.database import get_db
+from ..core.events import stream_events
 from ..models.todo import DailyTodo, TodoCategory
 from ..models.daily_memo import DailyMemo
 from ..services.daily_todo_service import DailyTodoService
 from ..services.daily_memo_service import DailyMemoService
+from ..services.postpone_analytics_service import PostponeAnalyticsService
+from ..services.image_upload_service import ImageUploadService, ImageTooLargeError
+from ..services.upload_store_service import UploadStoreService
 from ..core.timezone import get_current_date, format_date_for_display, format_datetime_for_api
 
 router = APIRouter(prefix="/api/daily", tags=["일상 Todo"])
@@ -17,6 +21,21 @@ router = APIRouter(prefix="/api/daily", tags=["일상 Todo"])
 
 # API 엔드포인트들
 
+@router.get("/events")
+async def stream_daily_events(request: Request, last_event_id: Optional[str] = Header(None)):
+    """오늘 화면 실시간 변경 이벤트 (Server-Sent Events)
+
+    todo.changed, summary.changed, memo.added/updated/deleted 이벤트를 보냅니다.
+    브라우저 재연결 시 Last-Event-ID 헤더 이후의 이벤트를 이어서 보냅니다.
+    """
+    resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    return StreamingResponse(
+        stream_events(request, last_event_id=resume_from, heartbeat_seconds=settings.sse_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/todos/today")
 async def get_today_todos(db: Session = Depends(get_db)):
     """오늘의 할 일 목록 조회"""
@@ -196,6 +215,16 @@ async def get_category_summary(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"카테고리 요약 조회 실패: {str(e)}")
 
 
+async def _save_reflection_image(db: Session, reflection_image: Optional[UploadFile]) -> Optional[dict]:
+    """완료 회고 이미지 저장 (형식 오류는 400, 크기 초과는 413)"""
+    try:
+        return await ImageUploadService.save_reflection_image(db, reflection_image)
+    except ImageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.patch("/todos/{todo_id}/complete")
 async def complete_todo_with_reflection(
     todo_id: int,
@@ -205,34 +234,24 @@ async def complete_todo_with_reflection(
 ):
     """할 일 완료 시 회고 작성 (이미지 포함)"""
     try:
-        # 이미지 업로드 처리
-        image_path = None
-        if reflection_image and reflection_image.filename:
-            # 파일 확장자 검증
-            allowed_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-            file_extension = Path(reflection_image.filename).suffix.lower()
-
-            if file_extension not in allowed_extensions:
-                raise HTTPException(status_code=400, detail="지원하지 않는 이미지 형식입니다. (jpg, png, gif, webp만 지원)")
-
-            # 고유 파일명 생성
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            upload_dir = Path("app/static/uploads/reflections")
-            upload_dir.mkdir(parents=True, exist_ok=True)
-
-            # 파일 저장
-            file_path = upload_dir / unique_filename
-            with open(file_path, "wb") as buffer:
-                content = await reflection_image.read()
-                buffer.write(content)
-
-            # 웹에서 접근 가능한 경로로 저장
-            image_path = f"/static/uploads/reflections/{unique_filename}"
+        # 이미지 업로드 처리 (스트리밍 저장, EXIF 제거, WebP 렌디션 생성)
+        image = await _save_reflection_image(db, reflection_image)
 
         # 할 일 완료 처리 (이미지 경로 포함)
-        todo = DailyTodoService.toggle_complete(db, todo_id, reflection, image_path)
+        todo = DailyTodoService.toggle_complete(
+            db,
+            todo_id,
+            reflection,
+            image["path"] if image else None,
+            image["renditions"] if image else None
+        )
         if not todo:
+            # 커밋되지 않은 업로드 참조는 세션 종료 시 롤백되고 파일은 gc-uploads가 정리
             raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다")
+        if image and not todo.is_completed:
+            # 이미 완료된 할일이 완료 해제된 경우 새 이미지는 연결되지 않으므로 참조 해제
+            UploadStoreService.release(db, image["path"])
+            db.commit()
 
         return {
             "id": todo.id,
@@ -240,6 +259,7 @@ async def complete_todo_with_reflection(
             "is_completed": todo.is_completed,
             "completion_reflection": todo.completion_reflection,
             "completion_image_path": todo.completion_image_path,
+            "completion_image_srcset": todo.completion_image_srcset,
             "completed_at": todo.completed_at.isoformat() if todo.completed_at else None,
         }
     except HTTPException:
@@ -266,43 +286,21 @@ async def update_completion_reflection(
         if not todo.is_completed:
             raise HTTPException(status_code=400, detail="완료된 할 일만 회고를 수정할 수 있습니다")
 
-        # 이미지 업로드 처리
-        image_path = None
-        if reflection_image and reflection_image.filename:
-            # 파일 확장자 검증
-            allowed_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-            file_extension = Path(reflection_image.filename).suffix.lower()
-
-            if file_extension not in allowed_extensions:
-                raise HTTPException(status_code=400, detail="지원하지 않는 이미지 형식입니다. (jpg, png, gif, webp만 지원)")
-
-            # 기존 이미지 삭제 (있는 경우)
-            if todo.completion_image_path:
-                old_image_path = Path(f"app{todo.completion_image_path}")
-                if old_image_path.exists():
-                    old_image_path.unlink()
-
-            # 고유 파일명 생성
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            upload_dir = Path("app/static/uploads/reflections")
-            upload_dir.mkdir(parents=True, exist_ok=True)
-
-            # 파일 저장
-            file_path = upload_dir / unique_filename
-            with open(file_path, "wb") as buffer:
-                content = await reflection_image.read()
-                buffer.write(content)
-
-            # 웹에서 접근 가능한 경로로 저장
-            image_path = f"/static/uploads/reflections/{unique_filename}"
+        # 이미지 업로드 처리 (스트리밍 저장, EXIF 제거, WebP 렌디션 생성)
+        image = await _save_reflection_image(db, reflection_image)
+        if image:
+            # 기존 이미지 참조 해제 (파일은 참조가 없을 때 gc-uploads가 정리)
+            UploadStoreService.release(db, todo.completion_image_path)
 
         # 회고 업데이트
         todo.completion_reflection = reflection if reflection else None
-        if image_path:
-            todo.completion_image_path = image_path
+        if image:
+            todo.completion_image_path = image["path"]
+            todo.completion_image_renditions = image["renditions"]
 
         db.commit()
         db.refresh(todo)
+        DailyTodoService.publish_change(db, todo.id, "updated")
 
         return {
             "id": todo.id,
@@ -310,6 +308,7 @@ async def update_completion_reflection(
             "is_completed": todo.is_completed,
             "completion_reflection": todo.completion_reflection,
             "completion_image_path": todo.completion_image_path,
+            "completion_image_srcset": todo.completion_image_srcset,
             "completed_at": todo.completed_at.isoformat() if todo.completed_at else None,
         }
     except HTTPException:
@@ -591,6 +590,29 @@ async def get_todo_postpone_summary(todo_id: int, db: Session = Depends(get_db))
         raise HTTPException(status_code=500, detail=f"미루기 요약 조회 실패: {str(e)}")
 
 
+@router.get("/postpones/analytics")
+async def get_postpone_analytics(
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD, 기본값: 이번 달 1일)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD, 기본값: 오늘)"),
+    limit: int = Query(default=10, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """기간 내 미루기 통계 (자주 쓰는 사유, 자주 미룬 할일, 미룬 일수)"""
+    from datetime import datetime
+
+    today = get_current_date()
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else today.replace(day=1)
+        end = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else today
+    except ValueError:
+        raise HTTPException(status_code=400, detail="올바른 날짜 형식이 아닙니다 (YYYY-MM-DD)")
+
+    try:
+        return PostponeAnalyticsService.get_analytics(db, start, end, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 # === 메모 관련 API 엔드포인트 ===
 
 @router.get("/memos/today")
@@ -7,12 +7,12 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from datetime import date
 
 from ..core.database import get_db
+from ..core.templates import templates
 from ..models.journey import Journey
 from ..schemas.journey import (
     JourneyCreate,
@@ -20,9 +20,9 @@ from ..schemas.journey import (
     JourneyResponse,
     JourneyListResponse,
 )
+from ..services.journey_service import JourneyService
 
 router = APIRouter(prefix="/journeys", tags=["여정"])
-templates = Jinja2Templates(directory="app/templates")
 
 
 # T1-15: 웹 UI 인터랙션을 위한 HTMX 엔드포인트들 (경로 충돌 방지를 위해 앞에 배치)
@@ -338,8 +338,8 @@ async def complete_journey(journey_id: int, request: Request, db: Session = Depe
 async def delete_journey(journey_id: int, db: Session = Depends(get_db)) -> None:
     """여정을 삭제합니다."""
     try:
-        # 기존 여정 조회
-        db_journey = db.query(Journey).filter(Journey.id == journey_id).first()
+        # 기존 여정 조회 (cascade 대상 할일 포함)
+        db_journey = JourneyService.get_journey_for_delete(db, journey_id)
 
         if not db_journey:
             raise HTTPException(
@@ -347,10 +347,8 @@ async def delete_journey(journey_id: int, db: Session = Depends(get_db)) -> None
                 detail=f"ID {journey_id}인 여정을 찾을 수 없습니다",
             )
 
-        # 연결된 TODO가 있는지 확인
-        from ..models.todo import Todo
-
-        related_todos = db.query(Todo).filter(Todo.journey_id == journey_id).count()
+        # 연결된 TODO가 있는지 확인 (조회 시 함께 로드됨)
+        related_todos = len(db_journey.todos)
 
         if related_todos > 0:
             raise HTTPException(
@@ -1,16 +1,21 @@
+import json
 from datetime import date, datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Form, Query
-from fastapi.responses import HTMLResponse, Response
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from starlette.requests import Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.templates import templates
 from app.models.daily_reflection import DailyReflection
 from app.services.daily_reflection_service import DailyReflectionService
 from app.services.llm_blog_service import LLMBlogService, LLMProvider
+from app.services.llm_cache_service import LLMCacheService
+from app.services.llm_provider_policy import LLMProviderPolicy
+from app.services.llm_batch_service import LLMBatchService
 from app.schemas.llm_blog import (
+    BatchBlogGenerationRequest,
     BlogGenerationRequest,
     BlogGenerationResponse,
     BlogContentResponse,
@@ -19,7 +24,6 @@ from app.schemas.llm_blog import (
 )
 
 router = APIRouter(prefix="/api/reflections", tags=["일일 회고"])
-templates = Jinja2Templates(directory="app/templates")
 
 
 @router.post("/", response_model=dict)
@@ -133,6 +137,22 @@ async def get_reflection_stats(
     return stats
 
 
+@router.get("/completed-todos")
+async def get_completed_todos_on_reflected_days(
+    start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db)
+):
+    """기간 내 회고한 날 완료한 할일 (회고 시점 스냅샷 기준)"""
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="올바른 날짜 형식이 아닙니다 (YYYY-MM-DD)")
+
+    return {"todos": DailyReflectionService.get_completed_todos_on_reflected_days(db, start, end)}
+
+
 @router.delete("/date/{reflection_date}")
 async def delete_reflection(
     reflection_date: str,
@@ -195,6 +215,45 @@ async def generate_blog_content(
             raise HTTPException(status_code=500, detail=f"블로그 글 생성 실패: {str(e)}")
 
 
+@router.post("/generate-blog/batch")
+async def generate_blog_content_batch(
+    request: BatchBlogGenerationRequest,
+    db: Session = Depends(get_db)
+):
+    """기간 내 회고들의 블로그 글을 일괄 생성합니다
+
+    회고별 결과를 완료되는 순서대로 NDJSON(한 줄에 JSON 하나)으로 스트리밍하고,
+    마지막 줄에 전체 요약을 보냅니다.
+    """
+    try:
+        provider = LLMProvider(request.provider)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"지원하지 않는 LLM 제공업체: {request.provider}")
+
+    try:
+        LLMBatchService.validate_date_range(request.start_date, request.end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def stream_results():
+        counts = {"generated": 0, "cached": 0, "failed": 0}
+        async for result in LLMBatchService.generate_batch(
+            db=db,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            provider=provider,
+            include_images=request.include_images,
+            force_regenerate=request.force_regenerate,
+            max_concurrency=request.max_concurrency
+        ):
+            counts[result["status"]] += 1
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+
+        yield json.dumps({"done": True, "total": sum(counts.values()), **counts}) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.post("/{reflection_id}/regenerate-blog", response_model=BlogGenerationResponse)
 async def regenerate_blog_content(
     reflection_id: int,
@@ -259,7 +318,8 @@ async def get_blog_content(
         return BlogContentResponse(
             content=cached_content["content"],
             generated_at=cached_content["generated_at"],
-            prompt=cached_content["prompt"]
+            prompt=cached_content["prompt"],
+            prompt_metadata=cached_content["prompt_metadata"]
         )
 
     except HTTPException:
@@ -289,7 +349,8 @@ async def update_blog_content(
         return BlogContentResponse(
             content=cached_content["content"],
             generated_at=cached_content["generated_at"],
-            prompt=cached_content["prompt"]
+            prompt=cached_content["prompt"],
+            prompt_metadata=cached_content["prompt_metadata"]
         )
 
     except ValueError as e:
@@ -345,6 +406,21 @@ async def refine_blog_content(
             raise HTTPException(status_code=500, detail=f"블로그 글 개선 실패: {str(e)}")
 
 
+@router.get("/llm-cache/stats")
+async def get_llm_cache_stats(db: Session = Depends(get_db)):
+    """LLM 응답 캐시 메트릭 조회 (적중률, 절약한 토큰 수)"""
+    try:
+        return LLMCacheService.get_stats(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"캐시 메트릭 조회 실패: {str(e)}")
+
+
+@router.get("/llm-providers/stats")
+async def get_llm_provider_stats():
+    """LLM 제공업체별 지연 시간 히스토그램과 페일오버/헤징 횟수 조회"""
+    return LLMProviderPolicy.get_stats()
+
+
 # 페이지 라우터들 - 레거시 /reflections 페이지 리다이렉트 추가
 page_router = APIRouter()
 
@@ -0,0 +1,133 @@
+"""
+다중 기기 동기화 API 라우터
+
+- /api/sync?since=<version>: 마지막 동기화 이후 바뀐 할일/메모/회고/여정과 삭제 기록 (오프라인 복제본용)
+- /ws/sync: change_log의 변경 기록 중 할일/메모/회고/여정을 순서대로 보내는 웹소켓
+
+웹소켓 프로토콜 (JSON 메시지):
+- 연결: /ws/sync?since=<마지막으로 적용한 seq> (생략하면 현재 시점부터)
+- 서버 → {"type": "hello", "last_seq": N}
+- 서버 → {"type": "changes", "changes": [{seq, entity, id, version, op, fields}, ...], "last_seq": N}
+- 클라이언트 → {"type": "ack", "seq": N} (N까지 적용 완료)
+- 서버 → {"type": "resync"} (since가 서버 기록과 맞지 않거나 이미 정리된 기록이므로 /api/sync로 전체를 다시 받아야 함)
+- 서버 → {"type": "ping"} (변경이 없을 때 연결 유지)
+
+확인(ack)받지 않은 기록이 SYNC_WINDOW개에 이르면 ack가 올 때까지 더 보내지 않습니다.
+보낼 기록은 메모리에 쌓지 않고 DB에서 seq 커서로 읽으므로 느린 클라이언트가 서버 메모리를 늘리지 않습니다.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import get_db
+from ..core.events import Subscription, event_bus
+from ..services.change_log_service import ChangeLogService
+from ..services.sync_service import SyncService
+
+SYNC_BATCH_SIZE = 100
+SYNC_WINDOW = 500
+
+router = APIRouter(tags=["동기화"])
+
+
+@router.get("/api/sync")
+async def get_sync_changes(since: int = Query(0, ge=0), db: Session = Depends(get_db)):
+    """since 버전 이후의 변경 (응답의 version을 다음 요청의 since로 사용)"""
+    return SyncService.get_changes_since(db, since)
+
+
+@router.websocket("/ws/sync")
+async def sync_socket(
+    websocket: WebSocket,
+    since: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """변경 기록 동기화 채널"""
+    await websocket.accept()
+    # 마지막 seq를 읽기 전에 구독하여 그 사이의 변경 알림을 놓치지 않음
+    subscription = event_bus.subscribe()
+    try:
+        await _stream_changes(websocket, db, subscription, since)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+async def _stream_changes(
+    websocket: WebSocket,
+    db: Session,
+    subscription: Subscription,
+    since: Optional[int]
+) -> None:
+    last_seq = ChangeLogService.get_last_seq(db)
+    first_seq = ChangeLogService.get_first_seq(db)
+    db.rollback()  # 읽기 트랜잭션 종료 (이후 커밋된 기록도 보이도록)
+
+    if since is None:
+        since = last_seq
+    elif since > last_seq or since < first_seq - 1:
+        # DB 초기화 등으로 클라이언트 기록이 서버보다 앞서거나, 받지 못한 기록이 보관 기간이 지나 삭제됨
+        await websocket.send_json({"type": "resync"})
+        since = last_seq
+    await websocket.send_json({"type": "hello", "last_seq": last_seq})
+
+    sent = since
+    in_flight: deque = deque()  # (배치 마지막 seq, 기록 수)
+    unacked = 0
+    receive_task: Optional[asyncio.Task] = None
+    wake_task: Optional[asyncio.Task] = None
+
+    try:
+        while True:
+            # 창(window)이 허락하는 만큼 새 기록 전송
+            while unacked < SYNC_WINDOW:
+                changes = ChangeLogService.get_changes_since(
+                    db, sent, min(SYNC_BATCH_SIZE, SYNC_WINDOW - unacked)
+                )
+                db.rollback()
+                if not changes:
+                    break
+                sent = changes[-1]["seq"]
+                await websocket.send_json({"type": "changes", "changes": changes, "last_seq": sent})
+                in_flight.append((sent, len(changes)))
+                unacked += len(changes)
+
+            # 클라이언트 ack 또는 새 변경 알림 대기 (알림이 없으면 keep-alive 후 다시 조회)
+            if receive_task is None:
+                receive_task = asyncio.ensure_future(websocket.receive_text())
+            if wake_task is None:
+                wake_task = asyncio.ensure_future(subscription.get(settings.sse_heartbeat_seconds))
+            done, _ = await asyncio.wait({receive_task, wake_task}, return_when=asyncio.FIRST_COMPLETED)
+
+            if receive_task in done:
+                acked = _parse_ack(receive_task.result())
+                receive_task = None
+                while acked is not None and in_flight and in_flight[0][0] <= acked:
+                    unacked -= in_flight.popleft()[1]
+
+            if wake_task in done:
+                if wake_task.result() is None:
+                    await websocket.send_json({"type": "ping"})
+                wake_task = None
+    finally:
+        for task in (receive_task, wake_task):
+            if task is not None:
+                task.cancel()
+
+
+def _parse_ack(message: str) -> Optional[int]:
+    """ack 메시지의 seq (다른 메시지나 잘못된 형식은 None)"""
+    try:
+        data = json.loads(message)
+        if isinstance(data, dict) and data.get("type") == "ack":
+            return int(data["seq"])
+    except (ValueError, KeyError, TypeError):
+        pass
+    return None
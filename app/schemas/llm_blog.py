@@ -1,8 +1,8 @@
 """
 LLM 블로그 생성 관련 Pydantic 스키마
 """
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Optional
+from datetime import date, datetime
 from pydantic import BaseModel, Field
 
 
@@ -25,6 +25,7 @@ class BlogContentResponse(BaseModel):
     content: str = Field(..., description="저장된 블로그 글 내용")
     generated_at: Optional[datetime] = Field(None, description="생성 시간")
     prompt: Optional[str] = Field(None, description="사용된 프롬프트")
+    prompt_metadata: Optional[Dict[str, Any]] = Field(None, description="프롬프트 토큰 추정 메타데이터")
 
 
 class BlogUpdateRequest(BaseModel):
@@ -36,4 +37,13 @@ class BlogRefinementRequest(BaseModel):
     """블로그 글 AI 개선 요청 스키마"""
     refinement_request: str = Field(..., description="수정 요청 내용")
     provider: str = Field(..., description="LLM 제공업체 (openai, claude)")
-    include_images: bool = Field(default=True, description="이미지 포함 여부")
\ No newline at end of file
+    include_images: bool = Field(default=True, description="이미지 포함 여부")
+
+class BatchBlogGenerationRequest(BaseModel):
+    """기간별 블로그 글 일괄 생성 요청 스키마"""
+    start_date: date = Field(..., description="시작 날짜 (YYYY-MM-DD)")
+    end_date: date = Field(..., description="종료 날짜 (YYYY-MM-DD)")
+    provider: str = Field(..., description="LLM 제공업체 (openai, claude)")
+    include_images: bool = Field(default=True, description="이미지 포함 여부")
+    force_regenerate: bool = Field(default=False, description="이미 생성된 글도 다시 생성할지 여부")
+    max_concurrency: int = Field(default=3, ge=1, le=10, description="동시 LLM 호출 수")
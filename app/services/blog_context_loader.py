@@ -0,0 +1,125 @@
+"""
+블로그 글 생성용 데이터 로더
+
+회고, 할일, 메모를 날짜(또는 기간) 단위로 한 번에 조회하여 회고별로 묶습니다.
+단건 생성, 일괄 생성이 같은 조회 기준을 사용하며, 생성된 글은 조회해 둔
+회고 객체에 바로 저장하여 다시 조회하지 않습니다.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session
+
+from ..models.daily_reflection import DailyReflection
+from ..models.todo import DailyTodo
+from .daily_memo_service import DailyMemoService
+
+
+class BlogContextLoader:
+    """블로그 글 생성용 데이터 로더"""
+
+    @staticmethod
+    def get_reflection(db: Session, reflection_id: int) -> DailyReflection:
+        """회고 조회
+
+        Raises:
+            ValueError: 회고가 없는 경우
+        """
+        reflection = db.query(DailyReflection).filter(
+            DailyReflection.id == reflection_id
+        ).first()
+
+        if not reflection:
+            raise ValueError(f"회고를 찾을 수 없습니다: ID {reflection_id}")
+
+        return reflection
+
+    @staticmethod
+    def load_for_reflection(db: Session, reflection: DailyReflection) -> Dict[str, Any]:
+        """이미 조회한 회고에 해당 날짜의 할일과 메모를 붙여 반환"""
+        day = reflection.reflection_date
+        return BlogContextLoader._attach(db, [reflection], day, day)[0]
+
+    @staticmethod
+    def load_range(db: Session, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """기간 내 회고별 데이터를 일괄 조회
+
+        회고, 할일, 메모를 각각 한 번씩만 조회한 뒤 날짜별로 묶습니다.
+
+        Returns:
+            회고 날짜순 리스트 (reflection, completed_todos, pending_todos, daily_memos)
+        """
+        reflections = db.query(DailyReflection).filter(
+            DailyReflection.reflection_date >= start_date,
+            DailyReflection.reflection_date <= end_date
+        ).order_by(DailyReflection.reflection_date.asc()).all()
+
+        if not reflections:
+            return []
+
+        return BlogContextLoader._attach(db, reflections, start_date, end_date)
+
+    @staticmethod
+    def _attach(
+        db: Session,
+        reflections: List[DailyReflection],
+        start_date: date,
+        end_date: date
+    ) -> List[Dict[str, Any]]:
+        """기간 내 할일/메모를 한 번씩 조회하여 회고 날짜별로 묶음"""
+        # 완료 할일은 완료 날짜, 미완료 할일은 예정 날짜 기준
+        todos = db.query(DailyTodo).filter(
+            or_(
+                and_(
+                    DailyTodo.is_completed == True,
+                    func.date(DailyTodo.completed_at) >= start_date,
+                    func.date(DailyTodo.completed_at) <= end_date
+                ),
+                and_(
+                    DailyTodo.is_completed == False,
+                    DailyTodo.scheduled_date >= start_date,
+                    DailyTodo.scheduled_date <= end_date
+                )
+            )
+        ).all()
+
+        completed_by_date: Dict[date, List[DailyTodo]] = defaultdict(list)
+        pending_by_date: Dict[date, List[DailyTodo]] = defaultdict(list)
+        for todo in todos:
+            if todo.is_completed:
+                completed_by_date[todo.completed_at.date()].append(todo)
+            else:
+                pending_by_date[todo.scheduled_date].append(todo)
+
+        memos_by_date = defaultdict(list)
+        for memo in DailyMemoService.get_memos_by_date_range(db, start_date, end_date):
+            memos_by_date[memo.memo_date].append(memo)
+
+        return [
+            {
+                "reflection": reflection,
+                "completed_todos": completed_by_date.get(reflection.reflection_date, []),
+                "pending_todos": pending_by_date.get(reflection.reflection_date, []),
+                "daily_memos": memos_by_date.get(reflection.reflection_date, []),
+            }
+            for reflection in reflections
+        ]
+
+    @staticmethod
+    def save_blog_content(
+        db: Session,
+        reflection: DailyReflection,
+        content: str,
+        prompt: str,
+        prompt_metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """조회해 둔 회고 객체에 생성된 블로그 글 저장 (재조회 없음)"""
+        reflection.generated_blog_content = content
+        reflection.blog_generation_prompt = prompt
+        reflection.blog_prompt_metadata = prompt_metadata
+        reflection.blog_generated_at = datetime.now()
+
+        db.commit()
@@ -0,0 +1,230 @@
+"""
+변경 기록 서비스
+
+- 세션 flush 시점(after_flush 이벤트)에 모든 모델의 생성·수정·삭제를 change_log에 기록합니다.
+  서비스 코드가 따로 기록하지 않아도 되며, 변경과 기록은 같은 트랜잭션으로 커밋됩니다.
+  기록에는 값 대신 수정된 컬럼 이름만 남기고, 값이 필요하면 읽을 때 현재 행에서 채웁니다.
+- 커밋 후 이벤트 버스에 sync.changed를 발행하여 동기화 채널(/ws/sync)이 새 기록을 읽게 합니다.
+- 오래된 기록은 compact()로 행마다 하나로 합치고 보관 기간이 지나면 지웁니다
+  (python scripts/db.py compact-change-log).
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.events import event_bus
+from ..core.timezone import get_current_utc_datetime
+from ..models.change_log import ChangeLog
+from .sync_service import VERSIONED_MODELS, row_to_dict
+
+# 기록하지 않는 테이블 (기록 자체, 동기화 카운터, 조회만으로 갱신되는 LLM 응답 캐시)
+EXCLUDED_TABLES = {"change_log", "sync_state", "sync_tombstones", "llm_response_cache"}
+
+# 동기화 채널로 보내는 테이블 → (모델, 엔티티 이름)
+SYNC_TABLES: Dict[str, tuple] = {
+    model.__tablename__: (model, entity) for model, (entity, _) in VERSIONED_MODELS.items()
+}
+
+SYNC_EVENT = "sync.changed"
+_PENDING_KEY = "change_log_pending"
+
+
+def _changed_columns(obj: Any) -> List[str]:
+    """수정된 컬럼 이름 (row_version은 기록의 version으로 저장하므로 제외)"""
+    state = inspect(obj)
+    return [
+        attr.key
+        for attr in state.mapper.column_attrs
+        if attr.key != "row_version" and state.attrs[attr.key].history.has_changes()
+    ]
+
+
+def _record_changes(session: Session, flush_context) -> None:
+    """flush된 객체의 변경 기록 (after_flush)"""
+    changes = []
+    for op, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            mapper = inspect(obj).mapper
+            table_name = mapper.persist_selectable.name
+            if table_name in EXCLUDED_TABLES:
+                continue
+            columns = None
+            if op == "update":
+                columns = _changed_columns(obj)
+                if not columns:
+                    continue  # 관계만 바뀌었거나 같은 값으로 덮어씀
+            changes.append({
+                "table_name": table_name,
+                "row_id": mapper.primary_key_from_instance(obj)[0],
+                "op": op,
+                "version": getattr(obj, "row_version", None),
+                "changed_columns": columns,
+            })
+
+    if not changes:
+        return
+
+    now = get_current_utc_datetime()
+    for change in changes:
+        change["created_at"] = now
+    session.connection().execute(ChangeLog.__table__.insert(), changes)
+    session.info[_PENDING_KEY] = True
+
+
+def _notify_after_commit(session: Session) -> None:
+    """커밋된 변경 기록이 있으면 동기화 채널 깨우기"""
+    if session.info.pop(_PENDING_KEY, False):
+        event_bus.publish(SYNC_EVENT, {})
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_flush", _record_changes)
+event.listen(Session, "after_commit", _notify_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
+
+
+def _merge_op(records: List[ChangeLog]) -> tuple:
+    """같은 행의 기록을 하나로 합친 (op, changed_columns)"""
+    ops = {record.op for record in records}
+    if records[-1].op == "delete":
+        return "delete", None
+    if "insert" in ops:
+        return "insert", None
+    columns = set()
+    for record in records:
+        if record.changed_columns is None:
+            return "update", None
+        columns.update(record.changed_columns)
+    return "update", sorted(columns)
+
+
+class ChangeLogService:
+    """변경 기록 조회·정리 서비스"""
+
+    @staticmethod
+    def get_last_seq(db: Session, table_names: Optional[Iterable[str]] = None) -> int:
+        """마지막 변경 순서 번호 (기록이 없으면 0)
+
+        table_names를 주면 그 테이블들의 마지막 변경만 봅니다.
+        값이 같으면 그 사이에 바뀐 것이 없으므로 캐시 키나 ETag로 쓸 수 있습니다.
+        """
+        query = db.query(func.max(ChangeLog.seq))
+        if table_names is not None:
+            query = query.filter(ChangeLog.table_name.in_(list(table_names)))
+        return query.scalar() or 0
+
+    @staticmethod
+    def get_first_seq(db: Session) -> int:
+        """남아 있는 가장 오래된 변경 순서 번호 (기록이 없으면 0)"""
+        return db.query(func.min(ChangeLog.seq)).scalar() or 0
+
+    @staticmethod
+    def get_changes_since(db: Session, since: int, limit: int = 100) -> List[Dict[str, Any]]:
+        """since 이후 동기화 대상 테이블의 변경 기록 (seq 순)
+
+        fields는 수정된 컬럼(생성은 전체 컬럼)의 현재 값입니다. 기록 이후 행이 다시 바뀌었다면
+        더 새로운 값이 오지만 그 변경의 기록도 뒤따르므로 클라이언트 결과는 같습니다.
+        삭제 기록이나 이미 삭제된 행은 fields가 None입니다.
+        """
+        records: List[ChangeLog] = (
+            db.query(ChangeLog)
+            .filter(ChangeLog.seq > since, ChangeLog.table_name.in_(list(SYNC_TABLES)))
+            .order_by(ChangeLog.seq)
+            .limit(limit)
+            .all()
+        )
+
+        # 현재 행은 테이블마다 한 번에 조회
+        ids_by_table: Dict[str, set] = defaultdict(set)
+        for record in records:
+            if record.op != "delete":
+                ids_by_table[record.table_name].add(record.row_id)
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for table_name, ids in ids_by_table.items():
+            model = SYNC_TABLES[table_name][0]
+            for row in db.query(model).filter(model.id.in_(ids)):
+                rows[(table_name, row.id)] = row_to_dict(row)
+
+        changes = []
+        for record in records:
+            values = rows.get((record.table_name, record.row_id)) if record.op != "delete" else None
+            fields = None
+            if values is not None:
+                fields = values if record.changed_columns is None else {
+                    key: values[key] for key in record.changed_columns if key in values
+                }
+            changes.append({
+                "seq": record.seq,
+                "entity": SYNC_TABLES[record.table_name][1],
+                "id": record.row_id,
+                "version": record.version,
+                "op": record.op,
+                "fields": fields,
+            })
+        return changes
+
+    @staticmethod
+    def compact(
+        db: Session,
+        now: Optional[datetime] = None,
+        compact_after_days: Optional[int] = None,
+        retention_days: Optional[int] = None
+    ) -> Dict[str, int]:
+        """오래된 변경 기록 압축 및 삭제
+
+        1. 보관 기간(CHANGE_LOG_RETENTION_DAYS)이 지난 기록을 지웁니다.
+           seq 기준점과 테이블별 마지막 seq가 뒤로 가지 않도록 테이블마다 가장 최근 기록 하나는 남깁니다.
+        2. 압축 기준(CHANGE_LOG_COMPACT_AFTER_DAYS)보다 오래된 기록은 행마다 마지막 기록 하나로 합칩니다.
+           삭제로 끝났으면 삭제, 중간에 생성이 있으면 생성, 아니면 수정된 컬럼을 모두 모은 수정이 됩니다.
+
+        지운 기록보다 앞선 seq로 접속한 동기화 클라이언트는 resync를 받습니다.
+
+        Returns:
+            {"expired": 삭제한 기록 수, "merged": 합쳐서 지운 기록 수}
+        """
+        now = now or get_current_utc_datetime()
+        if compact_after_days is None:
+            compact_after_days = settings.change_log_compact_after_days
+        if retention_days is None:
+            retention_days = settings.change_log_retention_days
+
+        # 테이블별 마지막 기록은 남김 (get_last_seq(db, table_names) 기반 ETag가 이전 값으로 돌아가지 않도록)
+        last_seqs = db.query(func.max(ChangeLog.seq)).group_by(ChangeLog.table_name).scalar_subquery()
+        expired = (
+            db.query(ChangeLog)
+            .filter(ChangeLog.created_at < now - timedelta(days=retention_days), ChangeLog.seq.notin_(last_seqs))
+            .delete(synchronize_session=False)
+        )
+
+        records: List[ChangeLog] = (
+            db.query(ChangeLog)
+            .filter(ChangeLog.created_at < now - timedelta(days=compact_after_days))
+            .order_by(ChangeLog.seq)
+            .all()
+        )
+        groups: Dict[tuple, List[ChangeLog]] = defaultdict(list)
+        for record in records:
+            groups[(record.table_name, record.row_id)].append(record)
+
+        merged_seqs = []
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            keep = group[-1]
+            keep.op, keep.changed_columns = _merge_op(group)
+            merged_seqs.extend(record.seq for record in group[:-1])
+
+        # SQLite 바인드 변수 수 제한을 넘지 않도록 나눠서 삭제
+        for start in range(0, len(merged_seqs), 500):
+            chunk = merged_seqs[start:start + 500]
+            db.query(ChangeLog).filter(ChangeLog.seq.in_(chunk)).delete(synchronize_session=False)
+        db.commit()
+        return {"expired": expired, "merged": len(merged_seqs)}
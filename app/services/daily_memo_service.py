@@ -10,9 +10,12 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.models.daily_memo import DailyMemo
-from app.core.timezone import get_current_utc_datetime
+from app.core.events import event_bus
+from app.core.timezone import get_current_utc_datetime, format_time_for_display
+from app.core.timing import timed_methods
 
 
+@timed_methods("service")
 class DailyMemoService:
     """일일 메모 서비스"""
 
@@ -46,9 +49,19 @@ class DailyMemoService:
         db.add(memo)
         db.commit()
         db.refresh(memo)
+        DailyMemoService._publish("memo.added", memo)
 
         return memo
 
+    @staticmethod
+    def _publish(event_type: str, memo: DailyMemo) -> None:
+        """메모 변경 이벤트 발행 (커밋 후 호출)"""
+        data = {"id": memo.id, "memo_date": memo.memo_date.isoformat()}
+        if event_type != "memo.deleted":
+            data["content"] = memo.content
+            data["created_time"] = format_time_for_display(memo.created_at)
+        event_bus.publish(event_type, data)
+
     @staticmethod
     def get_memos_by_date(db: Session, memo_date: date) -> List[DailyMemo]:
         """특정 날짜의 메모들 조회 (시간순 정렬)
@@ -109,6 +122,7 @@ class DailyMemoService:
         memo.updated_at = get_current_utc_datetime()
         db.commit()
         db.refresh(memo)
+        DailyMemoService._publish("memo.updated", memo)
 
         return memo
 
@@ -134,6 +148,7 @@ class DailyMemoService:
         # 메모 삭제
         db.delete(memo)
         db.commit()
+        DailyMemoService._publish("memo.deleted", memo)
 
         return True
 
@@ -1,13 +1,96 @@
 from datetime import date, datetime
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session, attributes, selectinload
+from sqlalchemy import desc, event, inspect, or_
 
 from app.models.daily_reflection import DailyReflection
+from app.models.reflection_todo_snapshot import ReflectionTodoSnapshot, STATE_COMPLETED, STATE_INCOMPLETE
 from app.models.todo import DailyTodo
 from app.core.timezone import get_current_date, get_current_utc_datetime
+from app.core.timing import timed_methods
 
+# 회고 통계·스냅샷에 들어가는 할일 컬럼 (설명, 메모 등이 바뀌면 재계산하지 않음)
+SNAPSHOT_TODO_COLUMNS = (
+    "title", "category", "is_completed", "completed_at",
+    "created_date", "scheduled_date", "estimated_minutes", "actual_minutes",
+)
+# 할일이 어느 날짜의 회고에 포함되는지 정하는 컬럼
+_DATE_COLUMNS = ("is_completed", "completed_at", "created_date", "scheduled_date")
 
+
+def _included_dates(values: Dict[str, Any]) -> Tuple[Optional[date], Optional[date]]:
+    """할일이 포함되는 회고 날짜 (미완료: 이 날짜 이후 모든 날, 완료: 완료한 날 하루)
+
+    create_reflection의 조회 조건과 같은 기준입니다.
+    """
+    if values["is_completed"]:
+        completed_at = values["completed_at"]
+        return None, completed_at.date() if completed_at else None
+    start = values["created_date"] or get_current_date()
+    scheduled = values["scheduled_date"]
+    if scheduled and scheduled > start:
+        start = scheduled
+    return start, None
+
+
+def _todo_values(state, op: str) -> List[Dict[str, Any]]:
+    """flush된 할일의 날짜 관련 값 (수정은 변경 전 값도 포함, 읽지 않은 값은 조회하지 않음)"""
+    current = {key: state.dict.get(key) for key in _DATE_COLUMNS}
+    if op != "update":
+        return [current]
+    previous = dict(current)
+    for key in _DATE_COLUMNS:
+        deleted = state.attrs[key].history.deleted
+        if deleted:
+            previous[key] = deleted[0]
+    return [current, previous]
+
+
+def _mark_reflections_dirty(session: Session, flush_context) -> None:
+    """할일 변경이 포함되는 날짜의 회고에 재계산 표시 (after_flush)"""
+    open_from: Optional[date] = None
+    days = set()
+    for op, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            if not isinstance(obj, DailyTodo):
+                continue
+            state = inspect(obj)
+            if op == "update" and not any(state.attrs[key].history.has_changes() for key in SNAPSHOT_TODO_COLUMNS):
+                continue
+            for values in _todo_values(state, op):
+                start, day = _included_dates(values)
+                if start is not None and (open_from is None or start < open_from):
+                    open_from = start
+                if day is not None:
+                    days.add(day)
+
+    if open_from is None and not days:
+        return
+
+    conditions = []
+    if open_from is not None:
+        conditions.append(DailyReflection.reflection_date >= open_from)
+    if days:
+        conditions.append(DailyReflection.reflection_date.in_(days))
+    session.connection().execute(
+        DailyReflection.__table__.update()
+        .where(DailyReflection.stats_dirty == False, or_(*conditions))  # noqa: E712
+        .values(stats_dirty=True)
+    )
+
+    # 이미 세션에 올라온 회고 객체에도 반영
+    for obj in list(session.identity_map.values()):
+        if not isinstance(obj, DailyReflection):
+            continue
+        reflection_date = inspect(obj).dict.get("reflection_date")
+        if reflection_date and ((open_from and reflection_date >= open_from) or reflection_date in days):
+            attributes.set_committed_value(obj, "stats_dirty", True)
+
+
+event.listen(Session, "after_flush", _mark_reflections_dirty)
+
+
+@timed_methods("service")
 class DailyReflectionService:
     """일일 회고 서비스"""
 
@@ -19,7 +102,28 @@ class DailyReflectionService:
         satisfaction_score: Optional[int] = None,
         energy_level: Optional[int] = None
     ) -> DailyReflection:
-        """일일 회고 생성"""
+        """일일 회고 생성
+
+        같은 날짜의 회고가 있고 그 뒤로 그날에 포함되는 할일이 바뀌지 않았으면(stats_dirty가 꺼짐)
+        할일 조회와 스냅샷 재생성 없이 바뀐 회고 필드만 UPDATE합니다.
+        반환하는 회고는 todo_snapshots가 로드된 상태입니다.
+        """
+        existing_reflection = DailyReflectionService.get_reflection_by_date(db, reflection_date)
+
+        if existing_reflection and not existing_reflection.stats_dirty:
+            changes = {
+                "reflection_text": reflection_text,
+                "satisfaction_score": satisfaction_score,
+                "energy_level": energy_level,
+            }
+            changed = {key: value for key, value in changes.items() if getattr(existing_reflection, key) != value}
+            if changed:
+                for key, value in changed.items():
+                    setattr(existing_reflection, key, value)
+                existing_reflection.updated_at = get_current_utc_datetime()
+                db.commit()
+                return DailyReflectionService.get_reflection_by_date(db, reflection_date)
+            return existing_reflection
 
         # 해당 날짜의 할 일 통계 계산
         # - 완료된 할일: 완료한 날짜 기준
@@ -51,49 +155,35 @@ class DailyReflectionService:
         completed_todos = len([t for t in todos if t.is_completed])
         completion_rate = (completed_todos / total_todos * 100) if total_todos > 0 else 0.0
 
-        # 할일 목록 스냅샷 생성
-        todos_snapshot = {
-            "completed": [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "category": t.category.value,
-                    "completed_at": t.completed_at.isoformat() if t.completed_at else None,
-                    "estimated_minutes": t.estimated_minutes,
-                    "actual_minutes": t.actual_minutes
-                }
-                for t in todos if t.is_completed
-            ],
-            "incomplete": [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "category": t.category.value,
-                    "estimated_minutes": t.estimated_minutes
-                }
-                for t in todos if not t.is_completed
-            ]
-        }
+        # 할일 목록 스냅샷 생성 (할일마다 한 행)
+        todo_snapshots = [
+            ReflectionTodoSnapshot(
+                todo_id=t.id,
+                state=STATE_COMPLETED if t.is_completed else STATE_INCOMPLETE,
+                title=t.title,
+                category=t.category.value if t.category else None,
+                completed_at=t.completed_at if t.is_completed else None,
+                estimated_minutes=t.estimated_minutes,
+                actual_minutes=t.actual_minutes if t.is_completed else None
+            )
+            for t in todos
+        ]
 
         # 기존 회고가 있으면 업데이트, 없으면 생성
-        existing_reflection = db.query(DailyReflection).filter(
-            DailyReflection.reflection_date == reflection_date
-        ).first()
-
         if existing_reflection:
             # 업데이트
             existing_reflection.reflection_text = reflection_text
             existing_reflection.total_todos = total_todos
             existing_reflection.completed_todos = completed_todos
             existing_reflection.completion_rate = completion_rate
-            existing_reflection.todos_snapshot = todos_snapshot
+            existing_reflection.todo_snapshots = todo_snapshots
             existing_reflection.satisfaction_score = satisfaction_score
             existing_reflection.energy_level = energy_level
+            existing_reflection.stats_dirty = False
             existing_reflection.updated_at = get_current_utc_datetime()
 
             db.commit()
-            db.refresh(existing_reflection)
-            return existing_reflection
+            return DailyReflectionService.get_reflection_by_date(db, reflection_date)
         else:
             # 새로 생성 (UTC 시간으로 저장)
             current_utc_time = get_current_utc_datetime()
@@ -103,21 +193,23 @@ class DailyReflectionService:
                 total_todos=total_todos,
                 completed_todos=completed_todos,
                 completion_rate=completion_rate,
-                todos_snapshot=todos_snapshot,
+                todo_snapshots=todo_snapshots,
                 satisfaction_score=satisfaction_score,
                 energy_level=energy_level,
+                stats_dirty=False,
                 created_at=current_utc_time
             )
 
             db.add(reflection)
             db.commit()
-            db.refresh(reflection)
-            return reflection
+            return DailyReflectionService.get_reflection_by_date(db, reflection_date)
 
     @staticmethod
     def get_reflection_by_date(db: Session, reflection_date: date) -> Optional[DailyReflection]:
-        """특정 날짜의 회고 조회"""
-        return db.query(DailyReflection).filter(
+        """특정 날짜의 회고 조회 (todos_snapshot을 읽으므로 스냅샷 행도 함께 로드)"""
+        return db.query(DailyReflection).options(
+            selectinload(DailyReflection.todo_snapshots)
+        ).filter(
             DailyReflection.reflection_date == reflection_date
         ).first()
 
@@ -141,12 +233,29 @@ class DailyReflectionService:
             DailyReflection.reflection_date <= end_date
         ).order_by(desc(DailyReflection.reflection_date)).all()
 
+    @staticmethod
+    def get_completed_todos_on_reflected_days(db: Session, start_date: date, end_date: date) -> List[dict]:
+        """기간 내 회고한 날 완료한 할일 (회고 시점 스냅샷 기준, 날짜 순)"""
+        rows = (
+            db.query(DailyReflection.reflection_date, ReflectionTodoSnapshot)
+            .join(ReflectionTodoSnapshot, ReflectionTodoSnapshot.reflection_id == DailyReflection.id)
+            .filter(
+                DailyReflection.reflection_date >= start_date,
+                DailyReflection.reflection_date <= end_date,
+                ReflectionTodoSnapshot.state == STATE_COMPLETED
+            )
+            .order_by(DailyReflection.reflection_date, ReflectionTodoSnapshot.id)
+            .all()
+        )
+        return [
+            {"reflection_date": reflection_date.isoformat(), **snapshot.to_dict()}
+            for reflection_date, snapshot in rows
+        ]
+
     @staticmethod
     def delete_reflection(db: Session, reflection_date: date) -> bool:
-        """회고 삭제"""
-        reflection = db.query(DailyReflection).filter(
-            DailyReflection.reflection_date == reflection_date
-        ).first()
+        """회고 삭제 (스냅샷 행은 cascade로 함께 삭제)"""
+        reflection = DailyReflectionService.get_reflection_by_date(db, reflection_date)
 
         if reflection:
             db.delete(reflection)
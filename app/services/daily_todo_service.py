@@ -1,14 +1,55 @@
 from datetime import date, datetime, timedelta
-from typing import List, Optional
-import json
+from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, case, or_, func
 
+from ..models.postpone_event import PostponeEvent
 from ..models.todo import DailyTodo, TodoCategory
+from ..core.events import event_bus
+from ..core.timing import timed_methods
 from ..core.timezone import get_current_date, get_current_utc_datetime
+from .upload_store_service import UploadStoreService
+
+
+def _today_condition(today: date):
+    """오늘 화면에 표시되는 할일 조건 (오늘 할일 + 오늘 완료 + 과거 미완료 이월 + 오늘로 미룬 할일)"""
+    return or_(
+        # 1. 오늘 생성된 할일 (단, scheduled_date가 미래가 아닌 경우만)
+        and_(
+            DailyTodo.created_date == today,
+            or_(
+                DailyTodo.scheduled_date == None,  # scheduled_date가 없는 경우
+                DailyTodo.scheduled_date <= today  # scheduled_date가 오늘 이전 또는 오늘인 경우
+            )
+        ),
+
+        # 2. 오늘 완료한 할일 (과거 생성된 것, 생성일이 오늘이 아닌 경우만)
+        and_(
+            DailyTodo.is_completed == True,
+            DailyTodo.created_date < today,
+            func.date(DailyTodo.completed_at) == today
+        ),
+
+        # 3. 과거 미완료 할일 (자동 이월)
+        and_(
+            DailyTodo.is_completed == False,
+            DailyTodo.created_date < today,
+            or_(
+                DailyTodo.scheduled_date == None,  # scheduled_date가 없는 경우
+                DailyTodo.scheduled_date <= today  # scheduled_date가 오늘 이전인 경우
+            )
+        ),
 
+        # 4. 오늘로 미룬 할일 (created_date는 과거지만 scheduled_date가 오늘인 경우)
+        and_(
+            DailyTodo.is_completed == False,
+            DailyTodo.scheduled_date == today
+        )
+    )
 
+
+@timed_methods("service")
 class DailyTodoService:
     """일상 Todo 관리 서비스"""
 
@@ -19,41 +60,8 @@ class DailyTodoService:
 
         query = (
             db.query(DailyTodo)
-            .filter(
-                or_(
-                    # 1. 오늘 생성된 할일 (단, scheduled_date가 미래가 아닌 경우만)
-                    and_(
-                        DailyTodo.created_date == today,
-                        or_(
-                            DailyTodo.scheduled_date == None,  # scheduled_date가 없는 경우
-                            DailyTodo.scheduled_date <= today  # scheduled_date가 오늘 이전 또는 오늘인 경우
-                        )
-                    ),
-
-                    # 2. 오늘 완료한 할일 (과거 생성된 것, 생성일이 오늘이 아닌 경우만)
-                    and_(
-                        DailyTodo.is_completed == True,
-                        DailyTodo.created_date < today,
-                        func.date(DailyTodo.completed_at) == today
-                    ),
-
-                    # 3. 과거 미완료 할일 (자동 이월)
-                    and_(
-                        DailyTodo.is_completed == False,
-                        DailyTodo.created_date < today,
-                        or_(
-                            DailyTodo.scheduled_date == None,  # scheduled_date가 없는 경우
-                            DailyTodo.scheduled_date <= today  # scheduled_date가 오늘 이전인 경우
-                        )
-                    ),
-
-                    # 4. 오늘로 미룬 할일 (created_date는 과거지만 scheduled_date가 오늘인 경우)
-                    and_(
-                        DailyTodo.is_completed == False,
-                        DailyTodo.scheduled_date == today
-                    )
-                )
-            )
+            .options(selectinload(DailyTodo.journey))  # 할일 항목에 여정 제목 표시
+            .filter(_today_condition(today))
             .order_by(
                 # 지연된 할일을 우선 표시 (created_date 오래된 순)
                 DailyTodo.created_date.asc(),
@@ -66,7 +74,7 @@ class DailyTodoService:
     @staticmethod
     def get_todo_by_id(db: Session, todo_id: int) -> Optional[DailyTodo]:
         """ID로 특정 할 일 조회"""
-        return db.query(DailyTodo).filter(DailyTodo.id == todo_id).first()
+        return db.query(DailyTodo).options(joinedload(DailyTodo.journey)).filter(DailyTodo.id == todo_id).first()
 
     @staticmethod
     def create_todo(
@@ -95,10 +103,17 @@ class DailyTodoService:
         db.add(todo)
         db.commit()
         db.refresh(todo)
+        DailyTodoService.publish_change(db, todo.id, "created")
         return todo
 
     @staticmethod
-    def toggle_complete(db: Session, todo_id: int, reflection: Optional[str] = None, image_path: Optional[str] = None) -> Optional[DailyTodo]:
+    def toggle_complete(
+        db: Session,
+        todo_id: int,
+        reflection: Optional[str] = None,
+        image_path: Optional[str] = None,
+        image_renditions: Optional[Dict[str, str]] = None
+    ) -> Optional[DailyTodo]:
         """할 일 완료/미완료 토글"""
         todo = db.query(DailyTodo).filter(DailyTodo.id == todo_id).first()
         if not todo:
@@ -106,39 +121,61 @@ class DailyTodoService:
 
         if todo.is_completed:
             todo.uncomplete()
-            # 완료 해제 시 회고와 이미지 초기화
+            # 완료 해제 시 회고와 이미지 초기화 (이미지 참조 해제)
+            UploadStoreService.release(db, todo.completion_image_path)
             todo.completion_reflection = None
             todo.completion_image_path = None
+            todo.completion_image_renditions = None
         else:
             todo.complete()
             if reflection:
                 todo.completion_reflection = reflection.strip()
             if image_path:
                 todo.completion_image_path = image_path
+                todo.completion_image_renditions = image_renditions
 
         db.commit()
         db.refresh(todo)
+        DailyTodoService.publish_change(db, todo.id, "completed" if todo.is_completed else "uncompleted")
         return todo
 
     @staticmethod
     def delete_todo(db: Session, todo_id: int) -> bool:
-        """할 일 삭제"""
-        todo = db.query(DailyTodo).filter(DailyTodo.id == todo_id).first()
+        """할 일 삭제 (미루기 기록은 cascade로 함께 삭제)"""
+        todo = (
+            db.query(DailyTodo)
+            .options(selectinload(DailyTodo.postpone_events))
+            .filter(DailyTodo.id == todo_id)
+            .first()
+        )
         if not todo:
             return False
 
+        # 완료 이미지 참조는 삭제 시 before_delete 이벤트에서 해제 (upload_store_service)
         db.delete(todo)
         db.commit()
+        DailyTodoService.publish_change(db, todo_id, "deleted")
         return True
 
+    @staticmethod
+    def publish_change(db: Session, todo_id: int, action: str) -> None:
+        """할일 변경 이벤트와 오늘 요약 이벤트 발행 (커밋 후 호출)
+
+        Args:
+            action: created, updated, completed, uncompleted, rescheduled, deleted
+        """
+        event_bus.publish("todo.changed", {"id": todo_id, "action": action})
+        event_bus.publish("summary.changed", DailyTodoService.get_today_summary(db))
+
     @staticmethod
     def get_today_summary(db: Session) -> dict:
         """오늘의 요약 정보 - 실제로 오늘 표시되는 할일들을 기준으로 계산"""
-        # get_today_todos와 동일한 로직으로 오늘 표시되는 할일들을 가져옴
-        today_todos = DailyTodoService.get_today_todos(db)
-
-        completed_count = len([t for t in today_todos if t.is_completed])
-        total_count = len(today_todos)
+        # get_today_todos와 같은 조건을 집계 쿼리 한 번으로 계산 (할일 변경마다 발행되므로 행을 읽지 않음)
+        total_count, completed_count = (
+            db.query(func.count(DailyTodo.id), func.count(case((DailyTodo.is_completed == True, 1))))
+            .filter(_today_condition(get_current_date()))
+            .one()
+        )
         pending_count = total_count - completed_count
 
         return {
@@ -219,6 +256,7 @@ class DailyTodoService:
 
         db.commit()
         db.refresh(todo)
+        DailyTodoService.publish_change(db, todo.id, "updated")
         return todo
 
     @staticmethod
@@ -262,6 +300,7 @@ class DailyTodoService:
 
         db.commit()
         db.refresh(todo)
+        DailyTodoService.publish_change(db, todo.id, "rescheduled")
         return todo
 
     @staticmethod
@@ -311,32 +350,22 @@ class DailyTodoService:
         # 현재 날짜 (미루기 이전 날짜)
         current_date = todo.scheduled_date or todo.created_date
 
-        # 미루기 히스토리 생성
-        postpone_record = {
-            "from_date": current_date.isoformat(),
-            "to_date": new_date.isoformat(),
-            "reason": reason,
-            "postponed_at": get_current_utc_datetime().isoformat()
-        }
-
-        # 기존 히스토리 로드
-        existing_history = []
-        if todo.postpone_history:
-            try:
-                existing_history = json.loads(todo.postpone_history)
-            except (json.JSONDecodeError, TypeError):
-                existing_history = []
-
-        # 새 히스토리 추가
-        existing_history.append(postpone_record)
+        # 미루기 기록 추가 (기존 기록을 읽지 않는 한 행 INSERT)
+        db.add(PostponeEvent(
+            todo_id=todo.id,
+            from_date=current_date,
+            to_date=new_date,
+            reason=reason,
+            postponed_at=get_current_utc_datetime()
+        ))
 
         # 업데이트
         todo.scheduled_date = new_date
         todo.postpone_count = (todo.postpone_count or 0) + 1
-        todo.postpone_history = json.dumps(existing_history, ensure_ascii=False)
 
         db.commit()
         db.refresh(todo)
+        DailyTodoService.publish_change(db, todo.id, "rescheduled")
         return todo
 
     @staticmethod
@@ -346,13 +375,12 @@ class DailyTodoService:
         if not todo:
             return None
 
-        # 히스토리 파싱
-        history = []
-        if todo.postpone_history:
-            try:
-                history = json.loads(todo.postpone_history)
-            except (json.JSONDecodeError, TypeError):
-                history = []
+        history = [
+            event.to_dict()
+            for event in db.query(PostponeEvent)
+            .filter(PostponeEvent.todo_id == todo_id)
+            .order_by(PostponeEvent.id)
+        ]
 
         # 원본 날짜 (첫 번째 생성 날짜)
         original_date = todo.created_date
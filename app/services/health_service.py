@@ -0,0 +1,171 @@
+"""
+헬스 체크 서비스 (/health/live, /health/ready)
+
+- 생존(live): 프로세스와 이벤트 루프가 응답하는지만 확인하며 외부 자원을 건드리지 않습니다.
+- 준비(ready): DB 연결(SQLite는 쓰기 잠금까지), Alembic 리비전이 head인지, 업로드 디렉터리 쓰기,
+  남은 디스크 공간, DB 연결 풀 포화도를 확인합니다. 각 검사는 스레드풀에서 제한 시간 안에 실행합니다.
+- 준비 결과는 settings.health_cache_ttl_seconds 동안 재사용하고 동시에 들어온 검사는 한 번만 실행하므로
+  프로브가 잦아도 DB·디스크에 부하를 더하지 않습니다.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import settings
+from .image_upload_service import UPLOAD_DIR
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+STATUS_OK = "ok"
+STATUS_FAIL = "fail"
+STATUS_SKIPPED = "skipped"
+
+# 마지막 준비 검사 결과 (monotonic 시각, 결과)
+_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_lock = asyncio.Lock()
+
+
+class HealthCheckError(Exception):
+    """준비 검사 실패 (메시지가 응답의 detail이 됨)"""
+
+
+@lru_cache(maxsize=1)
+def _migration_heads() -> Tuple[str, ...]:
+    """마이그레이션 스크립트의 head 리비전 (배포 중에는 바뀌지 않으므로 한 번만 읽음)"""
+    config = Config(str(ALEMBIC_INI))
+    return tuple(sorted(ScriptDirectory.from_config(config).get_heads()))
+
+
+def _database_directory(engine: Engine) -> Optional[Path]:
+    """SQLite 파일이 있는 디렉터리 (메모리 DB나 다른 DB면 None)"""
+    database = engine.url.database
+    if engine.dialect.name != "sqlite" or not database or database == ":memory:":
+        return None
+    return Path(database).resolve().parent
+
+
+class HealthService:
+    """헬스 체크 서비스"""
+
+    @staticmethod
+    def check_database(engine: Engine) -> Dict[str, Any]:
+        """DB 연결 확인 (SQLite는 제한 시간 안에 쓰기 잠금을 잡을 수 있는지까지 확인)"""
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+            if conn.dialect.name != "sqlite":
+                return {}
+            # 다른 연결이 쓰기 잠금을 오래 쥐고 있으면 "database is locked"로 실패
+            raw = conn.connection.driver_connection
+            busy_timeout = raw.execute("PRAGMA busy_timeout").fetchone()[0]
+            raw.execute(f"PRAGMA busy_timeout = {int(settings.health_check_timeout_seconds * 1000)}")
+            try:
+                raw.execute("BEGIN IMMEDIATE")
+                raw.execute("ROLLBACK")
+            finally:
+                raw.execute(f"PRAGMA busy_timeout = {busy_timeout}")
+        return {}
+
+    @staticmethod
+    def check_migrations(engine: Engine) -> Dict[str, Any]:
+        """DB 리비전이 마이그레이션 head와 같은지 확인"""
+        heads = _migration_heads()
+        with engine.connect() as conn:
+            current = tuple(sorted(MigrationContext.configure(conn).get_current_heads()))
+        if current != heads:
+            raise HealthCheckError(
+                f"마이그레이션이 최신이 아닙니다 (현재: {', '.join(current) or '없음'}, head: {', '.join(heads)})"
+            )
+        return {"revision": ", ".join(current)}
+
+    @staticmethod
+    def check_upload_dir() -> Dict[str, Any]:
+        """업로드 디렉터리에 파일을 만들 수 있는지 확인"""
+        UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, prefix=".health-"):
+            pass
+        return {"path": str(UPLOAD_DIR)}
+
+    @staticmethod
+    def check_disk_space(engine: Engine) -> Dict[str, Any]:
+        """DB와 업로드가 있는 디스크의 남은 공간 확인 (둘 중 적은 쪽 기준)"""
+        paths = [UPLOAD_DIR if UPLOAD_DIR.exists() else Path(".")]
+        database_dir = _database_directory(engine)
+        if database_dir is not None and database_dir.exists():
+            paths.append(database_dir)
+        free_mb = min(shutil.disk_usage(path).free for path in paths) // (1024 * 1024)
+        if free_mb < settings.health_min_free_disk_mb:
+            raise HealthCheckError(f"남은 디스크 공간 {free_mb}MB (최소 {settings.health_min_free_disk_mb}MB)")
+        return {"free_mb": free_mb}
+
+    @staticmethod
+    def check_pool(engine: Engine) -> Dict[str, Any]:
+        """DB 연결 풀 포화도 확인 (QueuePool이 아니면 건너뜀)"""
+        pool = engine.pool
+        if not all(hasattr(pool, name) for name in ("size", "checkedout")):
+            return {"status": STATUS_SKIPPED}
+        capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        checked_out = pool.checkedout()
+        saturation = round(checked_out / capacity, 2) if capacity else 0.0
+        if saturation >= settings.health_pool_saturation_ratio:
+            raise HealthCheckError(f"DB 연결 풀 포화 ({checked_out}/{capacity})")
+        return {"checked_out": checked_out, "capacity": capacity, "saturation": saturation}
+
+    @staticmethod
+    async def _run_check(check: Callable[..., Dict[str, Any]], *args: Any) -> Dict[str, Any]:
+        """검사 하나를 스레드풀에서 제한 시간 안에 실행"""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                run_in_threadpool(check, *args), timeout=settings.health_check_timeout_seconds
+            )
+            result = {"status": STATUS_OK, **result}
+        except asyncio.TimeoutError:
+            result = {"status": STATUS_FAIL, "detail": f"{settings.health_check_timeout_seconds}초 안에 응답하지 않음"}
+        except Exception as e:
+            result = {"status": STATUS_FAIL, "detail": str(e)}
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    @staticmethod
+    async def run_readiness_checks(engine: Engine) -> Dict[str, Any]:
+        """준비 검사 전체 실행 (캐시 없음)"""
+        checks = {
+            "database": await HealthService._run_check(HealthService.check_database, engine),
+            "migrations": await HealthService._run_check(HealthService.check_migrations, engine),
+            "upload_dir": await HealthService._run_check(HealthService.check_upload_dir),
+            "disk_space": await HealthService._run_check(HealthService.check_disk_space, engine),
+            "db_pool": await HealthService._run_check(HealthService.check_pool, engine),
+        }
+        ready = all(check["status"] != STATUS_FAIL for check in checks.values())
+        return {"status": "ready" if ready else "not_ready", "checks": checks}
+
+    @staticmethod
+    async def get_readiness(engine: Engine) -> Dict[str, Any]:
+        """준비 상태 (TTL 동안 마지막 결과 재사용)"""
+        global _cache
+        if _cache is not None and time.monotonic() - _cache[0] < settings.health_cache_ttl_seconds:
+            return _cache[1]
+        async with _lock:
+            # 잠금을 기다리는 동안 다른 프로브가 검사를 마쳤으면 그 결과 사용
+            if _cache is not None and time.monotonic() - _cache[0] < settings.health_cache_ttl_seconds:
+                return _cache[1]
+            result = await HealthService.run_readiness_checks(engine)
+            _cache = (time.monotonic(), result)
+            return result
+
+    @staticmethod
+    def reset_cache() -> None:
+        """캐시한 준비 결과 비우기 (테스트용)"""
+        global _cache
+        _cache = None
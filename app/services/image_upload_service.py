@@ -0,0 +1,193 @@
+"""
+완료 회고 이미지 업로드 처리
+
+- 업로드를 메모리에 모두 읽지 않고 청크 단위로 디스크에 기록하며 최대 크기를 넘으면 중단합니다.
+- 원본은 방향(Orientation)만 반영한 뒤 EXIF 등 메타데이터를 제거하고 다시 저장합니다.
+- 여러 너비의 WebP 렌디션을 워커 풀에서 생성하여 템플릿이 srcset으로 내보낼 수 있게 합니다.
+- 파일 이름은 업로드 내용의 SHA-256 해시이며, 이미 저장된 내용이면 변환 없이 참조만 추가합니다.
+"""
+
+import asyncio
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from fastapi import UploadFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+from sqlalchemy.orm import Session
+
+from ..core import metrics
+from ..core.config import settings
+from .upload_store_service import UploadStoreService
+
+ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+# 업로드 저장 위치와 웹 경로
+UPLOAD_DIR = Path("app/static/uploads/reflections")
+UPLOAD_URL_PREFIX = "/static/uploads/reflections"
+
+# 디스크에 기록할 청크 크기
+CHUNK_SIZE = 1024 * 1024
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 90
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+class ImageTooLargeError(ValueError):
+    """업로드 최대 크기 초과"""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """이미지 변환용 워커 풀 (Pillow 인코딩은 GIL을 놓으므로 스레드 풀 사용)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.image_worker_count,
+            thread_name_prefix="image-worker"
+        )
+    return _executor
+
+
+def _file_path(url_path: str) -> Path:
+    """웹 경로(/static/...)를 디스크 경로로 변환"""
+    return UPLOAD_DIR / Path(url_path).name
+
+
+def _files_exist(path: str, renditions: Optional[Dict[str, str]]) -> bool:
+    return all(_file_path(p).exists() for p in [path, *(renditions or {}).values()])
+
+
+def _process_image(
+    source: Path,
+    stem: str,
+    extension: str,
+    widths: Sequence[int]
+) -> Dict[str, Any]:
+    """원본 메타데이터 제거 후 저장하고 WebP 렌디션 생성 (워커 풀에서 실행)"""
+    try:
+        with Image.open(source) as opened:
+            opened.load()
+            image_format = opened.format
+            animated = getattr(opened, "is_animated", False)
+            # EXIF 방향 정보를 픽셀에 반영 (이후 메타데이터는 저장하지 않음)
+            image = ImageOps.exif_transpose(opened)
+    except (UnidentifiedImageError, OSError):
+        raise ValueError("이미지 파일을 읽을 수 없습니다")
+
+    original_name = f"{stem}{extension}"
+    original = UPLOAD_DIR / original_name
+    if animated:
+        # 애니메이션 이미지는 프레임 보존을 위해 원본 파일 그대로 사용
+        source.replace(original)
+    else:
+        options = {"quality": JPEG_QUALITY, "optimize": True} if image_format == "JPEG" else {}
+        image.save(original, format=image_format, **options)
+
+    # WebP 렌디션 (원본보다 큰 너비는 원본 너비로 맞춤)
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    renditions: Dict[str, str] = {}
+    for width in sorted(set(min(w, image.width) for w in widths)):
+        height = max(round(image.height * width / image.width), 1)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        name = f"{stem}_{width}w.webp"
+        resized.save(UPLOAD_DIR / name, format="WEBP", quality=WEBP_QUALITY, method=4)
+        renditions[str(width)] = f"{UPLOAD_URL_PREFIX}/{name}"
+
+    return {"path": f"{UPLOAD_URL_PREFIX}/{original_name}", "renditions": renditions}
+
+
+class ImageUploadService:
+    """완료 회고 이미지 업로드 서비스"""
+
+    @staticmethod
+    def validate_extension(filename: str) -> str:
+        """파일 확장자 검증
+
+        Raises:
+            ValueError: 지원하지 않는 형식인 경우
+        """
+        extension = Path(filename).suffix.lower()
+        if extension not in ALLOWED_EXTENSIONS:
+            raise ValueError("지원하지 않는 이미지 형식입니다. (jpg, png, gif, webp만 지원)")
+        return extension
+
+    @staticmethod
+    async def stream_to_disk(upload: UploadFile, destination: Path, max_bytes: int) -> Tuple[int, str]:
+        """업로드를 청크 단위로 디스크에 기록하고 (바이트 수, SHA-256 해시) 반환
+
+        Raises:
+            ImageTooLargeError: 최대 크기를 넘은 경우 (기록 중이던 파일은 삭제)
+        """
+        size = 0
+        digest = hashlib.sha256()
+        try:
+            with open(destination, "wb") as buffer:
+                while chunk := await upload.read(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise ImageTooLargeError(
+                            f"이미지 크기는 최대 {max_bytes // (1024 * 1024)}MB까지 업로드할 수 있습니다"
+                        )
+                    digest.update(chunk)
+                    buffer.write(chunk)
+        except BaseException:
+            destination.unlink(missing_ok=True)
+            raise
+        return size, digest.hexdigest()
+
+    @staticmethod
+    async def save_reflection_image(db: Session, upload: Optional[UploadFile]) -> Optional[Dict[str, Any]]:
+        """완료 회고 이미지 저장 후 업로드 저장소에 참조 추가
+
+        참조 추가는 flush만 하므로 할일 변경과 함께 커밋해야 합니다.
+
+        Returns:
+            업로드가 없으면 None, 있으면 {"path": 원본 웹 경로, "renditions": {너비: WebP 웹 경로}}
+
+        Raises:
+            ValueError: 지원하지 않는 형식이거나 이미지가 아닌 경우
+            ImageTooLargeError: 최대 크기를 넘은 경우
+        """
+        if not upload or not upload.filename:
+            return None
+
+        extension = ImageUploadService.validate_extension(upload.filename)
+        max_bytes = settings.upload_max_bytes
+        if upload.size is not None and upload.size > max_bytes:
+            raise ImageTooLargeError(
+                f"이미지 크기는 최대 {max_bytes // (1024 * 1024)}MB까지 업로드할 수 있습니다"
+            )
+
+        UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = UPLOAD_DIR / f".{uuid.uuid4()}.upload"
+
+        size, content_hash = await ImageUploadService.stream_to_disk(upload, temp_path, max_bytes)
+        try:
+            # 같은 내용이 이미 저장되어 있으면 변환 없이 참조만 추가
+            existing = UploadStoreService.get_by_hash(db, content_hash)
+            deduplicated = bool(existing and _files_exist(existing.path, existing.renditions))
+            if deduplicated:
+                image = {"path": existing.path, "renditions": existing.renditions}
+            else:
+                loop = asyncio.get_running_loop()
+                image = await loop.run_in_executor(
+                    _get_executor(),
+                    _process_image,
+                    temp_path,
+                    content_hash,
+                    extension,
+                    settings.image_rendition_widths
+                )
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        UploadStoreService.acquire(db, content_hash, image["path"], image["renditions"], size)
+        metrics.record_upload(size, deduplicated)
+        return image
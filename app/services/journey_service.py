@@ -4,16 +4,20 @@
 여정 관련 비즈니스 로직을 처리합니다.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import case, func, or_, select
 
 from ..models.journey import Journey, JourneyStatus
-from ..models.todo import Todo
+from ..models.journey_todo import journey_todos
+from ..models.todo import DailyTodo
 from ..schemas.journey import JourneyCreate, JourneyUpdate
 from ..core.timezone import get_current_utc_datetime
+from ..core.timing import timed_methods
+from . import upload_store_service  # noqa: F401  할일 삭제 시 이미지 참조 해제 이벤트 등록
 
 
+@timed_methods("service")
 class JourneyService:
     """여정 비즈니스 로직 서비스"""
 
@@ -90,10 +94,23 @@ class JourneyService:
         db.refresh(db_journey)
         return db_journey
 
+    @staticmethod
+    def get_journey_for_delete(db: Session, journey_id: int) -> Optional[Journey]:
+        """삭제할 여정 조회 (cascade로 함께 지울 할일과 미루기 기록을 미리 로드)"""
+        return (
+            db.query(Journey)
+            .options(
+                selectinload(Journey.todos),
+                selectinload(Journey.daily_todos).selectinload(DailyTodo.postpone_events),
+            )
+            .filter(Journey.id == journey_id)
+            .first()
+        )
+
     @staticmethod
     def delete_journey(db: Session, journey_id: int) -> bool:
         """여정 삭제"""
-        db_journey = JourneyService.get_journey_by_id(db, journey_id)
+        db_journey = JourneyService.get_journey_for_delete(db, journey_id)
         if not db_journey:
             return False
 
@@ -121,26 +138,12 @@ class JourneyService:
             if not journey:
                 raise ValueError(f"ID {journey_id}인 여정을 찾을 수 없습니다")
 
-            # 해당 여정의 전체 TODO 수와 완료된 TODO 수 조회
-            total_todos = (
-                db.query(func.count(Todo.id))
-                .filter(Todo.journey_id == journey_id)
-                .scalar()
-                or 0
-            )
+            # 해당 여정의 전체 TODO 수와 완료된 TODO 수 조회 (Todo, DailyTodo 통합)
+            total_todos, completed_todos = JourneyService.get_todo_counts(db, [journey_id]).get(journey_id, (0, 0))
 
             if total_todos == 0:
                 return 0.0
 
-            completed_todos = (
-                db.query(func.count(Todo.id))
-                .filter(
-                    and_(Todo.journey_id == journey_id, Todo.is_completed == True)
-                )
-                .scalar()
-                or 0
-            )
-
             return (completed_todos / total_todos) * 100.0
 
         except Exception as e:
@@ -173,10 +176,10 @@ class JourneyService:
 
     @staticmethod
     def get_journeys_with_todos(db: Session) -> List[Journey]:
-        """TODO를 포함한 여정 조회"""
+        """TODO를 포함한 여정 조회 (Todo, DailyTodo 목록을 여정 수와 관계없이 쿼리 2회로 로드)"""
         return (
             db.query(Journey)
-            .options(joinedload(Journey.todos))
+            .options(selectinload(Journey.todos), selectinload(Journey.daily_todos))
             .order_by(Journey.created_at.desc())
             .all()
         )
@@ -198,32 +201,18 @@ class JourneyService:
         if not journey:
             return {}
 
-        # TODO 통계 계산
-        todos_query = db.query(Todo).filter(Todo.journey_id == journey_id)
-
-        total_todos = todos_query.count()
-        completed_todos = todos_query.filter(Todo.is_completed == True).count()
+        # TODO 통계 계산 (Todo, DailyTodo 통합 뷰에서 한 번에 집계)
+        total_todos, completed_todos, estimated_time, actual_time = db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case((journey_todos.c.is_completed == True, 1), else_=0)), 0),
+                # 예상 시간 vs 실제 시간 (실제 시간은 완료된 할일만)
+                func.coalesce(func.sum(journey_todos.c.estimated_minutes), 0),
+                func.coalesce(func.sum(case((journey_todos.c.is_completed == True, journey_todos.c.actual_minutes))), 0),
+            ).where(journey_todos.c.journey_id == journey_id)
+        ).one()
         pending_todos = total_todos - completed_todos
 
-        # 예상 시간 vs 실제 시간
-        estimated_time = (
-            db.query(func.coalesce(func.sum(Todo.estimated_time), 0))
-            .filter(Todo.journey_id == journey_id)
-            .scalar()
-        )
-
-        actual_time = (
-            db.query(func.coalesce(func.sum(Todo.actual_time), 0))
-            .filter(
-                and_(
-                    Todo.journey_id == journey_id,
-                    Todo.is_completed == True,
-                    Todo.actual_time.isnot(None),
-                )
-            )
-            .scalar()
-        )
-
         return {
             "journey_id": journey_id,
             "total_todos": total_todos,
@@ -235,4 +224,88 @@ class JourneyService:
             "estimated_total_time": estimated_time,
             "actual_total_time": actual_time,
             "status": journey.status.value if journey.status else None,
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def get_todo_counts(
+        db: Session, journey_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, Tuple[int, int]]:
+        """여정별 할일 개수 (Todo, DailyTodo 통합, 쿼리 1회)
+
+        Args:
+            db: 데이터베이스 세션
+            journey_ids: 조회할 여정 ID 목록 (None이면 여정에 연결된 모든 할일)
+
+        Returns:
+            {여정 ID: (전체 개수, 완료 개수)} - 할일이 없는 여정은 포함되지 않음
+        """
+        query = (
+            select(
+                journey_todos.c.journey_id,
+                func.count(),
+                func.coalesce(func.sum(case((journey_todos.c.is_completed == True, 1), else_=0)), 0),
+            )
+            .where(journey_todos.c.journey_id.isnot(None))
+            .group_by(journey_todos.c.journey_id)
+        )
+        if journey_ids is not None:
+            query = query.where(journey_todos.c.journey_id.in_(list(journey_ids)))
+
+        return {journey_id: (total, completed) for journey_id, total, completed in db.execute(query)}
+
+    @staticmethod
+    def get_journey_todos(db: Session, journey_id: int) -> List[dict]:
+        """여정의 할일 목록 (Todo, DailyTodo 통합, 생성 순)
+
+        Returns:
+            [{"id", "source", "title", "description", "category", "is_completed",
+              "completed_at", "created_at", "estimated_minutes", "actual_minutes"}, ...]
+            (source는 "todo" 또는 "daily_todo", category는 카테고리 값 문자열)
+        """
+        rows = db.execute(
+            select(journey_todos)
+            .where(journey_todos.c.journey_id == journey_id)
+            .order_by(journey_todos.c.created_at, journey_todos.c.source, journey_todos.c.id)
+        ).mappings()
+
+        return [
+            {
+                "id": row["id"],
+                "source": row["source"],
+                "title": row["title"],
+                "description": row["description"],
+                "category": row["category"].value if row["category"] else None,
+                "is_completed": bool(row["is_completed"]),
+                "completed_at": row["completed_at"],
+                "created_at": row["created_at"],
+                "estimated_minutes": row["estimated_minutes"],
+                "actual_minutes": row["actual_minutes"],
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def search_todos(db: Session, keyword: str, limit: int = 5) -> List[dict]:
+        """제목·설명으로 할일 검색 (Todo, DailyTodo 통합, 여정 제목 포함)
+
+        Returns:
+            [{"id", "source", "title", "description", "is_completed", "journey_title"}, ...]
+            (여정이 없는 할일의 journey_title은 None)
+        """
+        pattern = f"%{keyword}%"
+        rows = db.execute(
+            select(
+                journey_todos.c.id,
+                journey_todos.c.source,
+                journey_todos.c.title,
+                journey_todos.c.description,
+                journey_todos.c.is_completed,
+                Journey.title.label("journey_title"),
+            )
+            .outerjoin(Journey, Journey.id == journey_todos.c.journey_id)
+            .where(or_(journey_todos.c.title.ilike(pattern), journey_todos.c.description.ilike(pattern)))
+            .order_by(journey_todos.c.created_at.desc(), journey_todos.c.id.desc())
+            .limit(limit)
+        ).mappings()
+
+        return [{**row, "is_completed": bool(row["is_completed"])} for row in rows]
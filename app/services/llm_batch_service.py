@@ -0,0 +1,175 @@
+"""
+LLM 블로그 글 일괄 생성 서비스
+
+기간 내의 회고들에 대해 블로그 글을 한 번에 생성합니다.
+- 회고, 할일, 메모를 BlogContextLoader로 기간 단위 일괄 조회하여 프롬프트를 만듭니다.
+- LLM 호출은 세마포어로 동시 실행 수를 제한합니다.
+- 429(Rate Limit) 응답을 받으면 모든 작업을 잠시 멈춘 뒤 재시도합니다.
+- 완료되는 순서대로 회고별 결과를 돌려줍니다.
+"""
+
+import asyncio
+from datetime import date
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy.orm import Session
+
+from .blog_context_loader import BlogContextLoader
+from .llm_blog_service import LLMBlogService, LLMProvider
+from .llm_provider_policy import ProviderCallPolicy, is_rate_limit_error
+
+# 한 번에 생성할 수 있는 최대 기간 (일)
+MAX_BATCH_DAYS = 62
+
+
+class RateLimitGate:
+    """429 응답 시 모든 작업을 함께 멈추게 하는 공유 게이트"""
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    def trip(self, delay: float) -> None:
+        """지금부터 delay초 동안 새 호출을 막음"""
+        loop = asyncio.get_running_loop()
+        self._resume_at = max(self._resume_at, loop.time() + delay)
+
+    async def wait(self) -> None:
+        """게이트가 열릴 때까지 대기"""
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = self._resume_at - loop.time()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+
+def get_retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """Retry-After 헤더가 있으면 사용하고, 없으면 지수 백오프"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after = headers.get("retry-after") if hasattr(headers, "get") else None
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return base_delay * (2 ** attempt)
+
+
+class LLMBatchService:
+    """LLM 블로그 글 일괄 생성 서비스"""
+
+    @staticmethod
+    def validate_date_range(start_date: date, end_date: date) -> None:
+        """일괄 생성 기간 검증
+
+        Raises:
+            ValueError: 종료일이 시작일보다 앞서거나 최대 기간을 넘는 경우
+        """
+        if end_date < start_date:
+            raise ValueError("종료 날짜는 시작 날짜 이후여야 합니다")
+        if (end_date - start_date).days + 1 > MAX_BATCH_DAYS:
+            raise ValueError(f"한 번에 최대 {MAX_BATCH_DAYS}일까지 생성할 수 있습니다")
+
+    @staticmethod
+    async def generate_batch(
+        db: Session,
+        start_date: date,
+        end_date: date,
+        provider: LLMProvider,
+        include_images: bool = True,
+        force_regenerate: bool = False,
+        max_concurrency: int = 3,
+        max_retries: int = 3,
+        base_retry_delay: float = 1.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """기간 내 회고들의 블로그 글을 동시에 생성하고 완료 순으로 결과 반환
+
+        Args:
+            db: 데이터베이스 세션
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            provider: LLM 제공업체
+            include_images: 이미지 포함 여부
+            force_regenerate: 이미 생성된 글도 다시 생성할지 여부
+            max_concurrency: 동시 LLM 호출 수
+            max_retries: 429 응답 시 최대 재시도 횟수
+            base_retry_delay: Retry-After가 없을 때 지수 백오프 기준 시간 (초)
+
+        Yields:
+            회고별 결과 (status: generated, cached, failed)
+
+        Raises:
+            ValueError: 기간이 잘못된 경우
+        """
+        LLMBatchService.validate_date_range(start_date, end_date)
+
+        contexts = BlogContextLoader.load_range(db, start_date, end_date)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        gate = RateLimitGate()
+        # 429는 공유 게이트로 함께 대기하고, 그 밖의 실패만 대체 제공업체로 전환
+        policy = ProviderCallPolicy.from_settings(fallback_on_rate_limit=False)
+
+        async def generate_one(context: Dict[str, Any]) -> Dict[str, Any]:
+            reflection = context["reflection"]
+            result = {
+                "reflection_id": reflection.id,
+                "reflection_date": reflection.reflection_date.isoformat(),
+            }
+
+            # 이미 생성된 글은 그대로 사용
+            if reflection.generated_blog_content and not force_regenerate:
+                return {**result, "status": "cached", "content": reflection.generated_blog_content}
+
+            # 한 회고의 실패가 스트림 전체를 끊지 않도록 실패 결과로 반환
+            try:
+                prompt, prompt_metadata = LLMBlogService.build_blog_prompt(
+                    reflection=reflection,
+                    completed_todos=context["completed_todos"],
+                    pending_todos=context["pending_todos"],
+                    daily_memos=context["daily_memos"],
+                    include_images=include_images
+                )
+            except Exception as e:
+                db.rollback()
+                return {**result, "status": "failed", "error": str(e), "retries": 0}
+
+            async with semaphore:
+                attempt = 0
+                while True:
+                    await gate.wait()
+                    try:
+                        content = await LLMBlogService.call_llm_api(
+                            provider=provider,
+                            prompt=prompt,
+                            db=db,
+                            policy=policy,
+                            use_cache=not force_regenerate
+                        )
+                        break
+                    except Exception as e:
+                        if is_rate_limit_error(e) and attempt < max_retries:
+                            gate.trip(get_retry_delay(e, attempt, base_retry_delay))
+                            attempt += 1
+                            continue
+                        return {**result, "status": "failed", "error": str(e), "retries": attempt}
+
+            # 조회해 둔 회고 객체에 바로 저장 (재조회 없음)
+            try:
+                BlogContextLoader.save_blog_content(db, reflection, content, prompt, prompt_metadata)
+            except Exception as e:
+                db.rollback()
+                return {**result, "status": "failed", "error": str(e), "retries": attempt}
+
+            return {**result, "status": "generated", "content": content, "retries": attempt}
+
+        tasks = [asyncio.ensure_future(generate_one(context)) for context in contexts]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # 클라이언트 연결이 끊기면 남은 호출 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -6,7 +6,7 @@ LLM 기반 블로그 글 생성 서비스
 """
 import os
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -16,6 +16,23 @@ from anthropic import AsyncAnthropic
 from ..models.daily_reflection import DailyReflection
 from ..models.todo import DailyTodo
 from ..models.daily_memo import DailyMemo
+from ..core import metrics
+from ..core.config import settings
+from .blog_context_loader import BlogContextLoader
+from .llm_cache_service import LLMCacheService
+from .llm_provider_policy import LLMProviderPolicy, ProviderCallPolicy
+from .prompt_builder import PromptBuilder, PromptSection, collapse_blank_lines
+
+
+# 블로그 글 생성 공통 설정
+BLOG_SYSTEM_PROMPT = "당신은 개인 블로그를 작성하는 전문 작가입니다. 일상적이고 친근한 톤으로 글을 작성하며, 개인의 성장과 경험을 중심으로 이야기를 풀어나갑니다."
+DEFAULT_TEMPERATURE = 0.7
+DEFAULT_MAX_TOKENS = 2000
+LLM_CALL_PARAMETERS = {
+    "system": BLOG_SYSTEM_PROMPT,
+    "temperature": DEFAULT_TEMPERATURE,
+    "max_tokens": DEFAULT_MAX_TOKENS,
+}
 
 
 class LLMProvider(Enum):
@@ -63,9 +80,35 @@ class LLMBlogService:
         additional_prompt: str = None
     ) -> str:
         """블로그 글 생성을 위한 프롬프트 생성"""
+        prompt, _ = LLMBlogService.build_blog_prompt(
+            reflection=reflection,
+            completed_todos=completed_todos,
+            pending_todos=pending_todos,
+            daily_memos=daily_memos,
+            include_images=include_images,
+            additional_prompt=additional_prompt
+        )
+        return prompt
+
+    @staticmethod
+    def build_blog_prompt(
+        reflection: DailyReflection,
+        completed_todos: List[DailyTodo],
+        pending_todos: List[DailyTodo],
+        daily_memos: List[DailyMemo] = None,
+        include_images: bool = False,
+        additional_prompt: str = None,
+        token_budget: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """토큰 예산에 맞춘 블로그 글 프롬프트와 토큰 추정 메타데이터 생성
+
+        회고 정보와 작성 지침은 항상 포함하고, 완료한 일 > 이미지 > 메모 > 미완료 일
+        순서로 남은 예산을 배정합니다. 예산을 넘는 항목은 생략 안내로 대체됩니다.
+        """
+        builder = PromptBuilder(token_budget or settings.llm_prompt_token_budget)
 
         # 기본 프롬프트 구조
-        prompt = f"""당신은 전문적인 블로거입니다. 아래 일일 회고 데이터를 바탕으로 매력적이고 읽기 좋은 블로그 글을 작성해주세요.
+        builder.add_text("header", f"""당신은 전문적인 블로거입니다. 아래 일일 회고 데이터를 바탕으로 매력적이고 읽기 좋은 블로그 글을 작성해주세요.
 
 ## 회고 정보
 - 날짜: {reflection.reflection_date.strftime('%Y년 %m월 %d일')}
@@ -73,60 +116,81 @@ class LLMBlogService:
 - 에너지: {reflection.energy_level}/5
 - 전체 완료율: {reflection.completion_rate:.1f}%
 
-## 전체 회고 내용
-{reflection.reflection_text}
-
-"""
+""")
+        builder.add_section(PromptSection(
+            "reflection_text",
+            heading="## 전체 회고 내용\n",
+            items=[reflection.reflection_text],
+            footer="\n\n",
+            required=True,
+            max_item_tokens=builder.token_budget // 3
+        ))
 
         # 완료된 할일 추가
-        if completed_todos:
-            prompt += "## 완료한 일들\n"
-            for todo in completed_todos:
-                prompt += f"- **{todo.title}**"
-                if todo.description:
-                    prompt += f": {todo.description}"
-                prompt += f" (카테고리: {todo.category.value})\n"
-
-                if todo.completion_reflection:
-                    prompt += f"  회고: {todo.completion_reflection}\n"
-
-                if include_images and todo.completion_image_path:
-                    prompt += f"  이미지: {todo.completion_image_path}\n"
-
-                prompt += "\n"
+        completed_items, completed_keys = [], []
+        for todo in completed_todos or []:
+            item = f"- **{todo.title}**"
+            if todo.description:
+                item += f": {todo.description}"
+            item += f" (카테고리: {todo.category.value})\n"
+            if todo.completion_reflection:
+                item += f"  회고: {todo.completion_reflection}\n"
+            if include_images and todo.completion_image_path:
+                item += f"  이미지: {todo.completion_image_path}\n"
+            completed_items.append(item + "\n")
+            completed_keys.append(f"{todo.title}|{todo.description or ''}|{todo.completion_reflection or ''}")
+        builder.add_section(PromptSection(
+            "completed_todos",
+            heading="## 완료한 일들\n",
+            items=completed_items,
+            dedup_keys=completed_keys,
+            priority=40
+        ))
 
         # 미완료 할일 추가
-        if pending_todos:
-            prompt += "## 미완료 할일들\n"
-            for todo in pending_todos:
-                prompt += f"- **{todo.title}**"
-                if todo.description:
-                    prompt += f": {todo.description}"
-                prompt += f" (카테고리: {todo.category.value})\n"
-            prompt += "\n"
-
-        # 하루 중 작성한 메모들 추가
-        if daily_memos:
-            prompt += "## 하루 중 작성한 메모들\n"
-            for memo in daily_memos:
-                time_str = memo.created_at.strftime('%H:%M') if memo.created_at else ""
-                prompt += f"- {memo.content}"
-                if time_str:
-                    prompt += f" ({time_str})"
-                prompt += "\n"
-            prompt += "\n"
+        pending_items, pending_keys = [], []
+        for todo in pending_todos or []:
+            item = f"- **{todo.title}**"
+            if todo.description:
+                item += f": {todo.description}"
+            pending_items.append(item + f" (카테고리: {todo.category.value})\n")
+            pending_keys.append(f"{todo.title}|{todo.description or ''}")
+        builder.add_section(PromptSection(
+            "pending_todos",
+            heading="## 미완료 할일들\n",
+            items=pending_items,
+            dedup_keys=pending_keys,
+            footer="\n",
+            priority=10
+        ))
+
+        # 하루 중 작성한 메모들 추가 (같은 내용의 메모는 한 번만)
+        memo_items = []
+        for memo in daily_memos or []:
+            time_str = memo.created_at.strftime('%H:%M') if memo.created_at else ""
+            memo_items.append(f"- {memo.content}" + (f" ({time_str})" if time_str else "") + "\n")
+        builder.add_section(PromptSection(
+            "daily_memos",
+            heading="## 하루 중 작성한 메모들\n",
+            items=memo_items,
+            dedup_keys=[memo.content for memo in daily_memos or []],
+            footer="\n",
+            priority=20
+        ))
 
         # 이미지 관련 지시사항
         if include_images:
-            image_todos = [todo for todo in completed_todos if todo.completion_image_path]
-            if image_todos:
-                prompt += "## 이미지가 포함된 할일들\n"
-                for todo in image_todos:
-                    prompt += f"- {todo.title}: {todo.completion_image_path}\n"
-                prompt += "\n블로그 글에 이미지를 적절한 위치에 배치해주세요.\n\n"
+            image_todos = [todo for todo in completed_todos or [] if todo.completion_image_path]
+            builder.add_section(PromptSection(
+                "images",
+                heading="## 이미지가 포함된 할일들\n",
+                items=[f"- {todo.title}: {todo.completion_image_path}\n" for todo in image_todos],
+                footer="\n블로그 글에 이미지를 적절한 위치에 배치해주세요.\n\n",
+                priority=30
+            ))
 
         # 블로그 글 작성 지시사항
-        prompt += """## 작성 지침
+        builder.add_text("guidelines", """## 작성 지침
 1. 마크다운 형식으로 작성해주세요
 2. 제목은 날짜와 함께 매력적으로 작성
 3. 개인적이고 진솔한 톤앤매너 사용
@@ -135,26 +199,92 @@ class LLMBlogService:
 6. 전체적으로 긍정적이고 성장 지향적인 메시지
 7. 적절한 이모지 사용으로 읽기 쉽게 작성
 
-"""
+""")
 
         # 추가 프롬프트가 있다면 추가
         if additional_prompt:
-            prompt += f"## 추가 요청사항\n{additional_prompt}\n\n"
+            builder.add_section(PromptSection(
+                "additional_prompt",
+                heading="## 추가 요청사항\n",
+                items=[additional_prompt],
+                footer="\n\n",
+                required=True
+            ))
 
-        prompt += "이제 위 정보를 바탕으로 블로그 글을 작성해주세요:"
+        builder.add_text("closing", "이제 위 정보를 바탕으로 블로그 글을 작성해주세요:")
 
-        return prompt
+        return builder.build()
+
+    @staticmethod
+    def has_api_key(provider: LLMProvider) -> bool:
+        """API 키가 설정된 제공업체인지 확인"""
+        try:
+            return bool(LLMBlogService.get_api_key(provider))
+        except ValueError:
+            return False
 
     @staticmethod
     async def call_llm_api(
         provider: LLMProvider,
-        prompt: str
+        prompt: str,
+        db: Optional[Session] = None,
+        policy: Optional[ProviderCallPolicy] = None,
+        use_cache: bool = True
     ) -> str:
-        """LLM API 호출 (환경변수에서 API 키 자동 로딩)"""
-        # 환경변수에서 API 키 가져오기
-        api_key = LLMBlogService.get_api_key(provider)
+        """LLM API 호출 (환경변수에서 API 키 자동 로딩)
+
+        db 세션이 주어지면 프롬프트 해시 기반 응답 캐시를 먼저 확인하고,
+        캐시 미적중 시 API 응답과 토큰 사용량을 캐시에 저장합니다.
+        use_cache=False(재생성)면 캐시를 확인하지 않고 새로 호출한 응답으로 캐시를 갱신합니다.
+        호출은 마감 시간/페일오버/헤징 정책(LLMProviderPolicy)에 따라 이뤄지며,
+        API 키가 설정된 다른 제공업체가 대체 제공업체로 사용됩니다.
+        """
+        # 주 제공업체 API 키는 필수
+        LLMBlogService.get_api_key(provider)
+
+        # 캐시 확인 (조회와 저장 모두 주 제공업체 기준 해시)
+        prompt_hash = LLMBlogService._make_prompt_hash(provider, prompt)
+        if db is not None and use_cache:
+            cached = LLMCacheService.get(db, prompt_hash)
+            if cached:
+                return cached.response
+
+        providers = [provider] + [
+            other for other in LLMProvider
+            if other != provider and LLMBlogService.has_api_key(other)
+        ]
+
+        async def call(target: LLMProvider) -> Dict[str, Any]:
+            return await LLMBlogService._call_provider_api(target, prompt)
+
+        used_provider, result = await LLMProviderPolicy.execute(providers, call, policy)
+        metrics.record_llm_tokens(used_provider.value, result["prompt_tokens"], result["completion_tokens"])
+
+        # 캐시 저장 (대체 제공업체가 응답했어도 다음 조회에서 적중하도록 주 제공업체 해시로 저장,
+        # provider/model에는 실제로 응답한 제공업체를 기록)
+        if db is not None:
+            LLMCacheService.put(
+                db,
+                prompt_hash=prompt_hash,
+                provider=used_provider.value,
+                model=LLMBlogService.get_optimal_model(used_provider),
+                response=result["content"],
+                parameters=LLM_CALL_PARAMETERS,
+                prompt_tokens=result["prompt_tokens"],
+                completion_tokens=result["completion_tokens"],
+            )
+
+        return result["content"]
 
-        # 최적의 모델 자동 선택
+    @staticmethod
+    def _make_prompt_hash(provider: LLMProvider, prompt: str) -> str:
+        model = LLMBlogService.get_optimal_model(provider)
+        return LLMCacheService.make_prompt_hash(provider.value, model, prompt, LLM_CALL_PARAMETERS)
+
+    @staticmethod
+    async def _call_provider_api(provider: LLMProvider, prompt: str) -> Dict[str, Any]:
+        """제공업체 한 곳의 API 호출"""
+        api_key = LLMBlogService.get_api_key(provider)
         model = LLMBlogService.get_optimal_model(provider)
 
         if provider == LLMProvider.OPENAI:
@@ -165,40 +295,45 @@ class LLMBlogService:
             raise ValueError(f"지원하지 않는 LLM 제공업체: {provider}")
 
     @staticmethod
-    async def _call_openai_api(prompt: str, api_key: str, model: str) -> str:
-        """OpenAI API 호출"""
+    async def _call_openai_api(prompt: str, api_key: str, model: str) -> Dict[str, Any]:
+        """OpenAI API 호출 (응답 내용과 토큰 사용량 반환)"""
 
-        client = AsyncOpenAI(api_key=api_key)
+        client = AsyncOpenAI(api_key=api_key, base_url=settings.openai_base_url)
 
         response = await client.chat.completions.create(
             model=model,
             messages=[
                 {
                     "role": "system",
-                    "content": "당신은 개인 블로그를 작성하는 전문 작가입니다. 일상적이고 친근한 톤으로 글을 작성하며, 개인의 성장과 경험을 중심으로 이야기를 풀어나갑니다."
+                    "content": BLOG_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            temperature=0.7,
-            max_tokens=2000
+            temperature=DEFAULT_TEMPERATURE,
+            max_tokens=DEFAULT_MAX_TOKENS
         )
 
-        return response.choices[0].message.content
+        usage = response.usage
+        return {
+            "content": response.choices[0].message.content,
+            "prompt_tokens": usage.prompt_tokens if usage else 0,
+            "completion_tokens": usage.completion_tokens if usage else 0,
+        }
 
     @staticmethod
-    async def _call_claude_api(prompt: str, api_key: str, model: str) -> str:
-        """Claude API 호출"""
+    async def _call_claude_api(prompt: str, api_key: str, model: str) -> Dict[str, Any]:
+        """Claude API 호출 (응답 내용과 토큰 사용량 반환)"""
 
-        client = AsyncAnthropic(api_key=api_key)
+        client = AsyncAnthropic(api_key=api_key, base_url=settings.claude_base_url)
 
         response = await client.messages.create(
             model=model,
-            max_tokens=2000,
-            temperature=0.7,
-            system="당신은 개인 블로그를 작성하는 전문 작가입니다. 일상적이고 친근한 톤으로 글을 작성하며, 개인의 성장과 경험을 중심으로 이야기를 풀어나갑니다.",
+            max_tokens=DEFAULT_MAX_TOKENS,
+            temperature=DEFAULT_TEMPERATURE,
+            system=BLOG_SYSTEM_PROMPT,
             messages=[
                 {
                     "role": "user",
@@ -207,7 +342,12 @@ class LLMBlogService:
             ]
         )
 
-        return response.content[0].text
+        usage = response.usage
+        return {
+            "content": response.content[0].text,
+            "prompt_tokens": usage.input_tokens if usage else 0,
+            "completion_tokens": usage.output_tokens if usage else 0,
+        }
 
     @staticmethod
     async def generate_blog_content(
@@ -221,56 +361,25 @@ class LLMBlogService:
         """블로그 콘텐츠 생성 메인 함수"""
 
         # 회고 데이터 조회
-        reflection = db.query(DailyReflection).filter(
-            DailyReflection.id == reflection_id
-        ).first()
-
-        if not reflection:
-            raise ValueError(f"회고를 찾을 수 없습니다: ID {reflection_id}")
+        reflection = BlogContextLoader.get_reflection(db, reflection_id)
 
         # 캐시된 콘텐츠 확인 (재생성 강제가 아닌 경우)
-        if not force_regenerate:
-            cached_content = LLMBlogService.get_cached_blog_content(reflection_id, db)
-            if cached_content:
-                return {
-                    "content": cached_content["content"],
-                    "is_cached": True,
-                    "generated_at": cached_content["generated_at"]
-                }
-
-        # 관련 할일 데이터 조회
-        from sqlalchemy import and_, or_, func
-
-        reflection_date = reflection.reflection_date
-
-        todos = db.query(DailyTodo).filter(
-            or_(
-                # 완료된 할일: 완료한 날짜가 회고 날짜와 같음
-                and_(
-                    DailyTodo.is_completed == True,
-                    func.date(DailyTodo.completed_at) == reflection_date
-                ),
-                # 미완료 할일: 예정된 날짜가 회고 날짜와 같음
-                and_(
-                    DailyTodo.is_completed == False,
-                    DailyTodo.scheduled_date == reflection_date
-                )
-            )
-        ).all()
-
-        completed_todos = [todo for todo in todos if todo.is_completed]
-        pending_todos = [todo for todo in todos if not todo.is_completed]
-
-        # 해당 날짜의 메모들 조회
-        from ..services.daily_memo_service import DailyMemoService
-        daily_memos = DailyMemoService.get_memos_by_date(db, reflection_date)
-
-        # 프롬프트 생성
-        prompt = LLMBlogService.generate_blog_prompt(
+        if not force_regenerate and reflection.generated_blog_content:
+            return {
+                "content": reflection.generated_blog_content,
+                "is_cached": True,
+                "generated_at": reflection.blog_generated_at
+            }
+
+        # 관련 할일과 메모 일괄 조회
+        context = BlogContextLoader.load_for_reflection(db, reflection)
+
+        # 토큰 예산에 맞춘 프롬프트 생성
+        prompt, prompt_metadata = LLMBlogService.build_blog_prompt(
             reflection=reflection,
-            completed_todos=completed_todos,
-            pending_todos=pending_todos,
-            daily_memos=daily_memos,
+            completed_todos=context["completed_todos"],
+            pending_todos=context["pending_todos"],
+            daily_memos=context["daily_memos"],
             include_images=include_images,
             additional_prompt=additional_prompt
         )
@@ -278,17 +387,14 @@ class LLMBlogService:
         # LLM API 호출
         blog_content = await LLMBlogService.call_llm_api(
             provider=provider,
-            prompt=prompt
-        )
-
-        # DB에 저장
-        LLMBlogService.save_blog_content_to_db(
-            reflection_id=reflection_id,
-            content=blog_content,
             prompt=prompt,
-            db=db
+            db=db,
+            use_cache=not force_regenerate  # 재생성은 캐시된 응답 대신 새 초안
         )
 
+        # 조회해 둔 회고에 바로 저장
+        BlogContextLoader.save_blog_content(db, reflection, blog_content, prompt, prompt_metadata)
+
         return {
             "content": blog_content,
             "is_cached": False,
@@ -308,7 +414,8 @@ class LLMBlogService:
         return {
             "content": reflection.generated_blog_content,
             "generated_at": reflection.blog_generated_at,
-            "prompt": reflection.blog_generation_prompt
+            "prompt": reflection.blog_generation_prompt,
+            "prompt_metadata": reflection.blog_prompt_metadata
         }
 
     @staticmethod
@@ -316,21 +423,12 @@ class LLMBlogService:
         reflection_id: int,
         content: str,
         prompt: str,
-        db: Session
+        db: Session,
+        prompt_metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """블로그 콘텐츠를 데이터베이스에 저장"""
-        reflection = db.query(DailyReflection).filter(
-            DailyReflection.id == reflection_id
-        ).first()
-
-        if not reflection:
-            raise ValueError(f"회고를 찾을 수 없습니다: ID {reflection_id}")
-
-        reflection.generated_blog_content = content
-        reflection.blog_generation_prompt = prompt
-        reflection.blog_generated_at = datetime.now()
-
-        db.commit()
+        reflection = BlogContextLoader.get_reflection(db, reflection_id)
+        BlogContextLoader.save_blog_content(db, reflection, content, prompt, prompt_metadata)
 
     @staticmethod
     def update_blog_content(
@@ -360,15 +458,42 @@ class LLMBlogService:
         reflection: DailyReflection
     ) -> str:
         """블로그 글 개선을 위한 프롬프트 생성"""
-        prompt = f"""당신은 전문적인 블로거입니다. 아래 기존 블로그 글을 사용자의 요청에 따라 개선해주세요.
-
-## 기존 블로그 글
-{current_content}
-
-## 사용자 수정 요청
-{refinement_request}
+        prompt, _ = LLMBlogService.build_refinement_prompt(
+            current_content=current_content,
+            refinement_request=refinement_request,
+            reflection=reflection
+        )
+        return prompt
 
-## 원본 회고 정보 (참고용)
+    @staticmethod
+    def build_refinement_prompt(
+        current_content: str,
+        refinement_request: str,
+        reflection: DailyReflection,
+        token_budget: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """블로그 글 개선 프롬프트와 토큰 추정 메타데이터 생성
+
+        기존 글은 수정 대상이므로 자르지 않고 연속된 빈 줄만 정리합니다.
+        """
+        builder = PromptBuilder(token_budget or settings.llm_prompt_token_budget)
+
+        builder.add_text("header", "당신은 전문적인 블로거입니다. 아래 기존 블로그 글을 사용자의 요청에 따라 개선해주세요.\n\n")
+        builder.add_section(PromptSection(
+            "current_content",
+            heading="## 기존 블로그 글\n",
+            items=[collapse_blank_lines(current_content)],
+            footer="\n\n",
+            required=True
+        ))
+        builder.add_section(PromptSection(
+            "refinement_request",
+            heading="## 사용자 수정 요청\n",
+            items=[refinement_request],
+            footer="\n\n",
+            required=True
+        ))
+        builder.add_text("reflection_info", f"""## 원본 회고 정보 (참고용)
 - 날짜: {reflection.reflection_date.strftime('%Y년 %m월 %d일')}
 - 만족도: {reflection.satisfaction_score}/5
 - 에너지: {reflection.energy_level}/5
@@ -381,9 +506,9 @@ class LLMBlogService:
 4. 적절한 이모지 사용
 5. 개인적이고 진솔한 톤앤매너 유지
 
-사용자 요청을 반영하여 개선된 블로그 글을 작성해주세요:"""
+사용자 요청을 반영하여 개선된 블로그 글을 작성해주세요:""")
 
-        return prompt
+        return builder.build()
 
     @staticmethod
     async def refine_blog_content(
@@ -395,12 +520,7 @@ class LLMBlogService:
     ) -> Dict[str, Any]:
         """기존 블로그 글을 개선"""
         # 회고 및 기존 블로그 글 조회
-        reflection = db.query(DailyReflection).filter(
-            DailyReflection.id == reflection_id
-        ).first()
-
-        if not reflection:
-            raise ValueError(f"회고를 찾을 수 없습니다: ID {reflection_id}")
+        reflection = BlogContextLoader.get_reflection(db, reflection_id)
 
         if not reflection.generated_blog_content:
             raise ValueError("개선할 블로그 글이 없습니다. 먼저 생성해주세요.")
@@ -408,7 +528,7 @@ class LLMBlogService:
         current_content = reflection.generated_blog_content
 
         # 개선 프롬프트 생성
-        prompt = LLMBlogService.generate_refinement_prompt(
+        prompt, prompt_metadata = LLMBlogService.build_refinement_prompt(
             current_content=current_content,
             refinement_request=refinement_request,
             reflection=reflection
@@ -417,17 +537,13 @@ class LLMBlogService:
         # LLM API 호출
         refined_content = await LLMBlogService.call_llm_api(
             provider=provider,
-            prompt=prompt
-        )
-
-        # DB에 저장
-        LLMBlogService.save_blog_content_to_db(
-            reflection_id=reflection_id,
-            content=refined_content,
             prompt=prompt,
             db=db
         )
 
+        # 조회해 둔 회고에 바로 저장
+        BlogContextLoader.save_blog_content(db, reflection, refined_content, prompt, prompt_metadata)
+
         return {
             "content": refined_content,
             "is_cached": False,
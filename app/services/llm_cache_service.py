@@ -0,0 +1,214 @@
+"""
+LLM 응답 캐시 서비스
+
+프롬프트 내용과 호출 파라미터를 해시한 키로 LLM 응답을 조회/저장합니다.
+- TTL이 지난 항목은 조회되지 않고 저장 시 정리됩니다.
+- 최대 개수를 초과하면 가장 오래 사용되지 않은 항목부터 제거합니다 (LRU).
+- 적중률과 절약한 토큰 수를 메트릭으로 제공합니다.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.timezone import get_current_utc_datetime
+from app.models.llm_response_cache import LLMResponseCache
+
+
+class LLMCacheService:
+    """LLM 응답 캐시 서비스"""
+
+    # 프로세스 시작 이후의 캐시 메트릭
+    _stats: Dict[str, int] = {"hits": 0, "misses": 0, "saved_tokens": 0}
+
+    @staticmethod
+    def make_prompt_hash(
+        provider: str,
+        model: str,
+        prompt: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """제공업체, 모델, 파라미터, 프롬프트로 캐시 키 생성
+
+        Args:
+            provider: LLM 제공업체 값 (openai, claude)
+            model: 모델 이름
+            prompt: 사용자 프롬프트
+            parameters: 호출 파라미터 (system 프롬프트, temperature 등)
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "parameters": parameters or {},
+                "prompt": prompt,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get(db: Session, prompt_hash: str) -> Optional[LLMResponseCache]:
+        """캐시 조회 (만료되지 않은 항목만)
+
+        적중 시 접근 시간과 적중 횟수를 갱신합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            prompt_hash: 캐시 키
+
+        Returns:
+            캐시 항목 또는 None
+        """
+        now = get_current_utc_datetime()
+        entry = db.query(LLMResponseCache).filter(
+            LLMResponseCache.prompt_hash == prompt_hash,
+            LLMResponseCache.expires_at > now
+        ).first()
+
+        if not entry:
+            LLMCacheService._stats["misses"] += 1
+            return None
+
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_accessed_at = now
+        db.commit()
+
+        LLMCacheService._stats["hits"] += 1
+        LLMCacheService._stats["saved_tokens"] += entry.total_tokens
+        return entry
+
+    @staticmethod
+    def put(
+        db: Session,
+        prompt_hash: str,
+        provider: str,
+        model: str,
+        response: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0
+    ) -> LLMResponseCache:
+        """캐시 저장 (같은 키가 있으면 덮어쓰기)
+
+        저장 후 만료 항목을 정리하고 최대 개수를 넘는 항목을 LRU 순으로 제거합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            prompt_hash: 캐시 키
+            provider: LLM 제공업체 값
+            model: 모델 이름
+            response: LLM 응답 내용
+            parameters: 호출 파라미터
+            prompt_tokens: 프롬프트 토큰 수
+            completion_tokens: 응답 토큰 수
+
+        Returns:
+            저장된 캐시 항목
+        """
+        now = get_current_utc_datetime()
+        expires_at = now + timedelta(seconds=settings.llm_cache_ttl_seconds)
+
+        entry = db.query(LLMResponseCache).filter(
+            LLMResponseCache.prompt_hash == prompt_hash
+        ).first()
+
+        if entry:
+            entry.response = response
+            entry.parameters = parameters
+            entry.prompt_tokens = prompt_tokens
+            entry.completion_tokens = completion_tokens
+            entry.last_accessed_at = now
+            entry.expires_at = expires_at
+        else:
+            entry = LLMResponseCache(
+                prompt_hash=prompt_hash,
+                provider=provider,
+                model=model,
+                parameters=parameters,
+                response=response,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                hit_count=0,
+                created_at=now,
+                last_accessed_at=now,
+                expires_at=expires_at,
+            )
+            db.add(entry)
+
+        db.flush()
+        LLMCacheService.evict(db)
+        db.commit()
+        db.refresh(entry)
+        return entry
+
+    @staticmethod
+    def evict(db: Session, max_entries: Optional[int] = None) -> int:
+        """만료 항목 및 최대 개수 초과 항목 제거
+
+        Args:
+            db: 데이터베이스 세션
+            max_entries: 최대 보관 개수 (기본값: 설정값)
+
+        Returns:
+            제거된 항목 수
+        """
+        if max_entries is None:
+            max_entries = settings.llm_cache_max_entries
+
+        now = get_current_utc_datetime()
+        removed = db.query(LLMResponseCache).filter(
+            LLMResponseCache.expires_at <= now
+        ).delete(synchronize_session=False)
+
+        total = db.query(func.count(LLMResponseCache.id)).scalar() or 0
+        overflow = total - max_entries
+        if overflow > 0:
+            # 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+            stale_ids = [
+                row.id for row in
+                db.query(LLMResponseCache.id)
+                .order_by(LLMResponseCache.last_accessed_at.asc(), LLMResponseCache.id.asc())
+                .limit(overflow)
+                .all()
+            ]
+            removed += db.query(LLMResponseCache).filter(
+                LLMResponseCache.id.in_(stale_ids)
+            ).delete(synchronize_session=False)
+
+        return removed
+
+    @staticmethod
+    def get_stats(db: Session) -> Dict[str, Any]:
+        """캐시 메트릭 조회
+
+        Returns:
+            항목 수, 적중/미적중 횟수, 적중률, 절약한 토큰 수
+        """
+        stats = LLMCacheService._stats
+        lookups = stats["hits"] + stats["misses"]
+        entries = db.query(func.count(LLMResponseCache.id)).scalar() or 0
+
+        return {
+            "entries": entries,
+            "max_entries": settings.llm_cache_max_entries,
+            "ttl_seconds": settings.llm_cache_ttl_seconds,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / lookups * 100, 1) if lookups > 0 else 0.0,
+            "saved_tokens": stats["saved_tokens"],
+        }
+
+    @staticmethod
+    def reset_stats() -> None:
+        """캐시 메트릭 초기화"""
+        LLMCacheService._stats.update({"hits": 0, "misses": 0, "saved_tokens": 0})
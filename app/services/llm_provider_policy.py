@@ -0,0 +1,200 @@
+"""
+LLM 제공업체 호출 정책 (마감 시간, 페일오버, 헤징)
+
+- 제공업체 호출마다 마감 시간(deadline)을 두고, 넘으면 실패로 처리합니다.
+- 주 제공업체가 실패하면 다른 제공업체(OpenAI ↔ Claude)로 자동 전환합니다.
+- 헤징을 켜면 주 제공업체 응답이 지연 백분위수보다 늦어질 때 다른 제공업체를
+  동시에 호출하고, 먼저 성공한 응답을 사용한 뒤 나머지 호출은 취소합니다.
+- 제공업체별 지연 시간 히스토그램을 유지하여 헤징 시점을 결정합니다.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from ..core.metrics import LatencyHistogram
+
+# 지연 시간 히스토그램 버킷 경계 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 45, 60, 90, 120)
+
+
+class ProviderCallPolicy:
+    """제공업체 호출 정책"""
+
+    def __init__(
+        self,
+        deadline_seconds: float,
+        fallback_enabled: bool = True,
+        hedge_enabled: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        fallback_on_rate_limit: bool = True
+    ) -> None:
+        self.deadline_seconds = deadline_seconds
+        self.fallback_enabled = fallback_enabled
+        # False면 429 응답은 대체 제공업체로 넘기지 않고 호출한 쪽(일괄 생성 등)에 그대로 전달
+        self.fallback_on_rate_limit = fallback_on_rate_limit
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "ProviderCallPolicy":
+        options = {
+            "deadline_seconds": settings.llm_call_deadline_seconds,
+            "fallback_enabled": settings.llm_fallback_enabled,
+            "hedge_enabled": settings.llm_hedge_enabled,
+            "hedge_percentile": settings.llm_hedge_percentile,
+            "hedge_min_samples": settings.llm_hedge_min_samples,
+        }
+        options.update(overrides)
+        return cls(**options)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """OpenAI/Claude SDK의 429 오류인지 확인"""
+    return getattr(error, "status_code", None) == 429
+
+
+def _provider_key(provider: Any) -> str:
+    return getattr(provider, "value", str(provider))
+
+
+class LLMProviderPolicy:
+    """마감 시간/페일오버/헤징 정책에 따라 LLM 제공업체 호출"""
+
+    _histograms: Dict[str, LatencyHistogram] = {}
+    _counters: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def get_histogram(provider: Any) -> LatencyHistogram:
+        key = _provider_key(provider)
+        if key not in LLMProviderPolicy._histograms:
+            LLMProviderPolicy._histograms[key] = LatencyHistogram(LATENCY_BUCKETS)
+        return LLMProviderPolicy._histograms[key]
+
+    @staticmethod
+    def get_histograms() -> Dict[str, LatencyHistogram]:
+        """제공업체별 지연 시간 히스토그램 (/metrics 노출용)"""
+        return dict(LLMProviderPolicy._histograms)
+
+    @staticmethod
+    def _count(provider: Any, name: str) -> None:
+        counters = LLMProviderPolicy._counters.setdefault(
+            _provider_key(provider),
+            {"success": 0, "failure": 0, "timeout": 0, "fallback": 0, "hedged": 0, "cancelled": 0}
+        )
+        counters[name] += 1
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """제공업체별 지연 시간 히스토그램과 호출 결과 카운터"""
+        keys = set(LLMProviderPolicy._histograms) | set(LLMProviderPolicy._counters)
+        return {
+            key: {
+                "latency": LLMProviderPolicy.get_histogram(key).to_dict(),
+                **LLMProviderPolicy._counters.get(key, {}),
+            }
+            for key in sorted(keys)
+        }
+
+    @staticmethod
+    def reset_stats() -> None:
+        LLMProviderPolicy._histograms.clear()
+        LLMProviderPolicy._counters.clear()
+
+    @staticmethod
+    def hedge_delay(provider: Any, policy: ProviderCallPolicy) -> Optional[float]:
+        """헤징 요청을 보낼 시점 (표본이 부족하면 None: 헤징하지 않음)"""
+        histogram = LLMProviderPolicy.get_histogram(provider)
+        if histogram.count < policy.hedge_min_samples:
+            return None
+        return histogram.percentile(policy.hedge_percentile)
+
+    @staticmethod
+    async def _attempt(
+        provider: Any,
+        call: Callable[[Any], Awaitable[Dict[str, Any]]],
+        deadline_seconds: float
+    ) -> Dict[str, Any]:
+        """마감 시간 안에서 제공업체 한 곳 호출하고 지연 시간 기록"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            result = await asyncio.wait_for(call(provider), timeout=deadline_seconds)
+        except asyncio.TimeoutError:
+            LLMProviderPolicy._count(provider, "timeout")
+            raise
+        except asyncio.CancelledError:
+            LLMProviderPolicy._count(provider, "cancelled")
+            raise
+        except Exception:
+            LLMProviderPolicy._count(provider, "failure")
+            raise
+        LLMProviderPolicy.get_histogram(provider).observe(loop.time() - started)
+        LLMProviderPolicy._count(provider, "success")
+        return result
+
+    @staticmethod
+    async def execute(
+        providers: List[Any],
+        call: Callable[[Any], Awaitable[Dict[str, Any]]],
+        policy: Optional[ProviderCallPolicy] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """정책에 따라 제공업체를 호출하고 (응답한 제공업체, 결과) 반환
+
+        Args:
+            providers: 호출 순서 (첫 번째가 주 제공업체, 나머지는 대체 제공업체)
+            call: 제공업체를 받아 API를 호출하는 코루틴 함수
+            policy: 호출 정책 (기본값: 환경 설정)
+
+        Raises:
+            모든 제공업체가 실패하면 마지막 오류 (시간 초과는 asyncio.TimeoutError)
+        """
+        policy = policy or ProviderCallPolicy.from_settings()
+        candidates = providers if policy.fallback_enabled else providers[:1]
+
+        primary = candidates[0]
+        pending: Dict[asyncio.Task, Any] = {
+            asyncio.ensure_future(LLMProviderPolicy._attempt(primary, call, policy.deadline_seconds)): primary
+        }
+        waiting = list(candidates[1:])
+        last_error: Optional[BaseException] = None
+
+        try:
+            # 헤징: 주 제공업체가 지연 백분위수 안에 응답하지 않으면 다음 제공업체 동시 호출
+            delay = LLMProviderPolicy.hedge_delay(primary, policy) if policy.hedge_enabled and waiting else None
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    hedge = waiting.pop(0)
+                    LLMProviderPolicy._count(hedge, "hedged")
+                    pending[asyncio.ensure_future(
+                        LLMProviderPolicy._attempt(hedge, call, policy.deadline_seconds)
+                    )] = hedge
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = pending.pop(task)
+                    if task.exception() is None:
+                        return provider, task.result()
+                    last_error = task.exception()
+                    if is_rate_limit_error(last_error) and not policy.fallback_on_rate_limit:
+                        raise last_error
+
+                # 진행 중인 호출이 모두 실패하면 다음 제공업체로 전환
+                if not pending and waiting:
+                    fallback = waiting.pop(0)
+                    LLMProviderPolicy._count(fallback, "fallback")
+                    pending[asyncio.ensure_future(
+                        LLMProviderPolicy._attempt(fallback, call, policy.deadline_seconds)
+                    )] = fallback
+        finally:
+            # 먼저 끝난 응답을 사용했으면 나머지 호출 취소
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise last_error
@@ -0,0 +1,73 @@
+"""
+메트릭 노출 서비스
+
+/metrics 요청 시 app/core/metrics.py에 누적된 요청·업로드·토큰 메트릭과
+각 서비스가 이미 유지하는 통계(LLM 제공업체 지연 시간 히스토그램, LLM 응답 캐시 적중률),
+DB 연결 풀 상태를 모아 Prometheus 텍스트 형식으로 만듭니다.
+"""
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..core import metrics
+from ..core.metrics import PrometheusWriter
+from .llm_cache_service import LLMCacheService
+from .llm_provider_policy import LLMProviderPolicy
+
+# Prometheus 텍스트 형식 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LLM_CALL_RESULTS = ("success", "failure", "timeout", "fallback", "hedged", "cancelled")
+
+
+class MetricsService:
+    """메트릭 노출 서비스"""
+
+    @staticmethod
+    def render(db: Session, engine: Engine) -> str:
+        """모든 메트릭을 Prometheus 텍스트 형식으로 반환"""
+        writer = PrometheusWriter()
+        metrics.write_app_metrics(writer)
+        MetricsService._write_llm_metrics(writer, db)
+        MetricsService._write_pool_metrics(writer, engine)
+        return writer.render()
+
+    @staticmethod
+    def _write_llm_metrics(writer: PrometheusWriter, db: Session) -> None:
+        writer.histogram(
+            "llm_call_duration_seconds", "LLM 제공업체 호출 시간 (성공한 호출)",
+            [({"provider": provider}, histogram)
+             for provider, histogram in sorted(LLMProviderPolicy.get_histograms().items())],
+        )
+        provider_stats = LLMProviderPolicy.get_stats()
+        writer.metric(
+            "llm_calls_total", "counter", "LLM 제공업체 호출 결과",
+            [({"provider": provider, "result": result}, stats[result])
+             for provider, stats in provider_stats.items()
+             for result in _LLM_CALL_RESULTS if result in stats],
+        )
+
+        cache = LLMCacheService.get_stats(db)
+        lookups = cache["hits"] + cache["misses"]
+        writer.metric(
+            "llm_cache_lookups_total", "counter", "LLM 응답 캐시 조회",
+            [({"result": "hit"}, cache["hits"]), ({"result": "miss"}, cache["misses"])],
+        )
+        writer.metric(
+            "llm_cache_hit_ratio", "gauge", "LLM 응답 캐시 적중률 (0~1)",
+            [({}, round(cache["hits"] / lookups, 4) if lookups else 0.0)],
+        )
+        writer.metric("llm_cache_entries", "gauge", "LLM 응답 캐시 항목 수", [({}, cache["entries"])])
+        writer.metric(
+            "llm_cache_saved_tokens_total", "counter", "캐시 적중으로 절약한 토큰 수", [({}, cache["saved_tokens"])]
+        )
+
+    @staticmethod
+    def _write_pool_metrics(writer: PrometheusWriter, engine: Engine) -> None:
+        """DB 연결 풀 상태 (QueuePool이 아니면 노출할 값이 없음)"""
+        pool = engine.pool
+        if not all(hasattr(pool, name) for name in ("size", "checkedout", "overflow")):
+            return
+        writer.metric("db_pool_size", "gauge", "DB 연결 풀 크기", [({}, pool.size())])
+        writer.metric("db_pool_checked_out", "gauge", "사용 중인 DB 연결 수", [({}, pool.checkedout())])
+        writer.metric("db_pool_overflow", "gauge", "풀 크기를 넘어 연 DB 연결 수", [({}, max(pool.overflow(), 0))])
@@ -0,0 +1,99 @@
+"""
+미루기 통계 서비스
+
+postpone_events를 SQL로 집계하여 기간 내 미루기 횟수, 자주 쓰는 사유, 자주 미룬 할일을 조회합니다.
+미룬 일수는 (to_date - from_date)이며 SQLite julianday로 계산합니다.
+"""
+
+from datetime import date
+from typing import Any, Dict
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.postpone_event import PostponeEvent
+from ..models.todo import DailyTodo
+
+# 미룬 일수 (SQL 식)
+_DAYS_POSTPONED = func.julianday(PostponeEvent.to_date) - func.julianday(PostponeEvent.from_date)
+
+
+def _round(value) -> float:
+    return round(float(value or 0), 1)
+
+
+class PostponeAnalyticsService:
+    """미루기 통계 서비스"""
+
+    @staticmethod
+    def get_analytics(db: Session, start_date: date, end_date: date, limit: int = 10) -> Dict[str, Any]:
+        """기간 내 미루기 통계 (미루기 전 날짜 기준)
+
+        Returns:
+            {"start_date", "end_date",
+             "summary": {"total_postpones", "todo_count", "total_days", "avg_days", "max_days"},
+             "reasons": [{"reason", "count", "avg_days"}, ...],
+             "todos": [{"id", "title", "is_completed", "count", "total_days"}, ...]}
+        """
+        if start_date > end_date:
+            raise ValueError("시작 날짜가 종료 날짜보다 늦을 수 없습니다")
+
+        in_range = (PostponeEvent.from_date >= start_date, PostponeEvent.from_date <= end_date)
+
+        total, todo_count, total_days, avg_days, max_days = (
+            db.query(
+                func.count(PostponeEvent.id),
+                func.count(func.distinct(PostponeEvent.todo_id)),
+                func.sum(_DAYS_POSTPONED),
+                func.avg(_DAYS_POSTPONED),
+                func.max(_DAYS_POSTPONED),
+            )
+            .filter(*in_range)
+            .one()
+        )
+
+        count = func.count(PostponeEvent.id).label("count")
+        reasons = (
+            db.query(PostponeEvent.reason, count, func.avg(_DAYS_POSTPONED))
+            .filter(*in_range)
+            .group_by(PostponeEvent.reason)
+            .order_by(count.desc(), PostponeEvent.reason)
+            .limit(limit)
+            .all()
+        )
+
+        todos = (
+            db.query(DailyTodo.id, DailyTodo.title, DailyTodo.is_completed, count, func.sum(_DAYS_POSTPONED))
+            .join(PostponeEvent, PostponeEvent.todo_id == DailyTodo.id)
+            .filter(*in_range)
+            .group_by(DailyTodo.id)
+            .order_by(count.desc(), DailyTodo.id)
+            .limit(limit)
+            .all()
+        )
+
+        return {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "summary": {
+                "total_postpones": total,
+                "todo_count": todo_count,
+                "total_days": int(total_days or 0),
+                "avg_days": _round(avg_days),
+                "max_days": int(max_days or 0),
+            },
+            "reasons": [
+                {"reason": reason, "count": reason_count, "avg_days": _round(reason_avg)}
+                for reason, reason_count, reason_avg in reasons
+            ],
+            "todos": [
+                {
+                    "id": todo_id,
+                    "title": title,
+                    "is_completed": bool(is_completed),
+                    "count": todo_postpones,
+                    "total_days": int(todo_days or 0),
+                }
+                for todo_id, title, is_completed, todo_postpones, todo_days in todos
+            ],
+        }
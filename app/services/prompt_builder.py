@@ -0,0 +1,207 @@
+"""
+토큰 예산 기반 프롬프트 조립
+
+프롬프트를 섹션 단위로 모은 뒤 토큰 수를 추정하여 설정된 예산 안에 들어오도록
+우선순위가 낮은 섹션부터 항목을 잘라냅니다. 같은 내용이 여러 번 들어가는 경우
+(반복 메모, 중복 할일 등) 한 번만 남깁니다.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# 항목 하나가 차지할 수 있는 기본 최대 토큰 수
+DEFAULT_MAX_ITEM_TOKENS = 200
+
+# 한글/한자/가나 등 넓은 문자는 약 1토큰, 나머지는 약 4글자당 1토큰으로 추정
+_WIDE_CHAR_START = 0x2E80
+_NARROW_CHARS_PER_TOKEN = 4
+_WHITESPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """텍스트의 토큰 수 추정 (토크나이저 없이 문자 종류로 근사)"""
+    if not text:
+        return 0
+    wide = sum(1 for ch in text if ord(ch) >= _WIDE_CHAR_START)
+    narrow = len(text) - wide
+    return wide + math.ceil(narrow / _NARROW_CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    """추정 토큰 수가 max_tokens를 넘지 않도록 텍스트를 자름"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    budget = max(max_tokens - estimate_tokens(suffix), 0) * _NARROW_CHARS_PER_TOKEN
+    used = 0
+    for index, ch in enumerate(text):
+        used += _NARROW_CHARS_PER_TOKEN if ord(ch) >= _WIDE_CHAR_START else 1
+        if used > budget:
+            return text[:index].rstrip() + suffix
+    return text
+
+
+def normalize_for_dedup(text: str) -> str:
+    """중복 비교용 정규화 (공백 통일, 대소문자 무시)"""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def collapse_blank_lines(text: str) -> str:
+    """연속된 빈 줄을 하나로 줄임"""
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+class PromptSection:
+    """프롬프트 섹션
+
+    required 섹션은 항상 포함되며, 나머지는 priority가 높은 순서로 예산을 배정받습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        heading: str = "",
+        items: Optional[List[str]] = None,
+        footer: str = "",
+        priority: int = 0,
+        required: bool = False,
+        dedup_keys: Optional[List[str]] = None,
+        max_item_tokens: Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.heading = heading
+        self.items = list(items or [])
+        self.footer = footer
+        self.priority = priority
+        self.required = required
+        self.dedup_keys = list(dedup_keys) if dedup_keys is not None else list(self.items)
+        self.max_item_tokens = max_item_tokens
+
+
+class PromptBuilder:
+    """토큰 예산 기반 프롬프트 빌더"""
+
+    def __init__(self, token_budget: int, max_item_tokens: int = DEFAULT_MAX_ITEM_TOKENS) -> None:
+        self.token_budget = token_budget
+        self.max_item_tokens = max_item_tokens
+        self.sections: List[PromptSection] = []
+
+    def add_section(self, section: PromptSection) -> "PromptBuilder":
+        """섹션 추가 (추가한 순서대로 출력됨)"""
+        self.sections.append(section)
+        return self
+
+    def add_text(self, name: str, text: str) -> "PromptBuilder":
+        """항상 포함되는 고정 텍스트 추가"""
+        return self.add_section(PromptSection(name, heading=text, required=True))
+
+    def build(self) -> Tuple[str, Dict[str, Any]]:
+        """예산에 맞춰 프롬프트 조립
+
+        Returns:
+            (프롬프트, 메타데이터) - 메타데이터에는 추정 토큰 수, 예산,
+            섹션별 포함/생략 항목 수와 제거된 중복 수가 들어갑니다.
+        """
+        duplicates = self._deduplicate()
+
+        # 항목별 최대 길이 적용 (필수 섹션은 max_item_tokens를 지정한 경우에만)
+        for section in self.sections:
+            limit = section.max_item_tokens or (None if section.required else self.max_item_tokens)
+            if limit:
+                section.items = [truncate_to_tokens(item, limit) for item in section.items]
+
+        # 필수 섹션 먼저 배정
+        kept: Dict[str, List[str]] = {}
+        remaining = self.token_budget
+        for section in self.sections:
+            if section.required:
+                kept[section.name] = section.items
+                remaining -= self._section_overhead(section) + sum(estimate_tokens(i) for i in section.items)
+
+        # 선택 섹션은 우선순위 순으로 남은 예산 배정
+        optional = sorted(
+            (s for s in self.sections if not s.required),
+            key=lambda s: s.priority,
+            reverse=True
+        )
+        for section in optional:
+            kept[section.name], remaining = self._fit_section(section, remaining)
+
+        # 원래 순서대로 출력
+        parts = []
+        sections_meta = {}
+        for section in self.sections:
+            items = kept[section.name]
+            skipped = len(section.items) - len(items)
+            text = ""
+            if section.required or items:
+                text = section.heading + "".join(items)
+                if skipped:
+                    text += self._omission_line(skipped)
+                text += section.footer
+                parts.append(text)
+            sections_meta[section.name] = {
+                "items": len(section.items),
+                "kept": len(items),
+                "tokens": estimate_tokens(text),
+            }
+
+        prompt = "".join(parts)
+        estimated = estimate_tokens(prompt)
+        metadata = {
+            "estimated_tokens": estimated,
+            "token_budget": self.token_budget,
+            "truncated": any(m["kept"] < m["items"] for m in sections_meta.values()) or estimated > self.token_budget,
+            "deduplicated": duplicates,
+            "sections": sections_meta,
+        }
+        return prompt, metadata
+
+    def _deduplicate(self) -> int:
+        """우선순위가 높은 섹션을 기준으로 같은 내용의 항목 제거"""
+        seen = set()
+        removed = 0
+        for section in sorted(self.sections, key=lambda s: (not s.required, -s.priority)):
+            if section.required:
+                continue
+            items, keys = [], []
+            for item, key in zip(section.items, section.dedup_keys):
+                normalized = normalize_for_dedup(key)
+                if normalized in seen:
+                    removed += 1
+                    continue
+                seen.add(normalized)
+                items.append(item)
+                keys.append(key)
+            section.items, section.dedup_keys = items, keys
+        return removed
+
+    def _fit_section(self, section: PromptSection, remaining: int) -> Tuple[List[str], int]:
+        """남은 예산 안에서 섹션 항목을 앞에서부터 채움 (하나도 안 들어가면 섹션 제외)"""
+        overhead = self._section_overhead(section)
+        kept: List[str] = []
+        for index, item in enumerate(section.items):
+            cost = estimate_tokens(item)
+            left_over = len(section.items) - index - 1
+            # 뒤에 생략될 항목이 있으면 생략 안내 줄의 자리도 남겨둠
+            reserve = estimate_tokens(self._omission_line(left_over)) if left_over else 0
+            needed = cost + reserve + (0 if kept else overhead)
+            if needed > remaining:
+                break
+            kept.append(item)
+            remaining -= cost + (0 if len(kept) > 1 else overhead)
+
+        skipped = len(section.items) - len(kept)
+        if kept and skipped:
+            remaining -= estimate_tokens(self._omission_line(skipped))
+        return kept, remaining
+
+    @staticmethod
+    def _section_overhead(section: PromptSection) -> int:
+        return estimate_tokens(section.heading) + estimate_tokens(section.footer)
+
+    @staticmethod
+    def _omission_line(count: int) -> str:
+        return f"- ... 외 {count}개 생략\n"
@@ -0,0 +1,222 @@
+"""
+회고 히스토리 조회 서비스
+
+- 주간 화면 첫 렌더링에는 날짜별 집계(할일 수, 완료 수, 회고 점수)만 사용합니다.
+  회고와 할일을 각각 한 번의 집계 쿼리로 조회하며 ORM 객체를 템플릿에 넘기지 않습니다.
+- 아코디언을 펼칠 때 필요한 날짜별 상세는 기간 단위로 한 번에 조회합니다
+  (/api/reflection-week/{week_start}, /api/reflection-day/{date_str}).
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, load_only
+
+from ..core.timing import timed_methods
+from ..models.daily_reflection import DailyReflection
+from ..models.todo import DailyTodo
+from .daily_todo_service import DailyTodoService
+
+DAY_KOREAN = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+@timed_methods("service")
+class ReflectionHistoryService:
+    """회고 히스토리 조회 서비스"""
+
+    @staticmethod
+    def get_week_aggregates(db: Session, monday: date, today: date) -> Dict[str, Any]:
+        """주간 날짜별 집계와 평균 (주간 요약/아코디언 헤더용)
+
+        Returns:
+            {"weekly_stats": [날짜별 집계 7개], "week_averages": {...}}
+        """
+        week_dates = [monday + timedelta(days=i) for i in range(7)]
+        sunday = week_dates[-1]
+
+        # 회고는 집계에 필요한 컬럼만 조회
+        reflections = {
+            row.reflection_date: row
+            for row in db.query(
+                DailyReflection.reflection_date,
+                DailyReflection.total_todos,
+                DailyReflection.completed_todos,
+                DailyReflection.completion_rate,
+                DailyReflection.satisfaction_score,
+                DailyReflection.energy_level,
+            ).filter(
+                DailyReflection.reflection_date >= monday,
+                DailyReflection.reflection_date <= sunday
+            )
+        }
+
+        # 할일은 생성 날짜별 개수만 집계
+        todo_counts = {
+            row.created_date: (row.total, row.completed or 0)
+            for row in db.query(
+                DailyTodo.created_date,
+                func.count(DailyTodo.id).label("total"),
+                func.sum(case((DailyTodo.is_completed == True, 1), else_=0)).label("completed"),
+            ).filter(
+                DailyTodo.created_date >= monday,
+                DailyTodo.created_date <= sunday
+            ).group_by(DailyTodo.created_date)
+        }
+
+        weekly_stats: List[Dict[str, Any]] = []
+        total_satisfaction = 0
+        total_energy = 0
+        reflection_count = 0
+
+        for day in week_dates:
+            reflection = reflections.get(day)
+
+            if reflection:
+                # 회고가 있으면 회고 시점의 정확한 데이터 사용 (소급 적용 방지)
+                total = reflection.total_todos
+                completed = reflection.completed_todos
+                completion_rate = reflection.completion_rate
+
+                if reflection.satisfaction_score:
+                    total_satisfaction += reflection.satisfaction_score
+                    reflection_count += 1
+                if reflection.energy_level:
+                    total_energy += reflection.energy_level
+            elif day == today:
+                # 오늘은 자동 이월을 포함한 오늘의 요약 사용
+                summary = DailyTodoService.get_today_summary(db)
+                total = summary["total"]
+                completed = summary["completed"]
+                completion_rate = summary["completion_rate"]
+            else:
+                # 과거 날짜는 created_date 기준으로만 계산
+                total, completed = todo_counts.get(day, (0, 0))
+                completion_rate = (completed / total * 100) if total > 0 else 0
+
+            weekly_stats.append({
+                "date": day,
+                "day_name": day.strftime("%a"),
+                "day_korean": DAY_KOREAN[day.weekday()],
+                "total_todos": total,
+                "completed_todos": completed,
+                "completion_rate": completion_rate,
+                "is_today": day == today,
+                "has_reflection": reflection is not None,
+                "satisfaction_score": reflection.satisfaction_score if reflection else None,
+                "energy_level": reflection.energy_level if reflection else None,
+            })
+
+        return {
+            "weekly_stats": weekly_stats,
+            "week_averages": {
+                "avg_satisfaction": (total_satisfaction / reflection_count) if reflection_count > 0 else 0,
+                "avg_energy": (total_energy / reflection_count) if reflection_count > 0 else 0,
+                "reflection_count": reflection_count,
+            },
+        }
+
+    @staticmethod
+    def get_day_details(db: Session, start_date: date, end_date: date) -> Dict[str, Dict[str, Any]]:
+        """기간 내 날짜별 회고/할일 상세 (아코디언 펼침용)
+
+        회고와 할일을 각각 한 번씩 조회한 뒤 날짜별로 묶습니다.
+
+        Returns:
+            "YYYY-MM-DD" -> 날짜 상세
+        """
+        reflections = {
+            reflection.reflection_date: reflection
+            for reflection in db.query(DailyReflection).options(
+                load_only(
+                    DailyReflection.id,
+                    DailyReflection.reflection_date,
+                    DailyReflection.reflection_text,
+                    DailyReflection.satisfaction_score,
+                    DailyReflection.energy_level,
+                    DailyReflection.completion_rate,
+                    DailyReflection.total_todos,
+                    DailyReflection.completed_todos,
+                    DailyReflection.created_at,
+                )
+            ).filter(
+                DailyReflection.reflection_date >= start_date,
+                DailyReflection.reflection_date <= end_date
+            )
+        }
+
+        todos_by_date: Dict[date, List[DailyTodo]] = defaultdict(list)
+        for todo in db.query(DailyTodo).filter(
+            DailyTodo.created_date >= start_date,
+            DailyTodo.created_date <= end_date
+        ).order_by(DailyTodo.id):
+            todos_by_date[todo.created_date].append(todo)
+
+        details = {}
+        day = start_date
+        while day <= end_date:
+            details[day.isoformat()] = ReflectionHistoryService._day_detail(
+                day, reflections.get(day), todos_by_date.get(day, [])
+            )
+            day += timedelta(days=1)
+        return details
+
+    @staticmethod
+    def _day_detail(day: date, reflection: Optional[DailyReflection], day_todos: List[DailyTodo]) -> Dict[str, Any]:
+        """날짜 하나의 상세 (회고 이후 완료된 할일은 소급 완료로 구분)"""
+        completed_todos = [todo for todo in day_todos if todo.is_completed]
+        pending_todos = [todo for todo in day_todos if not todo.is_completed]
+
+        retroactively_completed = []
+        completed_on_time = completed_todos
+
+        # 회고 시점보다 완료 개수가 늘었으면 회고 생성일 이후 완료된 할일을 소급 완료로 분류
+        if reflection and len(completed_todos) > (reflection.completed_todos or 0):
+            reflection_created_date = reflection.created_at.date() if reflection.created_at else day
+            completed_on_time = []
+            for todo in completed_todos:
+                if todo.completed_at and todo.completed_at.date() > reflection_created_date:
+                    retroactively_completed.append(todo)
+                else:
+                    completed_on_time.append(todo)
+
+        def completed_item(todo: DailyTodo) -> Dict[str, Any]:
+            return {
+                "id": todo.id,
+                "title": todo.title,
+                "category": todo.category.value,
+                "completion_reflection": todo.completion_reflection,
+                "completion_image_path": todo.completion_image_path,
+                "completion_image_srcset": todo.completion_image_srcset,
+                "journey_id": todo.journey_id,
+                "completed_at": todo.completed_at.isoformat() if todo.completed_at else None,
+            }
+
+        return {
+            "date": day.isoformat(),
+            "has_reflection": reflection is not None,
+            "reflection": {
+                "id": reflection.id if reflection else None,
+                "reflection_text": reflection.reflection_text if reflection else None,
+                "satisfaction_score": reflection.satisfaction_score if reflection else None,
+                "energy_level": reflection.energy_level if reflection else None,
+                "completion_rate": reflection.completion_rate if reflection else None,
+                "total_todos": reflection.total_todos if reflection else len(day_todos),
+                "completed_todos": reflection.completed_todos if reflection else len(completed_todos),
+                "created_at": reflection.created_at.isoformat() if reflection and reflection.created_at else None,
+            },
+            "todos": {
+                "completed_on_time": [completed_item(todo) for todo in completed_on_time],
+                "retroactively_completed": [completed_item(todo) for todo in retroactively_completed],
+                "pending": [
+                    {
+                        "id": todo.id,
+                        "title": todo.title,
+                        "category": todo.category.value,
+                        "journey_id": todo.journey_id
+                    }
+                    for todo in pending_todos
+                ]
+            }
+        }
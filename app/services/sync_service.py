@@ -0,0 +1,143 @@
+"""
+증분 동기화 서비스
+
+- 할일/메모/회고/여정 행은 생성·수정·삭제될 때마다 전역 카운터(sync_state)에서
+  단조 증가하는 row_version을 할당받습니다 (매퍼 before_insert/before_update/before_delete 이벤트).
+  카운터 갱신은 변경과 같은 트랜잭션에서 이루어지고 SQLite는 쓰기를 직렬화하므로,
+  더 작은 버전이 나중에 커밋되는 일이 없습니다.
+- 삭제된 행은 sync_tombstones에 남겨 클라이언트 복제본이 삭제를 반영할 수 있게 합니다.
+- /api/sync?since=<version>은 since 이후에 바뀐 행과 삭제 기록만 돌려줍니다.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List
+
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session, object_session
+
+from ..core.timezone import get_current_utc_datetime
+from ..models.daily_memo import DailyMemo
+from ..models.daily_reflection import DailyReflection
+from ..models.journey import Journey
+from ..models.sync import SyncState, SyncTombstone
+from ..models.todo import DailyTodo
+
+# 동기화 대상 모델 → (엔티티 이름, 응답 키)
+VERSIONED_MODELS: Dict[type, tuple] = {
+    DailyTodo: ("todo", "todos"),
+    DailyMemo: ("memo", "memos"),
+    DailyReflection: ("reflection", "reflections"),
+    Journey: ("journey", "journeys"),
+}
+
+# 복제본에 보낼 필요가 없는 컬럼 (내부용 프롬프트 등)
+EXCLUDED_COLUMNS: Dict[type, set] = {
+    DailyReflection: {"blog_generation_prompt", "blog_prompt_metadata", "stats_dirty"},
+}
+
+
+def serialize_value(value: Any) -> Any:
+    """JSON으로 보낼 수 있는 값으로 변환"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _next_version(connection) -> int:
+    """전역 카운터를 1 올리고 새 버전 반환 (flush 중인 연결에서 실행)"""
+    version = connection.execute(
+        update(SyncState)
+        .where(SyncState.id == 1)
+        .values(version=SyncState.version + 1)
+        .returning(SyncState.version)
+    ).scalar()
+    if version is None:
+        # 마이그레이션 없이 만든 DB (테스트 등)
+        connection.execute(insert(SyncState).values(id=1, version=1))
+        return 1
+    return version
+
+
+def _assign_version(mapper, connection, target) -> None:
+    target.row_version = _next_version(connection)
+
+
+def _assign_version_if_modified(mapper, connection, target) -> None:
+    # 관계만 바뀐 경우 등 컬럼 변경이 없으면 UPDATE가 실행되지 않으므로 버전도 올리지 않음
+    session = object_session(target)
+    if session is not None and session.is_modified(target, include_collections=False):
+        target.row_version = _next_version(connection)
+
+
+def _record_tombstone(mapper, connection, target) -> None:
+    entity = VERSIONED_MODELS[type(target)][0]
+    connection.execute(insert(SyncTombstone).values(
+        entity=entity,
+        entity_id=target.id,
+        row_version=target.row_version,
+        deleted_at=get_current_utc_datetime(),
+    ))
+
+
+for _model in VERSIONED_MODELS:
+    event.listen(_model, "before_insert", _assign_version)
+    event.listen(_model, "before_update", _assign_version_if_modified)
+    event.listen(_model, "before_delete", _assign_version)
+    event.listen(_model, "after_delete", _record_tombstone)
+
+
+def row_to_dict(obj: Any) -> Dict[str, Any]:
+    """복제본에 보낼 컬럼 값 (내부용 컬럼 제외)"""
+    excluded = EXCLUDED_COLUMNS.get(type(obj), set())
+    return {
+        attr.key: serialize_value(getattr(obj, attr.key))
+        for attr in obj.__mapper__.column_attrs
+        if attr.key not in excluded
+    }
+
+
+class SyncService:
+    """증분 동기화 서비스"""
+
+    @staticmethod
+    def get_current_version(db: Session) -> int:
+        """마지막으로 할당한 row_version (변경이 없었으면 0)"""
+        return db.query(SyncState.version).filter(SyncState.id == 1).scalar() or 0
+
+    @staticmethod
+    def get_changes_since(db: Session, since: int) -> Dict[str, Any]:
+        """since 이후 변경된 행과 삭제 기록
+
+        버전을 먼저 읽고 행을 조회하므로, 조회 도중 커밋된 변경은 다음 동기화에서 다시 받습니다
+        (클라이언트는 id 기준으로 덮어쓰므로 중복 적용해도 안전).
+        같은 id가 삭제 후 다시 생기면 행과 삭제 기록이 함께 올 수 있으며, row_version이 큰 쪽을 적용합니다.
+
+        Returns:
+            {"version": N, "todos": [...], "memos": [...], "reflections": [...],
+             "journeys": [...], "deleted": [{"entity", "id", "row_version"}, ...]}
+        """
+        result: Dict[str, Any] = {"version": SyncService.get_current_version(db)}
+
+        for model, (_, key) in VERSIONED_MODELS.items():
+            rows = (
+                db.query(model)
+                .filter(model.row_version > since)
+                .order_by(model.row_version)
+                .all()
+            )
+            result[key] = [row_to_dict(row) for row in rows]
+
+        tombstones: List[SyncTombstone] = (
+            db.query(SyncTombstone)
+            .filter(SyncTombstone.row_version > since)
+            .order_by(SyncTombstone.row_version)
+            .all()
+        )
+        result["deleted"] = [
+            {"entity": tombstone.entity, "id": tombstone.entity_id, "row_version": tombstone.row_version}
+            for tombstone in tombstones
+        ]
+        return result
@@ -0,0 +1,167 @@
+"""
+내용 해시 기반 업로드 저장소
+
+같은 내용의 업로드는 한 벌만 저장하고 할일이 참조하는 수(ref_count)를 관리합니다.
+참조가 모두 해제된 파일은 바로 지우지 않고 gc-uploads 명령(collect_garbage)이
+ref_count 인덱스 한 번의 조회로 찾아 정리합니다.
+할일이 삭제되면(여정 삭제 cascade 포함) before_delete 이벤트에서 완료 이미지 참조를 해제합니다.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import case, event
+from sqlalchemy.orm import Session, attributes, object_session
+
+from ..core.timezone import get_current_utc_datetime
+from ..models.todo import DailyTodo
+from ..models.uploaded_file import UploadedFile
+
+
+class UploadStoreService:
+    """업로드 파일 참조 관리 서비스"""
+
+    @staticmethod
+    def get_by_hash(db: Session, content_hash: str) -> Optional[UploadedFile]:
+        """내용 해시로 저장된 업로드 조회"""
+        return db.query(UploadedFile).filter(UploadedFile.content_hash == content_hash).first()
+
+    @staticmethod
+    def acquire(
+        db: Session,
+        content_hash: str,
+        path: str,
+        renditions: Optional[Dict[str, str]] = None,
+        size_bytes: Optional[int] = None
+    ) -> UploadedFile:
+        """업로드 참조 추가 (없으면 새로 등록)
+
+        호출한 쪽의 트랜잭션과 함께 커밋되도록 flush만 수행합니다.
+        """
+        entry = UploadStoreService.get_by_hash(db, content_hash)
+        if entry is None:
+            entry = UploadedFile(
+                content_hash=content_hash,
+                path=path,
+                ref_count=0,
+                created_at=get_current_utc_datetime()
+            )
+            db.add(entry)
+
+        entry.path = path
+        entry.renditions = renditions
+        entry.size_bytes = size_bytes
+        entry.ref_count = (entry.ref_count or 0) + 1
+        entry.released_at = None
+        db.flush()
+        return entry
+
+    @staticmethod
+    def release(db: Session, path: Optional[str]) -> None:
+        """업로드 참조 해제 (파일 삭제는 gc-uploads에서 처리)"""
+        if not path:
+            return
+
+        entry = db.query(UploadedFile).filter(UploadedFile.path == path).first()
+        if entry is None:
+            return
+
+        entry.ref_count = max((entry.ref_count or 0) - 1, 0)
+        if entry.ref_count == 0:
+            entry.released_at = get_current_utc_datetime()
+        db.flush()
+
+    @staticmethod
+    def _entry_files(entry: UploadedFile) -> Iterable[str]:
+        yield entry.path
+        yield from (entry.renditions or {}).values()
+
+    @staticmethod
+    def collect_garbage(
+        db: Session,
+        upload_dir: Path,
+        include_untracked: bool = False,
+        grace_seconds: int = 3600,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """참조가 없는 업로드 파일 정리
+
+        Args:
+            db: 데이터베이스 세션
+            upload_dir: 업로드 디렉터리
+            include_untracked: 저장소에 등록되지 않은 파일도 정리할지 여부
+            grace_seconds: 최근 수정된 미등록 파일은 업로드 진행 중일 수 있으므로 제외
+            dry_run: 실제 삭제 없이 대상만 집계
+
+        Returns:
+            정리한 항목/파일 수와 확보한 용량
+        """
+        stats = {"released_entries": 0, "untracked_files": 0, "deleted_files": 0, "freed_bytes": 0}
+
+        def remove(file_path: Path) -> None:
+            if not file_path.is_file():
+                return
+            stats["deleted_files"] += 1
+            stats["freed_bytes"] += file_path.stat().st_size
+            if not dry_run:
+                file_path.unlink()
+
+        # ref_count 인덱스를 사용하는 한 번의 조회로 참조가 없는 항목 수집
+        orphans = db.query(UploadedFile).filter(UploadedFile.ref_count <= 0).all()
+        for entry in orphans:
+            for path in UploadStoreService._entry_files(entry):
+                remove(upload_dir / Path(path).name)
+            stats["released_entries"] += 1
+            if not dry_run:
+                db.delete(entry)
+
+        if include_untracked and upload_dir.exists():
+            tracked = {
+                Path(path).name
+                for entry in db.query(UploadedFile).filter(UploadedFile.ref_count > 0).all()
+                for path in UploadStoreService._entry_files(entry)
+            }
+            cutoff = time.time() - grace_seconds
+            for file_path in upload_dir.iterdir():
+                if file_path.name in tracked or not file_path.is_file():
+                    continue
+                if file_path.stat().st_mtime > cutoff:
+                    continue
+                stats["untracked_files"] += 1
+                remove(file_path)
+
+        if not dry_run:
+            db.commit()
+        return stats
+
+
+def _release_on_delete(mapper, connection, target: DailyTodo) -> None:
+    """삭제되는 할일의 완료 이미지 참조 해제 (before_delete, 삭제 경로와 관계없이 한 번)"""
+    path = target.completion_image_path
+    if not path:
+        return
+
+    released_at = get_current_utc_datetime()
+    connection.execute(
+        UploadedFile.__table__.update()
+        .where(UploadedFile.path == path)
+        .values(
+            ref_count=case((UploadedFile.ref_count > 1, UploadedFile.ref_count - 1), else_=0),
+            released_at=case((UploadedFile.ref_count <= 1, released_at), else_=UploadedFile.released_at),
+        )
+    )
+
+    # 이미 세션에 올라온 저장소 항목에도 반영
+    session = object_session(target)
+    if session is None:
+        return
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, UploadedFile) and obj.path == path:
+            ref_count = max((obj.ref_count or 0) - 1, 0)
+            attributes.set_committed_value(obj, "ref_count", ref_count)
+            if ref_count == 0:
+                attributes.set_committed_value(obj, "released_at", released_at)
+
+
+event.listen(DailyTodo, "before_delete", _release_on_delete)
@@ -0,0 +1,1700 @@
+let currentTodoId = null;
+
+// === 화면 조각(fragment) 갱신 ===
+// 변경된 부분만 서버에서 다시 렌더링하여 교체 (전체 새로고침 대신)
+const FRAGMENT_TARGETS = {
+    summary: 'summary-card',
+    todos: 'todos-container',
+    memos: 'memo-panel'
+};
+
+async function fetchFragment(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`화면 갱신 실패: ${url}`);
+    }
+    return response.text();
+}
+
+async function refreshFragment(name) {
+    const html = await fetchFragment(`/fragments/daily/${name}`);
+    const target = document.getElementById(FRAGMENT_TARGETS[name]);
+    if (!target) return;
+
+    if (name === 'todos') {
+        // 할일 목록은 컨테이너 안쪽만 교체
+        target.innerHTML = html;
+    } else {
+        target.outerHTML = html;
+    }
+
+    if (name === 'summary') {
+        updateSummaryCounter();
+    }
+}
+
+// 할일 항목 하나만 다시 렌더링
+async function refreshTodoItem(todoId) {
+    const item = document.querySelector(`.todo-item[data-todo-id="${todoId}"]`);
+    if (!item) {
+        await refreshFragment('todos');
+        return;
+    }
+    item.outerHTML = await fetchFragment(`/fragments/daily/todos/${todoId}`);
+}
+
+// 헤더의 완료 개수를 요약 카드 값과 맞춤
+function updateSummaryCounter() {
+    const card = document.getElementById('summary-card');
+    const counter = document.getElementById('summary-counter');
+    if (card && counter) {
+        counter.textContent = `${card.dataset.completed}/${card.dataset.total}`;
+    }
+}
+
+// 할일 목록과 요약을 함께 갱신 (추가/삭제/미루기/수정)
+async function refreshTodosAndSummary() {
+    try {
+        await Promise.all([refreshFragment('todos'), refreshFragment('summary')]);
+    } catch (error) {
+        console.error(error);
+        location.reload();
+    }
+}
+
+// === 실시간 갱신 (Server-Sent Events) ===
+// 이 탭과 다른 탭/기기의 변경을 서버 이벤트로 받아 바뀐 부분만 다시 그림 (폴링 없음)
+let liveUpdatesConnected = false;
+const pendingRefreshes = new Set();
+let pendingRefreshTimer = null;
+
+// 연결 중이면 곧 도착할 이벤트가 화면을 갱신하므로 직접 다시 불러오지 않음
+async function refreshAfterMutation(refresh) {
+    if (liveUpdatesConnected) return;
+    await refresh();
+}
+
+// 짧은 시간에 몰린 이벤트는 대상별로 한 번만 갱신
+function scheduleRefresh(name) {
+    pendingRefreshes.add(name);
+    if (pendingRefreshTimer) return;
+    pendingRefreshTimer = setTimeout(async () => {
+        const names = [...pendingRefreshes];
+        pendingRefreshes.clear();
+        pendingRefreshTimer = null;
+
+        const refreshes = names
+            // 목록 전체를 다시 그리면 개별 항목 갱신은 필요 없음
+            .filter(name => !(name.startsWith('todo:') && names.includes('todos')))
+            .map(name => {
+                if (name.startsWith('todo:')) return refreshTodoItem(name.slice(5));
+                if (name === 'memos') return loadMemosBasedOnScreenSize();
+                return refreshFragment(name);
+            });
+        try {
+            await Promise.all(refreshes);
+        } catch (error) {
+            console.error(error);
+        }
+    }, 50);
+}
+
+function handleTodoChanged(data) {
+    const item = document.querySelector(`.todo-item[data-todo-id="${data.id}"]`);
+    if (data.action === 'deleted') {
+        if (item) item.remove();
+        if (!document.querySelector('.todo-item')) scheduleRefresh('todos');  // 빈 목록 안내 표시
+    } else if (data.action === 'created' || data.action === 'rescheduled') {
+        scheduleRefresh('todos');  // 목록 구성과 순서가 바뀜
+    } else if (item) {
+        scheduleRefresh(`todo:${data.id}`);
+    }
+}
+
+function handleSummaryChanged(data) {
+    const counter = document.getElementById('summary-counter');
+    if (counter) {
+        counter.textContent = `${data.completed}/${data.total}`;
+    }
+    const card = document.getElementById('summary-card');
+    if (!card || Number(card.dataset.completed) !== data.completed || Number(card.dataset.total) !== data.total) {
+        scheduleRefresh('summary');
+    }
+}
+
+function handleMemoChanged(data) {
+    if (data.memo_date === document.body.dataset.today) {
+        scheduleRefresh('memos');
+    }
+}
+
+function connectLiveUpdates() {
+    if (!window.EventSource) return;
+
+    // 연결이 끊기면 브라우저가 Last-Event-ID와 함께 자동 재연결
+    const source = new EventSource('/api/daily/events');
+    source.onopen = () => { liveUpdatesConnected = true; };
+    source.onerror = () => { liveUpdatesConnected = false; };
+
+    const listen = (type, handler) => {
+        source.addEventListener(type, (event) => handler(JSON.parse(event.data)));
+    };
+    listen('todo.changed', handleTodoChanged);
+    listen('summary.changed', handleSummaryChanged);
+    listen('memo.added', handleMemoChanged);
+    listen('memo.updated', handleMemoChanged);
+    listen('memo.deleted', handleMemoChanged);
+    // 놓친 이벤트가 있으면 전체 갱신
+    listen('resync', () => ['todos', 'summary', 'memos'].forEach(scheduleRefresh));
+}
+
+// 페이지 로드 시 여정 목록 로드
+document.addEventListener('DOMContentLoaded', async () => {
+    connectLiveUpdates();
+    await loadMilestones();
+});
+
+// 여정 목록 로드
+async function loadMilestones() {
+    try {
+        const response = await fetch('/api/daily/journeys');
+        if (response.ok) {
+            const data = await response.json();
+            const select = document.getElementById('journey-select');
+
+            // 기존 옵션 제거 (첫 번째 기본 옵션 제외)
+            while (select.children.length > 1) {
+                select.removeChild(select.lastChild);
+            }
+
+            // 여정 옵션 추가
+            data.journeys.forEach(journey => {
+                const option = document.createElement('option');
+                option.value = journey.id;
+                option.textContent = journey.title;
+                select.appendChild(option);
+            });
+        }
+    } catch (error) {
+        console.error('여정 로드 실패:', error);
+    }
+}
+
+// 상세 입력 폼 토글
+document.getElementById('detailed-todo-btn').addEventListener('click', () => {
+    const form = document.getElementById('detailed-form');
+    const isHidden = form.classList.contains('hidden');
+
+    if (isHidden) {
+        form.classList.remove('hidden');
+        document.getElementById('detailed-todo-btn').textContent = '📝';
+    } else {
+        form.classList.add('hidden');
+        document.getElementById('detailed-todo-btn').textContent = '⚙️';
+        clearDetailedForm();
+    }
+});
+
+// 상세 입력 폼 취소
+document.getElementById('cancel-detailed-btn').addEventListener('click', () => {
+    document.getElementById('detailed-form').classList.add('hidden');
+    document.getElementById('detailed-todo-btn').textContent = '⚙️';
+    clearDetailedForm();
+});
+
+// 상세 입력 폼 초기화
+function clearDetailedForm() {
+    document.getElementById('todo-description').value = '';
+    document.getElementById('journey-select').value = '';
+    document.getElementById('category-select').value = '기타';
+    document.getElementById('estimated-minutes').value = '';
+}
+
+// 빠른 할 일 추가
+document.getElementById('quick-add-btn').addEventListener('click', async () => {
+    const title = document.getElementById('quick-todo-input').value.trim();
+    if (!title) return;
+
+    try {
+        const formData = new FormData();
+        formData.append('title', title);
+
+        const response = await fetch('/api/daily/todos/quick', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (response.ok) {
+            document.getElementById('quick-todo-input').value = '';
+            await refreshAfterMutation(refreshTodosAndSummary);
+        } else {
+            alert('할 일 추가에 실패했습니다.');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('오류가 발생했습니다.');
+    }
+});
+
+// 상세 할 일 추가
+document.getElementById('detailed-add-btn').addEventListener('click', async () => {
+    const title = document.getElementById('quick-todo-input').value.trim();
+    if (!title) {
+        alert('할 일 제목을 입력해주세요.');
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        formData.append('title', title);
+
+        const description = document.getElementById('todo-description').value.trim();
+        if (description) {
+            formData.append('description', description);
+        }
+
+        const category = document.getElementById('category-select').value || '기타';
+        formData.append('category', category);
+
+        const journeyId = document.getElementById('journey-select').value;
+        if (journeyId) {
+            formData.append('journey_id', journeyId);
+        }
+
+        const estimatedMinutes = document.getElementById('estimated-minutes').value.trim();
+        if (estimatedMinutes && estimatedMinutes !== '') {
+            formData.append('estimated_minutes', estimatedMinutes);
+        }
+
+        const response = await fetch('/api/daily/todos', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (response.ok) {
+            document.getElementById('quick-todo-input').value = '';
+            clearDetailedForm();
+            document.getElementById('detailed-form').classList.add('hidden');
+            document.getElementById('detailed-todo-btn').textContent = '⚙️';
+            await refreshAfterMutation(refreshTodosAndSummary);
+        } else {
+            alert('할 일 추가에 실패했습니다.');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('오류가 발생했습니다.');
+    }
+});
+
+// 할 일 완료 토글 (회고 포함)
+document.addEventListener('click', async (e) => {
+    if (e.target.closest('.todo-checkbox')) {
+        const button = e.target.closest('.todo-checkbox');
+        const todoId = button.dataset.todoId;
+        currentTodoId = todoId;
+
+        try {
+            // API에서 현재 상태 확인
+            const response = await fetch(`/api/daily/todos/${todoId}`);
+            const todo = await response.json();
+
+            if (!todo.is_completed) {
+                // 미완료 -> 완료: 회고 모달 표시
+                document.getElementById('reflection-modal').classList.remove('hidden');
+            } else {
+                // 완료 -> 미완료: 바로 토글
+                await toggleTodoComplete(todoId, null);
+            }
+        } catch (error) {
+            console.error('할 일 상태 확인 실패:', error);
+            // 에러 시 바로 토글
+            await toggleTodoComplete(todoId, null);
+        }
+    }
+});
+
+// 회고와 함께 완료
+document.getElementById('complete-with-reflection').addEventListener('click', async () => {
+    const reflection = document.getElementById('reflection-text').value.trim();
+    const imageFile = document.getElementById('reflection-image').files[0];
+    await toggleTodoComplete(currentTodoId, reflection, imageFile);
+
+    document.getElementById('reflection-modal').classList.add('hidden');
+    document.getElementById('reflection-text').value = '';
+    removeImagePreview();
+    currentTodoId = null;
+});
+
+// 회고 모달 취소
+document.getElementById('cancel-reflection').addEventListener('click', () => {
+    document.getElementById('reflection-modal').classList.add('hidden');
+    document.getElementById('reflection-text').value = '';
+    removeImagePreview();
+    currentTodoId = null;
+});
+
+// 할 일 완료 토글 함수
+async function toggleTodoComplete(todoId, reflection, imageFile) {
+    try {
+        const formData = new FormData();
+        if (reflection) {
+            formData.append('reflection', reflection);
+        }
+        if (imageFile) {
+            formData.append('reflection_image', imageFile);
+        }
+
+        const response = await fetch(`/api/daily/todos/${todoId}/complete`, {
+            method: 'PATCH',
+            body: formData
+        });
+
+        if (response.ok) {
+            // 토글한 항목과 요약 카드만 다시 렌더링
+            await refreshAfterMutation(() => Promise.all([refreshTodoItem(todoId), refreshFragment('summary')]));
+        } else {
+            alert('상태 변경에 실패했습니다.');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('오류가 발생했습니다.');
+    }
+}
+
+// 할 일 삭제
+document.addEventListener('click', async (e) => {
+    if (e.target.closest('.todo-delete')) {
+        const button = e.target.closest('.todo-delete');
+        const todoId = button.dataset.todoId;
+
+        if (confirm('정말 삭제하시겠습니까?')) {
+            try {
+                const response = await fetch(`/api/daily/todos/${todoId}`, {
+                    method: 'DELETE'
+                });
+
+                if (response.ok) {
+                    await refreshAfterMutation(refreshTodosAndSummary);
+                } else {
+                    alert('삭제에 실패했습니다.');
+                }
+            } catch (error) {
+                console.error('Error:', error);
+                alert('오류가 발생했습니다.');
+            }
+        }
+    }
+});
+
+// 할 일 미루기
+document.addEventListener('click', (e) => {
+    if (e.target.closest('.reschedule-todo')) {
+        const button = e.target.closest('.reschedule-todo');
+        currentTodoId = button.dataset.todoId;
+
+        // 내일 날짜를 기본값으로 설정
+        const tomorrow = new Date();
+        tomorrow.setDate(tomorrow.getDate() + 1);
+        document.getElementById('reschedule-date').value = tomorrow.toISOString().split('T')[0];
+
+        document.getElementById('reschedule-modal').classList.remove('hidden');
+    }
+});
+
+// 미루기 확인
+document.getElementById('confirm-reschedule').addEventListener('click', async () => {
+    const newDate = document.getElementById('reschedule-date').value;
+    const reason = document.getElementById('reschedule-reason').value.trim();
+
+    if (!newDate) {
+        alert('날짜를 선택해주세요.');
+        return;
+    }
+
+    if (!reason) {
+        alert('미루기 사유를 입력해주세요.');
+        return;
+    }
+
+    if (reason.length > 100) {
+        alert('미루기 사유는 100자 이하로 입력해주세요.');
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        formData.append('new_date', newDate);
+        formData.append('reason', reason);
+
+        const response = await fetch(`/api/daily/todos/${currentTodoId}/reschedule`, {
+            method: 'PATCH',
+            body: formData
+        });
+
+        if (response.ok) {
+            document.getElementById('reschedule-modal').classList.add('hidden');
+            // 모달 초기화
+            document.getElementById('reschedule-reason').value = '';
+            currentTodoId = null;
+            await refreshAfterMutation(refreshTodosAndSummary);
+        } else {
+            const errorData = await response.json();
+            alert(`일정 변경에 실패했습니다: ${errorData.detail || '알 수 없는 오류'}`);
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('오류가 발생했습니다.');
+    }
+});
+
+// 미루기 모달 취소
+document.getElementById('cancel-reschedule').addEventListener('click', () => {
+    document.getElementById('reschedule-modal').classList.add('hidden');
+    document.getElementById('reschedule-reason').value = '';
+    currentTodoId = null;
+});
+
+// 할 일 편집
+document.addEventListener('click', async (e) => {
+    if (e.target.closest('.edit-todo')) {
+        const button = e.target.closest('.edit-todo');
+        currentTodoId = button.dataset.todoId;
+
+        try {
+            // API에서 할 일 정보 가져오기
+            const response = await fetch(`/api/daily/todos/${currentTodoId}`);
+            if (!response.ok) {
+                throw new Error('할 일 정보를 가져올 수 없습니다.');
+            }
+
+            const todo = await response.json();
+
+            // 폼에 데이터 채우기
+            document.getElementById('edit-title').value = todo.title || '';
+            document.getElementById('edit-description').value = todo.description || '';
+            document.getElementById('edit-estimated-minutes').value = todo.estimated_minutes || '';
+
+            // 카테고리 설정
+            const categorySelect = document.getElementById('edit-category');
+            // API에서 이미 한국어로 반환되므로 직접 설정
+            categorySelect.value = todo.category;
+
+            // 여정 설정
+            const journeySelect = document.getElementById('edit-journey');
+            journeySelect.value = todo.journey_id || '';
+
+            document.getElementById('edit-modal').classList.remove('hidden');
+        } catch (error) {
+            console.error('할 일 정보 로드 실패:', error);
+            alert('할 일 정보를 불러오는데 실패했습니다.');
+        }
+    }
+});
+
+// 편집 저장
+document.getElementById('save-edit').addEventListener('click', async () => {
+    const title = document.getElementById('edit-title').value.trim();
+    if (!title) {
+        alert('할 일 제목을 입력해주세요.');
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        formData.append('title', title);
+
+        const description = document.getElementById('edit-description').value.trim();
+        if (description) {
+            formData.append('description', description);
+        }
+
+        const category = document.getElementById('edit-category').value || '기타';
+        formData.append('category', category);
+
+        const estimatedMinutes = document.getElementById('edit-estimated-minutes').value.trim();
+        if (estimatedMinutes && estimatedMinutes !== '') {
+            formData.append('estimated_minutes', estimatedMinutes);
+        }
+
+        const journeyId = document.getElementById('edit-journey').value;
+        if (journeyId) {
+            formData.append('journey_id', journeyId);
+        }
+
+        const response = await fetch(`/api/daily/todos/${currentTodoId}`, {
+            method: 'PUT',
+            body: formData
+        });
+
+        if (response.ok) {
+            document.getElementById('edit-modal').classList.add('hidden');
+            const editedTodoId = currentTodoId;
+            currentTodoId = null;
+            await refreshAfterMutation(() => refreshTodoItem(editedTodoId));
+        } else {
+            alert('할 일 수정에 실패했습니다.');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('오류가 발생했습니다.');
+    }
+});
+
+// 편집 모달 취소
+document.getElementById('cancel-edit').addEventListener('click', () => {
+    document.getElementById('edit-modal').classList.add('hidden');
+    currentTodoId = null;
+});
+
+// Enter 키로 할 일 추가
+document.getElementById('quick-todo-input').addEventListener('keypress', (e) => {
+    if (e.key === 'Enter') {
+        e.preventDefault();
+        const detailedForm = document.getElementById('detailed-form');
+        if (detailedForm.classList.contains('hidden')) {
+            document.getElementById('quick-add-btn').click();
+        } else {
+            document.getElementById('detailed-add-btn').click();
+        }
+    }
+});
+
+
+// 일일 회고 모달 열기
+// (요약 카드가 다시 렌더링되므로 이벤트 위임 사용)
+document.addEventListener('click', async (e) => {
+    if (!e.target.closest('#daily-reflection-btn')) return;
+    await loadReflectionData();
+    document.getElementById('daily-reflection-modal').classList.remove('hidden');
+});
+
+// 회고 데이터 로드 함수
+async function loadReflectionData() {
+    try {
+        const response = await fetch('/api/daily/reflection-summary');
+        const data = await response.json();
+
+        // 요약 정보 업데이트
+        document.getElementById('modal-total-todos').textContent = data.summary.total || 0;
+        document.getElementById('modal-completed-todos').textContent = data.summary.completed || 0;
+        document.getElementById('modal-completion-rate').textContent = `${data.summary.completion_rate || 0}%`;
+
+        // 완료한 일들 목록
+        const completedList = document.getElementById('completed-list');
+        completedList.innerHTML = '';
+
+        if (data.completed_todos && Object.keys(data.completed_todos).length > 0) {
+            Object.entries(data.completed_todos).forEach(([category, todos]) => {
+                if (todos.length > 0) {
+                    const categoryName = getCategoryName(category);
+                    const categoryDiv = document.createElement('div');
+                    categoryDiv.innerHTML = `<div class="font-medium text-green-700 mb-1">${categoryName}</div>`;
+
+                    todos.forEach(todo => {
+                        const todoDiv = document.createElement('div');
+                        const timeStr = todo.completed_at ? ` (${todo.completed_at})` : '';
+                        todoDiv.className = 'text-gray-600 ml-2';
+                        todoDiv.textContent = `• ${todo.title}${timeStr}`;
+                        categoryDiv.appendChild(todoDiv);
+                    });
+                    completedList.appendChild(categoryDiv);
+                }
+            });
+        } else {
+            completedList.innerHTML = '<div class="text-gray-500 italic">완료한 일이 없습니다</div>';
+        }
+
+        // 미완료 일들 목록
+        const pendingList = document.getElementById('pending-list');
+        pendingList.innerHTML = '';
+
+        if (data.pending_todos && Object.keys(data.pending_todos).length > 0) {
+            Object.entries(data.pending_todos).forEach(([category, todos]) => {
+                if (todos.length > 0) {
+                    const categoryName = getCategoryName(category);
+                    const categoryDiv = document.createElement('div');
+                    categoryDiv.innerHTML = `<div class="font-medium text-orange-700 mb-1">${categoryName}</div>`;
+
+                    todos.forEach(todo => {
+                        const todoDiv = document.createElement('div');
+                        const timeStr = todo.estimated_minutes ? ` (예상 ${todo.estimated_minutes}분)` : '';
+                        todoDiv.className = 'text-gray-600 ml-2';
+                        todoDiv.textContent = `• ${todo.title}${timeStr}`;
+                        categoryDiv.appendChild(todoDiv);
+                    });
+                    pendingList.appendChild(categoryDiv);
+                }
+            });
+        } else {
+            pendingList.innerHTML = '<div class="text-gray-500 italic">미완료 일이 없습니다</div>';
+        }
+
+        // 전역 변수에 템플릿 저장
+        window.reflectionTemplate = data.reflection_template;
+
+        // 오늘 날짜의 기존 회고 조회
+        const today = new Date().toISOString().split('T')[0];
+        try {
+            const reflectionResponse = await fetch(`/api/reflections/date/${today}`);
+            if (reflectionResponse.ok) {
+                const reflectionData = await reflectionResponse.json();
+
+                // 기존 회고가 있으면 폼에 채우기
+                if (reflectionData.id) {
+                    document.getElementById('daily-reflection-text').value = reflectionData.reflection_text || '';
+                    document.getElementById('satisfaction-score').value = reflectionData.satisfaction_score || '';
+                    document.getElementById('energy-level').value = reflectionData.energy_level || '';
+
+                    // 수정 모드 표시를 위한 플래그 저장
+                    window.isEditingReflection = true;
+
+                    // UI 업데이트: 수정 모드 표시
+                    document.getElementById('daily-reflection-title').textContent = '📔 오늘 하루 회고 (수정)';
+                    document.getElementById('save-daily-reflection').textContent = '💾 회고 업데이트';
+                } else {
+                    // 새 작성 모드
+                    window.isEditingReflection = false;
+
+                    // UI 업데이트: 새 작성 모드 표시
+                    document.getElementById('daily-reflection-title').textContent = '📔 오늘 하루 회고';
+                    document.getElementById('save-daily-reflection').textContent = '💾 회고 저장하기';
+                }
+            }
+        } catch (reflectionError) {
+            // 기존 회고 조회 실패는 무시 (새 작성으로 진행)
+            console.log('기존 회고 없음 또는 조회 실패:', reflectionError);
+            window.isEditingReflection = false;
+
+            // UI 업데이트: 새 작성 모드 표시
+            document.getElementById('daily-reflection-title').textContent = '📔 오늘 하루 회고';
+            document.getElementById('save-daily-reflection').textContent = '💾 회고 저장하기';
+        }
+
+    } catch (error) {
+        console.error('회고 데이터 로드 실패:', error);
+        // 에러 시 기본값 설정
+        document.getElementById('modal-total-todos').textContent = '0';
+        document.getElementById('modal-completed-todos').textContent = '0';
+        document.getElementById('modal-completion-rate').textContent = '0%';
+    }
+}
+
+// 카테고리 이름 변환 함수
+function getCategoryName(category) {
+    const categoryNames = {
+        'WORK': '💼 업무',
+        'PERSONAL': '👤 개인',
+        'HEALTH': '💪 건강',
+        'LEARNING': '📚 학습',
+        'SOCIAL': '👥 사회',
+        'OTHER': '🔹 기타'
+    };
+    return categoryNames[category] || category;
+}
+
+// 템플릿 불러오기
+document.getElementById('load-template').addEventListener('click', () => {
+    if (window.reflectionTemplate) {
+        document.getElementById('daily-reflection-text').value = window.reflectionTemplate;
+    } else {
+        alert('템플릿을 불러올 수 없습니다. 모달을 다시 열어주세요.');
+    }
+});
+
+// 일일 회고 취소
+document.getElementById('cancel-daily-reflection').addEventListener('click', () => {
+    document.getElementById('daily-reflection-modal').classList.add('hidden');
+    document.getElementById('daily-reflection-text').value = '';
+    document.getElementById('satisfaction-score').value = '';
+    document.getElementById('energy-level').value = '';
+
+    // UI 초기화
+    document.getElementById('daily-reflection-title').textContent = '📔 오늘 하루 회고';
+    document.getElementById('save-daily-reflection').textContent = '💾 회고 저장하기';
+});
+
+// X 버튼으로 닫기
+document.getElementById('close-daily-reflection').addEventListener('click', () => {
+    document.getElementById('daily-reflection-modal').classList.add('hidden');
+    document.getElementById('daily-reflection-text').value = '';
+    document.getElementById('satisfaction-score').value = '';
+    document.getElementById('energy-level').value = '';
+
+    // UI 초기화
+    document.getElementById('daily-reflection-title').textContent = '📔 오늘 하루 회고';
+    document.getElementById('save-daily-reflection').textContent = '💾 회고 저장하기';
+});
+
+// 일일 회고 저장
+document.getElementById('save-daily-reflection').addEventListener('click', async () => {
+    const reflectionText = document.getElementById('daily-reflection-text').value.trim();
+    const satisfactionScore = document.getElementById('satisfaction-score').value;
+    const energyLevel = document.getElementById('energy-level').value;
+
+    if (!reflectionText) {
+        alert('회고 내용을 입력해주세요.');
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        const today = new Date().toISOString().split('T')[0]; // YYYY-MM-DD 형식
+
+        formData.append('reflection_date', today);
+        formData.append('reflection_text', reflectionText);
+
+        if (satisfactionScore) {
+            formData.append('satisfaction_score', satisfactionScore);
+        }
+        if (energyLevel) {
+            formData.append('energy_level', energyLevel);
+        }
+
+        const response = await fetch('/api/reflections/', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (response.ok) {
+            const result = await response.json();
+            document.getElementById('daily-reflection-modal').classList.add('hidden');
+            document.getElementById('daily-reflection-text').value = '';
+            document.getElementById('satisfaction-score').value = '';
+            document.getElementById('energy-level').value = '';
+
+            // UI 초기화
+            document.getElementById('daily-reflection-title').textContent = '📔 오늘 하루 회고';
+            document.getElementById('save-daily-reflection').textContent = '💾 회고 저장하기';
+
+            // 수정 모드에 따라 다른 메시지 표시
+            const message = window.isEditingReflection
+                ? '📔 오늘의 회고가 수정되었습니다!\n\n회고 히스토리에서 확인하실 수 있습니다.'
+                : '📔 오늘의 회고가 저장되었습니다!\n\n회고 히스토리에서 확인하실 수 있습니다.';
+            alert(message);
+
+            // 회고 히스토리 페이지로 이동할지 묻기
+            if (confirm('회고 히스토리를 확인하시겠습니까?')) {
+                window.location.href = '/reflection-history';
+            }
+        } else {
+            const errorData = await response.json();
+            alert(`회고 저장 중 오류가 발생했습니다: ${errorData.detail || '알 수 없는 오류'}`);
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('회고 저장 중 오류가 발생했습니다.');
+    }
+});
+
+// 여정 목록 로드 함수
+async function loadMilestones() {
+    try {
+        const response = await fetch('/api/daily/journeys');
+        if (response.ok) {
+            const data = await response.json();
+            const journeys = data.journeys || [];
+
+            // 추가 모달의 여정 드롭다운 업데이트
+            const addMilestoneSelect = document.getElementById('journey-select');
+            addMilestoneSelect.innerHTML = '<option value="">여정 선택 (선택사항)</option>';
+
+            // 편집 모달의 여정 드롭다운 업데이트
+            const editMilestoneSelect = document.getElementById('edit-journey');
+            editMilestoneSelect.innerHTML = '<option value="">여정 선택 (선택사항)</option>';
+
+            journeys.forEach(journey => {
+                const option = document.createElement('option');
+                option.value = journey.id;
+                option.textContent = journey.title;
+
+                addMilestoneSelect.appendChild(option.cloneNode(true));
+                editMilestoneSelect.appendChild(option);
+            });
+        }
+    } catch (error) {
+        console.error('여정 로드 실패:', error);
+    }
+}
+
+// 이미지 미리보기 처리
+function handleImagePreview(input) {
+    const file = input.files[0];
+    if (!file) return;
+
+    // 파일 크기 체크 (10MB)
+    if (file.size > 10 * 1024 * 1024) {
+        alert('이미지 파일 크기는 10MB 이하여야 합니다.');
+        input.value = '';
+        return;
+    }
+
+    // 파일 타입 체크
+    const allowedTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp'];
+    if (!allowedTypes.includes(file.type)) {
+        alert('지원하지 않는 이미지 형식입니다. (JPG, PNG, GIF, WebP만 지원)');
+        input.value = '';
+        return;
+    }
+
+    // 미리보기 표시
+    const reader = new FileReader();
+    reader.onload = function(e) {
+        document.getElementById('image-upload-area').classList.add('hidden');
+        document.getElementById('image-preview').classList.remove('hidden');
+        document.getElementById('remove-image').classList.remove('hidden');
+
+        document.getElementById('preview-img').src = e.target.result;
+        document.getElementById('image-name').textContent = file.name;
+    };
+    reader.readAsDataURL(file);
+}
+
+// 이미지 미리보기 제거
+function removeImagePreview() {
+    document.getElementById('reflection-image').value = '';
+    document.getElementById('image-upload-area').classList.remove('hidden');
+    document.getElementById('image-preview').classList.add('hidden');
+    document.getElementById('remove-image').classList.add('hidden');
+    document.getElementById('preview-img').src = '';
+    document.getElementById('image-name').textContent = '';
+}
+
+// === 회고 수정 관련 함수 ===
+
+// 회고 수정 이미지 미리보기 처리
+function handleEditImagePreview(input) {
+    const file = input.files[0];
+    if (!file) return;
+
+    // 파일 크기 체크 (10MB)
+    if (file.size > 10 * 1024 * 1024) {
+        alert('이미지 파일 크기는 10MB 이하여야 합니다.');
+        input.value = '';
+        return;
+    }
+
+    // 파일 타입 체크
+    const allowedTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp'];
+    if (!allowedTypes.includes(file.type)) {
+        alert('지원하지 않는 이미지 형식입니다. (JPG, PNG, GIF, WebP만 지원)');
+        input.value = '';
+        return;
+    }
+
+    // 미리보기 표시
+    const reader = new FileReader();
+    reader.onload = function(e) {
+        document.getElementById('edit-image-upload-area').classList.add('hidden');
+        document.getElementById('edit-image-preview').classList.remove('hidden');
+        document.getElementById('edit-remove-image').classList.remove('hidden');
+
+        document.getElementById('edit-preview-img').src = e.target.result;
+        document.getElementById('edit-image-name').textContent = file.name;
+    };
+    reader.readAsDataURL(file);
+}
+
+// 회고 수정 이미지 미리보기 제거
+function removeEditImagePreview() {
+    document.getElementById('edit-reflection-image').value = '';
+    document.getElementById('edit-image-upload-area').classList.remove('hidden');
+    document.getElementById('edit-image-preview').classList.add('hidden');
+    document.getElementById('edit-remove-image').classList.add('hidden');
+    document.getElementById('edit-preview-img').src = '';
+    document.getElementById('edit-image-name').textContent = '';
+}
+
+// 회고 수정 모달 열기
+let currentEditTodoId = null;
+
+document.addEventListener('click', (e) => {
+    if (e.target.closest('.edit-reflection')) {
+        const button = e.target.closest('.edit-reflection');
+        currentEditTodoId = button.dataset.todoId;
+        const reflection = button.dataset.reflection;
+        const imagePath = button.dataset.imagePath;
+
+        // 모달 열기
+        document.getElementById('edit-reflection-modal').classList.remove('hidden');
+
+        // 기존 회고 내용 채우기
+        document.getElementById('edit-reflection-text').value = reflection || '';
+
+        // 기존 이미지 표시 (있는 경우)
+        if (imagePath) {
+            document.getElementById('edit-image-upload-area').classList.add('hidden');
+            document.getElementById('edit-image-preview').classList.remove('hidden');
+            document.getElementById('edit-remove-image').classList.remove('hidden');
+            document.getElementById('edit-preview-img').src = imagePath;
+            document.getElementById('edit-image-name').textContent = '기존 이미지';
+        } else {
+            // 이미지 없으면 초기화
+            removeEditImagePreview();
+        }
+    }
+});
+
+// 회고 수정 완료 버튼
+document.getElementById('update-reflection').addEventListener('click', async () => {
+    if (!currentEditTodoId) return;
+
+    const reflection = document.getElementById('edit-reflection-text').value.trim();
+    const imageFile = document.getElementById('edit-reflection-image').files[0];
+
+    try {
+        const formData = new FormData();
+        formData.append('reflection', reflection);
+
+        if (imageFile) {
+            formData.append('reflection_image', imageFile);
+        }
+
+        const response = await fetch(`/api/daily/todos/${currentEditTodoId}/reflection`, {
+            method: 'PATCH',
+            body: formData
+        });
+
+        if (response.ok) {
+            // 모달 닫기
+            document.getElementById('edit-reflection-modal').classList.add('hidden');
+
+            // 수정한 항목만 다시 렌더링
+            await refreshAfterMutation(() => refreshTodoItem(currentEditTodoId));
+        } else {
+            const error = await response.json();
+            alert(error.detail || '회고 수정에 실패했습니다.');
+        }
+    } catch (error) {
+        console.error('Error updating reflection:', error);
+        alert('회고 수정 중 오류가 발생했습니다.');
+    }
+});
+
+// 회고 수정 취소 버튼
+document.getElementById('cancel-edit-reflection').addEventListener('click', () => {
+    document.getElementById('edit-reflection-modal').classList.add('hidden');
+    currentEditTodoId = null;
+    removeEditImagePreview();
+});
+
+// 모달 배경 클릭 시 닫기
+document.addEventListener('click', (e) => {
+    if (e.target.id === 'edit-reflection-modal') {
+        document.getElementById('edit-reflection-modal').classList.add('hidden');
+        currentEditTodoId = null;
+        removeEditImagePreview();
+    }
+});
+
+// === 회고 수정 관련 함수 끝 ===
+
+// 이미지 모달 표시
+function showImageModal(imagePath) {
+    document.getElementById('modal-image').src = imagePath;
+    document.getElementById('image-modal').classList.remove('hidden');
+}
+
+// 이미지 모달 닫기
+function closeImageModal() {
+    document.getElementById('image-modal').classList.add('hidden');
+    document.getElementById('modal-image').src = '';
+}
+
+// ESC 키로 이미지 모달 닫기
+document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
+        closeImageModal();
+    }
+});
+
+// 미루기 히스토리 표시
+async function showPostponeHistory(todoId) {
+    try {
+        const response = await fetch(`/api/daily/todos/${todoId}/postpone-summary`);
+        if (!response.ok) {
+            throw new Error('미루기 히스토리를 불러올 수 없습니다.');
+        }
+
+        const data = await response.json();
+
+        // 요약 정보 업데이트
+        document.getElementById('summary-postpone-count').textContent = data.postpone_count;
+        document.getElementById('summary-total-days').textContent = `${data.total_days_postponed}일`;
+        document.getElementById('summary-original-date').textContent = new Date(data.original_date).toLocaleDateString('ko-KR');
+
+        // 히스토리 목록 생성
+        const historyList = document.getElementById('postpone-history-list');
+        historyList.innerHTML = '';
+
+        if (data.full_history && data.full_history.length > 0) {
+            data.full_history.forEach((history, index) => {
+                const historyItem = document.createElement('div');
+                historyItem.className = 'p-3 border border-gray-200 rounded-md bg-gray-50';
+
+                const fromDate = new Date(history.from_date).toLocaleDateString('ko-KR');
+                const toDate = new Date(history.to_date).toLocaleDateString('ko-KR');
+                const postponedAt = new Date(history.postponed_at).toLocaleString('ko-KR');
+
+                historyItem.innerHTML = `
+                    <div class="flex items-center justify-between mb-2">
+                        <span class="text-sm font-medium text-gray-700">${index + 1}번째 미루기</span>
+                        <span class="text-xs text-gray-500">${postponedAt}</span>
+                    </div>
+                    <div class="text-sm text-gray-600 mb-2">
+                        <span class="font-medium">${fromDate}</span> → <span class="font-medium">${toDate}</span>
+                    </div>
+                    <div class="text-sm text-gray-700 bg-white p-2 rounded border-l-4 border-orange-400">
+                        💭 ${history.reason}
+                    </div>
+                `;
+
+                historyList.appendChild(historyItem);
+            });
+        } else {
+            historyList.innerHTML = '<div class="text-center text-gray-500 py-4">미루기 히스토리가 없습니다.</div>';
+        }
+
+        // 모달 표시
+        document.getElementById('postpone-history-modal').classList.remove('hidden');
+
+    } catch (error) {
+        console.error('미루기 히스토리 로드 오류:', error);
+        alert('미루기 히스토리를 불러오는 중 오류가 발생했습니다.');
+    }
+}
+
+// 미루기 히스토리 모달 닫기
+document.getElementById('close-postpone-history').addEventListener('click', () => {
+    document.getElementById('postpone-history-modal').classList.add('hidden');
+});
+
+document.getElementById('close-postpone-history-btn').addEventListener('click', () => {
+    document.getElementById('postpone-history-modal').classList.add('hidden');
+});
+
+// 모달 외부 클릭 시 닫기에 미루기 히스토리 모달 추가
+document.addEventListener('click', (e) => {
+    if (e.target.id === 'reflection-modal') {
+        document.getElementById('cancel-reflection').click();
+    }
+    if (e.target.id === 'reschedule-modal') {
+        document.getElementById('cancel-reschedule').click();
+    }
+    if (e.target.id === 'edit-modal') {
+        document.getElementById('cancel-edit').click();
+    }
+    if (e.target.id === 'daily-reflection-modal') {
+        document.getElementById('cancel-daily-reflection').click();
+    }
+    if (e.target.id === 'postpone-history-modal') {
+        document.getElementById('close-postpone-history').click();
+    }
+});
+
+// 페이지 로드 시 여정 목록 로드
+// (데스크톱 메모 패널은 서버에서 렌더링되어 있으므로 모바일일 때만 로드)
+document.addEventListener('DOMContentLoaded', () => {
+    loadMilestones();
+    if (window.innerWidth < 1280) {
+        loadMemosBasedOnScreenSize();
+    }
+    setupMemoCharCounter();
+});
+
+// === 메모 관련 기능 ===
+
+// 글자 수 카운터 설정
+function setupMemoCharCounter() {
+    const memoInput = document.getElementById('memo-input');
+    const charCount = document.getElementById('memo-char-count');
+
+    memoInput.addEventListener('input', () => {
+        const currentLength = memoInput.value.length;
+        charCount.textContent = currentLength;
+
+        // 글자 수에 따른 스타일 변경
+        if (currentLength > 450) {
+            charCount.className = 'text-red-600';
+        } else if (currentLength > 400) {
+            charCount.className = 'text-yellow-600';
+        } else {
+            charCount.className = 'text-gray-500';
+        }
+    });
+}
+
+// 화면 크기에 따라 적절한 메모 로딩 함수를 호출하는 헬퍼 함수
+async function loadMemosBasedOnScreenSize() {
+    const isDesktopMode = window.innerWidth >= 1280; // xl breakpoint
+
+    if (isDesktopMode) {
+        // 데스크톱 메모 패널은 서버 렌더링 조각으로 교체
+        try {
+            await refreshFragment('memos');
+        } catch (error) {
+            console.error('메모 로드 오류:', error);
+        }
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/daily/memos/today');
+        if (!response.ok) {
+            throw new Error('메모 로드 실패');
+        }
+
+        const data = await response.json();
+        const memos = data.memos || [];
+
+        updateMobileMemos(memos);
+    } catch (error) {
+        console.error('메모 로드 오류:', error);
+        updateMobileMemos([]);
+    }
+}
+
+// 모바일 메모 업데이트
+function updateMobileMemos(memos) {
+    // 화면 크기 체크 - 모바일 모드가 아니면 함수 실행하지 않음
+    if (window.innerWidth >= 1280) {
+        console.log('데스크톱 모드에서는 updateMobileMemos를 실행하지 않습니다.');
+        return;
+    }
+
+    const mobileContainer = document.getElementById('mobile-memo-list');
+
+    if (!mobileContainer) {
+        console.log('모바일 메모 컨테이너를 찾을 수 없습니다.');
+        return;
+    }
+
+    if (memos.length === 0) {
+        mobileContainer.innerHTML = `
+            <div class="text-center py-8 text-gray-500">
+                <p class="text-sm">📝</p>
+                <p class="text-sm mt-2">아직 작성된 메모가 없습니다.</p>
+                <p class="text-xs mt-1">위의 입력 창에서 오늘의 첫 메모를 작성해보세요!</p>
+            </div>
+        `;
+        return;
+    }
+
+    mobileContainer.innerHTML = memos.map(memo => {
+        const timeStr = memo.created_at ? new Date(memo.created_at).toLocaleTimeString('ko-KR', {
+            hour: '2-digit',
+            minute: '2-digit',
+            hour12: false
+        }) : '';
+
+        return `
+            <div class="border-b border-gray-100 py-3 px-4">
+                <div class="flex justify-between items-start">
+                    <div class="flex-1 pr-3">
+                        <p class="text-sm text-gray-800 leading-relaxed">${escapeHtml(memo.content)}</p>
+                        <p class="text-xs text-gray-400 mt-1">${timeStr}</p>
+                    </div>
+                    <div class="flex space-x-1">
+                        <button class="mobile-edit-memo-btn text-gray-400 hover:text-blue-500 p-1 rounded"
+                                data-memo-id="${memo.id}"
+                                data-memo-content="${escapeHtml(memo.content)}"
+                                title="메모 수정">
+                            ✏️
+                        </button>
+                        <button class="mobile-delete-memo-btn text-gray-400 hover:text-red-500 p-1 rounded"
+                                data-memo-id="${memo.id}"
+                                title="메모 삭제">
+                            🗑️
+                        </button>
+                    </div>
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+
+// HTML 이스케이프 함수
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+// 메모 추가
+document.getElementById('add-memo-btn').addEventListener('click', async () => {
+    const memoInput = document.getElementById('memo-input');
+    const content = memoInput.value.trim();
+
+    if (!content) {
+        alert('메모 내용을 입력해주세요.');
+        memoInput.focus();
+        return;
+    }
+
+    try {
+        if (currentEditingMemoId) {
+            // 수정 모드
+            await updateMemo(currentEditingMemoId, content);
+            resetMemoInputMode();
+        } else {
+            // 추가 모드
+            const formData = new FormData();
+            formData.append('content', content);
+
+            const response = await fetch('/api/daily/memos/quick', {
+                method: 'POST',
+                body: formData
+            });
+
+            if (!response.ok) {
+                throw new Error('메모 추가 실패');
+            }
+
+            // 입력창 초기화
+            memoInput.value = '';
+            document.getElementById('memo-char-count').textContent = '0';
+        }
+
+        // 메모 목록 새로고침
+        await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+    } catch (error) {
+        const operation = currentEditingMemoId ? '수정' : '추가';
+        console.error(`메모 ${operation} 오류:`, error);
+        alert(`메모 ${operation} 중 오류가 발생했습니다.`);
+    }
+});
+
+// Enter 키로 메모 추가/수정, ESC 키로 수정 취소
+document.getElementById('memo-input').addEventListener('keydown', (e) => {
+    if (e.key === 'Enter' && !e.shiftKey) {
+        e.preventDefault();
+        document.getElementById('add-memo-btn').click();
+    } else if (e.key === 'Escape' && currentEditingMemoId) {
+        e.preventDefault();
+        resetMemoInputMode();
+    }
+});
+
+// 메모 삭제
+async function deleteMemo(memoId) {
+    if (!confirm('이 메모를 삭제하시겠습니까?')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/daily/memos/${memoId}`, {
+            method: 'DELETE'
+        });
+
+        if (!response.ok) {
+            throw new Error('메모 삭제 실패');
+        }
+
+        // 메모 목록 새로고침
+        await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+    } catch (error) {
+        console.error('메모 삭제 오류:', error);
+        alert('메모 삭제 중 오류가 발생했습니다.');
+    }
+}
+
+// 메모 수정
+// 현재 수정 중인 메모 ID를 저장하는 변수
+let currentEditingMemoId = null;
+
+function editMemo(memoId, currentContent) {
+    const memoInput = document.getElementById('memo-input');
+    const addBtn = document.getElementById('add-memo-btn');
+    const charCount = document.getElementById('memo-char-count');
+
+    if (!memoInput || !addBtn || !charCount) {
+        console.error('메모 입력 요소들을 찾을 수 없습니다.');
+        return;
+    }
+
+    // 수정 모드로 전환
+    currentEditingMemoId = memoId;
+    memoInput.value = currentContent;
+    charCount.textContent = currentContent.length;
+
+    // 버튼 텍스트 변경 및 스타일 조정
+    addBtn.textContent = '수정 완료';
+    addBtn.className = 'px-4 py-2 bg-green-600 text-white rounded-md hover:bg-green-700 text-sm font-medium';
+
+    // 입력창에 포커스
+    memoInput.focus();
+
+    // 커서를 텍스트 끝으로 이동
+    memoInput.setSelectionRange(memoInput.value.length, memoInput.value.length);
+}
+
+// 메모 입력 모드를 초기 상태로 리셋
+function resetMemoInputMode() {
+    const memoInput = document.getElementById('memo-input');
+    const addBtn = document.getElementById('add-memo-btn');
+    const charCount = document.getElementById('memo-char-count');
+
+    if (!memoInput || !addBtn || !charCount) {
+        console.error('메모 입력 요소들을 찾을 수 없습니다.');
+        return;
+    }
+
+    // 수정 모드 해제
+    currentEditingMemoId = null;
+
+    // 입력창 초기화
+    memoInput.value = '';
+    charCount.textContent = '0';
+
+    // 버튼을 원래 상태로 복원
+    addBtn.textContent = '메모 추가';
+    addBtn.className = 'px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 text-sm font-medium';
+}
+
+// 메모 업데이트
+async function updateMemo(memoId, content) {
+    try {
+        const formData = new FormData();
+        formData.append('content', content);
+
+        const response = await fetch(`/api/daily/memos/${memoId}`, {
+            method: 'PUT',
+            body: formData
+        });
+
+        if (!response.ok) {
+            throw new Error('메모 수정 실패');
+        }
+
+    } catch (error) {
+        console.error('메모 수정 오류:', error);
+        alert('메모 수정 중 오류가 발생했습니다.');
+    }
+}
+
+// 전체 메모 삭제
+// (메모 패널이 다시 렌더링되므로 이벤트 위임 사용)
+document.addEventListener('click', async (e) => {
+    if (!e.target.closest('#clear-all-memos')) return;
+    if (!confirm('오늘의 모든 메모를 삭제하시겠습니까?\n\n이 작업은 되돌릴 수 없습니다.')) {
+        return;
+    }
+
+    try {
+        // 먼저 오늘의 메모 목록을 가져온다
+        const response = await fetch('/api/daily/memos/today');
+        if (!response.ok) {
+            throw new Error('메모 목록 조회 실패');
+        }
+
+        const data = await response.json();
+        const memos = data.memos || [];
+
+        if (memos.length === 0) {
+            alert('삭제할 메모가 없습니다.');
+            return;
+        }
+
+        // 각 메모를 개별적으로 삭제
+        let deletedCount = 0;
+        for (const memo of memos) {
+            try {
+                const deleteResponse = await fetch(`/api/daily/memos/${memo.id}`, {
+                    method: 'DELETE'
+                });
+                if (deleteResponse.ok) {
+                    deletedCount++;
+                }
+            } catch (deleteError) {
+                console.error(`메모 ${memo.id} 삭제 실패:`, deleteError);
+            }
+        }
+
+        alert(`${deletedCount}개의 메모가 삭제되었습니다.`);
+
+        // 메모 목록 새로고침
+        await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+    } catch (error) {
+        console.error('전체 메모 삭제 오류:', error);
+        alert('메모 삭제 중 오류가 발생했습니다.');
+    }
+});
+
+// === 모바일 메모 기능 ===
+// 모바일 메모 토글 버튼 (null 체크 추가)
+const mobileToggleBtn = document.getElementById('mobile-memo-toggle');
+if (mobileToggleBtn) {
+    mobileToggleBtn.addEventListener('click', () => {
+        const mobileModal = document.getElementById('mobile-memo-modal');
+        if (mobileModal) {
+            mobileModal.classList.remove('hidden');
+            // 모바일에서 메모를 열 때 최신 메모 목록 로드
+            loadMemosBasedOnScreenSize();
+        }
+    });
+}
+
+// 모바일 메모 모달 닫기 (null 체크 추가)
+const closeMobileBtn = document.getElementById('close-mobile-memo');
+if (closeMobileBtn) {
+    closeMobileBtn.addEventListener('click', () => {
+        const mobileModal = document.getElementById('mobile-memo-modal');
+        if (mobileModal) {
+            mobileModal.classList.add('hidden');
+        }
+    });
+}
+
+// 모바일 메모 입력 글자 수 카운터 (null 체크 추가)
+const mobileMemoInput = document.getElementById('mobile-memo-input');
+const mobileMemoCounter = document.getElementById('mobile-memo-counter');
+
+if (mobileMemoInput && mobileMemoCounter) {
+    mobileMemoInput.addEventListener('input', () => {
+    const length = mobileMemoInput.value.length;
+    mobileMemoCounter.textContent = `${length}/500`;
+
+    if (length > 500) {
+        mobileMemoCounter.classList.add('text-red-500');
+        mobileMemoCounter.classList.remove('text-gray-500');
+    } else {
+        mobileMemoCounter.classList.remove('text-red-500');
+        mobileMemoCounter.classList.add('text-gray-500');
+    }
+    });
+}
+
+// 모바일 메모 추가 (null 체크 추가)
+const addMobileMemoBtn = document.getElementById('add-mobile-memo');
+if (addMobileMemoBtn && mobileMemoInput && mobileMemoCounter) {
+    addMobileMemoBtn.addEventListener('click', async () => {
+    const content = mobileMemoInput.value.trim();
+
+    if (!content) {
+        alert('메모 내용을 입력해주세요.');
+        return;
+    }
+
+    if (content.length > 500) {
+        alert('메모는 500자를 초과할 수 없습니다.');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/daily/memos', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                content: content
+            })
+        });
+
+        if (!response.ok) {
+            throw new Error('메모 추가 실패');
+        }
+
+        // 입력 필드 클리어
+        mobileMemoInput.value = '';
+        mobileMemoCounter.textContent = '0/500';
+
+        // 모바일과 데스크톱 메모 목록 모두 새로고침
+        await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+        // 간단한 피드백
+        const button = document.getElementById('add-mobile-memo');
+        const originalText = button.textContent;
+        button.textContent = '✓ 추가됨';
+        button.disabled = true;
+
+        setTimeout(() => {
+            button.textContent = originalText;
+            button.disabled = false;
+        }, 1000);
+
+    } catch (error) {
+        console.error('모바일 메모 추가 오류:', error);
+        alert('메모 추가 중 오류가 발생했습니다.');
+    }
+    });
+}
+
+
+// 메모 이벤트 리스너 등록 (동적 생성된 버튼용 - 데스크톱과 모바일 공통)
+document.addEventListener('click', async function(e) {
+    // 데스크톱 메모 편집 버튼
+    if (e.target.classList.contains('desktop-edit-memo-btn') || e.target.closest('.desktop-edit-memo-btn')) {
+        const button = e.target.classList.contains('desktop-edit-memo-btn') ? e.target : e.target.closest('.desktop-edit-memo-btn');
+        const memoId = button.dataset.memoId;
+        const currentContent = button.dataset.memoContent;
+
+        // HTML 엔티티 디코딩
+        const decodedContent = currentContent
+            .replace(/&#39;/g, "'")
+            .replace(/&quot;/g, '"')
+            .replace(/&gt;/g, '>')
+            .replace(/&lt;/g, '<')
+            .replace(/&amp;/g, '&');
+
+        // 새로운 인라인 편집 방식 사용
+        editMemo(memoId, decodedContent);
+    }
+
+    // 데스크톱 메모 삭제 버튼
+    if (e.target.classList.contains('desktop-delete-memo-btn') || e.target.closest('.desktop-delete-memo-btn')) {
+        const button = e.target.classList.contains('desktop-delete-memo-btn') ? e.target : e.target.closest('.desktop-delete-memo-btn');
+        const memoId = button.dataset.memoId;
+
+        if (!confirm('이 메모를 삭제하시겠습니까?')) {
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/daily/memos/${memoId}`, {
+                method: 'DELETE'
+            });
+
+            if (!response.ok) {
+                throw new Error('메모 삭제 실패');
+            }
+
+            // 데스크톱과 모바일 메모 목록 모두 새로고침
+            await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+        } catch (error) {
+            console.error('데스크톱 메모 삭제 오류:', error);
+            alert('메모 삭제 중 오류가 발생했습니다.');
+        }
+    }
+
+    // 모바일 메모 편집 버튼
+    if (e.target.classList.contains('mobile-edit-memo-btn')) {
+        const memoId = e.target.dataset.memoId;
+        const currentContent = e.target.dataset.memoContent;
+
+        // HTML 엔티티 디코딩
+        const decodedContent = currentContent
+            .replace(/&#39;/g, "'")
+            .replace(/&quot;/g, '"')
+            .replace(/&gt;/g, '>')
+            .replace(/&lt;/g, '<')
+            .replace(/&amp;/g, '&');
+
+        const newContent = prompt('메모 수정:', decodedContent);
+
+        if (newContent === null) return; // 취소
+
+        if (!newContent.trim()) {
+            alert('메모 내용을 입력해주세요.');
+            return;
+        }
+
+        if (newContent.length > 500) {
+            alert('메모는 500자를 초과할 수 없습니다.');
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/daily/memos/${memoId}`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    content: newContent.trim()
+                })
+            });
+
+            if (!response.ok) {
+                throw new Error('메모 수정 실패');
+            }
+
+            // 모바일과 데스크톱 메모 목록 모두 새로고침
+            await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+        } catch (error) {
+            console.error('모바일 메모 수정 오류:', error);
+            alert('메모 수정 중 오류가 발생했습니다.');
+        }
+    }
+
+    // 모바일 메모 삭제 버튼
+    if (e.target.classList.contains('mobile-delete-memo-btn')) {
+        const memoId = e.target.dataset.memoId;
+
+        if (!confirm('이 메모를 삭제하시겠습니까?')) {
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/daily/memos/${memoId}`, {
+                method: 'DELETE'
+            });
+
+            if (!response.ok) {
+                throw new Error('메모 삭제 실패');
+            }
+
+            // 모바일과 데스크톱 메모 목록 모두 새로고침
+            await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+        } catch (error) {
+            console.error('모바일 메모 삭제 오류:', error);
+            alert('메모 삭제 중 오류가 발생했습니다.');
+        }
+    }
+});
+
+// 모바일 전체 메모 삭제 (null 체크 추가)
+const mobileClearAllBtn = document.getElementById('mobile-clear-all-memos');
+if (mobileClearAllBtn) {
+    mobileClearAllBtn.addEventListener('click', async () => {
+    if (!confirm('오늘의 모든 메모를 삭제하시겠습니까?\n\n이 작업은 되돌릴 수 없습니다.')) {
+        return;
+    }
+
+    try {
+        // 먼저 오늘의 메모 목록을 가져온다
+        const response = await fetch('/api/daily/memos/today');
+        if (!response.ok) {
+            throw new Error('메모 목록 조회 실패');
+        }
+
+        const data = await response.json();
+        const memos = data.memos || [];
+
+        if (memos.length === 0) {
+            alert('삭제할 메모가 없습니다.');
+            return;
+        }
+
+        // 각 메모를 개별적으로 삭제
+        let deletedCount = 0;
+        for (const memo of memos) {
+            try {
+                const deleteResponse = await fetch(`/api/daily/memos/${memo.id}`, {
+                    method: 'DELETE'
+                });
+                if (deleteResponse.ok) {
+                    deletedCount++;
+                }
+            } catch (deleteError) {
+                console.error(`메모 ${memo.id} 삭제 실패:`, deleteError);
+            }
+        }
+
+        alert(`${deletedCount}개의 메모가 삭제되었습니다.`);
+
+        // 모바일과 데스크톱 메모 목록 모두 새로고침
+        await refreshAfterMutation(loadMemosBasedOnScreenSize);
+
+    } catch (error) {
+        console.error('모바일 전체 메모 삭제 오류:', error);
+        alert('메모 삭제 중 오류가 발생했습니다.');
+    }
+});
+}
@@ -0,0 +1,1139 @@
+// 주간 요약/아코디언 조각만 다시 렌더링 (전체 새로고침 대신)
+async function refreshWeekFragments() {
+    weekDetailsPromise = null;
+    const weekStart = document.getElementById('week-accordion').dataset.weekStart;
+    const targets = {summary: 'week-summary', week: 'week-accordion'};
+
+    try {
+        await Promise.all(Object.entries(targets).map(async ([name, id]) => {
+            const response = await fetch(`/fragments/reflection-history/${name}?week_start=${weekStart}`);
+            if (!response.ok) {
+                throw new Error(`화면 갱신 실패: ${name}`);
+            }
+            document.getElementById(id).outerHTML = await response.text();
+        }));
+    } catch (error) {
+        console.error(error);
+        location.reload();
+    }
+}
+
+// 달력 선택기 토글
+function toggleDatePicker() {
+    const picker = document.getElementById('date-picker');
+    picker.classList.toggle('hidden');
+}
+
+// 주 선택 시 네비게이션
+function navigateToWeek(weekValue) {
+    // weekValue 형식: "2025-W39"
+    const [year, weekStr] = weekValue.split('-W');
+    const weekNum = parseInt(weekStr);
+
+    // 해당 년도의 첫 번째 월요일 계산
+    const jan1 = new Date(parseInt(year), 0, 1);
+    const firstMonday = new Date(jan1);
+
+    // 1월 1일이 월요일이 아니면 다음 월요일로 이동
+    const dayOfWeek = jan1.getDay();
+    if (dayOfWeek !== 1) { // 월요일이 아니면
+        const daysToAdd = dayOfWeek === 0 ? 1 : 8 - dayOfWeek;
+        firstMonday.setDate(jan1.getDate() + daysToAdd);
+    }
+
+    // 선택한 주의 월요일 계산
+    const targetMonday = new Date(firstMonday);
+    targetMonday.setDate(firstMonday.getDate() + (weekNum - 1) * 7);
+
+    // YYYY-MM-DD 형식으로 변환
+    const mondayStr = targetMonday.toISOString().split('T')[0];
+
+    // 페이지 이동
+    window.location.href = `/reflection-history?week_start=${mondayStr}`;
+}
+
+// 이번 주로 이동
+function goToCurrentWeek() {
+    window.location.href = '/reflection-history';
+}
+
+// 아코디언 토글
+function toggleAccordion(dateStr) {
+    const accordionContent = document.getElementById(`accordion-${dateStr}`);
+    const accordionItem = document.querySelector(`[data-date="${dateStr}"]`);
+    const arrow = accordionItem.querySelector('.accordion-arrow i');
+
+    if (accordionContent.classList.contains('hidden')) {
+        // 아코디언 열기
+        accordionContent.classList.remove('hidden');
+        arrow.classList.replace('fa-chevron-down', 'fa-chevron-up');
+
+        // 데이터 로드
+        loadAccordionData(dateStr);
+    } else {
+        // 아코디언 닫기
+        accordionContent.classList.add('hidden');
+        arrow.classList.replace('fa-chevron-up', 'fa-chevron-down');
+    }
+}
+
+// 주간 상세 (처음 펼칠 때 7일치를 한 번에 조회하고 주 단위로 재사용)
+let weekDetailsPromise = null;
+
+function loadWeekDetails() {
+    if (!weekDetailsPromise) {
+        const weekStart = document.getElementById('week-accordion').dataset.weekStart;
+        weekDetailsPromise = fetch(`/api/reflection-week/${weekStart}`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('주간 상세 조회 실패');
+                }
+                return response.json();
+            })
+            .catch(error => {
+                // 실패하면 다음에 다시 시도
+                weekDetailsPromise = null;
+                throw error;
+            });
+    }
+    return weekDetailsPromise;
+}
+
+// 아코디언 데이터 로드
+async function loadAccordionData(dateStr) {
+    const contentDiv = document.getElementById(`accordion-${dateStr}`);
+    const loadingIndicator = contentDiv.querySelector('.loading-indicator');
+
+    try {
+        loadingIndicator.style.display = 'block';
+
+        const week = await loadWeekDetails();
+        const data = week.days[dateStr];
+
+        loadingIndicator.style.display = 'none';
+
+        // 아코디언 내용 렌더링
+        contentDiv.innerHTML = renderAccordionContent(data);
+
+    } catch (error) {
+        console.error('데이터 로딩 중 오류:', error);
+        loadingIndicator.innerHTML = '<div class="text-red-500"><i class="fas fa-exclamation-circle mr-2"></i>데이터 로딩 실패</div>';
+    }
+}
+
+// 아코디언 내용 렌더링
+function renderAccordionContent(data) {
+    let html = '<div class="space-y-4">';
+
+    // 회고 내용
+    if (data.has_reflection) {
+        html += `
+            <div class="bg-blue-50 p-4 rounded-lg">
+                <div class="flex items-center justify-between mb-3">
+                    <h4 class="font-medium text-gray-900">📝 회고 내용</h4>
+                    <button onclick="showReflectionDetail('${data.date}')"
+                            class="text-sm text-blue-600 hover:text-blue-800">
+                        <i class="fas fa-external-link-alt mr-1"></i>상세보기
+                    </button>
+                </div>
+                <div class="text-sm text-gray-700 leading-relaxed whitespace-pre-wrap">${data.reflection.reflection_text || '회고 내용이 없습니다.'}</div>
+
+                <div class="flex items-center space-x-4 mt-3 pt-3 border-t border-blue-200">
+                    ${data.reflection.satisfaction_score ? `
+                        <div class="flex items-center">
+                            <span class="text-xs text-gray-600 mr-2">만족도:</span>
+                            <div class="text-yellow-500">
+                                ${'★'.repeat(data.reflection.satisfaction_score)}${'☆'.repeat(5 - data.reflection.satisfaction_score)}
+                            </div>
+                        </div>
+                    ` : ''}
+                    ${data.reflection.energy_level ? `
+                        <div class="flex items-center">
+                            <span class="text-xs text-gray-600 mr-2">에너지:</span>
+                            <div class="text-blue-500">
+                                ${data.reflection.energy_level >= 4 ? '⚡' : data.reflection.energy_level >= 3 ? '🔋' : data.reflection.energy_level >= 2 ? '🔋' : '🪫'}
+                            </div>
+                        </div>
+                    ` : ''}
+                </div>
+            </div>
+        `;
+    } else {
+        html += `
+            <div class="bg-gray-50 p-4 rounded-lg text-center">
+                <div class="text-gray-500 mb-3">
+                    <i class="fas fa-edit text-3xl"></i>
+                </div>
+                <div class="text-sm text-gray-600 mb-4">이 날의 회고가 아직 작성되지 않았습니다.</div>
+                <button onclick="showReflectionWriteModal('${data.date}')"
+                        class="inline-flex items-center px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 transition-colors">
+                    <i class="fas fa-pencil-alt mr-2"></i>
+                    회고 작성하기
+                </button>
+            </div>
+        `;
+    }
+
+    // 할일 목록
+    if ((data.todos.completed_on_time && data.todos.completed_on_time.length > 0) ||
+        (data.todos.retroactively_completed && data.todos.retroactively_completed.length > 0) ||
+        (data.todos.pending && data.todos.pending.length > 0)) {
+        html += `
+            <div class="bg-white border border-gray-200 rounded-lg p-4">
+                <h4 class="font-medium text-gray-900 mb-3">📋 할일 목록</h4>
+
+                ${(data.todos.completed_on_time && data.todos.completed_on_time.length > 0) ? `
+                    <div class="mb-4">
+                        <div class="text-sm font-medium text-green-600 mb-2">✅ 당일 완료한 할일 (${data.todos.completed_on_time.length}개)</div>
+                        <div class="space-y-2">
+                            ${data.todos.completed_on_time.map(todo => `
+                                <div class="flex items-center text-sm text-gray-700 bg-green-50 p-2 rounded">
+                                    <i class="fas fa-check-circle text-green-500 mr-2"></i>
+                                    <span class="line-through">${todo.title}</span>
+                                    <span class="ml-auto text-xs text-gray-500">${todo.category}</span>
+                                </div>
+                            `).join('')}
+                        </div>
+                    </div>
+                ` : ''}
+
+                ${(data.todos.retroactively_completed && data.todos.retroactively_completed.length > 0) ? `
+                    <div class="mb-4">
+                        <div class="text-sm font-medium text-orange-600 mb-2">🔄 나중에 완료한 할일 (${data.todos.retroactively_completed.length}개)</div>
+                        <div class="space-y-2">
+                            ${data.todos.retroactively_completed.map(todo => `
+                                <div class="flex items-center text-sm text-gray-700 bg-orange-50 border border-orange-200 p-2 rounded">
+                                    <i class="fas fa-check-circle text-orange-500 mr-2"></i>
+                                    <span class="line-through opacity-75">${todo.title}</span>
+                                    <span class="ml-auto text-xs text-orange-600">회고 후 완료</span>
+                                </div>
+                            `).join('')}
+                        </div>
+                    </div>
+                ` : ''}
+
+                ${(data.todos.pending && data.todos.pending.length > 0) ? `
+                    <div>
+                        <div class="text-sm font-medium text-red-600 mb-2">⏳ 미완료 할일 (${data.todos.pending.length}개)</div>
+                        <div class="space-y-2">
+                            ${data.todos.pending.map(todo => `
+                                <div class="flex items-center text-sm text-gray-700 bg-red-50 p-2 rounded">
+                                    <i class="fas fa-clock text-red-500 mr-2"></i>
+                                    <span>${todo.title}</span>
+                                    <span class="ml-auto text-xs text-gray-500">${todo.category}</span>
+                                </div>
+                            `).join('')}
+                        </div>
+                    </div>
+                ` : ''}
+            </div>
+        `;
+    }
+
+    html += '</div>';
+    return html;
+}
+
+// 회고 상세보기 모달 열기
+function showReflectionDetail(dateStr) {
+    const modal = document.getElementById('reflection-detail-modal');
+    const modalTitle = document.getElementById('modal-title');
+    const modalContent = document.getElementById('modal-content');
+
+    modalTitle.textContent = `${dateStr} 회고 상세보기`;
+    modalContent.innerHTML = '<div class="text-center py-8"><i class="fas fa-spinner fa-spin mr-2"></i>로딩 중...</div>';
+
+    // 현재 모달 정보 설정
+    currentModalDate = dateStr;
+
+    modal.classList.remove('hidden');
+
+    // 상세 데이터 로드
+    loadReflectionDetail(dateStr);
+}
+
+// 회고 상세 데이터 로드
+async function loadReflectionDetail(dateStr) {
+    const modalContent = document.getElementById('modal-content');
+
+    try {
+        const response = await fetch(`/api/reflection-day/${dateStr}`);
+        const data = await response.json();
+
+        // 회고 ID 설정 (블로그 내보내기용)
+        currentModalReflectionId = data.reflection.id;
+
+        modalContent.innerHTML = renderReflectionDetail(data);
+
+    } catch (error) {
+        console.error('상세 데이터 로딩 중 오류:', error);
+        modalContent.innerHTML = '<div class="text-center text-red-500 py-8"><i class="fas fa-exclamation-circle mr-2"></i>데이터 로딩 실패</div>';
+    }
+}
+
+// 회고 상세 내용 렌더링
+function renderReflectionDetail(data) {
+    if (!data.has_reflection) {
+        return `
+            <div class="text-center py-8">
+                <div class="text-gray-400 mb-4">
+                    <i class="fas fa-edit text-6xl"></i>
+                </div>
+                <h3 class="text-lg font-medium text-gray-900 mb-2">회고가 작성되지 않았습니다</h3>
+                <p class="text-gray-600">이 날의 회고를 아직 작성하지 않았습니다.</p>
+            </div>
+        `;
+    }
+
+    return `
+        <div class="space-y-6">
+            <!-- 회고 텍스트 -->
+            <div>
+                <h4 class="font-medium text-gray-900 mb-3">📝 회고 내용</h4>
+                <div class="bg-gray-50 p-4 rounded-lg">
+                    <div class="text-gray-700 leading-relaxed whitespace-pre-wrap">${data.reflection.reflection_text || '회고 내용이 없습니다.'}</div>
+                </div>
+            </div>
+
+            <!-- 만족도 & 에너지 -->
+            <div class="grid grid-cols-2 gap-4">
+                ${data.reflection.satisfaction_score ? `
+                    <div class="bg-yellow-50 p-4 rounded-lg">
+                        <h5 class="font-medium text-gray-900 mb-2">만족도</h5>
+                        <div class="text-yellow-500 text-xl">
+                            ${'★'.repeat(data.reflection.satisfaction_score)}${'☆'.repeat(5 - data.reflection.satisfaction_score)}
+                        </div>
+                        <div class="text-sm text-gray-600 mt-1">${data.reflection.satisfaction_score}/5점</div>
+                    </div>
+                ` : '<div class="bg-gray-50 p-4 rounded-lg text-center text-gray-500">만족도 미입력</div>'}
+
+                ${data.reflection.energy_level ? `
+                    <div class="bg-blue-50 p-4 rounded-lg">
+                        <h5 class="font-medium text-gray-900 mb-2">에너지 레벨</h5>
+                        <div class="text-blue-500 text-2xl">
+                            ${data.reflection.energy_level >= 4 ? '⚡' : data.reflection.energy_level >= 3 ? '🔋' : data.reflection.energy_level >= 2 ? '🔋' : '🪫'}
+                        </div>
+                        <div class="text-sm text-gray-600 mt-1">${data.reflection.energy_level}/5점</div>
+                    </div>
+                ` : '<div class="bg-gray-50 p-4 rounded-lg text-center text-gray-500">에너지 레벨 미입력</div>'}
+            </div>
+
+            <!-- 완료 통계 -->
+            <div class="bg-white border border-gray-200 rounded-lg p-4">
+                <h4 class="font-medium text-gray-900 mb-3">📊 할일 완료 통계</h4>
+                <div class="grid grid-cols-3 gap-4 text-center">
+                    <div>
+                        <div class="text-2xl font-bold text-blue-600">${data.reflection.completion_rate.toFixed(1)}%</div>
+                        <div class="text-xs text-gray-500">완료율</div>
+                    </div>
+                    <div>
+                        <div class="text-2xl font-bold text-green-600">${data.reflection.completed_todos}</div>
+                        <div class="text-xs text-gray-500">완료</div>
+                    </div>
+                    <div>
+                        <div class="text-2xl font-bold text-gray-600">${data.reflection.total_todos}</div>
+                        <div class="text-xs text-gray-500">전체</div>
+                    </div>
+                </div>
+            </div>
+
+            <!-- 할일 상세 목록 -->
+            ${((data.todos.completed_on_time && data.todos.completed_on_time.length > 0) ||
+               (data.todos.retroactively_completed && data.todos.retroactively_completed.length > 0) ||
+               (data.todos.pending && data.todos.pending.length > 0)) ? `
+                <div>
+                    <h4 class="font-medium text-gray-900 mb-3">📋 할일 상세 목록</h4>
+
+                    ${(data.todos.completed_on_time && data.todos.completed_on_time.length > 0) ? `
+                        <div class="mb-4">
+                            <div class="text-sm font-medium text-green-600 mb-2">✅ 당일 완료한 할일</div>
+                            <div class="space-y-2">
+                                ${data.todos.completed_on_time.map(todo => `
+                                    <div class="flex items-start bg-green-50 p-3 rounded-lg">
+                                        <i class="fas fa-check-circle text-green-500 mr-3 mt-0.5"></i>
+                                        <div class="flex-1">
+                                            <div class="font-medium text-gray-900 line-through">${todo.title}</div>
+                                            <div class="text-xs text-gray-500 mt-1">${todo.category}</div>
+                                            ${todo.completion_reflection ? `
+                                                <div class="text-sm text-gray-600 mt-2 italic">"${todo.completion_reflection}"</div>
+                                            ` : ''}
+                                            ${todo.completion_image_path ? `
+                                                <div class="mt-3">
+                                                    <img src="${todo.completion_image_path}"
+                                                         ${todo.completion_image_srcset ? `srcset="${todo.completion_image_srcset}" sizes="(max-width: 640px) 100vw, 640px"` : ''}
+                                                         loading="lazy"
+                                                         alt="할일 완료 이미지"
+                                                         class="max-w-full h-auto rounded-md border border-gray-200 cursor-pointer hover:shadow-lg transition-shadow"
+                                                         onclick="showImageModal('${todo.completion_image_path}', '${todo.title} 완료 이미지')"
+                                                         style="max-height: 200px;">
+                                                </div>
+                                            ` : ''}
+                                        </div>
+                                    </div>
+                                `).join('')}
+                            </div>
+                        </div>
+                    ` : ''}
+
+                    ${(data.todos.retroactively_completed && data.todos.retroactively_completed.length > 0) ? `
+                        <div class="mb-4">
+                            <div class="text-sm font-medium text-orange-600 mb-2">🔄 나중에 완료한 할일</div>
+                            <div class="space-y-2">
+                                ${data.todos.retroactively_completed.map(todo => `
+                                    <div class="flex items-start bg-orange-50 border border-orange-200 p-3 rounded-lg">
+                                        <i class="fas fa-check-circle text-orange-500 mr-3 mt-0.5"></i>
+                                        <div class="flex-1">
+                                            <div class="font-medium text-gray-900 line-through opacity-75">${todo.title}</div>
+                                            <div class="text-xs text-orange-600 mt-1">${todo.category} • 회고 작성 후 완료됨</div>
+                                            ${todo.completed_at ? `
+                                                <div class="text-xs text-orange-600 mt-1">완료일: ${new Date(todo.completed_at).toLocaleDateString('ko-KR')}</div>
+                                            ` : ''}
+                                            ${todo.completion_reflection ? `
+                                                <div class="text-sm text-gray-600 mt-2 italic">"${todo.completion_reflection}"</div>
+                                            ` : ''}
+                                            ${todo.completion_image_path ? `
+                                                <div class="mt-3">
+                                                    <img src="${todo.completion_image_path}"
+                                                         ${todo.completion_image_srcset ? `srcset="${todo.completion_image_srcset}" sizes="(max-width: 640px) 100vw, 640px"` : ''}
+                                                         loading="lazy"
+                                                         alt="할일 완료 이미지"
+                                                         class="max-w-full h-auto rounded-md border border-gray-200 cursor-pointer hover:shadow-lg transition-shadow"
+                                                         onclick="showImageModal('${todo.completion_image_path}', '${todo.title} 완료 이미지')"
+                                                         style="max-height: 200px;">
+                                                </div>
+                                            ` : ''}
+                                        </div>
+                                    </div>
+                                `).join('')}
+                            </div>
+                        </div>
+                    ` : ''}
+
+                    ${(data.todos.pending && data.todos.pending.length > 0) ? `
+                        <div>
+                            <div class="text-sm font-medium text-red-600 mb-2">⏳ 미완료 할일</div>
+                            <div class="space-y-2">
+                                ${data.todos.pending.map(todo => `
+                                    <div class="flex items-start bg-red-50 p-3 rounded-lg">
+                                        <i class="fas fa-clock text-red-500 mr-3 mt-0.5"></i>
+                                        <div class="flex-1">
+                                            <div class="font-medium text-gray-900">${todo.title}</div>
+                                            <div class="text-xs text-gray-500 mt-1">${todo.category}</div>
+                                        </div>
+                                    </div>
+                                `).join('')}
+                            </div>
+                        </div>
+                    ` : ''}
+                </div>
+            ` : ''}
+        </div>
+    `;
+}
+
+// 모달 닫기
+function closeReflectionModal() {
+    document.getElementById('reflection-detail-modal').classList.add('hidden');
+}
+
+// 현재 모달의 회고 ID와 날짜를 저장할 변수
+let currentModalReflectionId = null;
+let currentModalDate = null;
+
+// LLM 블로그 모달 열기
+function showLLMBlogModal() {
+    if (!currentModalReflectionId) {
+        alert('회고 정보를 불러올 수 없습니다.');
+        return;
+    }
+
+    // 먼저 기존 블로그 글이 있는지 확인
+    checkExistingBlogContent();
+
+    document.getElementById('llm-blog-modal').classList.remove('hidden');
+}
+
+// LLM 블로그 모달 닫기
+function closeLLMBlogModal() {
+    document.getElementById('llm-blog-modal').classList.add('hidden');
+    // 폼 초기화
+    const form = document.getElementById('llm-blog-form');
+    form.reset();
+    form.removeAttribute('data-regenerate');
+    // 제목 초기화
+    document.querySelector('#llm-blog-modal h3').textContent = '🤖 AI 블로그 글 생성';
+}
+
+// 기존 블로그 글 확인
+async function checkExistingBlogContent() {
+    try {
+        const response = await fetch(`/api/reflections/${currentModalReflectionId}/blog-content`);
+        if (response.ok) {
+            const data = await response.json();
+            // 기존 글이 있으면 바로 결과 모달 표시
+            showBlogResult(data.content, true, data.generated_at);
+            closeLLMBlogModal();
+        }
+    } catch (error) {
+        // 기존 글이 없거나 오류 발생 시 새로 생성하도록 모달 표시
+        console.log('기존 블로그 글이 없습니다. 새로 생성합니다.');
+    }
+}
+
+// LLM 블로그 글 생성
+async function generateLLMBlog(event) {
+    event.preventDefault();
+
+    if (!currentModalReflectionId) {
+        alert('회고 정보를 불러올 수 없습니다.');
+        return;
+    }
+
+    const form = event.target;
+    const formData = new FormData(form);
+
+    // 로딩 표시
+    const submitButton = form.querySelector('button[type="submit"]');
+    const originalText = submitButton.innerHTML;
+    submitButton.innerHTML = '<i class="fas fa-spinner fa-spin mr-2"></i>생성 중...';
+    submitButton.disabled = true;
+
+    try {
+        const requestData = {
+            provider: formData.get('provider'),
+            include_images: formData.get('include_images') ? true : false,
+            additional_prompt: formData.get('additional_prompt') || null
+        };
+
+        // 재생성 모드인지 확인
+        const isRegenerate = form.getAttribute('data-regenerate') === 'true';
+        const endpoint = isRegenerate ? 'regenerate-blog' : 'generate-blog';
+
+        const response = await fetch(`/api/reflections/${currentModalReflectionId}/${endpoint}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(requestData)
+        });
+
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.detail || '블로그 글 생성에 실패했습니다.');
+        }
+
+        const data = await response.json();
+
+        // 성공 시 결과 모달 표시
+        showBlogResult(data.content, data.is_cached, data.generated_at);
+        closeLLMBlogModal();
+
+    } catch (error) {
+        console.error('블로그 글 생성 실패:', error);
+        alert(`블로그 글 생성 실패: ${error.message}`);
+    } finally {
+        // 로딩 상태 해제
+        submitButton.innerHTML = originalText;
+        submitButton.disabled = false;
+    }
+}
+
+// 블로그 글 결과 표시
+function showBlogResult(content, isCached, generatedAt) {
+    const modal = document.getElementById('blog-result-modal');
+    const title = document.getElementById('blog-result-title');
+    const contentDiv = document.getElementById('blog-result-content');
+    const cacheStatus = document.getElementById('cache-status');
+    const generationTime = document.getElementById('generation-time');
+
+    // 제목 설정
+    title.textContent = isCached ? '📄 기존 블로그 글' : '🎉 AI 블로그 글 생성 완료';
+
+    // 콘텐츠 설정 (마크다운을 HTML로 변환)
+    contentDiv.innerHTML = `
+        <div class="prose prose-blue max-w-none">
+            <div class="bg-gray-50 p-6 rounded-lg border">
+                ${content.replace(/\n/g, '<br>')}
+            </div>
+        </div>
+    `;
+
+    // 상태 정보 설정
+    cacheStatus.textContent = isCached ? '💾 캐시된 내용' : '✨ 새로 생성됨';
+    generationTime.textContent = generatedAt ? `생성 시간: ${new Date(generatedAt).toLocaleString('ko-KR')}` : '';
+
+    // 글로벌 변수에 저장 (재생성과 복사를 위해)
+    currentBlogContent = content;
+
+    modal.classList.remove('hidden');
+}
+
+// 블로그 결과 모달 닫기
+function closeBlogResultModal() {
+    document.getElementById('blog-result-modal').classList.add('hidden');
+}
+
+// 블로그 글 클립보드 복사
+async function copyBlogToClipboard() {
+    try {
+        await navigator.clipboard.writeText(currentBlogContent);
+
+        // 복사 버튼 피드백
+        const copyButton = document.querySelector('button[onclick="copyBlogToClipboard()"]');
+        const originalText = copyButton.innerHTML;
+        copyButton.innerHTML = '<i class="fas fa-check mr-2"></i>복사됨!';
+        copyButton.classList.remove('text-blue-600', 'bg-blue-50', 'border-blue-200');
+        copyButton.classList.add('text-green-600', 'bg-green-50', 'border-green-200');
+
+        setTimeout(() => {
+            copyButton.innerHTML = originalText;
+            copyButton.classList.remove('text-green-600', 'bg-green-50', 'border-green-200');
+            copyButton.classList.add('text-blue-600', 'bg-blue-50', 'border-blue-200');
+        }, 2000);
+
+    } catch (error) {
+        console.error('클립보드 복사 실패:', error);
+        alert('클립보드 복사에 실패했습니다.');
+    }
+}
+
+// 글로벌 변수
+let currentBlogContent = '';
+
+// 블로그 글 생성 함수 (레거시 지원)
+async function exportReflectionToBlog() {
+    if (!currentModalReflectionId) {
+        alert('회고 정보를 불러올 수 없습니다.');
+        return;
+    }
+
+    try {
+        // 마크다운 형식으로 내보내기
+        const response = await fetch(`/api/reflections/${currentModalReflectionId}/export?format=html`);
+        if (!response.ok) {
+            throw new Error('콘텐츠 생성 실패');
+        }
+
+        const data = await response.json();
+
+        // 새 창에서 콘텐츠 표시
+        const newWindow = window.open('', '_blank');
+
+        // 안전하게 HTML 생성
+        newWindow.document.open();
+        newWindow.document.write('<!DOCTYPE html>');
+        newWindow.document.write('<html>');
+        newWindow.document.write('<head>');
+        newWindow.document.write('<title>회고 블로그 글 - ' + currentModalDate + '</title>');
+        newWindow.document.write('<meta charset="UTF-8">');
+        newWindow.document.write('<style>');
+        newWindow.document.write('body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; background: white; }');
+        newWindow.document.write('.content { background: #f8f9fa; padding: 20px; border-radius: 8px; border: 1px solid #e9ecef; }');
+        newWindow.document.write('.content img { max-width: 100%; height: auto; border-radius: 8px; margin: 10px 0; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }');
+        newWindow.document.write('.actions { position: fixed; top: 20px; right: 20px; background: white; padding: 10px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }');
+        newWindow.document.write('button { background: #007bff; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer; margin: 0 4px; }');
+        newWindow.document.write('button:hover { background: #0056b3; }');
+        newWindow.document.write('</style>');
+        newWindow.document.write('</head>');
+        newWindow.document.write('<body>');
+        newWindow.document.write('<div class="actions">');
+        newWindow.document.write('<button onclick="copyToClipboard()">📋 복사</button>');
+        newWindow.document.write('<button onclick="downloadAsFile()">💾 다운로드</button>');
+        newWindow.document.write('<button onclick="window.close()">❌ 닫기</button>');
+        newWindow.document.write('</div>');
+
+        // 콘텐츠를 안전하게 설정
+        const contentElement = newWindow.document.createElement('div');
+        contentElement.className = 'content';
+        contentElement.innerHTML = data.content;
+        newWindow.document.body.appendChild(contentElement);
+
+        // 스크립트 추가
+        const script = newWindow.document.createElement('script');
+        script.textContent =
+            'function copyToClipboard() {' +
+                'const content = document.querySelector(".content").innerHTML;' +
+                'navigator.clipboard.writeText(content).then(() => {' +
+                    'alert("클립보드에 복사되었습니다!");' +
+                '});' +
+            '}' +
+            'function downloadAsFile() {' +
+                'const content = document.querySelector(".content").innerHTML;' +
+                'const blob = new Blob([content], { type: "text/html" });' +
+                'const url = URL.createObjectURL(blob);' +
+                'const a = document.createElement("a");' +
+                'a.href = url;' +
+                'a.download = "reflection_' + currentModalDate + '.html";' +
+                'document.body.appendChild(a);' +
+                'a.click();' +
+                'document.body.removeChild(a);' +
+                'URL.revokeObjectURL(url);' +
+            '}';
+        newWindow.document.head.appendChild(script);
+
+        newWindow.document.write('</body>');
+        newWindow.document.write('</html>');
+        newWindow.document.close();
+
+    } catch (error) {
+        console.error('블로그 글 생성 실패:', error);
+        alert('블로그 글 생성 중 오류가 발생했습니다.');
+    }
+}
+
+// 달력 외부 클릭시 닫기
+document.addEventListener('click', function(event) {
+    const picker = document.getElementById('date-picker');
+    const button = event.target.closest('button[onclick="toggleDatePicker()"]');
+
+    if (!picker.contains(event.target) && !button) {
+        picker.classList.add('hidden');
+    }
+});
+
+// ESC 키로 달력/모달 닫기
+document.addEventListener('keydown', function(event) {
+    if (event.key === 'Escape') {
+        document.getElementById('date-picker').classList.add('hidden');
+        document.getElementById('reflection-detail-modal').classList.add('hidden');
+        document.getElementById('reflection-write-modal').classList.add('hidden');
+        document.getElementById('llm-blog-modal').classList.add('hidden');
+        document.getElementById('blog-result-modal').classList.add('hidden');
+        document.getElementById('direct-edit-modal').classList.add('hidden');
+        document.getElementById('ai-improve-modal').classList.add('hidden');
+    }
+});
+
+// 회고 작성 모달 열기
+function showReflectionWriteModal(dateStr) {
+    const modal = document.getElementById('reflection-write-modal');
+    const modalTitle = document.getElementById('write-modal-title');
+    const dateInput = document.getElementById('write-reflection-date');
+    const form = document.getElementById('reflection-write-form');
+
+    // 날짜 설정
+    dateInput.value = dateStr;
+    modalTitle.textContent = `📝 ${dateStr} 회고 작성`;
+
+    // 폼 초기화
+    form.reset();
+    dateInput.value = dateStr; // reset 후 다시 설정
+
+    modal.classList.remove('hidden');
+}
+
+// 회고 작성 모달 닫기
+function closeReflectionWriteModal() {
+    const modal = document.getElementById('reflection-write-modal');
+    modal.classList.add('hidden');
+}
+
+// 회고 제출
+async function submitReflection(event) {
+    event.preventDefault();
+
+    const form = event.target;
+    const formData = new FormData(form);
+
+    // 제출 버튼 찾기
+    const submitButton = form.querySelector('button[type="submit"]');
+    const originalText = submitButton.innerHTML;
+
+    try {
+        // 로딩 상태
+        submitButton.innerHTML = '<i class="fas fa-spinner fa-spin mr-2"></i>저장 중...';
+        submitButton.disabled = true;
+
+        // FormData를 일반 객체로 변환 (빈 값은 null로)
+        const data = {};
+        for (let [key, value] of formData.entries()) {
+            if (value === '') {
+                data[key] = null;
+            } else if (key === 'satisfaction_score' || key === 'energy_level') {
+                data[key] = value ? parseInt(value) : null;
+            } else {
+                data[key] = value;
+            }
+        }
+
+        // API 호출 (FormData 형식으로 전송)
+        const response = await fetch('/api/reflections/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            body: new URLSearchParams(formData)
+        });
+
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.detail || '회고 저장에 실패했습니다.');
+        }
+
+        const result = await response.json();
+
+        // 성공 시 모달 닫기
+        closeReflectionWriteModal();
+
+        // 성공 메시지 후 주간 요약과 아코디언만 다시 렌더링
+        alert('✅ 회고가 성공적으로 저장되었습니다!');
+        await refreshWeekFragments();
+
+    } catch (error) {
+        console.error('회고 저장 실패:', error);
+        alert(`❌ 회고 저장 실패: ${error.message}`);
+    } finally {
+        // 로딩 상태 해제
+        submitButton.innerHTML = originalText;
+        submitButton.disabled = false;
+    }
+}
+
+// 아코디언 헤더 업데이트 (회고 완료 상태 반영)
+function updateAccordionHeader(dateStr, reflectionData) {
+    const accordionItem = document.querySelector(`[data-date="${dateStr}"]`);
+    if (!accordionItem) return;
+
+    const statusIndicator = accordionItem.querySelector('.flex.items-center.space-x-1');
+    if (!statusIndicator) return;
+
+    // 회고 완료 상태로 업데이트
+    statusIndicator.innerHTML = `
+        <div class="w-2 h-2 bg-green-500 rounded-full"></div>
+        <span class="text-xs text-green-600 font-medium">회고 완료</span>
+        ${reflectionData.satisfaction_score ? `
+            <div class="text-yellow-500 text-sm ml-2">
+                ${'★'.repeat(reflectionData.satisfaction_score)}${'☆'.repeat(5 - reflectionData.satisfaction_score)}
+            </div>
+        ` : ''}
+        ${reflectionData.energy_level ? `
+            <div class="text-blue-500 text-sm ml-1">
+                ${reflectionData.energy_level >= 4 ? '⚡' : reflectionData.energy_level >= 3 ? '🔋' : reflectionData.energy_level >= 2 ? '🔋' : '🪫'}
+            </div>
+        ` : ''}
+    `;
+}
+
+// 이미지 모달 열기
+function showImageModal(imageSrc, title) {
+    const modal = document.getElementById('image-modal');
+    const modalImage = document.getElementById('modal-image');
+    const modalTitle = document.getElementById('modal-image-title');
+
+    modalImage.src = imageSrc;
+    modalImage.alt = title;
+    modalTitle.textContent = title;
+
+    modal.classList.remove('hidden');
+
+    // ESC 키로 모달 닫기
+    document.addEventListener('keydown', handleImageModalEscape);
+}
+
+// 이미지 모달 닫기
+function closeImageModal() {
+    const modal = document.getElementById('image-modal');
+    modal.classList.add('hidden');
+
+    // ESC 키 이벤트 리스너 제거
+    document.removeEventListener('keydown', handleImageModalEscape);
+}
+
+// ESC 키로 이미지 모달 닫기
+function handleImageModalEscape(event) {
+    if (event.key === 'Escape') {
+        closeImageModal();
+    }
+}
+
+// 키보드 네비게이션 (화살표 키)
+document.addEventListener('keydown', function(event) {
+    // 입력 필드에 포커스가 있을 때는 무시 (INPUT, TEXTAREA)
+    if (event.target.tagName === 'INPUT' || event.target.tagName === 'TEXTAREA') return;
+
+    // 모달이 열려있을 때는 무시
+    const imageModal = document.getElementById('image-modal');
+    const reflectionDetailModal = document.getElementById('reflection-detail-modal');
+    const reflectionWriteModal = document.getElementById('reflection-write-modal');
+    const llmBlogModal = document.getElementById('llm-blog-modal');
+    const blogResultModal = document.getElementById('blog-result-modal');
+    const directEditModal = document.getElementById('direct-edit-modal');
+    const aiImproveModal = document.getElementById('ai-improve-modal');
+
+    if (!imageModal.classList.contains('hidden') ||
+        !reflectionDetailModal.classList.contains('hidden') ||
+        !reflectionWriteModal.classList.contains('hidden') ||
+        !llmBlogModal.classList.contains('hidden') ||
+        !blogResultModal.classList.contains('hidden') ||
+        !directEditModal.classList.contains('hidden') ||
+        !aiImproveModal.classList.contains('hidden')) {
+        return;
+    }
+
+    if (event.key === 'ArrowLeft') {
+        // 이전 주로 이동
+        window.location.href = `/reflection-history?week_start=${document.body.dataset.prevWeek}`;
+    } else if (event.key === 'ArrowRight') {
+        // 다음 주로 이동
+        window.location.href = `/reflection-history?week_start=${document.body.dataset.nextWeek}`;
+    }
+});
+
+// ============================================
+// 블로그 직접 수정 관련 함수
+// ============================================
+
+// 직접 수정 모달 열기
+function showDirectEditModal() {
+    if (!currentBlogContent) {
+        alert('수정할 블로그 글이 없습니다.');
+        return;
+    }
+
+    const modal = document.getElementById('direct-edit-modal');
+    const textarea = document.getElementById('direct-edit-content');
+
+    // 현재 블로그 글 내용을 textarea에 설정
+    textarea.value = currentBlogContent;
+
+    // 글자 수 업데이트
+    updateCharCount();
+
+    // 모달 표시
+    modal.classList.remove('hidden');
+
+    // textarea에 포커스
+    setTimeout(() => textarea.focus(), 100);
+}
+
+// 직접 수정 모달 닫기
+function closeDirectEditModal() {
+    const modal = document.getElementById('direct-edit-modal');
+    modal.classList.add('hidden');
+}
+
+// 글자 수 업데이트
+function updateCharCount() {
+    const textarea = document.getElementById('direct-edit-content');
+    const charCount = document.getElementById('char-count');
+    charCount.textContent = textarea.value.length;
+}
+
+// textarea 변경 시 글자 수 자동 업데이트
+document.addEventListener('DOMContentLoaded', function() {
+    const textarea = document.getElementById('direct-edit-content');
+    if (textarea) {
+        textarea.addEventListener('input', updateCharCount);
+    }
+});
+
+// 직접 수정 저장
+async function saveDirectEdit(event) {
+    event.preventDefault();
+
+    if (!currentModalReflectionId) {
+        alert('회고 정보를 불러올 수 없습니다.');
+        return;
+    }
+
+    const form = event.target;
+    const formData = new FormData(form);
+    const content = formData.get('content');
+
+    // 로딩 표시
+    const submitButton = form.querySelector('button[type="submit"]');
+    const originalText = submitButton.innerHTML;
+    submitButton.innerHTML = '<i class="fas fa-spinner fa-spin mr-2"></i>저장 중...';
+    submitButton.disabled = true;
+
+    try {
+        const response = await fetch(`/api/reflections/${currentModalReflectionId}/blog-content`, {
+            method: 'PATCH',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ content: content })
+        });
+
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.detail || '블로그 글 수정에 실패했습니다.');
+        }
+
+        const data = await response.json();
+
+        // 성공 시 모달 닫고 결과 표시
+        closeDirectEditModal();
+        showBlogResult(data.content, false, data.generated_at);
+
+        // 글로벌 변수 업데이트
+        currentBlogContent = data.content;
+
+        alert('✅ 블로그 글이 성공적으로 수정되었습니다!');
+
+    } catch (error) {
+        console.error('블로그 글 수정 실패:', error);
+        alert(`❌ 블로그 글 수정 실패: ${error.message}`);
+    } finally {
+        // 로딩 상태 해제
+        submitButton.innerHTML = originalText;
+        submitButton.disabled = false;
+    }
+}
+
+// ============================================
+// AI 블로그 개선 관련 함수 (수정 요청 + 재생성 통합)
+// ============================================
+
+// AI 개선 모달 열기
+function showAIImproveModal() {
+    const modal = document.getElementById('ai-improve-modal');
+    const previewSection = modal.querySelector('.mb-6'); // 현재 블로그 글 미리보기 섹션
+    const previewContent = document.getElementById('current-blog-preview-content');
+    const refineRadio = modal.querySelector('input[name="improve_type"][value="refine"]');
+    const regenerateRadio = modal.querySelector('input[name="improve_type"][value="regenerate"]');
+    const refineLabel = refineRadio.closest('label');
+    const form = document.getElementById('ai-improve-form');
+
+    // 폼 초기화
+    form.reset();
+
+    if (currentBlogContent) {
+        // 블로그 글이 있는 경우: 모든 옵션 표시, "기존 글 수정" 기본 선택
+        previewSection.classList.remove('hidden');
+        previewContent.textContent = currentBlogContent;
+        refineLabel.classList.remove('hidden');
+        refineRadio.checked = true;
+        toggleImproveType(); // 라벨과 placeholder 업데이트
+    } else {
+        // 블로그 글이 없는 경우: "재생성"만 표시 및 자동 선택
+        previewSection.classList.add('hidden');
+        refineLabel.classList.add('hidden');
+        regenerateRadio.checked = true;
+        toggleImproveType(); // 라벨과 placeholder 업데이트
+    }
+
+    // 모달 표시
+    modal.classList.remove('hidden');
+}
+
+// AI 개선 모달 닫기
+function closeAIImproveModal() {
+    const modal = document.getElementById('ai-improve-modal');
+    modal.classList.add('hidden');
+
+    // 폼 초기화
+    const form = document.getElementById('ai-improve-form');
+    form.reset();
+
+    // 미리보기 숨기기
+    const preview = document.getElementById('current-blog-preview');
+    const arrow = document.getElementById('preview-arrow');
+    preview.classList.add('hidden');
+    arrow.classList.remove('fa-chevron-up');
+    arrow.classList.add('fa-chevron-down');
+}
+
+// 현재 블로그 글 미리보기 토글
+function toggleCurrentBlogPreview() {
+    const preview = document.getElementById('current-blog-preview');
+    const arrow = document.getElementById('preview-arrow');
+
+    preview.classList.toggle('hidden');
+
+    if (preview.classList.contains('hidden')) {
+        arrow.classList.remove('fa-chevron-up');
+        arrow.classList.add('fa-chevron-down');
+    } else {
+        arrow.classList.remove('fa-chevron-down');
+        arrow.classList.add('fa-chevron-up');
+    }
+}
+
+// 개선 방식 토글 (라디오 버튼 변경 시)
+function toggleImproveType() {
+    const selectedType = document.querySelector('input[name="improve_type"]:checked').value;
+    const label = document.getElementById('prompt-label');
+    const textarea = document.getElementById('user-prompt-textarea');
+
+    if (selectedType === 'refine') {
+        label.textContent = '수정 요청사항';
+        textarea.placeholder = '예: 더 유머러스하게 작성해주세요\n예: 완료한 일에 대한 설명을 더 자세히 써주세요\n예: 전체적으로 간결하게 요약해주세요';
+        textarea.required = true;
+    } else {
+        label.textContent = '추가 프롬프트 (선택사항)';
+        textarea.placeholder = '예: 이모지를 많이 사용해주세요\n예: 성장과 배움에 초점을 맞춰주세요';
+        textarea.required = false;
+    }
+}
+
+// AI 개선 요청 제출
+async function submitAIImprove(event) {
+    event.preventDefault();
+
+    if (!currentModalReflectionId) {
+        alert('회고 정보를 불러올 수 없습니다.');
+        return;
+    }
+
+    const form = event.target;
+    const formData = new FormData(form);
+    const improveType = formData.get('improve_type');
+
+    // 로딩 표시
+    const submitButton = form.querySelector('button[type="submit"]');
+    const buttonText = document.getElementById('submit-button-text');
+    const originalText = buttonText.textContent;
+    buttonText.textContent = '생성 중...';
+    submitButton.disabled = true;
+    submitButton.innerHTML = '<i class="fas fa-spinner fa-spin mr-2"></i><span id="submit-button-text">생성 중...</span>';
+
+    try {
+        let endpoint, requestData;
+
+        if (improveType === 'refine') {
+            // 수정 요청
+            endpoint = `/api/reflections/${currentModalReflectionId}/refine-blog`;
+            requestData = {
+                refinement_request: formData.get('user_prompt'),
+                provider: formData.get('provider'),
+                include_images: formData.get('include_images') ? true : false
+            };
+        } else {
+            // 재생성
+            endpoint = `/api/reflections/${currentModalReflectionId}/regenerate-blog`;
+            requestData = {
+                provider: formData.get('provider'),
+                include_images: formData.get('include_images') ? true : false,
+                additional_prompt: formData.get('user_prompt') || null
+            };
+        }
+
+        const response = await fetch(endpoint, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(requestData)
+        });
+
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.detail || 'AI 블로그 개선에 실패했습니다.');
+        }
+
+        const data = await response.json();
+
+        // 성공 시 결과 모달 표시
+        closeAIImproveModal();
+        showBlogResult(data.content, data.is_cached, data.generated_at);
+
+    } catch (error) {
+        console.error('AI 블로그 개선 실패:', error);
+        alert(`❌ AI 블로그 개선 실패: ${error.message}`);
+    } finally {
+        // 로딩 상태 해제
+        submitButton.innerHTML = `<i class="fas fa-magic mr-2"></i><span id="submit-button-text">${originalText}</span>`;
+        submitButton.disabled = false;
+    }
+}
@@ -19,6 +19,12 @@ from app.models.todo import Todo, DailyTodo
 from app.models.record import DailyRecord
 from app.models.daily_reflection import DailyReflection
 from app.models.daily_memo import DailyMemo
+from app.models.llm_response_cache import LLMResponseCache
+from app.models.uploaded_file import UploadedFile
+from app.models.change_log import ChangeLog
+from app.models.sync import SyncState, SyncTombstone
+from app.models.postpone_event import PostponeEvent
+from app.models.reflection_todo_snapshot import ReflectionTodoSnapshot
 
 # This is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,48 @@
+"""Add llm_response_cache table
+
+Revision ID: 5c3e1f7a9b21
+Revises: 4d731929c2b0
+Create Date: 2026-10-19 09:10:12.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e1f7a9b21'
+down_revision: Union[str, Sequence[str], None] = '4d731929c2b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('llm_response_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('prompt_hash', sa.String(length=64), nullable=False, comment='프롬프트 해시 (SHA-256)'),
+    sa.Column('provider', sa.String(length=20), nullable=False, comment='LLM 제공업체'),
+    sa.Column('model', sa.String(length=100), nullable=False, comment='사용된 모델'),
+    sa.Column('parameters', sa.JSON(), nullable=True, comment='호출 파라미터 (temperature, max_tokens 등)'),
+    sa.Column('response', sa.Text(), nullable=False, comment='LLM 응답 내용'),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=True, comment='프롬프트 토큰 수'),
+    sa.Column('completion_tokens', sa.Integer(), nullable=True, comment='응답 토큰 수'),
+    sa.Column('hit_count', sa.Integer(), nullable=True, comment='캐시 적중 횟수'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='생성 시간 (UTC)'),
+    sa.Column('last_accessed_at', sa.DateTime(), nullable=False, comment='마지막 접근 시간 (UTC, LRU 기준)'),
+    sa.Column('expires_at', sa.DateTime(), nullable=False, comment='만료 시간 (UTC)'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_llm_response_cache_id'), 'llm_response_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_llm_response_cache_prompt_hash'), 'llm_response_cache', ['prompt_hash'], unique=True)
+    op.create_index(op.f('ix_llm_response_cache_last_accessed_at'), 'llm_response_cache', ['last_accessed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_llm_response_cache_last_accessed_at'), table_name='llm_response_cache')
+    op.drop_index(op.f('ix_llm_response_cache_prompt_hash'), table_name='llm_response_cache')
+    op.drop_index(op.f('ix_llm_response_cache_id'), table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
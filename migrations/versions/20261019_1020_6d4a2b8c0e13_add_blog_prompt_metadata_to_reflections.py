@@ -0,0 +1,30 @@
+"""Add blog_prompt_metadata to daily_reflections
+
+Revision ID: 6d4a2b8c0e13
+Revises: 5c3e1f7a9b21
+Create Date: 2026-10-19 10:20:41.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d4a2b8c0e13'
+down_revision: Union[str, Sequence[str], None] = '5c3e1f7a9b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('daily_reflections', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('blog_prompt_metadata', sa.JSON(), nullable=True, comment='블로그 프롬프트 토큰 추정 메타데이터'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily_reflections', schema=None) as batch_op:
+        batch_op.drop_column('blog_prompt_metadata')
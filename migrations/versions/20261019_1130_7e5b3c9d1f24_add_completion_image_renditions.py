@@ -0,0 +1,30 @@
+"""Add completion_image_renditions to daily_todos
+
+Revision ID: 7e5b3c9d1f24
+Revises: 6d4a2b8c0e13
+Create Date: 2026-10-19 11:30:08.315742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e5b3c9d1f24'
+down_revision: Union[str, Sequence[str], None] = '6d4a2b8c0e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('daily_todos', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('completion_image_renditions', sa.JSON(), nullable=True, comment='완료 회고 이미지 WebP 렌디션 경로 (너비: 경로)'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily_todos', schema=None) as batch_op:
+        batch_op.drop_column('completion_image_renditions')
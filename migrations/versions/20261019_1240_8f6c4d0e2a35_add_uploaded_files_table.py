@@ -0,0 +1,70 @@
+"""Add uploaded_files table
+
+Revision ID: 8f6c4d0e2a35
+Revises: 7e5b3c9d1f24
+Create Date: 2026-10-19 12:40:27.551093
+
+"""
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f6c4d0e2a35'
+down_revision: Union[str, Sequence[str], None] = '7e5b3c9d1f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    uploaded_files = op.create_table('uploaded_files',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=True, comment='업로드 내용 해시 (SHA-256, 기존 파일은 NULL)'),
+    sa.Column('path', sa.String(length=500), nullable=False, comment='원본 이미지 웹 경로'),
+    sa.Column('renditions', sa.JSON(), nullable=True, comment='WebP 렌디션 경로 (너비: 경로)'),
+    sa.Column('size_bytes', sa.Integer(), nullable=True, comment='업로드 크기 (bytes)'),
+    sa.Column('ref_count', sa.Integer(), nullable=False, comment='참조 중인 할일 수'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='생성 시간 (UTC)'),
+    sa.Column('released_at', sa.DateTime(), nullable=True, comment='마지막 참조 해제 시간 (UTC)'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_uploaded_files_id'), 'uploaded_files', ['id'], unique=False)
+    op.create_index(op.f('ix_uploaded_files_content_hash'), 'uploaded_files', ['content_hash'], unique=True)
+    op.create_index(op.f('ix_uploaded_files_path'), 'uploaded_files', ['path'], unique=True)
+    op.create_index(op.f('ix_uploaded_files_ref_count'), 'uploaded_files', ['ref_count'], unique=False)
+
+    # 기존 할일이 참조하는 이미지를 참조 수와 함께 등록 (내용 해시는 알 수 없으므로 NULL)
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT completion_image_path, MAX(completion_image_renditions), COUNT(*) "
+        "FROM daily_todos WHERE completion_image_path IS NOT NULL "
+        "GROUP BY completion_image_path"
+    )).fetchall()
+    if rows:
+        now = datetime.utcnow()
+        op.bulk_insert(uploaded_files, [
+            {
+                'content_hash': None,
+                'path': path,
+                'renditions': json.loads(renditions) if isinstance(renditions, str) else renditions,
+                'size_bytes': None,
+                'ref_count': count,
+                'created_at': now,
+                'released_at': None,
+            }
+            for path, renditions, count in rows
+        ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_uploaded_files_ref_count'), table_name='uploaded_files')
+    op.drop_index(op.f('ix_uploaded_files_path'), table_name='uploaded_files')
+    op.drop_index(op.f('ix_uploaded_files_content_hash'), table_name='uploaded_files')
+    op.drop_index(op.f('ix_uploaded_files_id'), table_name='uploaded_files')
+    op.drop_table('uploaded_files')
@@ -0,0 +1,40 @@
+"""Add change_log table
+
+Revision ID: 9a7d5e1f3b46
+Revises: 8f6c4d0e2a35
+Create Date: 2026-10-19 13:50:12.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a7d5e1f3b46'
+down_revision: Union[str, Sequence[str], None] = '8f6c4d0e2a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_log',
+    sa.Column('seq', sa.Integer(), autoincrement=True, nullable=False, comment='변경 순서 번호'),
+    sa.Column('entity', sa.String(length=50), nullable=False, comment='엔티티 종류 (todo, memo)'),
+    sa.Column('entity_id', sa.Integer(), nullable=False, comment='엔티티 ID'),
+    sa.Column('version', sa.Integer(), nullable=False, comment='엔티티별 버전 (변경마다 1 증가)'),
+    sa.Column('op', sa.String(length=10), nullable=False, comment='변경 종류 (insert, update, delete)'),
+    sa.Column('changed_fields', sa.JSON(), nullable=True, comment='변경된 필드와 값'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='기록 시간 (UTC)'),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_change_log_entity', 'change_log', ['entity', 'entity_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_change_log_entity', table_name='change_log')
+    op.drop_table('change_log')
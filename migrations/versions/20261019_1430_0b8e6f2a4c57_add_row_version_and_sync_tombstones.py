@@ -0,0 +1,60 @@
+"""Add row_version columns, sync_state and sync_tombstones
+
+Revision ID: 0b8e6f2a4c57
+Revises: 9a7d5e1f3b46
+Create Date: 2026-10-19 14:30:41.873326
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b8e6f2a4c57'
+down_revision: Union[str, Sequence[str], None] = '9a7d5e1f3b46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ('daily_todos', 'daily_memos', 'daily_reflections', 'journeys')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in VERSIONED_TABLES:
+        op.add_column(table, sa.Column('row_version', sa.Integer(), server_default='0', nullable=False, comment='동기화 버전 (변경마다 전역 카운터에서 할당)'))
+        op.create_index(op.f(f'ix_{table}_row_version'), table, ['row_version'], unique=False)
+
+    sync_state = op.create_table('sync_state',
+    sa.Column('id', sa.Integer(), nullable=False, comment='항상 1'),
+    sa.Column('version', sa.Integer(), nullable=False, comment='마지막으로 할당한 row_version'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('sync_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=50), nullable=False, comment='엔티티 종류 (todo, memo, reflection, journey)'),
+    sa.Column('entity_id', sa.Integer(), nullable=False, comment='삭제된 행 ID'),
+    sa.Column('row_version', sa.Integer(), nullable=False, comment='삭제 시 할당한 동기화 버전'),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False, comment='삭제 시간 (UTC)'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sync_tombstones_id'), 'sync_tombstones', ['id'], unique=False)
+    op.create_index(op.f('ix_sync_tombstones_row_version'), 'sync_tombstones', ['row_version'], unique=False)
+
+    # 기존 행은 모두 버전 1 (since=0으로 처음 동기화하면 전부 받음)
+    for table in VERSIONED_TABLES:
+        op.execute(f"UPDATE {table} SET row_version = 1")
+    op.bulk_insert(sync_state, [{'id': 1, 'version': 1}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sync_tombstones_row_version'), table_name='sync_tombstones')
+    op.drop_index(op.f('ix_sync_tombstones_id'), table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    op.drop_table('sync_state')
+    for table in VERSIONED_TABLES:
+        op.drop_index(op.f(f'ix_{table}_row_version'), table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('row_version')
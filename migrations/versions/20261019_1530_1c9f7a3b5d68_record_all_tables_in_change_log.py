@@ -0,0 +1,89 @@
+"""Record all tables in change_log
+
+Revision ID: 1c9f7a3b5d68
+Revises: 0b8e6f2a4c57
+Create Date: 2026-10-19 15:30:41.582306
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c9f7a3b5d68'
+down_revision: Union[str, Sequence[str], None] = '0b8e6f2a4c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 값 대신 수정된 컬럼 이름만 남기는 형태로 새로 만들고 기존 기록을 옮김 (seq 유지)
+    op.create_table('change_log_new',
+    sa.Column('seq', sa.Integer(), autoincrement=True, nullable=False, comment='변경 순서 번호'),
+    sa.Column('table_name', sa.String(length=50), nullable=False, comment='테이블 이름'),
+    sa.Column('row_id', sa.Integer(), nullable=False, comment='행 기본키'),
+    sa.Column('op', sa.String(length=10), nullable=False, comment='변경 종류 (insert, update, delete)'),
+    sa.Column('version', sa.Integer(), nullable=True, comment='변경 후 row_version (동기화 대상 테이블만)'),
+    sa.Column('changed_columns', sa.JSON(), nullable=True, comment='수정된 컬럼 이름 목록 (생성·삭제는 NULL)'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='기록 시간 (UTC)'),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+
+    connection = op.get_bind()
+    tables = {'todo': 'daily_todos', 'memo': 'daily_memos'}
+    rows = connection.execute(sa.text(
+        "SELECT seq, entity, entity_id, op, version, changed_fields, created_at "
+        "FROM change_log ORDER BY seq"
+    )).fetchall()
+    new_table = sa.table(
+        'change_log_new',
+        sa.column('seq', sa.Integer), sa.column('table_name', sa.String), sa.column('row_id', sa.Integer),
+        sa.column('op', sa.String), sa.column('version', sa.Integer), sa.column('changed_columns', sa.JSON(none_as_null=True)),
+        sa.column('created_at', sa.String),  # 원본 문자열 그대로 복사
+    )
+    if rows:
+        op.bulk_insert(new_table, [
+            {
+                'seq': seq,
+                'table_name': tables.get(entity, entity),
+                'row_id': entity_id,
+                'op': change_op,
+                'version': version,
+                'changed_columns': sorted(json.loads(fields)) if change_op == 'update' and fields else None,
+                'created_at': created_at,
+            }
+            for seq, entity, entity_id, change_op, version, fields, created_at in rows
+        ])
+
+    op.drop_index('ix_change_log_entity', table_name='change_log')
+    op.drop_table('change_log')
+    op.rename_table('change_log_new', 'change_log')
+    op.create_index('ix_change_log_row', 'change_log', ['table_name', 'row_id'], unique=False)
+    op.create_index('ix_change_log_table_seq', 'change_log', ['table_name', 'seq'], unique=False)
+    op.create_index(op.f('ix_change_log_created_at'), 'change_log', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 이전 형식은 값을 담으므로 기록을 옮기지 않고 빈 테이블로 되돌림 (동기화 클라이언트는 resync)
+    op.drop_index(op.f('ix_change_log_created_at'), table_name='change_log')
+    op.drop_index('ix_change_log_table_seq', table_name='change_log')
+    op.drop_index('ix_change_log_row', table_name='change_log')
+    op.drop_table('change_log')
+    op.create_table('change_log',
+    sa.Column('seq', sa.Integer(), autoincrement=True, nullable=False, comment='변경 순서 번호'),
+    sa.Column('entity', sa.String(length=50), nullable=False, comment='엔티티 종류 (todo, memo)'),
+    sa.Column('entity_id', sa.Integer(), nullable=False, comment='엔티티 ID'),
+    sa.Column('version', sa.Integer(), nullable=False, comment='변경 후 엔티티의 row_version'),
+    sa.Column('op', sa.String(length=10), nullable=False, comment='변경 종류 (insert, update, delete)'),
+    sa.Column('changed_fields', sa.JSON(), nullable=True, comment='변경된 필드와 값'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='기록 시간 (UTC)'),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_change_log_entity', 'change_log', ['entity', 'entity_id'], unique=False)
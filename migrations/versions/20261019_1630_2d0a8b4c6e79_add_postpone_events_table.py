@@ -0,0 +1,116 @@
+"""Add postpone_events table
+
+Revision ID: 2d0a8b4c6e79
+Revises: 1c9f7a3b5d68
+Create Date: 2026-10-19 16:30:08.913275
+
+"""
+import json
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d0a8b4c6e79'
+down_revision: Union[str, Sequence[str], None] = '1c9f7a3b5d68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+postpone_events = sa.table(
+    'postpone_events',
+    sa.column('todo_id', sa.Integer), sa.column('from_date', sa.Date), sa.column('to_date', sa.Date),
+    sa.column('reason', sa.String), sa.column('postponed_at', sa.DateTime),
+)
+
+
+def _parse_history(todo_id: int, history_text: str) -> list:
+    """postpone_history JSON을 postpone_events 행으로 변환 (형식이 잘못된 항목은 건너뜀)"""
+    try:
+        history = json.loads(history_text)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(history, list):
+        return []
+
+    rows = []
+    for item in history:
+        try:
+            from_date = date.fromisoformat(item["from_date"])
+            to_date = date.fromisoformat(item["to_date"])
+            postponed_at = (
+                datetime.fromisoformat(item["postponed_at"]) if item.get("postponed_at")
+                else datetime.combine(from_date, datetime.min.time())
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+        rows.append({
+            'todo_id': todo_id,
+            'from_date': from_date,
+            'to_date': to_date,
+            'reason': (item.get("reason") or "")[:100],
+            'postponed_at': postponed_at,
+        })
+    return rows
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('postpone_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('todo_id', sa.Integer(), nullable=False, comment='미룬 할일 ID'),
+    sa.Column('from_date', sa.Date(), nullable=False, comment='미루기 전 날짜'),
+    sa.Column('to_date', sa.Date(), nullable=False, comment='미룬 날짜'),
+    sa.Column('reason', sa.String(length=100), nullable=False, comment='미루기 사유'),
+    sa.Column('postponed_at', sa.DateTime(), nullable=False, comment='미룬 시간 (UTC)'),
+    sa.ForeignKeyConstraint(['todo_id'], ['daily_todos.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_postpone_events_todo_id', 'postpone_events', ['todo_id', 'id'], unique=False)
+    op.create_index('ix_postpone_events_from_date', 'postpone_events', ['from_date'], unique=False)
+
+    # 기존 JSON 히스토리를 미룬 순서대로 옮김
+    connection = op.get_bind()
+    rows = []
+    for todo_id, history_text in connection.execute(sa.text(
+        "SELECT id, postpone_history FROM daily_todos "
+        "WHERE postpone_history IS NOT NULL AND postpone_history != '' ORDER BY id"
+    )):
+        rows.extend(_parse_history(todo_id, history_text))
+    if rows:
+        op.bulk_insert(postpone_events, rows)
+
+    with op.batch_alter_table('daily_todos', schema=None) as batch_op:
+        batch_op.drop_column('postpone_history')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily_todos', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('postpone_history', sa.Text(), nullable=True, comment='미루기 히스토리 (JSON)'))
+
+    # 미루기 기록을 할일별 JSON 히스토리로 되돌림
+    connection = op.get_bind()
+    histories = {}
+    for todo_id, from_date, to_date, reason, postponed_at in connection.execute(sa.select(
+        postpone_events.c.todo_id, postpone_events.c.from_date, postpone_events.c.to_date,
+        postpone_events.c.reason, postpone_events.c.postponed_at,
+    ).order_by(sa.text('id'))):
+        histories.setdefault(todo_id, []).append({
+            "from_date": from_date.isoformat(),
+            "to_date": to_date.isoformat(),
+            "reason": reason,
+            "postponed_at": postponed_at.isoformat(),
+        })
+    for todo_id, history in histories.items():
+        connection.execute(
+            sa.text("UPDATE daily_todos SET postpone_history = :history WHERE id = :id"),
+            {"history": json.dumps(history, ensure_ascii=False), "id": todo_id}
+        )
+
+    op.drop_index('ix_postpone_events_from_date', table_name='postpone_events')
+    op.drop_index('ix_postpone_events_todo_id', table_name='postpone_events')
+    op.drop_table('postpone_events')
@@ -0,0 +1,123 @@
+"""Add reflection_todo_snapshots table
+
+Revision ID: 3e1b9c5d7f80
+Revises: 2d0a8b4c6e79
+Create Date: 2026-10-19 17:30:52.406187
+
+"""
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e1b9c5d7f80'
+down_revision: Union[str, Sequence[str], None] = '2d0a8b4c6e79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+snapshots = sa.table(
+    'reflection_todo_snapshots',
+    sa.column('id', sa.Integer), sa.column('reflection_id', sa.Integer), sa.column('todo_id', sa.Integer),
+    sa.column('state', sa.String), sa.column('title', sa.String), sa.column('category', sa.String),
+    sa.column('completed_at', sa.DateTime), sa.column('estimated_minutes', sa.Integer),
+    sa.column('actual_minutes', sa.Integer),
+)
+
+
+def _parse_snapshot(reflection_id: int, snapshot_text: str) -> list:
+    """todos_snapshot JSON을 스냅샷 행으로 변환 (예전 형식의 "pending"은 미완료로 취급)"""
+    try:
+        snapshot = json.loads(snapshot_text)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(snapshot, dict):
+        return []
+
+    rows = []
+    for key, state in (('completed', 'completed'), ('incomplete', 'incomplete'), ('pending', 'incomplete')):
+        for item in snapshot.get(key) or []:
+            if not isinstance(item, dict) or not item.get('title'):
+                continue
+            completed_at = None
+            if state == 'completed' and item.get('completed_at'):
+                try:
+                    completed_at = datetime.fromisoformat(item['completed_at'])
+                except (TypeError, ValueError):
+                    pass
+            rows.append({
+                'reflection_id': reflection_id,
+                'todo_id': item.get('id'),
+                'state': state,
+                'title': str(item['title'])[:200],
+                'category': item.get('category'),
+                'completed_at': completed_at,
+                'estimated_minutes': item.get('estimated_minutes'),
+                'actual_minutes': item.get('actual_minutes') if state == 'completed' else None,
+            })
+    return rows
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reflection_todo_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('reflection_id', sa.Integer(), nullable=False, comment='회고 ID'),
+    sa.Column('todo_id', sa.Integer(), nullable=True, comment='할일 ID'),
+    sa.Column('state', sa.String(length=20), nullable=False, comment='회고 시점 상태 (completed, incomplete)'),
+    sa.Column('title', sa.String(length=200), nullable=False, comment='회고 시점 할일 제목'),
+    sa.Column('category', sa.String(length=20), nullable=True, comment='회고 시점 카테고리'),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True, comment='완료 시각'),
+    sa.Column('estimated_minutes', sa.Integer(), nullable=True, comment='예상 소요시간 (분)'),
+    sa.Column('actual_minutes', sa.Integer(), nullable=True, comment='실제 소요시간 (분)'),
+    sa.ForeignKeyConstraint(['reflection_id'], ['daily_reflections.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_reflection_todo_snapshots_reflection', 'reflection_todo_snapshots', ['reflection_id', 'state'], unique=False)
+    op.create_index('ix_reflection_todo_snapshots_todo_id', 'reflection_todo_snapshots', ['todo_id'], unique=False)
+
+    # 기존 JSON 스냅샷을 행으로 옮김
+    connection = op.get_bind()
+    rows = []
+    for reflection_id, snapshot_text in connection.execute(sa.text(
+        "SELECT id, todos_snapshot FROM daily_reflections WHERE todos_snapshot IS NOT NULL ORDER BY id"
+    )):
+        rows.extend(_parse_snapshot(reflection_id, snapshot_text))
+    if rows:
+        op.bulk_insert(snapshots, rows)
+
+    with op.batch_alter_table('daily_reflections', schema=None) as batch_op:
+        batch_op.drop_column('todos_snapshot')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily_reflections', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('todos_snapshot', sa.JSON(), nullable=True, comment='회고 시점의 할일 목록 스냅샷'))
+
+    # 스냅샷 행을 회고별 JSON으로 되돌림
+    connection = op.get_bind()
+    restored = {}
+    for row in connection.execute(sa.select(snapshots).order_by(snapshots.c.id)):
+        snapshot = restored.setdefault(row.reflection_id, {'completed': [], 'incomplete': []})
+        item = {'id': row.todo_id, 'title': row.title, 'category': row.category}
+        if row.state == 'completed':
+            item['completed_at'] = row.completed_at.isoformat() if row.completed_at else None
+            item['estimated_minutes'] = row.estimated_minutes
+            item['actual_minutes'] = row.actual_minutes
+        else:
+            item['estimated_minutes'] = row.estimated_minutes
+        snapshot[row.state].append(item)
+    for reflection_id, snapshot in restored.items():
+        connection.execute(
+            sa.text("UPDATE daily_reflections SET todos_snapshot = :snapshot WHERE id = :id"),
+            {"snapshot": json.dumps(snapshot, ensure_ascii=False), "id": reflection_id}
+        )
+
+    op.drop_index('ix_reflection_todo_snapshots_todo_id', table_name='reflection_todo_snapshots')
+    op.drop_index('ix_reflection_todo_snapshots_reflection', table_name='reflection_todo_snapshots')
+    op.drop_table('reflection_todo_snapshots')
@@ -0,0 +1,31 @@
+"""Add stats_dirty to daily_reflections
+
+Revision ID: 4f2c0d6e8a91
+Revises: 3e1b9c5d7f80
+Create Date: 2026-10-19 18:30:27.650419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2c0d6e8a91'
+down_revision: Union[str, Sequence[str], None] = '3e1b9c5d7f80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 회고는 다음 저장 때 한 번 다시 계산하도록 1로 채움
+    with op.batch_alter_table('daily_reflections', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('stats_dirty', sa.Boolean(), server_default='1', nullable=False, comment='회고 이후 그날 할일이 바뀌어 통계·스냅샷 재계산이 필요한지 여부'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily_reflections', schema=None) as batch_op:
+        batch_op.drop_column('stats_dirty')
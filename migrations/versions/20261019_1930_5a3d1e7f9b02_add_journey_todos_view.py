@@ -0,0 +1,49 @@
+"""Add journey_todos view and journey_id indexes
+
+Revision ID: 5a3d1e7f9b02
+Revises: 4f2c0d6e8a91
+Create Date: 2026-10-19 19:30:14.208836
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a3d1e7f9b02'
+down_revision: Union[str, Sequence[str], None] = '4f2c0d6e8a91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app/models/journey_todo.py의 VIEW_SELECT와 같은 정의 (마이그레이션 시점 기준으로 고정)
+# 이후 todos/daily_todos를 batch_alter_table로 재생성할 때는 SQLite가 테이블 이름 변경 중 뷰를 검사하므로
+# 그 마이그레이션에서 뷰를 먼저 지우고 다시 만들어야 합니다.
+JOURNEY_TODOS_VIEW = """
+CREATE VIEW journey_todos AS
+SELECT id, 'todo' AS source, journey_id, title, description, category,
+       is_completed, completed_at, created_at,
+       estimated_time AS estimated_minutes, actual_time AS actual_minutes
+FROM todos
+UNION ALL
+SELECT id, 'daily_todo' AS source, journey_id, title, description, category,
+       is_completed, completed_at, created_at,
+       estimated_minutes, actual_minutes
+FROM daily_todos
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_todos_journey_id'), 'todos', ['journey_id'], unique=False)
+    op.create_index(op.f('ix_daily_todos_journey_id'), 'daily_todos', ['journey_id'], unique=False)
+    op.execute(JOURNEY_TODOS_VIEW)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS journey_todos")
+    op.drop_index(op.f('ix_daily_todos_journey_id'), table_name='daily_todos')
+    op.drop_index(op.f('ix_todos_journey_id'), table_name='todos')
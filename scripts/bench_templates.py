@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+템플릿 렌더링 벤치마크
+
+daily_todos.html 기준으로 다음을 측정합니다.
+- 콜드 스타트: 새 환경에서 첫 get_template() 시간
+  (바이트코드 캐시 없음 / 빈 캐시 / 채워진 캐시)
+- 렌더링 1회당 시간: auto_reload 켬(dev) / 끔(main)
+
+사용법:
+    python scripts/bench_templates.py
+    python scripts/bench_templates.py --iterations 2000 --todos 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)  # 템플릿/정적 파일 경로는 프로젝트 루트 기준
+
+from jinja2 import BytecodeCache, FileSystemBytecodeCache  # noqa: E402
+
+from app.core.templates import create_environment  # noqa: E402
+
+TEMPLATE_NAME = "daily_todos.html"
+
+
+def sample_context(todo_count: int) -> dict:
+    """daily_todos.html 렌더링용 예시 컨텍스트"""
+    todos = []
+    for i in range(todo_count):
+        todos.append(SimpleNamespace(
+            id=i + 1,
+            title=f"벤치마크 할일 {i + 1}",
+            description="설명" if i % 3 == 0 else None,
+            is_completed=i % 2 == 0,
+            journey=SimpleNamespace(title="여정") if i % 4 == 0 else None,
+            category="업무",
+            estimated_minutes=30 if i % 5 == 0 else None,
+            overdue_status="overdue" if i % 7 == 0 else "today",
+            overdue_text="1일 지남" if i % 7 == 0 else None,
+            postpone_count=i % 3,
+            completion_reflection="완료 소감\n두 번째 줄" if i % 2 == 0 else None,
+            completion_image_path=None,
+            completion_image_srcset=None,
+        ))
+    completed = sum(1 for todo in todos if todo.is_completed)
+    return {
+        "request": SimpleNamespace(url=SimpleNamespace(port=8000)),
+        "today_todos": todos,
+        "summary": {
+            "total": todo_count,
+            "completed": completed,
+            "pending": todo_count - completed,
+            "completion_rate": round(completed / todo_count * 100, 1) if todo_count else 0,
+        },
+        "memos": [
+            {"id": i + 1, "content": f"메모 {i + 1}", "created_time": "09:00"}
+            for i in range(5)
+        ],
+        "today_date": "2025년 10월 20일 (월)",
+        "messages": [],
+    }
+
+
+def measure_ms(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def cold_start_ms(bytecode_cache: Optional[BytecodeCache]) -> float:
+    """새 환경에서 첫 템플릿 로드(파싱/컴파일 또는 캐시 적재) 시간"""
+    env = create_environment(bytecode_cache)
+    return measure_ms(lambda: env.get_template(TEMPLATE_NAME))
+
+
+def render_times_ms(auto_reload: bool, context: dict, iterations: int) -> List[float]:
+    """TemplateResponse처럼 매번 get_template() 후 렌더링"""
+    env = create_environment()
+    env.auto_reload = auto_reload
+    env.get_template(TEMPLATE_NAME).render(context)  # 워밍업
+    return [
+        measure_ms(lambda: env.get_template(TEMPLATE_NAME).render(context))
+        for _ in range(iterations)
+    ]
+
+
+def print_stats(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"  {label:<24} 평균 {statistics.mean(ordered):7.3f}ms  "
+          f"중앙값 {statistics.median(ordered):7.3f}ms  p95 {p95:7.3f}ms")
+
+
+def main():
+    """메인 함수 - CLI 인터페이스"""
+    parser = argparse.ArgumentParser(description="템플릿 렌더링 벤치마크")
+    parser.add_argument("--iterations", type=int, default=500, help="렌더링 반복 횟수 (기본 500)")
+    parser.add_argument("--todos", type=int, default=20, help="예시 할일 수 (기본 20)")
+    args = parser.parse_args()
+
+    print(f"📄 {TEMPLATE_NAME} (할일 {args.todos}개, 반복 {args.iterations}회)")
+
+    print("\n🧊 콜드 스타트 (첫 get_template)")
+    print(f"  {'바이트코드 캐시 없음':<24} {cold_start_ms(None):7.3f}ms")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print(f"  {'빈 캐시 (컴파일+저장)':<24} {cold_start_ms(FileSystemBytecodeCache(cache_dir)):7.3f}ms")
+        print(f"  {'채워진 캐시 (적재만)':<24} {cold_start_ms(FileSystemBytecodeCache(cache_dir)):7.3f}ms")
+
+    context = sample_context(args.todos)
+    print("\n🔁 렌더링 1회")
+    print_stats("auto_reload 켬 (dev)", render_times_ms(True, context, args.iterations))
+    print_stats("auto_reload 끔 (main)", render_times_ms(False, context, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,8 @@
     list-backups           백업 목록 표시
     reset                   백업 + 초기화 + 최신 마이그레이션
     fresh                   완전 초기화 (데이터 삭제)
+    gc-uploads              참조가 없는 업로드 이미지 정리
+    compact-change-log      오래된 변경 기록 압축 및 삭제
 
 예시:
     python scripts/db.py init
@@ -28,6 +30,8 @@
     python scripts/db.py migrate-new "Add user profile table"
     python scripts/db.py backup
     python scripts/db.py restore data/backups/app_backup_20241011_120000.db
+    python scripts/db.py gc-uploads --dry-run
+    python scripts/db.py compact-change-log --retention-days 30
 """
 
 import sys
@@ -503,6 +507,69 @@ class DatabaseManager:
         # 2. 새로운 데이터베이스 초기화
         return self.init()
 
+    # === 업로드 정리 ===
+    def gc_uploads(self, include_untracked: bool = False, dry_run: bool = False, grace_seconds: int = 3600) -> bool:
+        """참조가 없는 업로드 이미지와 렌디션 정리"""
+        if not self.db_path.exists():
+            self._print_error("데이터베이스 파일이 존재하지 않습니다")
+            return False
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from app.services.upload_store_service import UploadStoreService
+
+        upload_dir = self.project_root / "app" / "static" / "uploads" / "reflections"
+        engine = create_engine(f"sqlite:///{self.db_path}")
+        db = sessionmaker(bind=engine)()
+        try:
+            self._print_working("참조가 없는 업로드를 찾는 중..." + (" (dry-run)" if dry_run else ""))
+            stats = UploadStoreService.collect_garbage(
+                db,
+                upload_dir,
+                include_untracked=include_untracked,
+                grace_seconds=grace_seconds,
+                dry_run=dry_run
+            )
+        finally:
+            db.close()
+            engine.dispose()
+
+        print(f"   - 참조 해제된 항목: {stats['released_entries']}개")
+        if include_untracked:
+            print(f"   - 등록되지 않은 파일: {stats['untracked_files']}개")
+        print(f"   - 삭제{' 대상' if dry_run else '한'} 파일: {stats['deleted_files']}개 ({stats['freed_bytes']:,} bytes)")
+        self._print_success("업로드 정리가 완료되었습니다" if not dry_run else "dry-run 완료 (삭제하지 않음)")
+        return True
+
+    # === 변경 기록 정리 ===
+    def compact_change_log(self, compact_after_days: Optional[int] = None, retention_days: Optional[int] = None) -> bool:
+        """오래된 변경 기록(change_log)을 행마다 하나로 합치고 보관 기간이 지난 기록 삭제"""
+        if not self.db_path.exists():
+            self._print_error("데이터베이스 파일이 존재하지 않습니다")
+            return False
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from app.services.change_log_service import ChangeLogService
+
+        engine = create_engine(f"sqlite:///{self.db_path}")
+        db = sessionmaker(bind=engine)()
+        try:
+            self._print_working("변경 기록을 정리하는 중...")
+            stats = ChangeLogService.compact(
+                db,
+                compact_after_days=compact_after_days,
+                retention_days=retention_days
+            )
+        finally:
+            db.close()
+            engine.dispose()
+
+        print(f"   - 보관 기간이 지나 삭제한 기록: {stats['expired']}개")
+        print(f"   - 합쳐서 삭제한 기록: {stats['merged']}개")
+        self._print_success("변경 기록 정리가 완료되었습니다")
+        return True
+
 
 def main():
     """메인 함수 - CLI 인터페이스"""
@@ -518,6 +585,8 @@ def main():
   python scripts/db.py --env main migrate-up       # 메인 DB에 마이그레이션 적용
   python scripts/db.py --env dev backup            # 개발 DB 백업
   python scripts/db.py --env main backup           # 메인 DB 백업
+  python scripts/db.py --env main gc-uploads       # 참조가 없는 업로드 이미지 정리
+  python scripts/db.py --env main compact-change-log # 오래된 변경 기록 압축 및 삭제
         """
     )
 
@@ -570,6 +639,17 @@ def main():
     # fresh 명령어
     subparsers.add_parser('fresh', help='완전 초기화 (데이터 삭제)')
 
+    # gc-uploads 명령어
+    gc_parser = subparsers.add_parser('gc-uploads', help='참조가 없는 업로드 이미지 정리')
+    gc_parser.add_argument('--include-untracked', action='store_true', help='저장소에 등록되지 않은 파일도 정리')
+    gc_parser.add_argument('--grace-seconds', type=int, default=3600, help='최근 수정된 미등록 파일 제외 기준 (기본값: 3600초)')
+    gc_parser.add_argument('--dry-run', action='store_true', help='실제 삭제 없이 대상만 확인')
+
+    # compact-change-log 명령어
+    compact_parser = subparsers.add_parser('compact-change-log', help='오래된 변경 기록 압축 및 삭제')
+    compact_parser.add_argument('--compact-after-days', type=int, help='행마다 하나로 합칠 기록의 기준 일수 (기본값: CHANGE_LOG_COMPACT_AFTER_DAYS)')
+    compact_parser.add_argument('--retention-days', type=int, help='삭제할 기록의 기준 일수 (기본값: CHANGE_LOG_RETENTION_DAYS)')
+
     args = parser.parse_args()
 
     if not args.command:
@@ -607,6 +687,17 @@ def main():
             success = db_manager.reset()
         elif args.command == 'fresh':
             success = db_manager.fresh()
+        elif args.command == 'gc-uploads':
+            success = db_manager.gc_uploads(
+                include_untracked=args.include_untracked,
+                dry_run=args.dry_run,
+                grace_seconds=args.grace_seconds
+            )
+        elif args.command == 'compact-change-log':
+            success = db_manager.compact_change_log(
+                compact_after_days=args.compact_after_days,
+                retention_days=args.retention_days
+            )
         else:
             parser.print_help()
             return
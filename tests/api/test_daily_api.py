@@ -431,6 +431,27 @@ class TestDailyTodoAPI:
         assert data["scheduled_date"] == new_date
         assert data["postpone_count"] == 1
 
+    def test_postpone_analytics(self, client: TestClient, test_db):
+        """미루기 통계 조회 테스트"""
+        todo = DailyTodo(title="통계용 할 일", category=TodoCategory.WORK, created_date=date(2026, 10, 1))
+        test_db.add(todo)
+        test_db.commit()
+        client.patch(f"/api/daily/todos/{todo.id}/reschedule", data={"new_date": "2026-10-03", "reason": "바쁨"})
+
+        response = client.get("/api/daily/postpones/analytics?start_date=2026-10-01&end_date=2026-10-31")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["summary"]["total_postpones"] == 1
+        assert data["reasons"] == [{"reason": "바쁨", "count": 1, "avg_days": 2.0}]
+        assert data["todos"][0]["id"] == todo.id
+
+    def test_postpone_analytics_invalid_dates(self, client: TestClient, test_db):
+        """미루기 통계 잘못된 날짜 테스트"""
+        assert client.get("/api/daily/postpones/analytics?start_date=bad").status_code == 400
+        response = client.get("/api/daily/postpones/analytics?start_date=2026-10-31&end_date=2026-10-01")
+        assert response.status_code == 400
+
     def test_get_journeys_for_selection(self, client: TestClient, test_db):
         """할일 추가용 여정 목록 조회 테스트"""
         # 여정 생성
@@ -5,6 +5,7 @@
 import pytest
 from datetime import date, datetime, timedelta
 from app.models.todo import DailyTodo, TodoCategory
+from app.services.daily_todo_service import DailyTodoService
 
 
 class TestDailyProgressAPI:
@@ -256,8 +257,7 @@ class TestDailyProgressAPI:
         assert "남은 일: 0개" in html_content
 
         # Case 2: 할일 완료 취소
-        test_db.delete(past_todo)
-        test_db.commit()
+        DailyTodoService.delete_todo(test_db, past_todo.id)
 
         # 미완료 할일 추가 후 완료
         new_todo = DailyTodo(
@@ -331,4 +331,53 @@ class TestJourneysAPI:
     def test_get_journey_edit_form_not_found(self, client: TestClient, test_db):
         """존재하지 않는 여정 편집 폼 조회 실패 테스트"""
         response = client.get("/api/journeys/999/edit")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_journey_pages_render_both_todo_tables(self, client: TestClient, test_db):
+        """여정 관리·상세 페이지는 통합 조회로 Todo와 DailyTodo를 함께 표시 (지연 로딩 없이)"""
+        from app.models.todo import DailyTodo, Todo
+        journeys = [
+            Journey(title=f"페이지 여정 {i}", start_date=date.today(), end_date=date.today() + timedelta(days=30),
+                    status=JourneyStatus.ACTIVE)
+            for i in range(2)
+        ]
+        test_db.add_all(journeys)
+        test_db.commit()
+        for journey in journeys:
+            test_db.add_all([
+                Todo(title=f"기존 할일 {journey.id}", journey_id=journey.id, is_completed=True),
+                DailyTodo(title=f"일상 할일 {journey.id}", journey_id=journey.id),
+            ])
+        test_db.commit()
+
+        management = client.get("/journeys")
+        detail = client.get(f"/journeys/{journeys[0].id}")
+
+        assert management.status_code == 200
+        assert "페이지 여정 1" in management.text
+        assert detail.status_code == 200
+        assert f"기존 할일 {journeys[0].id}" in detail.text
+        assert f"일상 할일 {journeys[0].id}" in detail.text
+        assert f"일상 할일 {journeys[1].id}" not in detail.text
+
+    def test_journey_detail_hides_category_and_time_for_legacy_todos(self, client: TestClient, test_db):
+        """기존 Todo는 통합 전 화면처럼 카테고리 배지와 시간을 표시하지 않음"""
+        import re
+        from app.models.todo import DailyTodo, Todo, TodoCategory
+        journey = Journey(title="배지 여정", start_date=date.today(), end_date=date.today() + timedelta(days=30),
+                          status=JourneyStatus.ACTIVE)
+        test_db.add(journey)
+        test_db.commit()
+        test_db.add_all([
+            Todo(title="기존 할일", journey_id=journey.id, category=TodoCategory.RELATIONSHIP, estimated_time=37),
+            DailyTodo(title="일상 할일", journey_id=journey.id, category=TodoCategory.HEALTH, estimated_minutes=25),
+        ])
+        test_db.commit()
+
+        detail = client.get(f"/journeys/{journey.id}")
+
+        assert detail.status_code == 200
+        assert "예상 37분" not in detail.text
+        assert "예상 25분" in detail.text
+        badges = re.findall(r'rounded-full text-xs font-medium bg-gray-100 text-gray-800">\s*([^<]+?)\s*</span>', detail.text)
+        assert badges == [TodoCategory.HEALTH.value]
@@ -0,0 +1,178 @@
+"""
+화면 조각(fragment) 엔드포인트 테스트
+"""
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.core.static_assets import asset_url
+from app.core.timezone import get_current_date
+from app.models.journey import Journey
+from app.services.daily_memo_service import DailyMemoService
+from app.services.daily_todo_service import DailyTodoService
+
+
+class TestDailyFragments:
+    """오늘의 할 일 화면 조각 테스트"""
+
+    def test_page_loads_script_from_static_file(self, client: TestClient, test_db):
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert asset_url("js/daily_todos.js") in response.text
+        assert "<script>" not in response.text
+
+    def test_page_renders_memo_panel_on_server(self, client: TestClient, test_db):
+        DailyMemoService.create_memo(test_db, get_current_date(), "서버에서 그린 메모")
+
+        response = client.get("/")
+
+        assert "서버에서 그린 메모" in response.text
+        assert 'id="memo-panel"' in response.text
+
+    def test_summary_fragment_reflects_toggle(self, client: TestClient, test_db):
+        todo = DailyTodoService.create_todo(test_db, "요약 조각 테스트")
+        DailyTodoService.create_todo(test_db, "남은 할일")
+
+        before = client.get("/fragments/daily/summary")
+        client.patch(f"/api/daily/todos/{todo.id}/complete")
+        after = client.get("/fragments/daily/summary")
+
+        assert 'data-completed="0" data-total="2"' in before.text
+        assert 'data-completed="1" data-total="2"' in after.text
+        assert "<html" not in after.text
+
+    def test_summary_fragment_empty(self, client: TestClient, test_db):
+        response = client.get("/fragments/daily/summary")
+
+        assert response.status_code == 200
+        assert 'id="summary-card"' in response.text
+        assert "daily-reflection-btn" not in response.text
+
+    def test_todo_list_fragment(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "목록 조각 할일")
+
+        response = client.get("/fragments/daily/todos")
+
+        assert response.status_code == 200
+        assert "목록 조각 할일" in response.text
+        assert "<html" not in response.text
+
+    def test_todo_list_fragment_with_journeys(self, client: TestClient, test_db):
+        """여정 제목은 목록 조회에서 함께 로드 (할일마다 지연 로딩하면 가드가 실패시킴)"""
+        for title in ("첫 여정", "둘째 여정"):
+            journey = Journey(title=title, start_date=date(2025, 1, 1), end_date=date(2025, 12, 31))
+            test_db.add(journey)
+            test_db.commit()
+            DailyTodoService.create_todo(test_db, f"{title} 할일", journey_id=journey.id)
+
+        response = client.get("/fragments/daily/todos")
+
+        assert response.status_code == 200
+        assert "첫 여정" in response.text and "둘째 여정" in response.text
+
+    def test_todo_item_fragment(self, client: TestClient, test_db):
+        todo = DailyTodoService.create_todo(test_db, "항목 조각 할일")
+
+        response = client.get(f"/fragments/daily/todos/{todo.id}")
+
+        assert response.status_code == 200
+        assert f'data-todo-id="{todo.id}"' in response.text
+        assert response.text.count('class="todo-item') == 1
+
+    def test_todo_item_fragment_not_found(self, client: TestClient, test_db):
+        response = client.get("/fragments/daily/todos/99999")
+
+        assert response.status_code == 404
+
+    def test_memo_panel_fragment_escapes_content(self, client: TestClient, test_db):
+        DailyMemoService.create_memo(test_db, get_current_date(), "<b>굵게</b>")
+
+        response = client.get("/fragments/daily/memos")
+
+        assert response.status_code == 200
+        assert "&lt;b&gt;굵게&lt;/b&gt;" in response.text
+        assert 'data-memo-count="1"' in response.text
+
+
+class TestReflectionHistoryFragments:
+    """회고 히스토리 화면 조각 테스트"""
+
+    def test_page_loads_script_from_static_file(self, client: TestClient, test_db):
+        response = client.get("/reflection-history")
+
+        assert response.status_code == 200
+        assert asset_url("js/reflection_history.js") in response.text
+        assert "<script>" not in response.text
+
+    def test_week_accordion_fragment(self, client: TestClient, test_db):
+        today = get_current_date()
+        monday = today - timedelta(days=today.weekday())
+
+        response = client.get(f"/fragments/reflection-history/week?week_start={today.isoformat()}")
+
+        assert response.status_code == 200
+        assert f'data-week-start="{monday.isoformat()}"' in response.text
+        assert response.text.count('class="accordion-item') == 7
+
+    def test_week_summary_fragment(self, client: TestClient, test_db):
+        response = client.get("/fragments/reflection-history/summary")
+
+        assert response.status_code == 200
+        assert 'id="week-summary"' in response.text
+        assert "<html" not in response.text
+
+    def test_week_accordion_has_no_day_details(self, client: TestClient, test_db):
+        """첫 렌더링에는 날짜별 집계만 포함 (할일 제목은 펼칠 때 조회)"""
+        DailyTodoService.create_todo(test_db, "펼칠 때만 보이는 할일")
+
+        response = client.get("/reflection-history")
+
+        assert "펼칠 때만 보이는 할일" not in response.text
+
+    def test_week_details_endpoint(self, client: TestClient, test_db):
+        todo = DailyTodoService.create_todo(test_db, "주간 상세 할일")
+        today = get_current_date()
+        monday = today - timedelta(days=today.weekday())
+
+        response = client.get(f"/api/reflection-week/{today.isoformat()}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["week_start"] == monday.isoformat()
+        assert len(data["days"]) == 7
+        pending = data["days"][today.isoformat()]["todos"]["pending"]
+        assert [t["id"] for t in pending] == [todo.id]
+
+    def test_week_details_not_modified(self, client: TestClient, test_db):
+        first = client.get("/api/reflection-week/2025-10-06")
+        etag = first.headers["etag"]
+
+        second = client.get("/api/reflection-week/2025-10-06", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+
+    def test_week_details_etag_changes_after_todo_change(self, client: TestClient, test_db):
+        today = get_current_date().isoformat()
+        etag = client.get(f"/api/reflection-week/{today}").headers["etag"]
+
+        DailyTodoService.create_todo(test_db, "새 할일")
+        response = client.get(f"/api/reflection-week/{today}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_week_details_invalid_date(self, client: TestClient, test_db):
+        response = client.get("/api/reflection-week/not-a-date")
+
+        assert response.status_code == 400
+
+    def test_day_details_endpoint(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "하루 상세 할일")
+        today = get_current_date().isoformat()
+
+        response = client.get(f"/api/reflection-day/{today}")
+
+        assert response.status_code == 200
+        assert response.json()["date"] == today
+        assert response.json()["todos"]["pending"][0]["title"] == "하루 상세 할일"
@@ -114,8 +114,7 @@ class TestReflectionsAPI:
             completed_todos=3,
             completion_rate=60.0,
             satisfaction_score=4,
-            energy_level=3,
-            todos_snapshot={"completed": [], "incomplete": []}
+            energy_level=3
         )
         test_db.add(reflection)
         test_db.commit()
@@ -165,8 +164,7 @@ class TestReflectionsAPI:
                 completed_todos=3,
                 completion_rate=60.0,
                 satisfaction_score=4,
-                energy_level=3,
-                todos_snapshot={"completed": [], "incomplete": []}
+                energy_level=3
             )
             test_db.add(reflection)
         test_db.commit()
@@ -189,8 +187,7 @@ class TestReflectionsAPI:
                 reflection_text=f"회고 {i+1}",
                 total_todos=1,
                 completed_todos=1,
-                completion_rate=100.0,
-                todos_snapshot={"completed": [], "incomplete": []}
+                completion_rate=100.0
             )
             test_db.add(reflection)
         test_db.commit()
@@ -229,8 +226,7 @@ class TestReflectionsAPI:
                 completed_todos=int(5 * completion_rate / 100),
                 completion_rate=completion_rate,
                 satisfaction_score=satisfaction,
-                energy_level=energy,
-                todos_snapshot={"completed": [], "incomplete": []}
+                energy_level=energy
             )
             test_db.add(reflection)
         test_db.commit()
@@ -252,8 +248,7 @@ class TestReflectionsAPI:
             reflection_text="삭제할 회고",
             total_todos=1,
             completed_todos=1,
-            completion_rate=100.0,
-            todos_snapshot={"completed": [], "incomplete": []}
+            completion_rate=100.0
         )
         test_db.add(reflection)
         test_db.commit()
@@ -292,8 +287,7 @@ class TestReflectionsAPI:
             completed_todos=1,
             completion_rate=100.0,
             satisfaction_score=3,
-            energy_level=3,
-            todos_snapshot={"completed": [], "incomplete": []}
+            energy_level=3
         )
         test_db.add(existing_reflection)
         test_db.commit()
@@ -319,4 +313,15 @@ class TestReflectionsAPI:
             DailyReflection.reflection_date == date.today()
         ).all()
         assert len(reflections) == 1
-        assert reflections[0].reflection_text == "업데이트된 회고 내용"
\ No newline at end of file
+        assert reflections[0].reflection_text == "업데이트된 회고 내용"
+
+    def test_get_completed_todos_on_reflected_days(self, client: TestClient, test_db, sample_reflection):
+        """회고한 날 완료한 할일 조회 테스트"""
+        today = date.today().isoformat()
+
+        response = client.get(f"/api/reflections/completed-todos?start_date={today}&end_date={today}")
+        assert response.status_code == 200
+        assert [todo["title"] for todo in response.json()["todos"]] == ["할일 1", "할일 2"]
+
+        response = client.get("/api/reflections/completed-todos?start_date=bad&end_date=bad")
+        assert response.status_code == 400
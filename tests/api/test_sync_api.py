@@ -0,0 +1,97 @@
+"""
+동기화 웹소켓 테스트
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.routers import sync
+from app.services.change_log_service import ChangeLogService
+from app.services.daily_todo_service import DailyTodoService
+
+
+@pytest.fixture
+def fast_heartbeat(monkeypatch):
+    monkeypatch.setattr(settings, "sse_heartbeat_seconds", 0.05)
+
+
+class TestSyncSocket:
+    """동기화 웹소켓 테스트"""
+
+    def test_resume_sends_missed_changes(self, client: TestClient, test_db):
+        first = DailyTodoService.create_todo(test_db, "놓친 변경 1")
+        DailyTodoService.create_todo(test_db, "놓친 변경 2")
+        first_seq = ChangeLogService.get_changes_since(test_db, 0)[0]["seq"]
+
+        with client.websocket_connect(f"/ws/sync?since={first_seq}") as websocket:
+            hello = websocket.receive_json()
+            message = websocket.receive_json()
+
+        assert hello == {"type": "hello", "last_seq": first_seq + 1}
+        assert message["type"] == "changes"
+        assert [c["fields"]["title"] for c in message["changes"]] == ["놓친 변경 2"]
+        assert first.id not in [c["id"] for c in message["changes"]]
+
+    def test_streams_new_changes(self, client: TestClient, test_db):
+        with client.websocket_connect("/ws/sync") as websocket:
+            assert websocket.receive_json()["type"] == "hello"
+
+            todo = DailyTodoService.create_todo(test_db, "실시간 변경")
+            message = websocket.receive_json()
+
+        assert message["changes"][0]["id"] == todo.id
+        assert message["changes"][0]["op"] == "insert"
+
+    def test_waits_for_ack_when_window_is_full(self, client: TestClient, test_db, monkeypatch, fast_heartbeat):
+        monkeypatch.setattr(sync, "SYNC_WINDOW", 2)
+        monkeypatch.setattr(sync, "SYNC_BATCH_SIZE", 1)
+        for i in range(3):
+            DailyTodoService.create_todo(test_db, f"할일 {i}")
+
+        with client.websocket_connect("/ws/sync?since=0") as websocket:
+            websocket.receive_json()  # hello
+            first = websocket.receive_json()
+            second = websocket.receive_json()
+            waiting = websocket.receive_json()
+            websocket.send_json({"type": "ack", "seq": second["last_seq"]})
+            third = websocket.receive_json()
+
+        assert [len(first["changes"]), len(second["changes"])] == [1, 1]
+        assert waiting == {"type": "ping"}
+        assert third["changes"][0]["fields"]["title"] == "할일 2"
+
+    def test_resync_when_client_is_ahead(self, client: TestClient, test_db):
+        with client.websocket_connect("/ws/sync?since=999") as websocket:
+            assert websocket.receive_json() == {"type": "resync"}
+            assert websocket.receive_json() == {"type": "hello", "last_seq": 0}
+
+    def test_resync_when_missed_changes_were_compacted(self, client: TestClient, test_db):
+        for i in range(3):
+            DailyTodoService.create_todo(test_db, f"정리될 할일 {i}")
+        last_seq = ChangeLogService.get_last_seq(test_db)
+        ChangeLogService.compact(test_db, now=datetime.utcnow() + timedelta(days=365))
+
+        with client.websocket_connect("/ws/sync?since=0") as websocket:
+            assert websocket.receive_json() == {"type": "resync"}
+            assert websocket.receive_json() == {"type": "hello", "last_seq": last_seq}
+
+
+class TestSyncAPI:
+    """증분 동기화 API 테스트"""
+
+    def test_initial_and_incremental_sync(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "처음 할일")
+
+        first = client.get("/api/sync").json()
+        DailyTodoService.create_todo(test_db, "다음 할일")
+        second = client.get(f"/api/sync?since={first['version']}").json()
+
+        assert [todo["title"] for todo in first["todos"]] == ["처음 할일"]
+        assert [todo["title"] for todo in second["todos"]] == ["다음 할일"]
+        assert second["version"] > first["version"]
+        assert set(second) == {"version", "todos", "memos", "reflections", "journeys", "deleted"}
+
+    def test_rejects_negative_since(self, client: TestClient, test_db):
+        assert client.get("/api/sync?since=-1").status_code == 422
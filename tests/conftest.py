@@ -2,9 +2,9 @@
 테스트 설정 및 공통 픽스쳐
 """
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Generator
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 
@@ -13,6 +13,7 @@ from app.core.database import Base, get_db
 from app.models.todo import DailyTodo, TodoCategory, Todo
 from app.models.journey import Journey, JourneyStatus
 from app.models.daily_reflection import DailyReflection
+from app.models.reflection_todo_snapshot import ReflectionTodoSnapshot
 from app.models.daily_memo import DailyMemo
 
 # 모든 모델을 import 해야 Base.metadata.create_all()에서 테이블이 생성됨
@@ -27,6 +28,36 @@ TEST_DATABASE_URL = "sqlite:///./test_temp.db"
 test_engine = None
 test_session_local = None
 
+
+class LazyLoadError(AssertionError):
+    """테스트 중 예상하지 못한 관계 지연 로딩(N+1 후보)이 일어남"""
+
+
+# allow_lazy_load 마커가 붙은 테스트에서만 False
+lazy_load_guard_enabled = True
+
+
+def _guard_lazy_load(orm_execute_state) -> None:
+    """관계 속성 지연 로딩이 SQL을 실행하려 하면 실패 (raiseload("*")를 기본값으로 둔 것과 같은 효과)
+
+    selectinload 등 쿼리에 명시한 로더 옵션과 이미 세션에 있는 객체 참조는 SQL이 없으므로 통과합니다.
+    """
+    if lazy_load_guard_enabled and orm_execute_state.is_select and orm_execute_state.lazy_loaded_from is not None:
+        state = orm_execute_state.lazy_loaded_from
+        raise LazyLoadError(
+            f"{state.class_.__name__}(id={state.identity[0] if state.identity else None})의 관계를 지연 로딩했습니다. "
+            "쿼리에 selectinload/joinedload 옵션을 지정하세요 (의도한 경우 @pytest.mark.allow_lazy_load)"
+        )
+
+
+@pytest.fixture(autouse=True)
+def lazy_load_guard(request):
+    """모든 테스트에서 지연 로딩 가드를 켬 (allow_lazy_load 마커로 해제)"""
+    global lazy_load_guard_enabled
+    lazy_load_guard_enabled = request.node.get_closest_marker("allow_lazy_load") is None
+    yield
+    lazy_load_guard_enabled = True
+
 @pytest.fixture(scope="function")
 def test_db() -> Generator[Session, None, None]:
     """테스트용 데이터베이스 세션 픽스쳐"""
@@ -50,6 +81,7 @@ def test_db() -> Generator[Session, None, None]:
         print(f"Actually created tables: {[row[0] for row in inspector]}")
 
     test_session_local = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+    event.listen(test_session_local, "do_orm_execute", _guard_lazy_load)
 
     # 테스트용 데이터베이스 세션 생성
     db = test_session_local()
@@ -166,15 +198,11 @@ def sample_reflection(test_db: Session) -> DailyReflection:
         energy_level=3,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-        todos_snapshot={
-            "completed": [
-                {"title": "할일 1", "category": "업무"},
-                {"title": "할일 2", "category": "개인"},
-            ],
-            "pending": [
-                {"title": "할일 3", "category": "학습"},
-            ]
-        }
+        todo_snapshots=[
+            ReflectionTodoSnapshot(state="completed", title="할일 1", category="업무"),
+            ReflectionTodoSnapshot(state="completed", title="할일 2", category="개인"),
+            ReflectionTodoSnapshot(state="incomplete", title="할일 3", category="학습"),
+        ]
     )
     test_db.add(reflection)
     test_db.commit()
@@ -182,6 +210,50 @@ def sample_reflection(test_db: Session) -> DailyReflection:
     return reflection
 
 
+# 블로그 생성·일괄 생성 테스트가 함께 쓰는 일주일치 데이터 시작일
+WEEK_START = date(2025, 10, 6)
+
+
+@pytest.fixture
+def week_of_reflections(test_db: Session) -> list:
+    """WEEK_START부터 일주일치 회고와 할일(완료 1, 미완료 1), 메모"""
+    reflections = []
+    for i in range(7):
+        day = WEEK_START + timedelta(days=i)
+        reflection = DailyReflection(
+            reflection_date=day,
+            reflection_text=f"{i + 1}일차 회고",
+            total_todos=2,
+            completed_todos=1,
+            completion_rate=50.0,
+            satisfaction_score=4,
+            energy_level=3,
+            created_at=datetime.now()
+        )
+        test_db.add(reflection)
+        reflections.append(reflection)
+
+        test_db.add(DailyTodo(
+            title=f"{i + 1}일차 완료 할일",
+            category=TodoCategory.WORK,
+            is_completed=True,
+            completed_at=datetime.combine(day, datetime.min.time()) + timedelta(hours=10),
+            created_date=day,
+            scheduled_date=day
+        ))
+        test_db.add(DailyTodo(
+            title=f"{i + 1}일차 미완료 할일",
+            category=TodoCategory.PERSONAL,
+            is_completed=False,
+            created_date=day,
+            scheduled_date=day
+        ))
+        test_db.add(DailyMemo(memo_date=day, content=f"{i + 1}일차 메모", created_at=datetime.now()))
+
+    test_db.commit()
+    return reflections
+
+
 # === 테스트 데이터 생성기 ===
 
 @pytest.fixture
@@ -0,0 +1,145 @@
+"""
+이벤트 버스와 SSE 스트림 테스트
+"""
+import asyncio
+import json
+
+from app.core.events import EventBus, RESYNC_EVENT, event_bus, stream_events
+from app.core.timezone import get_current_date
+from app.services.daily_memo_service import DailyMemoService
+from app.services.daily_todo_service import DailyTodoService
+
+
+class FakeRequest:
+    """지정한 횟수만큼 확인한 뒤 연결이 끊기는 요청"""
+
+    def __init__(self, checks: int):
+        self.checks = checks
+
+    async def is_disconnected(self) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+def parse_events(chunks):
+    """SSE 메시지를 (event, data) 목록으로 변환"""
+    events = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestEventBus:
+    """이벤트 버스 테스트"""
+
+    async def test_publish_delivers_to_subscribers(self):
+        bus = EventBus()
+        subscription = bus.subscribe()
+
+        bus.publish("todo.changed", {"id": 1})
+        event = await subscription.get(timeout=1)
+
+        assert (event.type, event.data) == ("todo.changed", {"id": 1})
+
+    async def test_publish_from_another_thread(self):
+        bus = EventBus()
+        subscription = bus.subscribe()
+
+        await asyncio.to_thread(bus.publish, "memo.added", {"id": 2})
+        event = await subscription.get(timeout=1)
+
+        assert event.data == {"id": 2}
+
+    async def test_full_queue_marks_overflow(self):
+        bus = EventBus(queue_size=1)
+        subscription = bus.subscribe()
+
+        bus.publish("a", {})
+        bus.publish("b", {})
+        await asyncio.sleep(0)
+
+        assert subscription.overflowed is True
+
+    def test_events_since(self):
+        bus = EventBus(history_size=3)
+        for i in range(5):
+            bus.publish("e", {"n": i})
+
+        assert [event.data["n"] for event in bus.events_since(3)] == [3, 4]
+        assert bus.events_since(5) == []
+        assert bus.events_since(1) is None  # 보관 범위를 벗어남
+        assert bus.events_since(10) is None  # 서버 재시작
+
+
+class TestStreamEvents:
+    """SSE 스트림 테스트"""
+
+    async def test_resume_from_last_event_id(self):
+        bus = EventBus()
+        first = bus.publish("todo.changed", {"id": 1})
+        bus.publish("todo.changed", {"id": 2})
+
+        chunks = await collect(stream_events(FakeRequest(0), bus, last_event_id=first.id))
+
+        assert chunks[0].startswith("retry:")
+        assert parse_events(chunks) == [("todo.changed", {"id": 2})]
+
+    async def test_resync_when_history_lost(self):
+        bus = EventBus(history_size=1)
+        bus.publish("a", {})
+        bus.publish("b", {})
+
+        chunks = await collect(stream_events(FakeRequest(0), bus, last_event_id=0))
+
+        assert parse_events(chunks) == [(RESYNC_EVENT, {})]
+
+    async def test_streams_published_events_and_heartbeat(self):
+        bus = EventBus()
+        stream = stream_events(FakeRequest(2), bus, heartbeat_seconds=0.01)
+
+        assert (await stream.__anext__()).startswith("retry:")
+        assert await stream.__anext__() == ": keep-alive\n\n"
+        bus.publish("summary.changed", {"total": 1})
+        chunks = await collect(stream)
+
+        assert parse_events(chunks) == [("summary.changed", {"total": 1})]
+        assert bus.subscriber_count == 0
+
+
+class TestServiceEvents:
+    """서비스 변경 작업의 이벤트 발행 테스트"""
+
+    @staticmethod
+    def page_events(start):
+        """오늘 화면용 이벤트만 (동기화 채널 알림 제외)"""
+        return [event for event in event_bus.events_since(start) if event.type != "sync.changed"]
+
+    def test_todo_mutations_publish_events(self, test_db):
+        start = event_bus.last_event_id
+
+        todo = DailyTodoService.create_todo(test_db, "이벤트 할일")
+        DailyTodoService.toggle_complete(test_db, todo.id)
+
+        events = self.page_events(start)
+        assert [(event.type, event.data.get("action")) for event in events] == [
+            ("todo.changed", "created"), ("summary.changed", None),
+            ("todo.changed", "completed"), ("summary.changed", None),
+        ]
+        assert events[-1].data == {"total": 1, "completed": 1, "pending": 0, "completion_rate": 100.0}
+
+    def test_memo_mutations_publish_events(self, test_db):
+        start = event_bus.last_event_id
+
+        memo = DailyMemoService.create_memo(test_db, get_current_date(), "이벤트 메모")
+        DailyMemoService.delete_memo(test_db, memo.id)
+
+        events = self.page_events(start)
+        assert [event.type for event in events] == ["memo.added", "memo.deleted"]
+        assert events[0].data["content"] == "이벤트 메모"
+        assert events[1].data == {"id": memo.id, "memo_date": get_current_date().isoformat()}
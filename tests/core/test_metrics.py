@@ -0,0 +1,82 @@
+"""
+운영 메트릭(/metrics) 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.metrics import LatencyHistogram, PrometheusWriter
+from app.services.llm_cache_service import LLMCacheService
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.registry.reset()
+    LLMCacheService.reset_stats()
+    yield
+    metrics.registry.reset()
+    LLMCacheService.reset_stats()
+
+
+class TestPrometheusWriter:
+    """텍스트 형식 테스트"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = LatencyHistogram((0.1, 1))
+        for seconds in (0.05, 0.5, 0.7, 3):
+            histogram.observe(seconds)
+        writer = PrometheusWriter()
+
+        writer.histogram("x_seconds", "설명", [({"route": "/a"}, histogram)])
+        text = writer.render()
+
+        assert 'x_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'x_seconds_bucket{route="/a",le="1.0"} 3' in text
+        assert 'x_seconds_bucket{route="/a",le="+Inf"} 4' in text
+        assert 'x_seconds_count{route="/a"} 4' in text
+
+    def test_label_values_are_escaped(self):
+        writer = PrometheusWriter()
+
+        writer.metric("x_total", "counter", "설명", [({"path": 'a"b\\c'}, 1)])
+
+        assert 'x_total{path="a\\"b\\\\c"} 1' in writer.render()
+
+
+class TestMetricsEndpoint:
+    """/metrics 테스트"""
+
+    def test_content_type_and_route_template_label(self, client: TestClient, test_db):
+        client.get("/journeys/999")
+        client.get("/journeys/998")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        # 경로 값이 아니라 라우트 템플릿 하나로 모임
+        assert 'http_requests_total{method="GET",route="/journeys/{journey_id}",status="404"} 2' in response.text
+        assert "/journeys/999" not in response.text
+
+    def test_unmatched_paths_share_one_label(self, client: TestClient, test_db):
+        client.get("/no-such-page-1")
+        client.get("/no-such-page-2")
+
+        text = client.get("/metrics").text
+
+        assert f'http_requests_total{{method="GET",route="{metrics.UNMATCHED_ROUTE}",status="404"}} 2' in text
+
+    def test_token_upload_and_cache_metrics(self, client: TestClient, test_db):
+        metrics.record_llm_tokens("openai", 120, 30)
+        metrics.record_upload(2048, deduplicated=False)
+        metrics.record_upload(2048, deduplicated=True)
+        LLMCacheService._stats.update({"hits": 3, "misses": 1, "saved_tokens": 500})
+
+        text = client.get("/metrics").text
+
+        assert 'llm_tokens_total{provider="openai",type="prompt"} 120' in text
+        assert 'llm_tokens_total{provider="openai",type="completion"} 30' in text
+        assert "upload_bytes_total 4096" in text
+        assert "upload_dedup_hits_total 1" in text
+        assert "llm_cache_hit_ratio 0.75" in text
+        assert "llm_cache_saved_tokens_total 500" in text
@@ -0,0 +1,112 @@
+"""
+요청 프로파일링 테스트
+"""
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import StackSampler
+from app.services.daily_todo_service import DailyTodoService
+
+
+@pytest.fixture(autouse=True)
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "profile_dir", str(tmp_path / "profiles"))
+    monkeypatch.setattr(settings, "profile_sample_rate", 0)
+    monkeypatch.setattr(settings, "app_env", "dev")
+    return tmp_path / "profiles"
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestStackSampler:
+    """샘플러 테스트"""
+
+    def test_collects_hot_frames_of_app_code(self, monkeypatch):
+        # 테스트 파일을 app 코드로 간주
+        monkeypatch.setattr(profiling, "APP_DIR", str(Path(__file__).resolve().parent))
+        sampler = StackSampler(0.001)
+
+        sampler.start()
+        _busy(0.1)
+        sampler.stop()
+        summary = sampler.summary()
+
+        assert summary["samples"] > 0
+        assert summary["self"][0]["frame"].startswith("_busy")
+        assert any("test_collects_hot_frames_of_app_code" in f["frame"] for f in summary["cumulative"])
+
+
+class TestProfilingMiddleware:
+    """미들웨어 선택 실행·저장 테스트"""
+
+    def test_not_profiled_without_trigger(self, client: TestClient, test_db, profile_dir):
+        response = client.get("/health")
+
+        assert "X-Profile-Id" not in response.headers
+        assert profiling.list_profiles() == []
+
+    def test_header_triggers_profile_with_db_and_template_time(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "프로파일 대상")
+
+        response = client.get("/", headers={"X-Profile": "1"})
+
+        profile = profiling.load_profile(response.headers["X-Profile-Id"])
+        assert profile["trigger"] == "header"
+        assert profile["route"] == "/"
+        assert profile["status_code"] == 200
+        assert profile["db"]["queries"] >= 1
+        assert profile["template_ms"] > 0
+        assert profile["duration_ms"] >= profile["template_ms"]
+
+    def test_query_flag_triggers_profile(self, client: TestClient, test_db):
+        response = client.get("/health?profile=1")
+
+        assert profiling.load_profile(response.headers["X-Profile-Id"])["trigger"] == "query"
+
+    def test_flags_ignored_outside_dev_but_sampling_applies(self, client: TestClient, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "app_env", "main")
+        assert "X-Profile-Id" not in client.get("/health", headers={"X-Profile": "1"}).headers
+
+        monkeypatch.setattr(settings, "profile_sample_rate", 1.0)
+        response = client.get("/health")
+
+        assert profiling.load_profile(response.headers["X-Profile-Id"])["trigger"] == "sample"
+
+    def test_ring_buffer_keeps_latest_files(self, client: TestClient, test_db, monkeypatch, profile_dir):
+        monkeypatch.setattr(settings, "profile_max_files", 2)
+
+        ids = [client.get("/health?profile=1").headers["X-Profile-Id"] for _ in range(3)]
+
+        assert sorted(path.stem for path in profile_dir.glob("*.json")) == ids[1:]
+
+
+class TestDebugProfilesEndpoint:
+    """/debug/profiles 테스트"""
+
+    def test_list_and_detail(self, client: TestClient, test_db):
+        profile_id = client.get("/health?profile=1").headers["X-Profile-Id"]
+
+        listed = client.get("/debug/profiles").json()
+        detail = client.get(f"/debug/profiles/{profile_id}").json()
+
+        assert listed[0]["id"] == profile_id
+        assert listed[0]["path"] == "/health"
+        assert "stacks" in detail["profile"]
+
+    def test_invalid_id_is_not_found(self, client: TestClient, test_db):
+        assert client.get("/debug/profiles/..%2F..%2Fapp").status_code == 404
+        assert client.get("/debug/profiles/00000000000000000000-deadbeef").status_code == 404
+
+    def test_hidden_outside_dev(self, client: TestClient, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "app_env", "main")
+
+        assert client.get("/debug/profiles").status_code == 404
@@ -0,0 +1,86 @@
+"""
+SQL 실행 계측 테스트
+"""
+import logging
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core import query_stats
+from app.core.config import settings
+from app.services.daily_todo_service import DailyTodoService
+
+
+class TestFingerprint:
+    """SQL 지문 테스트"""
+
+    def test_literals_and_params_are_normalized(self):
+        assert query_stats.fingerprint("SELECT * FROM t WHERE a = 'x' AND b = 3") == \
+            query_stats.fingerprint("SELECT *  FROM t\n WHERE a = 'y''s' AND b = 42")
+        assert query_stats.fingerprint("SELECT * FROM t WHERE id = :id_1") == "SELECT * FROM t WHERE id = ?"
+
+    def test_in_lists_collapse(self):
+        assert query_stats.fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == \
+            query_stats.fingerprint("SELECT * FROM t WHERE id IN (?)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+class TestRequestStats:
+    """요청별 집계 테스트"""
+
+    def test_counts_statements_in_context(self, test_db):
+        stats, token = query_stats.begin_request()
+        try:
+            test_db.execute(text("SELECT 1")).all()
+            test_db.execute(text("SELECT 2")).all()
+            assert query_stats.get_current_stats() is stats
+        finally:
+            query_stats.end_request(stats, token, "GET", "/test", 200)
+
+        assert stats.count == 2
+        assert [(r["fingerprint"], r["count"]) for r in stats.repeated()] == [("SELECT ?", 2)]
+        assert query_stats.get_current_stats() is None
+
+    def test_response_headers(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "헤더 테스트")
+
+        response = client.get("/api/daily/todos/today")
+
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Queries"]) >= 1
+        assert float(response.headers["X-DB-Time"]) >= 0
+
+    def test_no_queries_header_is_zero(self, client: TestClient, test_db):
+        response = client.get("/health")
+
+        assert response.headers["X-DB-Queries"] == "0"
+
+    def test_slow_query_logged_with_plan(self, test_db, monkeypatch, caplog):
+        monkeypatch.setattr(settings, "slow_query_ms", 0)
+        DailyTodoService.create_todo(test_db, "느린 쿼리")
+
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            test_db.execute(text("SELECT id FROM daily_todos WHERE journey_id = :journey_id"), {"journey_id": 1}).all()
+
+        message = next(r.getMessage() for r in caplog.records if "SELECT id FROM daily_todos" in r.getMessage())
+        assert "WHERE journey_id = ?" in message
+        assert "ix_daily_todos_journey_id" in message
+
+
+class TestDebugEndpoint:
+    """/debug/queries 테스트"""
+
+    def test_lists_recent_requests_in_dev(self, client: TestClient, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "app_env", "dev")
+        query_stats.reset()
+        client.get("/api/daily/todos/today")
+
+        snapshot = client.get("/debug/queries").json()
+
+        assert snapshot["recent_requests"][0]["path"] == "/api/daily/todos/today"
+        assert snapshot["recent_requests"][0]["queries"] >= 1
+        assert snapshot["top_fingerprints"]
+
+    def test_hidden_outside_dev(self, client: TestClient, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "app_env", "main")
+
+        assert client.get("/debug/queries").status_code == 404
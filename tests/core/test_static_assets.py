@@ -0,0 +1,88 @@
+"""
+정적 파일 지문과 캐시 헤더 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import static_assets
+from app.core.static_assets import (
+    IMMUTABLE_CACHE_CONTROL,
+    asset_url,
+    build_asset_manifest,
+    split_fingerprint,
+)
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestAssetUrl:
+    def test_asset_url_contains_content_hash(self):
+        url = asset_url("js/main.js")
+
+        original, fingerprint = split_fingerprint(url[len("/static/"):])
+        assert original == "js/main.js"
+        assert fingerprint is not None
+
+    def test_asset_url_changes_when_file_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(static_assets, "STATIC_DIR", tmp_path)
+        (tmp_path / "js").mkdir()
+        script = tmp_path / "js" / "app.js"
+        script.write_text("console.log(1);")
+        first = asset_url("js/app.js")
+
+        script.write_text("console.log(2); // changed")
+        second = asset_url("js/app.js")
+
+        assert first != second
+
+    def test_missing_file_is_not_fingerprinted(self):
+        assert asset_url("js/missing.js") == "/static/js/missing.js"
+
+    def test_build_manifest_skips_uploads(self):
+        manifest = build_asset_manifest()
+
+        assert "css/style.css" in manifest
+        assert not any(path.startswith("uploads/") for path in manifest)
+
+
+class TestStaticCacheHeaders:
+    def test_fingerprinted_asset_is_immutable(self, client):
+        response = client.get(asset_url("css/style.css"))
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_stale_fingerprint_is_served_without_long_cache(self, client):
+        response = client.get("/static/css/style.000000000000.css")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_plain_path_has_no_long_cache(self, client):
+        response = client.get("/static/js/main.js")
+
+        assert response.status_code == 200
+        assert "immutable" not in response.headers.get("cache-control", "")
+
+    def test_upload_is_immutable(self, client, tmp_path):
+        upload_dir = static_assets.STATIC_DIR / "uploads" / "reflections"
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        upload = upload_dir / ("a" * 64 + ".png")
+        upload.write_bytes(b"fake image")
+        try:
+            response = client.get(f"/static/uploads/reflections/{upload.name}")
+        finally:
+            upload.unlink()
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_pages_reference_fingerprinted_assets(self, client):
+        response = client.get("/no-such-page")
+
+        assert asset_url("css/style.css") in response.text
+        assert asset_url("js/main.js") in response.text
@@ -0,0 +1,37 @@
+"""
+공유 템플릿 환경 테스트
+"""
+from jinja2 import FileSystemBytecodeCache
+
+from app.core import templates as templates_module
+from app.core.templates import create_environment, precompile_templates, templates
+from app.routers import journeys, reflections
+
+
+def test_routers_share_one_environment():
+    assert journeys.templates is templates
+    assert reflections.templates is templates
+
+
+def test_environment_globals():
+    env = create_environment()
+
+    assert {"app_env", "is_dev", "database_url", "asset_url"} <= set(env.globals)
+
+
+def test_auto_reload_only_in_dev(monkeypatch):
+    monkeypatch.setattr(templates_module.settings, "app_env", "main")
+    assert create_environment().auto_reload is False
+
+    monkeypatch.setattr(templates_module.settings, "app_env", "dev")
+    assert create_environment().auto_reload is True
+
+
+def test_precompile_writes_bytecode_cache(tmp_path):
+    env = create_environment(FileSystemBytecodeCache(str(tmp_path)))
+
+    count = precompile_templates(env)
+
+    assert count > 0
+    assert "daily_todos.html" in env.list_templates()
+    assert len(list(tmp_path.iterdir())) >= count
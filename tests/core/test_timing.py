@@ -0,0 +1,97 @@
+"""
+요청 단계별 시간(Server-Timing) 테스트
+"""
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core import query_stats, timing
+from app.services.daily_todo_service import DailyTodoService
+
+
+def _parse_server_timing(header: str) -> dict:
+    """{이름: dur(ms)}"""
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = float(next(p for p in params if p.startswith("dur="))[4:])
+    return metrics
+
+
+class TestSpan:
+    """span API 테스트"""
+
+    def test_no_op_outside_request(self):
+        with timing.span("service"):
+            pass
+
+        assert timing.get_current() is None
+
+    def test_nested_same_name_counted_once(self):
+        timings, token = timing.begin()
+        try:
+            with timing.span("service"):
+                with timing.span("service"):
+                    time.sleep(0.01)
+        finally:
+            timing.end(token)
+
+        assert timings.to_dict()["service"]["count"] == 1
+        assert timings.total_ms("service") >= 10
+
+    def test_db_time_inside_span_is_excluded(self, test_db):
+        stats, stats_token = query_stats.begin_request()
+        timings, token = timing.begin()
+        try:
+            with timing.span("service"):
+                test_db.execute(text("SELECT 1")).all()
+        finally:
+            timing.end(token)
+            query_stats.end_request(stats, stats_token, "GET", "/test", 200)
+
+        assert timings.spans["service"][2] == stats.total_seconds
+        assert timings.total_ms("service") == round((timings.spans["service"][1] - stats.total_seconds) * 1000, 1)
+
+    def test_timed_methods_wraps_public_static_methods(self):
+        @timing.timed_methods("service")
+        class SampleService:
+            @staticmethod
+            def public() -> str:
+                return "ok"
+
+            @staticmethod
+            def _private() -> str:
+                return "private"
+
+        timings, token = timing.begin()
+        try:
+            assert SampleService.public() == "ok"
+            assert SampleService._private() == "private"
+        finally:
+            timing.end(token)
+
+        assert timings.to_dict()["service"]["count"] == 1
+
+
+class TestServerTimingHeader:
+    """Server-Timing 헤더 테스트"""
+
+    def test_html_page_has_stage_breakdown(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "단계별 시간")
+
+        response = client.get("/")
+
+        metrics = _parse_server_timing(response.headers["Server-Timing"])
+        assert {"db", "service", "template", "total"} <= set(metrics)
+        assert metrics["template"] > 0
+        assert metrics["total"] >= metrics["template"]
+        assert 'db;desc="DB (' in response.headers["Server-Timing"]
+
+    def test_json_response_includes_serialization(self, client: TestClient, test_db):
+        DailyTodoService.create_todo(test_db, "직렬화")
+
+        response = client.get("/api/daily/todos/today")
+
+        metrics = _parse_server_timing(response.headers["Server-Timing"])
+        assert {"db", "service", "serialization", "total"} <= set(metrics)
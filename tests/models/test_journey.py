@@ -11,6 +11,8 @@ from app.models.journey import Journey, JourneyStatus
 from app.models.todo import Todo, DailyTodo, TodoCategory
 
 
+# calculate_actual_progress는 로드된 여정에서 todos/daily_todos 관계를 직접 순회하는 모델 메서드
+@pytest.mark.allow_lazy_load
 class TestJourneyModel:
     """Journey 모델 테스트"""
 
@@ -0,0 +1,83 @@
+"""
+블로그 글 생성용 데이터 로더 테스트
+"""
+import pytest
+from unittest.mock import patch, AsyncMock
+from datetime import timedelta
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.daily_reflection import DailyReflection
+from app.services.blog_context_loader import BlogContextLoader
+from app.services.llm_blog_service import LLMBlogService, LLMProvider
+from tests.conftest import WEEK_START
+
+
+class TestBlogContextLoader:
+    """블로그 글 생성용 데이터 로더 테스트"""
+
+    @pytest.fixture
+    def select_statements(self, test_db: Session):
+        """실행된 SELECT 문 기록"""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        engine = test_db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        yield statements
+        event.remove(engine, "before_cursor_execute", record)
+
+    def test_load_range_groups_by_date(self, test_db: Session, week_of_reflections):
+        """기간 조회 결과가 회고 날짜별로 묶임"""
+        contexts = BlogContextLoader.load_range(
+            test_db, WEEK_START, WEEK_START + timedelta(days=6)
+        )
+
+        assert len(contexts) == 7
+        for i, context in enumerate(contexts):
+            assert context["reflection"].reflection_date == WEEK_START + timedelta(days=i)
+            assert [t.title for t in context["completed_todos"]] == [f"{i + 1}일차 완료 할일"]
+            assert [t.title for t in context["pending_todos"]] == [f"{i + 1}일차 미완료 할일"]
+            assert [m.content for m in context["daily_memos"]] == [f"{i + 1}일차 메모"]
+
+    def test_load_for_reflection(self, test_db: Session, week_of_reflections):
+        """단일 회고 날짜의 할일과 메모만 묶임"""
+        reflection = week_of_reflections[2]
+
+        context = BlogContextLoader.load_for_reflection(test_db, reflection)
+
+        assert context["reflection"] is reflection
+        assert [t.title for t in context["completed_todos"]] == ["3일차 완료 할일"]
+        assert [t.title for t in context["pending_todos"]] == ["3일차 미완료 할일"]
+        assert [m.content for m in context["daily_memos"]] == ["3일차 메모"]
+
+    def test_get_reflection_not_found(self, test_db: Session):
+        with pytest.raises(ValueError, match="회고를 찾을 수 없습니다"):
+            BlogContextLoader.get_reflection(test_db, 999)
+
+    async def test_generate_blog_queries_reflection_once(
+        self, test_db: Session, week_of_reflections, select_statements
+    ):
+        """블로그 생성 시 회고는 한 번만 조회하고 그 객체에 바로 저장"""
+        reflection_id = week_of_reflections[0].id
+        test_db.expire_all()
+        select_statements.clear()
+
+        with patch.object(LLMBlogService, "call_llm_api", new_callable=AsyncMock) as mock_api:
+            mock_api.return_value = "# 생성된 글"
+            await LLMBlogService.generate_blog_content(
+                reflection_id=reflection_id,
+                db=test_db,
+                provider=LLMProvider.OPENAI,
+                force_regenerate=True
+            )
+
+        reflection_selects = [s for s in select_statements if "FROM daily_reflections" in s]
+        assert len(reflection_selects) == 1
+        assert len(select_statements) == 3  # 회고, 할일, 메모
+
+        saved = test_db.query(DailyReflection).filter(DailyReflection.id == reflection_id).first()
+        assert saved.generated_blog_content == "# 생성된 글"
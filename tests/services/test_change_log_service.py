@@ -0,0 +1,194 @@
+"""
+변경 기록 서비스 테스트
+"""
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.timezone import get_current_date
+from app.models.change_log import ChangeLog
+from app.models.journey import Journey, JourneyStatus
+from app.models.llm_response_cache import LLMResponseCache
+from app.services.change_log_service import ChangeLogService
+from app.services.daily_memo_service import DailyMemoService
+from app.services.daily_todo_service import DailyTodoService
+from app.services.journey_service import JourneyService
+
+
+def log_rows(db: Session):
+    return [
+        (record.table_name, record.row_id, record.op, record.changed_columns)
+        for record in db.query(ChangeLog).order_by(ChangeLog.seq)
+    ]
+
+
+class TestChangeLogRecording:
+    """변경 기록 테스트"""
+
+    def test_records_insert_update_delete(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "기록 할일")
+        DailyTodoService.update_todo(test_db, todo.id, title="바뀐 제목")
+        DailyTodoService.delete_todo(test_db, todo.id)
+
+        assert log_rows(test_db) == [
+            ("daily_todos", todo.id, "insert", None),
+            ("daily_todos", todo.id, "update", ["title"]),
+            ("daily_todos", todo.id, "delete", None),
+        ]
+        assert [record.version for record in test_db.query(ChangeLog).order_by(ChangeLog.seq)] == [1, 2, 3]
+
+    def test_unchanged_update_is_not_recorded(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "그대로")
+        DailyTodoService.update_todo(test_db, todo.id, title="그대로")
+
+        assert test_db.query(ChangeLog).count() == 1
+
+    def test_rollback_discards_records(self, test_db: Session):
+        DailyMemoService.create_memo(test_db, get_current_date(), "남는 메모")
+        memo = DailyMemoService.create_memo(test_db, get_current_date(), "취소될 수정")
+        memo.content = "롤백"
+        test_db.flush()
+        test_db.rollback()
+
+        assert [op for _, _, op, _ in log_rows(test_db)] == ["insert", "insert"]
+
+    def test_cascade_delete_is_recorded(self, test_db: Session):
+        journey = Journey(title="여정", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31), status=JourneyStatus.ACTIVE)
+        test_db.add(journey)
+        test_db.commit()
+        todo = DailyTodoService.create_todo(test_db, "여정 할일", journey_id=journey.id)
+
+        JourneyService.delete_journey(test_db, journey.id)
+
+        deleted = sorted((table, row_id) for table, row_id, op, _ in log_rows(test_db) if op == "delete")
+        assert deleted == [("daily_todos", todo.id), ("journeys", journey.id)]
+
+    def test_llm_cache_is_not_recorded(self, test_db: Session):
+        now = datetime(2026, 1, 1)
+        test_db.add(LLMResponseCache(
+            prompt_hash="h", provider="openai", model="m", response="응답",
+            created_at=now, last_accessed_at=now, expires_at=now + timedelta(days=1)
+        ))
+        test_db.commit()
+
+        assert test_db.query(ChangeLog).count() == 0
+
+    def test_last_seq_by_table(self, test_db: Session):
+        DailyTodoService.create_todo(test_db, "할일")
+        todo_seq = ChangeLogService.get_last_seq(test_db, ["daily_todos"])
+        DailyMemoService.create_memo(test_db, get_current_date(), "메모")
+
+        assert ChangeLogService.get_last_seq(test_db, ["daily_todos"]) == todo_seq
+        assert ChangeLogService.get_last_seq(test_db) == todo_seq + 1
+        assert ChangeLogService.get_last_seq(test_db, ["daily_reflections"]) == 0
+
+
+class TestChangesSince:
+    """동기화용 변경 조회 테스트"""
+
+    def test_fields_are_filled_from_current_row(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "기록 할일")
+        DailyTodoService.update_todo(test_db, todo.id, title="바뀐 제목")
+
+        changes = ChangeLogService.get_changes_since(test_db, 0)
+
+        assert [(c["entity"], c["op"], c["version"]) for c in changes] == [("todo", "insert", 1), ("todo", "update", 2)]
+        assert changes[0]["fields"]["category"] == "기타"
+        assert changes[1]["fields"] == {"title": "바뀐 제목"}
+
+    def test_deleted_row_has_no_fields(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "지울 할일")
+        DailyTodoService.delete_todo(test_db, todo.id)
+
+        changes = ChangeLogService.get_changes_since(test_db, 0)
+
+        assert [(c["op"], c["fields"]) for c in changes] == [("insert", None), ("delete", None)]
+
+    def test_changes_since_with_limit(self, test_db: Session):
+        for i in range(3):
+            DailyTodoService.create_todo(test_db, f"할일 {i}")
+
+        first_seq = ChangeLogService.get_changes_since(test_db, 0)[0]["seq"]
+        changes = ChangeLogService.get_changes_since(test_db, first_seq, limit=1)
+
+        assert [c["fields"]["title"] for c in changes] == ["할일 1"]
+        assert ChangeLogService.get_last_seq(test_db) == first_seq + 2
+
+
+class TestCompaction:
+    """변경 기록 압축·보관 테스트"""
+
+    @staticmethod
+    def age_records(db: Session, days: int):
+        db.query(ChangeLog).update({ChangeLog.created_at: datetime.utcnow() - timedelta(days=days)})
+        db.commit()
+
+    def test_merges_old_updates_per_row(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "압축 할일")
+        DailyTodoService.update_todo(test_db, todo.id, title="제목 1")
+        DailyTodoService.update_todo(test_db, todo.id, description="설명")
+        other = DailyTodoService.create_todo(test_db, "다른 할일")
+        self.age_records(test_db, 10)
+
+        stats = ChangeLogService.compact(test_db, compact_after_days=7, retention_days=90)
+
+        assert stats == {"expired": 0, "merged": 2}
+        assert log_rows(test_db) == [
+            ("daily_todos", todo.id, "insert", None),
+            ("daily_todos", other.id, "insert", None),
+        ]
+
+    def test_merged_updates_keep_union_of_columns(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "압축 할일")
+        test_db.query(ChangeLog).delete()
+        test_db.commit()
+        DailyTodoService.update_todo(test_db, todo.id, title="제목 1")
+        DailyTodoService.update_todo(test_db, todo.id, description="설명")
+        self.age_records(test_db, 10)
+
+        ChangeLogService.compact(test_db, compact_after_days=7, retention_days=90)
+
+        assert log_rows(test_db) == [("daily_todos", todo.id, "update", ["description", "title"])]
+
+    def test_delete_wins_when_merging(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "지울 할일")
+        DailyTodoService.delete_todo(test_db, todo.id)
+        self.age_records(test_db, 10)
+
+        ChangeLogService.compact(test_db, compact_after_days=7, retention_days=90)
+
+        assert log_rows(test_db) == [("daily_todos", todo.id, "delete", None)]
+
+    def test_recent_records_are_kept(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "최근 할일")
+        DailyTodoService.update_todo(test_db, todo.id, title="최근 수정")
+
+        stats = ChangeLogService.compact(test_db, compact_after_days=7, retention_days=90)
+
+        assert stats == {"expired": 0, "merged": 0}
+        assert len(log_rows(test_db)) == 2
+
+    def test_expired_records_are_deleted_except_last(self, test_db: Session):
+        for i in range(3):
+            DailyTodoService.create_todo(test_db, f"오래된 할일 {i}")
+        last_seq = ChangeLogService.get_last_seq(test_db)
+        self.age_records(test_db, 100)
+
+        stats = ChangeLogService.compact(test_db, compact_after_days=7, retention_days=90)
+
+        assert stats["expired"] == 2
+        assert ChangeLogService.get_first_seq(test_db) == last_seq
+        assert ChangeLogService.get_last_seq(test_db) == last_seq
+
+    def test_expiry_keeps_last_record_per_table(self, test_db: Session):
+        """다른 테이블만 계속 바뀌어도 테이블별 마지막 seq(주간 ETag 기준)는 그대로"""
+        for i in range(2):
+            DailyTodoService.create_todo(test_db, f"오래된 할일 {i}")
+        todo_seq = ChangeLogService.get_last_seq(test_db, ["daily_todos"])
+        self.age_records(test_db, 100)
+        DailyMemoService.create_memo(test_db, get_current_date(), "최근 메모")
+
+        stats = ChangeLogService.compact(test_db, compact_after_days=7, retention_days=90)
+
+        assert stats["expired"] == 1
+        assert ChangeLogService.get_last_seq(test_db, ["daily_todos", "daily_reflections"]) == todo_seq
@@ -3,10 +3,13 @@ DailyReflectionService 유닛 테스트
 """
 import pytest
 from datetime import date, datetime, timedelta
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.services.daily_reflection_service import DailyReflectionService
+from app.services.daily_todo_service import DailyTodoService
 from app.models.daily_reflection import DailyReflection
+from app.models.reflection_todo_snapshot import ReflectionTodoSnapshot
 from app.models.todo import DailyTodo, TodoCategory
 
 
@@ -426,4 +429,113 @@ class TestDailyReflectionService:
         display_incomplete = len([t for t in today_todos_display if not t.is_completed])
 
         assert reflection.completed_todos == display_completed
-        assert (reflection.total_todos - reflection.completed_todos) == display_incomplete
\ No newline at end of file
+        assert (reflection.total_todos - reflection.completed_todos) == display_incomplete
+
+    def test_recreating_reflection_replaces_snapshot_rows(self, test_db: Session):
+        """같은 날 회고를 다시 저장하면 스냅샷 행을 새로 만듦"""
+        today = date.today()
+        todo = DailyTodo(title="스냅샷 할일", category=TodoCategory.WORK, created_date=today, scheduled_date=today)
+        test_db.add(todo)
+        test_db.commit()
+        DailyReflectionService.create_reflection(test_db, today, "첫 회고")
+
+        todo.is_completed = True
+        todo.completed_at = datetime.now()
+        test_db.commit()
+        reflection = DailyReflectionService.create_reflection(test_db, today, "다시 쓴 회고")
+
+        assert test_db.query(ReflectionTodoSnapshot).count() == 1
+        assert [item["title"] for item in reflection.todos_snapshot["completed"]] == ["스냅샷 할일"]
+        assert reflection.todos_snapshot["incomplete"] == []
+
+    def test_completed_todos_on_reflected_days(self, test_db: Session):
+        """회고한 날 완료한 할일은 할일이 삭제되어도 스냅샷으로 조회"""
+        today = date.today()
+        done = DailyTodo(
+            title="완료한 할일", category=TodoCategory.WORK, created_date=today,
+            is_completed=True, completed_at=datetime.now()
+        )
+        pending = DailyTodo(title="남은 할일", category=TodoCategory.WORK, created_date=today)
+        test_db.add_all([done, pending])
+        test_db.commit()
+        DailyReflectionService.create_reflection(test_db, today, "회고")
+        DailyTodoService.delete_todo(test_db, done.id)
+
+        todos = DailyReflectionService.get_completed_todos_on_reflected_days(test_db, today, today)
+
+        assert [(t["reflection_date"], t["title"]) for t in todos] == [(today.isoformat(), "완료한 할일")]
+
+
+class TestReflectionIncrementalRecompute:
+    """회고 재저장 시 증분 재계산 테스트"""
+
+    @pytest.fixture
+    def statements(self, test_db: Session):
+        """실행된 SQL 문 기록"""
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement.lstrip().upper())
+
+        engine = test_db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", record)
+
+    @staticmethod
+    def add_todo(db: Session, **kwargs) -> DailyTodo:
+        todo = DailyTodo(category=TodoCategory.WORK, created_date=date.today(), **kwargs)
+        db.add(todo)
+        db.commit()
+        return todo
+
+    def test_text_only_update_skips_todo_scan(self, test_db: Session, statements):
+        """할일이 그대로면 회고 필드만 UPDATE"""
+        self.add_todo(test_db, title="그대로인 할일")
+        DailyReflectionService.create_reflection(test_db, date.today(), "처음 회고", satisfaction_score=3)
+        statements.clear()
+
+        reflection = DailyReflectionService.create_reflection(test_db, date.today(), "고친 회고", satisfaction_score=3)
+
+        assert reflection.reflection_text == "고친 회고"
+        assert reflection.total_todos == 1
+        assert not any("FROM DAILY_TODOS" in statement for statement in statements)
+        updates = [statement for statement in statements if statement.startswith("UPDATE DAILY_REFLECTIONS")]
+        assert len(updates) == 1
+        assert "REFLECTION_TEXT" in updates[0]
+
+    def test_unchanged_resave_writes_nothing(self, test_db: Session, statements):
+        """내용이 같으면 쓰지 않음"""
+        DailyReflectionService.create_reflection(test_db, date.today(), "같은 회고")
+        statements.clear()
+
+        DailyReflectionService.create_reflection(test_db, date.today(), "같은 회고")
+
+        assert not any(statement.startswith(("UPDATE", "INSERT", "DELETE")) for statement in statements)
+
+    def test_todo_change_marks_reflection_dirty(self, test_db: Session):
+        """그날 할일이 바뀌면 재저장 시 통계 재계산"""
+        todo = self.add_todo(test_db, title="완료할 할일")
+        reflection = DailyReflectionService.create_reflection(test_db, date.today(), "회고")
+        assert reflection.stats_dirty is False
+
+        todo.is_completed = True
+        todo.completed_at = datetime.now()
+        test_db.commit()
+        assert reflection.stats_dirty is True
+
+        reflection = DailyReflectionService.create_reflection(test_db, date.today(), "회고")
+        assert reflection.completed_todos == 1
+        assert reflection.stats_dirty is False
+
+    def test_unrelated_changes_keep_reflection_clean(self, test_db: Session):
+        """다른 날짜의 완료 할일이나 스냅샷에 없는 컬럼 변경은 재계산 표시를 하지 않음"""
+        today = date.today()
+        todo = self.add_todo(test_db, title="메모만 바꿀 할일")
+        reflection = DailyReflectionService.create_reflection(test_db, today - timedelta(days=1), "어제 회고")
+
+        todo.notes = "메모"
+        test_db.commit()
+        self.add_todo(test_db, title="오늘 완료", is_completed=True, completed_at=datetime.now())
+
+        assert reflection.stats_dirty is False
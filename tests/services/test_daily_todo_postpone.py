@@ -1,8 +1,8 @@
 import pytest
 from datetime import date, datetime, timedelta
-import json
 from sqlalchemy.orm import Session
 
+from app.models.postpone_event import PostponeEvent
 from app.models.todo import DailyTodo, TodoCategory
 from app.services.daily_todo_service import DailyTodoService
 
@@ -33,9 +33,7 @@ class TestDailyTodoPostpone:
         # Then: 미루기 히스토리가 기록됨
         assert updated_todo is not None
         assert updated_todo.postpone_count == 1
-        assert updated_todo.postpone_history is not None
-
-        history = json.loads(updated_todo.postpone_history)
+        history = DailyTodoService.get_postpone_summary(test_db, todo.id)["full_history"]
         assert len(history) == 1
         assert history[0]["from_date"] == date.today().isoformat()
         assert history[0]["to_date"] == tomorrow.isoformat()
@@ -67,7 +65,7 @@ class TestDailyTodoPostpone:
         # Then: 미루기 횟수가 올바르게 증가
         assert todo.postpone_count == 3
 
-        history = json.loads(todo.postpone_history)
+        history = DailyTodoService.get_postpone_summary(test_db, todo.id)["full_history"]
         assert len(history) == 3
 
         # 각 미루기 기록 확인
@@ -103,7 +101,7 @@ class TestDailyTodoPostpone:
             expected_from_dates.append(target_date)  # 다음 미루기의 시작점
 
         # Then: 날짜 변경이 올바르게 기록됨
-        history = json.loads(todo.postpone_history)
+        history = DailyTodoService.get_postpone_summary(test_db, todo.id)["full_history"]
 
         for i, (target_date, reason) in enumerate(dates_and_reasons):
             assert history[i]["from_date"] == expected_from_dates[i].isoformat()
@@ -170,7 +168,7 @@ class TestDailyTodoPostpone:
         # Then: 전체 히스토리가 보존됨
         assert todo.postpone_count == 5
 
-        history = json.loads(todo.postpone_history)
+        history = DailyTodoService.get_postpone_summary(test_db, todo.id)["full_history"]
         assert len(history) == 5
 
         # 각 미루기가 시간순으로 기록됨
@@ -263,4 +261,27 @@ class TestDailyTodoPostpone:
                 todo_id=todo.id,
                 new_date=tomorrow,
                 reason="완료된 할 일 미루기"
-            )
\ No newline at end of file
+            )
+
+    def test_postpone_appends_event_rows(self, test_db: Session):
+        """미루기마다 postpone_events에 한 행씩 추가되는지 테스트"""
+        todo = DailyTodoService.create_todo(
+            db=test_db,
+            title="테스트 할 일",
+            scheduled_date=date.today()
+        )
+
+        for i in range(1, 3):
+            DailyTodoService.reschedule_todo_with_reason(
+                db=test_db,
+                todo_id=todo.id,
+                new_date=date.today() + timedelta(days=i),
+                reason=f"사유{i}"
+            )
+
+        events = test_db.query(PostponeEvent).filter(PostponeEvent.todo_id == todo.id).order_by(PostponeEvent.id).all()
+        assert [event.reason for event in events] == ["사유1", "사유2"]
+
+        # 할일을 삭제하면 미루기 기록도 함께 삭제
+        DailyTodoService.delete_todo(test_db, todo.id)
+        assert test_db.query(PostponeEvent).count() == 0
@@ -5,6 +5,7 @@ import pytest
 from datetime import date, datetime
 from sqlalchemy.orm import Session
 
+from app.core import query_stats
 from app.services.daily_todo_service import DailyTodoService
 from app.models.todo import DailyTodo, TodoCategory
 from app.models.journey import Journey, JourneyStatus
@@ -266,6 +267,20 @@ class TestDailyTodoService:
         assert summary["pending"] == 1
         assert summary["completion_rate"] == 66.7
 
+    def test_get_today_summary_is_single_aggregate_query(self, test_db: Session):
+        """할일 변경마다 발행하는 요약은 행을 읽지 않고 집계 쿼리 한 번으로 계산"""
+        from tests.conftest import create_test_todos
+
+        create_test_todos(test_db, 5)
+        stats, token = query_stats.begin_request()
+        try:
+            summary = DailyTodoService.get_today_summary(test_db)
+        finally:
+            query_stats.end_request(stats, token, "GET", "/test", 200)
+
+        assert summary["total"] == len(DailyTodoService.get_today_todos(test_db))
+        assert stats.count == 1
+
     def test_get_category_summary(self, test_db: Session):
         """카테고리별 요약"""
         # 다양한 카테고리의 할일 생성
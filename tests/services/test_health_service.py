@@ -0,0 +1,133 @@
+"""
+헬스 체크 서비스 테스트
+"""
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import app.main as main_module
+from app.core.config import settings
+from app.services import health_service
+from app.services.health_service import HealthCheckError, HealthService
+from tests import conftest
+
+
+@pytest.fixture(autouse=True)
+def reset_health_cache():
+    HealthService.reset_cache()
+    yield
+    HealthService.reset_cache()
+
+
+def _stamp_head(engine) -> None:
+    """테스트 DB(create_all)를 마이그레이션 head로 표시"""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        conn.execute(text("DELETE FROM alembic_version"))
+        for head in health_service._migration_heads():
+            conn.execute(text("INSERT INTO alembic_version (version_num) VALUES (:head)"), {"head": head})
+
+
+class TestReadinessChecks:
+    """개별 준비 검사 테스트"""
+
+    def test_database_ok(self, test_db):
+        assert HealthService.check_database(conftest.test_engine) == {}
+
+    def test_database_write_lock_held_elsewhere_fails(self, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "health_check_timeout_seconds", 0.1)
+        other = sqlite3.connect(conftest.test_engine.url.database, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            with pytest.raises(Exception, match="locked"):
+                HealthService.check_database(conftest.test_engine)
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+
+        # 검사 후 연결의 busy_timeout은 원래 값으로 돌아옴
+        with conftest.test_engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() != 100
+
+    def test_migrations_behind_fails(self, test_db):
+        with pytest.raises(HealthCheckError, match="마이그레이션"):
+            HealthService.check_migrations(conftest.test_engine)
+
+        _stamp_head(conftest.test_engine)
+        result = HealthService.check_migrations(conftest.test_engine)
+
+        assert result["revision"] == ", ".join(health_service._migration_heads())
+
+    def test_disk_space_below_minimum_fails(self, test_db, monkeypatch):
+        assert HealthService.check_disk_space(conftest.test_engine)["free_mb"] > 0
+
+        monkeypatch.setattr(settings, "health_min_free_disk_mb", 10 ** 12)
+        with pytest.raises(HealthCheckError, match="디스크"):
+            HealthService.check_disk_space(conftest.test_engine)
+
+    def test_pool_saturation_fails(self, test_db, monkeypatch):
+        monkeypatch.setattr(settings, "health_pool_saturation_ratio", 0.01)
+        with conftest.test_engine.connect():
+            with pytest.raises(HealthCheckError, match="포화"):
+                HealthService.check_pool(conftest.test_engine)
+
+
+class TestReadiness:
+    """준비 상태 집계·캐시 테스트"""
+
+    async def test_result_is_cached_for_ttl(self, test_db, monkeypatch):
+        calls = []
+
+        async def fake_checks(engine):
+            calls.append(engine)
+            return {"status": "ready", "checks": {}}
+
+        monkeypatch.setattr(HealthService, "run_readiness_checks", staticmethod(fake_checks))
+        await HealthService.get_readiness(conftest.test_engine)
+        await HealthService.get_readiness(conftest.test_engine)
+        assert len(calls) == 1
+
+        monkeypatch.setattr(settings, "health_cache_ttl_seconds", 0)
+        await HealthService.get_readiness(conftest.test_engine)
+        assert len(calls) == 2
+
+    async def test_slow_check_times_out(self, monkeypatch):
+        monkeypatch.setattr(settings, "health_check_timeout_seconds", 0.05)
+
+        def slow_check():
+            import time
+            time.sleep(0.3)
+            return {}
+
+        result = await HealthService._run_check(slow_check)
+
+        assert result["status"] == "fail"
+        assert "응답하지 않음" in result["detail"]
+
+
+class TestHealthEndpoints:
+    """/health/live, /health/ready 테스트"""
+
+    def test_live(self, client: TestClient):
+        assert client.get("/health/live").json() == {"status": "alive"}
+
+    def test_ready_when_all_checks_pass(self, client: TestClient, test_db, monkeypatch):
+        monkeypatch.setattr(main_module, "engine", conftest.test_engine)
+        _stamp_head(conftest.test_engine)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert set(body["checks"]) == {"database", "migrations", "upload_dir", "disk_space", "db_pool"}
+
+    def test_not_ready_returns_503(self, client: TestClient, test_db, monkeypatch):
+        monkeypatch.setattr(main_module, "engine", conftest.test_engine)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"]["migrations"]["status"] == "fail"
@@ -0,0 +1,155 @@
+"""
+완료 회고 이미지 업로드 처리 테스트
+"""
+import hashlib
+import io
+import pytest
+from datetime import date
+from unittest.mock import patch
+from fastapi import UploadFile
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.todo import DailyTodo, TodoCategory
+from app.models.uploaded_file import UploadedFile
+from app.services import image_upload_service
+from app.services.image_upload_service import ImageUploadService, ImageTooLargeError
+
+EXIF_ORIENTATION = 0x0112
+EXIF_MAKE = 0x010F
+
+
+def make_jpeg(width: int = 2000, height: int = 1000, orientation: int = 1) -> bytes:
+    """EXIF(제조사, 방향)가 포함된 JPEG 생성"""
+    image = Image.new("RGB", (width, height), color=(200, 100, 50))
+    exif = Image.Exif()
+    exif[EXIF_MAKE] = "TestPhone"
+    exif[EXIF_ORIENTATION] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def make_upload(content: bytes, filename: str = "photo.jpg") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+@pytest.fixture
+def upload_dir(tmp_path):
+    """업로드 디렉터리를 임시 경로로 교체"""
+    with patch.object(image_upload_service, "UPLOAD_DIR", tmp_path), \
+            patch.object(settings, "image_rendition_widths", [320, 640, 1280]):
+        yield tmp_path
+
+
+class TestImageUploadService:
+    """이미지 업로드 처리 테스트"""
+
+    async def test_save_creates_webp_renditions(self, test_db: Session, upload_dir):
+        """여러 너비의 WebP 렌디션 생성"""
+        result = await ImageUploadService.save_reflection_image(test_db, make_upload(make_jpeg()))
+
+        assert result["path"].startswith("/static/uploads/reflections/")
+        assert set(result["renditions"].keys()) == {"320", "640", "1280"}
+        for width, path in result["renditions"].items():
+            with Image.open(upload_dir / path.rsplit("/", 1)[1]) as rendition:
+                assert rendition.format == "WEBP"
+                assert rendition.width == int(width)
+                assert rendition.height == int(width) // 2
+
+        # 임시 업로드 파일은 남지 않음
+        assert not list(upload_dir.glob(".*.upload"))
+
+    async def test_small_image_not_upscaled(self, test_db: Session, upload_dir):
+        """원본보다 큰 렌디션은 원본 너비로 한 번만 생성"""
+        result = await ImageUploadService.save_reflection_image(test_db, make_upload(make_jpeg(500, 250)))
+
+        assert set(result["renditions"].keys()) == {"320", "500"}
+
+    async def test_exif_stripped_and_orientation_applied(self, test_db: Session, upload_dir):
+        """원본의 EXIF는 제거되고 방향은 픽셀에 반영"""
+        # orientation 6: 90도 회전 필요 (가로 2000x1000 → 세로 1000x2000)
+        result = await ImageUploadService.save_reflection_image(
+            test_db, make_upload(make_jpeg(orientation=6))
+        )
+
+        with Image.open(upload_dir / result["path"].rsplit("/", 1)[1]) as original:
+            assert original.size == (1000, 2000)
+            assert EXIF_MAKE not in original.getexif()
+            assert "exif" not in original.info
+
+    async def test_rejects_oversized_upload(self, test_db: Session, upload_dir):
+        """최대 크기를 넘으면 중단하고 파일을 남기지 않음"""
+        with patch.object(settings, "upload_max_bytes", 1024), \
+                patch.object(image_upload_service, "CHUNK_SIZE", 256):
+            with pytest.raises(ImageTooLargeError):
+                await ImageUploadService.save_reflection_image(test_db, make_upload(make_jpeg()))
+
+        assert list(upload_dir.iterdir()) == []
+
+    async def test_rejects_invalid_files(self, test_db: Session, upload_dir):
+        """지원하지 않는 확장자나 이미지가 아닌 파일은 거부"""
+        with pytest.raises(ValueError, match="지원하지 않는 이미지 형식"):
+            await ImageUploadService.save_reflection_image(test_db, make_upload(b"text", "note.txt"))
+
+        with pytest.raises(ValueError, match="이미지 파일을 읽을 수 없습니다"):
+            await ImageUploadService.save_reflection_image(test_db, make_upload(b"not an image", "fake.png"))
+
+        assert list(upload_dir.iterdir()) == []
+
+    async def test_same_content_stored_once(self, test_db: Session, upload_dir):
+        """같은 내용은 내용 해시 이름으로 한 번만 저장하고 참조 수만 증가"""
+        content = make_jpeg()
+
+        first = await ImageUploadService.save_reflection_image(test_db, make_upload(content, "a.jpg"))
+        second = await ImageUploadService.save_reflection_image(test_db, make_upload(content, "b.jpeg"))
+
+        assert first == second
+        assert hashlib.sha256(content).hexdigest() in first["path"]
+        assert len(list(upload_dir.glob("*.jpg"))) == 1
+
+        entry = test_db.query(UploadedFile).one()
+        assert entry.ref_count == 2
+
+    def test_complete_endpoint_returns_srcset(self, client, test_db: Session, upload_dir):
+        """완료 회고 API가 렌디션을 저장하고 srcset을 반환"""
+        todo = DailyTodo(
+            title="사진 찍기",
+            category=TodoCategory.PERSONAL,
+            created_date=date.today(),
+            scheduled_date=date.today()
+        )
+        test_db.add(todo)
+        test_db.commit()
+
+        response = client.patch(
+            f"/api/daily/todos/{todo.id}/complete",
+            data={"reflection": "좋은 사진"},
+            files={"reflection_image": ("photo.jpg", make_jpeg(), "image/jpeg")}
+        )
+
+        assert response.status_code == 200
+        srcset = response.json()["completion_image_srcset"]
+        assert "320w" in srcset and "1280w" in srcset
+
+        test_db.refresh(todo)
+        assert set(todo.completion_image_renditions.keys()) == {"320", "640", "1280"}
+
+    def test_complete_endpoint_rejects_oversized(self, client, test_db: Session, upload_dir):
+        todo = DailyTodo(
+            title="큰 사진",
+            category=TodoCategory.PERSONAL,
+            created_date=date.today(),
+            scheduled_date=date.today()
+        )
+        test_db.add(todo)
+        test_db.commit()
+
+        with patch.object(settings, "upload_max_bytes", 1024):
+            response = client.patch(
+                f"/api/daily/todos/{todo.id}/complete",
+                files={"reflection_image": ("photo.jpg", make_jpeg(), "image/jpeg")}
+            )
+
+        assert response.status_code == 413
@@ -2,13 +2,15 @@
 JourneyService 유닛 테스트
 """
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 
 from app.services.journey_service import JourneyService
 from app.models.journey import Journey, JourneyStatus
 from app.models.todo import DailyTodo, TodoCategory, Todo
 from app.schemas.journey import JourneyCreate, JourneyUpdate
+from app.services.daily_todo_service import DailyTodoService
+from tests.conftest import LazyLoadError
 
 
 class TestJourneyService:
@@ -396,4 +398,108 @@ class TestJourneyService:
         stats = JourneyService.get_journey_statistics(test_db, 99999)
 
         # 빈 dict 반환 확인
-        assert stats == {}
\ No newline at end of file
+        assert stats == {}
+
+
+class TestJourneyTodoReadModel:
+    """Todo·DailyTodo 통합 조회(journey_todos 뷰) 테스트"""
+
+    @staticmethod
+    def add_mixed_todos(db: Session, journey: Journey):
+        db.add_all([
+            Todo(title="기존 할일", journey_id=journey.id, is_completed=True, estimated_time=60, actual_time=50),
+            Todo(title="기존 미완료", journey_id=journey.id, is_completed=False, estimated_time=30),
+            DailyTodo(title="일상 할일", journey_id=journey.id, is_completed=True,
+                      category=TodoCategory.LEARNING, estimated_minutes=20, actual_minutes=40),
+            DailyTodo(title="여정 없는 할일", is_completed=True),
+        ])
+        db.commit()
+
+    def test_progress_counts_both_tables(self, test_db: Session, sample_journey: Journey):
+        """진행률과 통계는 기존 Todo와 DailyTodo를 함께 센다"""
+        self.add_mixed_todos(test_db, sample_journey)
+
+        progress = JourneyService.calculate_journey_progress(test_db, sample_journey.id)
+        stats = JourneyService.get_journey_statistics(test_db, sample_journey.id)
+
+        assert round(progress, 1) == 66.7
+        assert (stats["total_todos"], stats["completed_todos"], stats["pending_todos"]) == (3, 2, 1)
+        assert stats["estimated_total_time"] == 110
+        assert stats["actual_total_time"] == 90
+
+    def test_todo_counts_grouped_by_journey(self, test_db: Session, sample_journey: Journey):
+        """여정별 개수를 한 번에 집계 (여정 없는 할일과 할일 없는 여정은 제외)"""
+        other = Journey(title="빈 여정", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31))
+        test_db.add(other)
+        test_db.commit()
+        self.add_mixed_todos(test_db, sample_journey)
+
+        counts = JourneyService.get_todo_counts(test_db, [sample_journey.id, other.id])
+
+        assert counts == {sample_journey.id: (3, 2)}
+        assert JourneyService.get_todo_counts(test_db) == counts
+
+    def test_journey_todos_have_source(self, test_db: Session, sample_journey: Journey):
+        """통합 목록은 출처와 분 단위 시간을 같은 이름으로 돌려준다"""
+        self.add_mixed_todos(test_db, sample_journey)
+
+        todos = JourneyService.get_journey_todos(test_db, sample_journey.id)
+
+        assert sorted((t["source"], t["title"]) for t in todos) == [
+            ("daily_todo", "일상 할일"), ("todo", "기존 미완료"), ("todo", "기존 할일"),
+        ]
+        daily = next(t for t in todos if t["source"] == "daily_todo")
+        assert (daily["category"], daily["estimated_minutes"], daily["actual_minutes"]) == ("학습", 20, 40)
+        assert next(t for t in todos if t["title"] == "기존 할일")["estimated_minutes"] == 60
+
+    def test_search_todos_covers_both_tables(self, test_db: Session, sample_journey: Journey):
+        """검색은 두 테이블을 함께 찾고 여정 제목을 붙인다"""
+        self.add_mixed_todos(test_db, sample_journey)
+
+        results = JourneyService.search_todos(test_db, "할일")
+
+        assert {(r["title"], r["journey_title"]) for r in results} == {
+            ("기존 할일", "테스트 여정"), ("일상 할일", "테스트 여정"), ("여정 없는 할일", None),
+        }
+
+
+class TestJourneyLoading:
+    """관계 로딩 전략 테스트 (테스트에서는 로더 옵션 없는 지연 로딩이 실패함)"""
+
+    def test_unexpected_lazy_load_fails(self, test_db: Session, sample_journey: Journey):
+        DailyTodoService.create_todo(test_db, "여정 할일", journey_id=sample_journey.id)
+        test_db.expunge_all()
+
+        todo = test_db.query(DailyTodo).first()
+
+        with pytest.raises(LazyLoadError):
+            todo.journey
+
+    def test_today_todos_preload_journey(self, test_db: Session, sample_journey: Journey):
+        DailyTodoService.create_todo(test_db, "여정 할일", journey_id=sample_journey.id)
+        test_db.expunge_all()
+
+        todos = DailyTodoService.get_today_todos(test_db)
+
+        assert [todo.journey.title for todo in todos] == ["테스트 여정"]
+
+    def test_journeys_with_todos_preload_both_collections(self, test_db: Session, sample_journey: Journey):
+        test_db.add_all([
+            Todo(title="기존 할일", journey_id=sample_journey.id, is_completed=True),
+            DailyTodo(title="일상 할일", journey_id=sample_journey.id),
+        ])
+        test_db.commit()
+        test_db.expunge_all()
+
+        journeys = JourneyService.get_journeys_with_todos(test_db)
+
+        assert journeys[0].calculate_actual_progress() == 50.0
+
+    def test_delete_journey_cascades_without_lazy_loads(self, test_db: Session, sample_journey: Journey):
+        todo = DailyTodoService.create_todo(test_db, "여정 할일", journey_id=sample_journey.id)
+        DailyTodoService.reschedule_todo_with_reason(test_db, todo.id, date.today() + timedelta(days=1), "바쁨")
+        journey_id = sample_journey.id
+        test_db.expunge_all()
+
+        assert JourneyService.delete_journey(test_db, journey_id) is True
+        assert test_db.query(DailyTodo).count() == 0
@@ -0,0 +1,211 @@
+"""
+LLM 블로그 글 일괄 생성 서비스 테스트
+
+실제 API 대신 지연 시간과 429 응답을 흉내 내는 스텁 제공업체를 사용합니다.
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+from datetime import timedelta
+from sqlalchemy.orm import Session
+
+from app.services.blog_context_loader import BlogContextLoader
+from app.services.llm_blog_service import LLMBlogService, LLMProvider
+from app.services.llm_batch_service import LLMBatchService
+from tests.conftest import WEEK_START
+
+
+class RateLimitError(Exception):
+    """SDK의 429 오류를 흉내 낸 예외"""
+    status_code = 429
+
+    def __init__(self, retry_after: str = "0.01"):
+        super().__init__("rate limited")
+        self.response = type("Response", (), {"headers": {"retry-after": retry_after}})()
+
+
+class StubProvider:
+    """지연 시간과 429 응답을 흉내 내는 스텁 LLM 제공업체"""
+
+    def __init__(self, latency: float = 0.02, rate_limited_calls: int = 0):
+        self.latency = latency
+        self.rate_limited_calls = rate_limited_calls
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, prompt: str, api_key: str, model: str) -> dict:
+        self.calls += 1
+        if self.calls <= self.rate_limited_calls:
+            raise RateLimitError()
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        date_line = next(line for line in prompt.splitlines() if line.startswith("- 날짜:"))
+        return {"content": f"# 블로그 {date_line}", "prompt_tokens": 10, "completion_tokens": 5}
+
+
+class TestLLMBatchService:
+    """LLM 블로그 글 일괄 생성 서비스 테스트"""
+
+    async def test_generate_batch_respects_concurrency(self, test_db: Session, week_of_reflections):
+        """동시 호출 수가 max_concurrency를 넘지 않음"""
+        stub = StubProvider(latency=0.02)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new=stub):
+            results = [
+                r async for r in LLMBatchService.generate_batch(
+                    db=test_db,
+                    start_date=WEEK_START,
+                    end_date=WEEK_START + timedelta(days=6),
+                    provider=LLMProvider.OPENAI,
+                    max_concurrency=2
+                )
+            ]
+
+        assert len(results) == 7
+        assert all(r["status"] == "generated" for r in results)
+        assert stub.max_in_flight <= 2
+        assert stub.calls == 7
+
+        for reflection in week_of_reflections:
+            test_db.refresh(reflection)
+            assert reflection.generated_blog_content.startswith("# 블로그")
+
+    async def test_generate_batch_retries_after_rate_limit(self, test_db: Session, week_of_reflections):
+        """429 응답 후 재시도하여 모두 생성"""
+        stub = StubProvider(latency=0.01, rate_limited_calls=2)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new=stub):
+            results = [
+                r async for r in LLMBatchService.generate_batch(
+                    db=test_db,
+                    start_date=WEEK_START,
+                    end_date=WEEK_START + timedelta(days=2),
+                    provider=LLMProvider.OPENAI,
+                    max_concurrency=3,
+                    base_retry_delay=0.01
+                )
+            ]
+
+        assert len(results) == 3
+        assert all(r["status"] == "generated" for r in results)
+        assert sum(r["retries"] for r in results) == 2
+
+    async def test_generate_batch_gives_up_after_max_retries(self, test_db: Session, week_of_reflections):
+        """재시도 횟수를 넘기면 실패로 보고"""
+        stub = StubProvider(latency=0.01, rate_limited_calls=100)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new=stub):
+            results = [
+                r async for r in LLMBatchService.generate_batch(
+                    db=test_db,
+                    start_date=WEEK_START,
+                    end_date=WEEK_START,
+                    provider=LLMProvider.OPENAI,
+                    max_retries=2,
+                    base_retry_delay=0.01
+                )
+            ]
+
+        assert results[0]["status"] == "failed"
+        assert results[0]["retries"] == 2
+        assert stub.calls == 3
+
+    async def test_generate_batch_skips_existing_content(self, test_db: Session, week_of_reflections):
+        """이미 생성된 글은 다시 생성하지 않음"""
+        week_of_reflections[0].generated_blog_content = "기존 글"
+        test_db.commit()
+        stub = StubProvider(latency=0.01)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new=stub):
+            results = [
+                r async for r in LLMBatchService.generate_batch(
+                    db=test_db,
+                    start_date=WEEK_START,
+                    end_date=WEEK_START + timedelta(days=1),
+                    provider=LLMProvider.OPENAI
+                )
+            ]
+
+        statuses = {r["reflection_date"]: r["status"] for r in results}
+        assert statuses == {"2025-10-06": "cached", "2025-10-07": "generated"}
+        assert stub.calls == 1
+
+    async def test_generate_batch_reports_save_failure(self, test_db: Session, week_of_reflections):
+        """한 회고의 저장이 실패해도 나머지는 생성되고 실패 결과로 보고"""
+        stub = StubProvider(latency=0.01)
+        save_blog_content = BlogContextLoader.save_blog_content
+
+        def failing_save(db, reflection, content, prompt, prompt_metadata):
+            if reflection.reflection_date == WEEK_START:
+                raise RuntimeError("저장 실패")
+            return save_blog_content(db, reflection, content, prompt, prompt_metadata)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new=stub), \
+                patch.object(BlogContextLoader, "save_blog_content", new=failing_save):
+            results = [
+                r async for r in LLMBatchService.generate_batch(
+                    db=test_db,
+                    start_date=WEEK_START,
+                    end_date=WEEK_START + timedelta(days=2),
+                    provider=LLMProvider.OPENAI
+                )
+            ]
+
+        statuses = {r["reflection_date"]: r["status"] for r in results}
+        assert statuses == {"2025-10-06": "failed", "2025-10-07": "generated", "2025-10-08": "generated"}
+        failed = next(r for r in results if r["status"] == "failed")
+        assert failed["error"] == "저장 실패"
+
+        test_db.refresh(week_of_reflections[0])
+        assert week_of_reflections[0].generated_blog_content is None
+
+    def test_validate_date_range(self):
+        """잘못된 기간 검증"""
+        with pytest.raises(ValueError):
+            LLMBatchService.validate_date_range(WEEK_START, WEEK_START - timedelta(days=1))
+        with pytest.raises(ValueError):
+            LLMBatchService.validate_date_range(WEEK_START, WEEK_START + timedelta(days=365))
+
+    def test_batch_endpoint_streams_results(self, client, test_db: Session, week_of_reflections):
+        """일괄 생성 API가 회고별 결과와 요약을 NDJSON으로 스트리밍"""
+        stub = StubProvider(latency=0.01)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new=stub):
+            response = client.post(
+                "/api/reflections/generate-blog/batch",
+                json={"start_date": "2025-10-06", "end_date": "2025-10-08", "provider": "openai"}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.strip().splitlines()]
+        assert len(lines) == 4
+        assert lines[-1] == {"done": True, "total": 3, "generated": 3, "cached": 0, "failed": 0}
+
+    def test_batch_endpoint_validation(self, client):
+        """잘못된 제공업체와 기간"""
+        response = client.post(
+            "/api/reflections/generate-blog/batch",
+            json={"start_date": "2025-10-06", "end_date": "2025-10-08", "provider": "unknown"}
+        )
+        assert response.status_code == 422
+
+        response = client.post(
+            "/api/reflections/generate-blog/batch",
+            json={"start_date": "2025-10-08", "end_date": "2025-10-06", "provider": "openai"}
+        )
+        assert response.status_code == 400
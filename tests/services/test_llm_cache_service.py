@@ -0,0 +1,215 @@
+"""
+LLM 응답 캐시 서비스 테스트
+"""
+import pytest
+from unittest.mock import patch, AsyncMock
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.daily_reflection import DailyReflection
+from app.models.llm_response_cache import LLMResponseCache
+from app.services.llm_blog_service import LLMBlogService, LLMProvider
+from app.services.llm_cache_service import LLMCacheService
+from app.services.llm_provider_policy import ProviderCallPolicy
+
+
+class TestLLMCacheService:
+    """LLM 응답 캐시 서비스 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        """테스트마다 메트릭 초기화"""
+        LLMCacheService.reset_stats()
+        yield
+        LLMCacheService.reset_stats()
+
+    @pytest.fixture
+    def reflection(self, test_db: Session) -> DailyReflection:
+        """블로그 생성용 회고"""
+        reflection = DailyReflection(
+            reflection_date=date.today(),
+            reflection_text="캐시 테스트 회고",
+            total_todos=0,
+            completed_todos=0,
+            completion_rate=0.0,
+            satisfaction_score=4,
+            energy_level=3,
+            created_at=datetime.now()
+        )
+        test_db.add(reflection)
+        test_db.commit()
+        test_db.refresh(reflection)
+        return reflection
+
+    def test_prompt_hash_depends_on_all_inputs(self):
+        """프롬프트, 모델, 파라미터가 다르면 다른 키 생성"""
+        base = LLMCacheService.make_prompt_hash("openai", "gpt-4o", "프롬프트", {"temperature": 0.7})
+
+        assert base == LLMCacheService.make_prompt_hash("openai", "gpt-4o", "프롬프트", {"temperature": 0.7})
+        assert base != LLMCacheService.make_prompt_hash("claude", "gpt-4o", "프롬프트", {"temperature": 0.7})
+        assert base != LLMCacheService.make_prompt_hash("openai", "gpt-4o", "다른 프롬프트", {"temperature": 0.7})
+        assert base != LLMCacheService.make_prompt_hash("openai", "gpt-4o", "프롬프트", {"temperature": 0.2})
+
+    def test_put_and_get(self, test_db: Session):
+        """저장한 응답을 조회하면 적중 메트릭이 증가"""
+        LLMCacheService.put(
+            test_db, "hash-1", "openai", "gpt-4o", "캐시된 응답",
+            prompt_tokens=100, completion_tokens=50
+        )
+
+        entry = LLMCacheService.get(test_db, "hash-1")
+        assert entry is not None
+        assert entry.response == "캐시된 응답"
+        assert entry.hit_count == 1
+
+        assert LLMCacheService.get(test_db, "missing") is None
+
+        stats = LLMCacheService.get_stats(test_db)
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 50.0
+        assert stats["saved_tokens"] == 150
+
+    def test_expired_entry_is_not_served(self, test_db: Session):
+        """TTL이 지난 항목은 조회되지 않음"""
+        entry = LLMCacheService.put(test_db, "hash-expired", "openai", "gpt-4o", "오래된 응답")
+        entry.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        test_db.commit()
+
+        assert LLMCacheService.get(test_db, "hash-expired") is None
+
+    def test_lru_eviction(self, test_db: Session):
+        """최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거"""
+        with patch.object(settings, "llm_cache_max_entries", 2):
+            LLMCacheService.put(test_db, "hash-a", "openai", "gpt-4o", "A")
+            LLMCacheService.put(test_db, "hash-b", "openai", "gpt-4o", "B")
+
+            # A를 최근에 사용한 것으로 만들고 B를 오래된 것으로 설정
+            test_db.query(LLMResponseCache).filter(
+                LLMResponseCache.prompt_hash == "hash-b"
+            ).update({"last_accessed_at": datetime.utcnow() - timedelta(hours=1)})
+            test_db.commit()
+
+            LLMCacheService.put(test_db, "hash-c", "openai", "gpt-4o", "C")
+
+        hashes = {e.prompt_hash for e in test_db.query(LLMResponseCache).all()}
+        assert hashes == {"hash-a", "hash-c"}
+
+    async def test_identical_prompt_served_locally(self, test_db: Session, reflection: DailyReflection):
+        """같은 프롬프트로 다시 생성하면 API 대신 캐시에서 응답"""
+        api_result = {"content": "# 생성된 글", "prompt_tokens": 300, "completion_tokens": 200}
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new_callable=AsyncMock) as mock_api:
+            mock_api.return_value = api_result
+
+            first = await LLMBlogService.generate_blog_content(
+                reflection_id=reflection.id,
+                db=test_db,
+                provider=LLMProvider.OPENAI
+            )
+            # 저장된 글이 있으면 바로 반환하므로 지운 뒤 같은 프롬프트로 다시 생성
+            reflection.generated_blog_content = None
+            test_db.commit()
+            second = await LLMBlogService.generate_blog_content(
+                reflection_id=reflection.id,
+                db=test_db,
+                provider=LLMProvider.OPENAI
+            )
+
+        assert first["content"] == second["content"] == "# 생성된 글"
+        assert mock_api.await_count == 1
+
+        stats = LLMCacheService.get_stats(test_db)
+        assert stats["hits"] == 1
+        assert stats["saved_tokens"] == 500
+
+    async def test_force_regenerate_bypasses_cache(self, test_db: Session, reflection: DailyReflection):
+        """강제 재생성은 캐시를 확인하지 않고 새 응답으로 캐시를 갱신"""
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new_callable=AsyncMock) as mock_api:
+            mock_api.side_effect = [
+                {"content": "첫 번째 글", "prompt_tokens": 10, "completion_tokens": 5},
+                {"content": "다시 쓴 글", "prompt_tokens": 10, "completion_tokens": 5},
+            ]
+
+            first = await LLMBlogService.generate_blog_content(
+                reflection_id=reflection.id,
+                db=test_db,
+                provider=LLMProvider.OPENAI,
+                force_regenerate=True
+            )
+            second = await LLMBlogService.generate_blog_content(
+                reflection_id=reflection.id,
+                db=test_db,
+                provider=LLMProvider.OPENAI,
+                force_regenerate=True
+            )
+
+        assert first["content"] == "첫 번째 글"
+        assert second["content"] == "다시 쓴 글"
+        assert mock_api.await_count == 2
+
+        stats = LLMCacheService.get_stats(test_db)
+        assert stats["hits"] == 0
+        assert stats["entries"] == 1
+        assert test_db.query(LLMResponseCache).one().response == "다시 쓴 글"
+
+    async def test_fallback_response_served_from_cache(self, test_db: Session):
+        """대체 제공업체의 응답도 주 제공업체 기준으로 저장되어 다음 호출에서 적중"""
+        policy = ProviderCallPolicy(deadline_seconds=1)
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new_callable=AsyncMock) as openai_api, \
+                patch.object(LLMBlogService, "_call_claude_api", new_callable=AsyncMock) as claude_api:
+            openai_api.side_effect = RuntimeError("OpenAI 장애")
+            claude_api.return_value = {"content": "Claude 응답", "prompt_tokens": 10, "completion_tokens": 5}
+
+            first = await LLMBlogService.call_llm_api(LLMProvider.OPENAI, "프롬프트", db=test_db, policy=policy)
+            second = await LLMBlogService.call_llm_api(LLMProvider.OPENAI, "프롬프트", db=test_db, policy=policy)
+
+        assert first == second == "Claude 응답"
+        assert openai_api.await_count == 1
+        assert claude_api.await_count == 1
+
+        entry = test_db.query(LLMResponseCache).one()
+        assert entry.prompt_hash == LLMBlogService._make_prompt_hash(LLMProvider.OPENAI, "프롬프트")
+        assert entry.provider == LLMProvider.CLAUDE.value
+
+    async def test_refinement_prompt_cached(self, test_db: Session, reflection: DailyReflection):
+        """같은 개선 요청도 캐시에서 응답"""
+        reflection.generated_blog_content = "기존 글"
+        test_db.commit()
+
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_claude_api", new_callable=AsyncMock) as mock_api:
+            mock_api.return_value = {"content": "개선된 글", "prompt_tokens": 10, "completion_tokens": 5}
+
+            await LLMBlogService.refine_blog_content(
+                reflection_id=reflection.id,
+                db=test_db,
+                refinement_request="더 짧게",
+                provider=LLMProvider.CLAUDE
+            )
+            # 저장된 글이 바뀌었으므로 원래 글로 되돌린 뒤 같은 요청 반복
+            reflection.generated_blog_content = "기존 글"
+            test_db.commit()
+            result = await LLMBlogService.refine_blog_content(
+                reflection_id=reflection.id,
+                db=test_db,
+                refinement_request="더 짧게",
+                provider=LLMProvider.CLAUDE
+            )
+
+        assert result["content"] == "개선된 글"
+        assert mock_api.await_count == 1
+
+    def test_cache_stats_endpoint(self, client, test_db: Session):
+        """캐시 메트릭 API"""
+        response = client.get("/api/reflections/llm-cache/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {"entries", "hits", "misses", "hit_rate", "saved_tokens"} <= set(data.keys())
@@ -0,0 +1,238 @@
+"""
+LLM 제공업체 호출 정책 테스트 (마감 시간, 페일오버, 헤징)
+
+스텁 제공업체 함수와 로컬 스텁 HTTP 서버(OPENAI_BASE_URL/CLAUDE_BASE_URL)를 사용합니다.
+"""
+import asyncio
+import json
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from app.core.config import settings
+from app.services.llm_blog_service import LLMBlogService, LLMProvider
+from app.services.llm_provider_policy import (
+    LatencyHistogram,
+    LLMProviderPolicy,
+    ProviderCallPolicy,
+)
+
+
+def make_stub(latencies: dict, failures: tuple = ()):
+    """제공업체별 지연 시간/실패를 흉내 내는 호출 함수"""
+    calls = []
+    cancelled = []
+
+    async def call(provider):
+        calls.append(provider)
+        try:
+            await asyncio.sleep(latencies[provider])
+        except asyncio.CancelledError:
+            cancelled.append(provider)
+            raise
+        if provider in failures:
+            raise RuntimeError(f"{provider} 장애")
+        return {"content": f"{provider} 응답", "prompt_tokens": 1, "completion_tokens": 1}
+
+    return call, calls, cancelled
+
+
+class TestLatencyHistogram:
+    """지연 시간 히스토그램 테스트"""
+
+    def test_percentile(self):
+        histogram = LatencyHistogram(buckets=(0.1, 0.5, 1.0))
+        for seconds in (0.05, 0.05, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.8):
+            histogram.observe(seconds)
+
+        assert histogram.count == 10
+        assert histogram.percentile(0.2) == 0.1
+        assert histogram.percentile(0.5) == 0.5
+        assert histogram.percentile(1.0) == 1.0
+        assert LatencyHistogram().percentile(0.5) is None
+
+
+class TestLLMProviderPolicy:
+    """제공업체 호출 정책 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        LLMProviderPolicy.reset_stats()
+        yield
+        LLMProviderPolicy.reset_stats()
+
+    async def test_primary_success(self):
+        call, calls, _ = make_stub({"openai": 0.01, "claude": 0.01})
+
+        provider, result = await LLMProviderPolicy.execute(
+            ["openai", "claude"], call, ProviderCallPolicy(deadline_seconds=1)
+        )
+
+        assert provider == "openai"
+        assert calls == ["openai"]
+        assert LLMProviderPolicy.get_stats()["openai"]["latency"]["count"] == 1
+
+    async def test_fallback_on_failure(self):
+        call, calls, _ = make_stub({"openai": 0.01, "claude": 0.01}, failures=("openai",))
+
+        provider, result = await LLMProviderPolicy.execute(
+            ["openai", "claude"], call, ProviderCallPolicy(deadline_seconds=1)
+        )
+
+        assert provider == "claude"
+        assert result["content"] == "claude 응답"
+        stats = LLMProviderPolicy.get_stats()
+        assert stats["openai"]["failure"] == 1
+        assert stats["claude"]["fallback"] == 1
+
+    async def test_fallback_on_deadline(self):
+        call, calls, _ = make_stub({"openai": 1.0, "claude": 0.01})
+
+        provider, _ = await LLMProviderPolicy.execute(
+            ["openai", "claude"], call, ProviderCallPolicy(deadline_seconds=0.05)
+        )
+
+        assert provider == "claude"
+        assert LLMProviderPolicy.get_stats()["openai"]["timeout"] == 1
+
+    async def test_all_providers_fail(self):
+        call, _, _ = make_stub({"openai": 0.01, "claude": 0.01}, failures=("openai", "claude"))
+
+        with pytest.raises(RuntimeError, match="claude 장애"):
+            await LLMProviderPolicy.execute(
+                ["openai", "claude"], call, ProviderCallPolicy(deadline_seconds=1)
+            )
+
+    async def test_fallback_disabled(self):
+        call, calls, _ = make_stub({"openai": 0.01, "claude": 0.01}, failures=("openai",))
+
+        with pytest.raises(RuntimeError):
+            await LLMProviderPolicy.execute(
+                ["openai", "claude"], call,
+                ProviderCallPolicy(deadline_seconds=1, fallback_enabled=False)
+            )
+        assert calls == ["openai"]
+
+    async def test_hedge_after_percentile_and_cancel_loser(self):
+        """주 제공업체가 평소 지연 백분위수보다 늦으면 헤징하고 진 쪽은 취소"""
+        # 평소 openai 지연 시간은 0.25초 버킷 이하
+        for _ in range(5):
+            LLMProviderPolicy.get_histogram("openai").observe(0.01)
+
+        call, calls, cancelled = make_stub({"openai": 2.0, "claude": 0.01})
+        policy = ProviderCallPolicy(deadline_seconds=5, hedge_enabled=True, hedge_min_samples=5)
+
+        started = time.monotonic()
+        provider, _ = await LLMProviderPolicy.execute(["openai", "claude"], call, policy)
+        elapsed = time.monotonic() - started
+
+        assert provider == "claude"
+        assert calls == ["openai", "claude"]
+        assert cancelled == ["openai"]
+        assert elapsed < 1.0
+        assert LLMProviderPolicy.get_stats()["claude"]["hedged"] == 1
+
+    async def test_no_hedge_without_samples(self):
+        """지연 표본이 부족하면 헤징하지 않음"""
+        call, calls, _ = make_stub({"openai": 0.05, "claude": 0.01})
+        policy = ProviderCallPolicy(deadline_seconds=5, hedge_enabled=True, hedge_min_samples=5)
+
+        provider, _ = await LLMProviderPolicy.execute(["openai", "claude"], call, policy)
+
+        assert provider == "openai"
+        assert calls == ["openai"]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """OpenAI/Claude API 응답을 흉내 내는 로컬 스텁 서버 핸들러"""
+
+    delay = 0.0
+    payload: dict = {}
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay)
+        body = json.dumps(self.payload).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """지연 시간과 응답을 지정한 로컬 스텁 서버 실행"""
+    servers = []
+
+    def start(delay: float, payload: dict) -> str:
+        handler = type("Handler", (_StubHandler,), {"delay": delay, "payload": payload})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+OPENAI_PAYLOAD = {
+    "id": "chatcmpl-stub", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+    "choices": [{"index": 0, "finish_reason": "stop",
+                 "message": {"role": "assistant", "content": "OpenAI 스텁 글"}}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 4, "total_tokens": 7},
+}
+
+
+class TestLLMBlogServiceFailover:
+    """로컬 스텁 서버를 사용한 블로그 생성 페일오버 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        LLMProviderPolicy.reset_stats()
+        yield
+        LLMProviderPolicy.reset_stats()
+
+    async def test_slow_openai_falls_back_to_claude(self, stub_server):
+        openai_url = stub_server(delay=2.0, payload=OPENAI_PAYLOAD)
+
+        async def claude_stub(prompt, api_key, model):
+            return {"content": "Claude 스텁 글", "prompt_tokens": 3, "completion_tokens": 4}
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test", "CLAUDE_API_KEY": "sk-ant-test"}), \
+                patch.object(settings, "openai_base_url", f"{openai_url}/v1"), \
+                patch.object(settings, "llm_call_deadline_seconds", 0.5), \
+                patch.object(settings, "llm_hedge_enabled", False), \
+                patch.object(LLMBlogService, "_call_claude_api", new=claude_stub):
+            content = await LLMBlogService.call_llm_api(LLMProvider.OPENAI, "프롬프트")
+
+        assert content == "Claude 스텁 글"
+        stats = LLMProviderPolicy.get_stats()
+        assert stats["openai"]["timeout"] == 1
+        assert stats["claude"]["success"] == 1
+
+    async def test_no_fallback_without_second_key(self, stub_server):
+        openai_url = stub_server(delay=0.0, payload=OPENAI_PAYLOAD)
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test", "CLAUDE_API_KEY": ""}), \
+                patch.object(settings, "openai_base_url", f"{openai_url}/v1"):
+            content = await LLMBlogService.call_llm_api(LLMProvider.OPENAI, "프롬프트")
+
+        assert content == "OpenAI 스텁 글"
+
+    def test_provider_stats_endpoint(self, client):
+        response = client.get("/api/reflections/llm-providers/stats")
+
+        assert response.status_code == 200
+        assert isinstance(response.json(), dict)
@@ -0,0 +1,56 @@
+"""
+미루기 통계 서비스 테스트
+"""
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.daily_todo_service import DailyTodoService
+from app.services.postpone_analytics_service import PostponeAnalyticsService
+
+START = date(2026, 10, 1)
+
+
+def postpone(db: Session, todo, days: int, reason: str):
+    current = todo.scheduled_date or todo.created_date
+    return DailyTodoService.reschedule_todo_with_reason(db, todo.id, current + timedelta(days=days), reason)
+
+
+class TestPostponeAnalyticsService:
+    """미루기 통계 서비스 테스트"""
+
+    def test_aggregates_reasons_and_todos(self, test_db: Session):
+        often = DailyTodoService.create_todo(test_db, "자주 미룸", scheduled_date=START)
+        once = DailyTodoService.create_todo(test_db, "한 번 미룸", scheduled_date=START)
+        postpone(test_db, often, 1, "피곤함")
+        postpone(test_db, often, 3, "피곤함")
+        postpone(test_db, often, 2, "회의")
+        postpone(test_db, once, 4, "회의")
+
+        result = PostponeAnalyticsService.get_analytics(test_db, START, START + timedelta(days=30))
+
+        assert result["summary"] == {
+            "total_postpones": 4, "todo_count": 2, "total_days": 10, "avg_days": 2.5, "max_days": 4,
+        }
+        assert result["reasons"] == [
+            {"reason": "피곤함", "count": 2, "avg_days": 2.0},
+            {"reason": "회의", "count": 2, "avg_days": 3.0},
+        ]
+        assert [(t["title"], t["count"], t["total_days"]) for t in result["todos"]] == [
+            ("자주 미룸", 3, 6), ("한 번 미룸", 1, 4),
+        ]
+
+    def test_filters_by_from_date(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "기간 밖", scheduled_date=START)
+        postpone(test_db, todo, 1, "이전 달")
+
+        result = PostponeAnalyticsService.get_analytics(test_db, START + timedelta(days=1), START + timedelta(days=30))
+
+        assert result["summary"]["total_postpones"] == 0
+        assert result["reasons"] == []
+        assert result["todos"] == []
+
+    def test_invalid_range(self, test_db: Session):
+        with pytest.raises(ValueError):
+            PostponeAnalyticsService.get_analytics(test_db, START, START - timedelta(days=1))
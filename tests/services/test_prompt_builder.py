@@ -0,0 +1,154 @@
+"""
+토큰 예산 기반 프롬프트 빌더 테스트
+"""
+import pytest
+from unittest.mock import patch, AsyncMock
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+
+from app.models.daily_memo import DailyMemo
+from app.models.daily_reflection import DailyReflection
+from app.models.todo import DailyTodo, TodoCategory
+from app.services.llm_blog_service import LLMBlogService, LLMProvider
+from app.services.prompt_builder import (
+    PromptBuilder,
+    PromptSection,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+
+
+class TestPromptBuilder:
+    """프롬프트 빌더 테스트"""
+
+    def test_estimate_tokens(self):
+        """한글은 글자당 1토큰, 영문은 약 4글자당 1토큰으로 추정"""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("회고") == 2
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("회고 abcd") == 4
+
+    def test_truncate_to_tokens(self):
+        """잘린 텍스트는 지정한 토큰 수를 넘지 않음"""
+        text = "가" * 100
+        truncated = truncate_to_tokens(text, 10)
+
+        assert truncated.endswith("…")
+        assert estimate_tokens(truncated) <= 10
+        assert truncate_to_tokens("짧은 글", 10) == "짧은 글"
+
+    def test_low_priority_sections_dropped_first(self):
+        """예산을 넘으면 우선순위가 낮은 섹션부터 생략"""
+        builder = PromptBuilder(token_budget=60)
+        builder.add_text("header", "머리말\n")
+        builder.add_section(PromptSection(
+            "important", heading="## 중요\n", items=[f"- 중요 항목 {i}\n" for i in range(3)], priority=10
+        ))
+        builder.add_section(PromptSection(
+            "minor", heading="## 부가\n", items=[f"- 부가 항목 {i}\n" for i in range(10)], priority=1
+        ))
+
+        prompt, metadata = builder.build()
+
+        assert "중요 항목 2" in prompt
+        assert metadata["sections"]["important"]["kept"] == 3
+        assert metadata["sections"]["minor"]["kept"] < 10
+        assert metadata["truncated"] is True
+        assert metadata["estimated_tokens"] == estimate_tokens(prompt)
+        assert metadata["estimated_tokens"] <= 60
+
+    def test_duplicates_removed_across_sections(self):
+        """같은 내용은 우선순위가 높은 섹션에만 남김"""
+        builder = PromptBuilder(token_budget=1000)
+        builder.add_section(PromptSection("a", items=["- 같은 메모\n", "- 같은  메모\n"], priority=2))
+        builder.add_section(PromptSection("b", items=["- 같은 메모\n", "- 다른 메모\n"], priority=1))
+
+        prompt, metadata = builder.build()
+
+        assert prompt.count("같은") == 1
+        assert "다른 메모" in prompt
+        assert metadata["deduplicated"] == 2
+
+
+class TestBlogPromptBudget:
+    """블로그 프롬프트 토큰 예산 테스트"""
+
+    @pytest.fixture
+    def busy_day(self, test_db: Session) -> DailyReflection:
+        """할일과 메모가 많은 하루"""
+        today = date.today()
+        reflection = DailyReflection(
+            reflection_date=today,
+            reflection_text="바쁜 하루였다.",
+            total_todos=40,
+            completed_todos=20,
+            completion_rate=50.0,
+            satisfaction_score=4,
+            energy_level=3,
+            created_at=datetime.now()
+        )
+        test_db.add(reflection)
+        for i in range(20):
+            test_db.add(DailyTodo(
+                title=f"완료한 일 {i}",
+                description="설명 " * 30,
+                category=TodoCategory.WORK,
+                is_completed=True,
+                completed_at=datetime.now(),
+                created_date=today,
+                scheduled_date=today
+            ))
+            test_db.add(DailyTodo(
+                title=f"남은 일 {i}",
+                category=TodoCategory.PERSONAL,
+                is_completed=False,
+                created_date=today,
+                scheduled_date=today
+            ))
+            # 같은 내용의 메모가 반복 작성된 경우
+            test_db.add(DailyMemo(content="물 마시기", memo_date=today))
+        test_db.commit()
+        test_db.refresh(reflection)
+        return reflection
+
+    def test_blog_prompt_fits_budget(self, test_db: Session, busy_day: DailyReflection):
+        """할일이 많아도 프롬프트가 예산 안에 들어옴"""
+        completed = test_db.query(DailyTodo).filter(DailyTodo.is_completed == True).all()
+        pending = test_db.query(DailyTodo).filter(DailyTodo.is_completed == False).all()
+        memos = test_db.query(DailyMemo).all()
+
+        prompt, metadata = LLMBlogService.build_blog_prompt(
+            reflection=busy_day,
+            completed_todos=completed,
+            pending_todos=pending,
+            daily_memos=memos,
+            token_budget=800
+        )
+
+        assert metadata["estimated_tokens"] <= 800
+        assert metadata["truncated"] is True
+        assert metadata["deduplicated"] == 19
+        assert "바쁜 하루였다." in prompt
+        assert "## 작성 지침" in prompt
+        assert prompt.endswith("블로그 글을 작성해주세요:")
+
+    async def test_prompt_metadata_saved(self, test_db: Session, busy_day: DailyReflection):
+        """생성 시 토큰 추정 메타데이터가 회고에 함께 저장됨"""
+        with patch.object(LLMBlogService, "get_api_key", return_value="sk-test"), \
+                patch.object(LLMBlogService, "_call_openai_api", new_callable=AsyncMock) as mock_api:
+            mock_api.return_value = {"content": "# 글", "prompt_tokens": 10, "completion_tokens": 5}
+
+            await LLMBlogService.generate_blog_content(
+                reflection_id=busy_day.id,
+                db=test_db,
+                provider=LLMProvider.OPENAI
+            )
+
+        test_db.refresh(busy_day)
+        metadata = busy_day.blog_prompt_metadata
+        assert metadata is not None
+        assert metadata["estimated_tokens"] <= metadata["token_budget"]
+        assert "completed_todos" in metadata["sections"]
+
+        cached = LLMBlogService.get_cached_blog_content(busy_day.id, test_db)
+        assert cached["prompt_metadata"] == metadata
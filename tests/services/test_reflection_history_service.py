@@ -0,0 +1,111 @@
+"""
+회고 히스토리 조회 서비스 테스트
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.daily_reflection import DailyReflection
+from app.models.todo import DailyTodo, TodoCategory
+from app.services.reflection_history_service import ReflectionHistoryService
+
+
+class TestReflectionHistoryService:
+    """회고 히스토리 조회 서비스 테스트"""
+
+    MONDAY = date(2025, 10, 6)
+    TODAY = date(2025, 10, 20)  # 조회 주 이후 (오늘 요약 분기 제외)
+
+    @pytest.fixture
+    def week_data(self, test_db: Session) -> None:
+        """월요일은 회고 있음, 화~일은 할일만 있음"""
+        test_db.add(DailyReflection(
+            reflection_date=self.MONDAY,
+            reflection_text="월요일 회고",
+            total_todos=2,
+            completed_todos=1,
+            completion_rate=50.0,
+            satisfaction_score=4,
+            energy_level=3,
+            created_at=datetime(2025, 10, 6, 22, 0)
+        ))
+        for i in range(7):
+            day = self.MONDAY + timedelta(days=i)
+            test_db.add(DailyTodo(
+                title=f"{i + 1}일차 완료", category=TodoCategory.WORK, created_date=day,
+                is_completed=True, completed_at=datetime.combine(day, datetime.min.time())
+            ))
+            test_db.add(DailyTodo(
+                title=f"{i + 1}일차 미완료", category=TodoCategory.WORK, created_date=day,
+                is_completed=False
+            ))
+        # 회고 작성 이후에 완료한 월요일 할일 (소급 완료)
+        test_db.add(DailyTodo(
+            title="소급 완료", category=TodoCategory.WORK, created_date=self.MONDAY,
+            is_completed=True, completed_at=datetime(2025, 10, 8, 9, 0)
+        ))
+        test_db.commit()
+
+    @pytest.fixture
+    def select_statements(self, test_db: Session):
+        """실행된 SELECT 문 기록"""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        engine = test_db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        yield statements
+        event.remove(engine, "before_cursor_execute", record)
+
+    def test_week_aggregates(self, test_db: Session, week_data):
+        """회고가 있는 날은 회고 시점 값, 없는 날은 할일 집계 사용"""
+        result = ReflectionHistoryService.get_week_aggregates(test_db, self.MONDAY, self.TODAY)
+        stats = result["weekly_stats"]
+
+        assert len(stats) == 7
+        assert stats[0]["has_reflection"] is True
+        assert (stats[0]["completed_todos"], stats[0]["total_todos"]) == (1, 2)
+        assert stats[0]["satisfaction_score"] == 4
+        assert stats[1]["has_reflection"] is False
+        assert (stats[1]["completed_todos"], stats[1]["total_todos"]) == (1, 2)
+        assert stats[1]["completion_rate"] == 50.0
+        assert result["week_averages"]["avg_satisfaction"] == 4
+        assert result["week_averages"]["reflection_count"] == 1
+
+    def test_week_aggregates_do_not_load_todo_rows(self, test_db: Session, week_data, select_statements):
+        """집계는 날짜 수와 무관하게 두 번의 쿼리로 처리"""
+        ReflectionHistoryService.get_week_aggregates(test_db, self.MONDAY, self.TODAY)
+
+        assert len(select_statements) == 2
+        assert any("count(" in statement.lower() for statement in select_statements)
+
+    def test_week_aggregates_without_data(self, test_db: Session):
+        result = ReflectionHistoryService.get_week_aggregates(test_db, self.MONDAY, self.TODAY)
+
+        assert all(day["total_todos"] == 0 for day in result["weekly_stats"])
+        assert result["week_averages"]["avg_energy"] == 0
+
+    def test_day_details_for_week(self, test_db: Session, week_data, select_statements):
+        """7일 상세를 두 번의 쿼리로 조회"""
+        details = ReflectionHistoryService.get_day_details(
+            test_db, self.MONDAY, self.MONDAY + timedelta(days=6)
+        )
+
+        assert len(select_statements) == 2
+        assert list(details) == [(self.MONDAY + timedelta(days=i)).isoformat() for i in range(7)]
+        tuesday = details["2025-10-07"]
+        assert tuesday["has_reflection"] is False
+        assert [t["title"] for t in tuesday["todos"]["completed_on_time"]] == ["2일차 완료"]
+        assert [t["title"] for t in tuesday["todos"]["pending"]] == ["2일차 미완료"]
+
+    def test_day_details_split_retroactive_completion(self, test_db: Session, week_data):
+        """회고 이후 완료한 할일은 소급 완료로 구분"""
+        monday = ReflectionHistoryService.get_day_details(test_db, self.MONDAY, self.MONDAY)["2025-10-06"]
+
+        assert monday["reflection"]["reflection_text"] == "월요일 회고"
+        assert [t["title"] for t in monday["todos"]["completed_on_time"]] == ["1일차 완료"]
+        assert [t["title"] for t in monday["todos"]["retroactively_completed"]] == ["소급 완료"]
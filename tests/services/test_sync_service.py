@@ -0,0 +1,83 @@
+"""
+증분 동기화 서비스 테스트
+"""
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.core.timezone import get_current_date
+from app.models.journey import Journey, JourneyStatus
+from app.services.daily_memo_service import DailyMemoService
+from app.services.daily_todo_service import DailyTodoService
+from app.services.journey_service import JourneyService
+from app.services.sync_service import SyncService
+
+
+class TestSyncService:
+    """증분 동기화 서비스 테스트"""
+
+    def test_row_version_increases_on_every_change(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "버전 할일")
+        created_version = todo.row_version
+        memo = DailyMemoService.create_memo(test_db, get_current_date(), "버전 메모")
+        DailyTodoService.update_todo(test_db, todo.id, title="수정")
+
+        assert created_version < memo.row_version < todo.row_version
+        assert SyncService.get_current_version(test_db) == todo.row_version
+
+    def test_unchanged_row_keeps_version(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "그대로")
+        version = todo.row_version
+
+        DailyTodoService.update_todo(test_db, todo.id, title="그대로")
+
+        assert todo.row_version == version
+
+    def test_changes_since_returns_only_newer_rows(self, test_db: Session):
+        old = DailyTodoService.create_todo(test_db, "이전 할일")
+        since = SyncService.get_current_version(test_db)
+        new = DailyTodoService.create_todo(test_db, "새 할일")
+        DailyMemoService.create_memo(test_db, get_current_date(), "새 메모")
+
+        changes = SyncService.get_changes_since(test_db, since)
+
+        assert [todo["id"] for todo in changes["todos"]] == [new.id]
+        assert changes["todos"][0]["category"] == "기타"
+        assert [memo["content"] for memo in changes["memos"]] == ["새 메모"]
+        assert changes["version"] == SyncService.get_current_version(test_db)
+        assert old.id not in [todo["id"] for todo in changes["todos"]]
+
+    def test_delete_leaves_tombstone(self, test_db: Session):
+        todo = DailyTodoService.create_todo(test_db, "삭제될 할일")
+        since = SyncService.get_current_version(test_db)
+
+        DailyTodoService.delete_todo(test_db, todo.id)
+        changes = SyncService.get_changes_since(test_db, since)
+
+        assert changes["todos"] == []
+        assert changes["deleted"] == [{"entity": "todo", "id": todo.id, "row_version": since + 1}]
+
+    def test_cascade_delete_leaves_tombstones(self, test_db: Session):
+        journey = Journey(title="여정", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31), status=JourneyStatus.ACTIVE)
+        test_db.add(journey)
+        test_db.commit()
+        todo = DailyTodoService.create_todo(test_db, "여정 할일", journey_id=journey.id)
+        since = SyncService.get_current_version(test_db)
+
+        JourneyService.delete_journey(test_db, journey.id)
+        deleted = SyncService.get_changes_since(test_db, since)["deleted"]
+
+        assert sorted((d["entity"], d["id"]) for d in deleted) == [("journey", journey.id), ("todo", todo.id)]
+
+    def test_excludes_internal_reflection_columns(self, test_db: Session):
+        from app.models.daily_reflection import DailyReflection
+
+        test_db.add(DailyReflection(
+            reflection_date=date(2025, 10, 6), reflection_text="회고", blog_generation_prompt="내부 프롬프트"
+        ))
+        test_db.commit()
+
+        reflection = SyncService.get_changes_since(test_db, 0)["reflections"][0]
+
+        assert reflection["reflection_text"] == "회고"
+        assert "blog_generation_prompt" not in reflection
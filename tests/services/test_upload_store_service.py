@@ -0,0 +1,144 @@
+"""
+내용 해시 기반 업로드 저장소 테스트 (참조 수 관리, 고아 파일 정리)
+"""
+import os
+import time
+import pytest
+from datetime import date
+from pathlib import Path
+from sqlalchemy.orm import Session
+
+from app.models.todo import DailyTodo, TodoCategory
+from app.models.uploaded_file import UploadedFile
+from app.services.daily_todo_service import DailyTodoService
+from app.services.journey_service import JourneyService
+from app.services.upload_store_service import UploadStoreService
+
+PREFIX = "/static/uploads/reflections"
+
+
+class TestUploadStoreService:
+    """업로드 저장소 테스트"""
+
+    @pytest.fixture
+    def stored_image(self, test_db: Session, tmp_path: Path) -> UploadedFile:
+        """디스크에 원본과 렌디션이 있는 업로드 (참조 1)"""
+        (tmp_path / "abc.jpg").write_bytes(b"original")
+        (tmp_path / "abc_320w.webp").write_bytes(b"rendition")
+        entry = UploadStoreService.acquire(
+            test_db, "abc", f"{PREFIX}/abc.jpg", {"320": f"{PREFIX}/abc_320w.webp"}, 8
+        )
+        test_db.commit()
+        return entry
+
+    def make_todo(self, test_db: Session, image_path: str) -> DailyTodo:
+        todo = DailyTodo(
+            title="사진 할일",
+            category=TodoCategory.PERSONAL,
+            created_date=date.today(),
+            scheduled_date=date.today(),
+        )
+        test_db.add(todo)
+        test_db.commit()
+        return DailyTodoService.toggle_complete(test_db, todo.id, "회고", image_path)
+
+    def test_acquire_and_release(self, test_db: Session, stored_image: UploadedFile):
+        """같은 해시로 다시 등록하면 참조 수가 증가하고 해제하면 감소"""
+        UploadStoreService.acquire(test_db, "abc", stored_image.path, stored_image.renditions, 8)
+        assert stored_image.ref_count == 2
+
+        UploadStoreService.release(test_db, stored_image.path)
+        UploadStoreService.release(test_db, stored_image.path)
+        UploadStoreService.release(test_db, stored_image.path)
+        assert stored_image.ref_count == 0
+        assert stored_image.released_at is not None
+
+        # 등록되지 않은 경로는 무시
+        UploadStoreService.release(test_db, f"{PREFIX}/unknown.jpg")
+
+    def test_uncomplete_releases_reference(self, test_db: Session, stored_image: UploadedFile):
+        """완료 해제 시 이미지 참조 해제"""
+        todo = self.make_todo(test_db, stored_image.path)
+
+        DailyTodoService.toggle_complete(test_db, todo.id)
+
+        test_db.refresh(stored_image)
+        assert stored_image.ref_count == 0
+
+    def test_delete_todo_releases_reference(self, test_db: Session, stored_image: UploadedFile):
+        """할일 삭제 시 이미지 참조 해제"""
+        todo = self.make_todo(test_db, stored_image.path)
+
+        DailyTodoService.delete_todo(test_db, todo.id)
+
+        test_db.refresh(stored_image)
+        assert stored_image.ref_count == 0
+
+    def test_delete_journey_releases_cascaded_todo_reference(
+        self, test_db: Session, stored_image: UploadedFile, sample_journey
+    ):
+        """여정 삭제로 cascade 삭제되는 할일의 이미지 참조도 해제"""
+        journey_id = sample_journey.id
+        todo = self.make_todo(test_db, stored_image.path)
+        todo.journey_id = journey_id
+        test_db.commit()
+
+        assert JourneyService.delete_journey(test_db, journey_id)
+
+        test_db.refresh(stored_image)
+        assert stored_image.ref_count == 0
+        assert stored_image.released_at is not None
+        assert test_db.get(DailyTodo, todo.id) is None
+
+    def test_delete_journey_api_releases_cascaded_todo_reference(
+        self, client, test_db: Session, stored_image: UploadedFile, sample_journey
+    ):
+        """여정 삭제 API에서도 같은 방식으로 해제 (삭제 경로와 관계없음)"""
+        journey_id = sample_journey.id
+        todo = self.make_todo(test_db, stored_image.path)
+        todo.journey_id = journey_id
+        test_db.commit()
+
+        response = client.delete(f"/api/journeys/{journey_id}")
+
+        assert response.status_code == 204
+        test_db.refresh(stored_image)
+        assert stored_image.ref_count == 0
+
+    def test_gc_deletes_released_files(self, test_db: Session, stored_image: UploadedFile, tmp_path: Path):
+        """참조가 없는 항목의 원본과 렌디션 삭제"""
+        UploadStoreService.release(test_db, stored_image.path)
+        test_db.commit()
+
+        dry_run = UploadStoreService.collect_garbage(test_db, tmp_path, dry_run=True)
+        assert dry_run["deleted_files"] == 2
+        assert (tmp_path / "abc.jpg").exists()
+
+        stats = UploadStoreService.collect_garbage(test_db, tmp_path)
+
+        assert stats["released_entries"] == 1
+        assert stats["deleted_files"] == 2
+        assert stats["freed_bytes"] == len(b"original") + len(b"rendition")
+        assert list(tmp_path.iterdir()) == []
+        assert test_db.query(UploadedFile).count() == 0
+
+    def test_gc_keeps_referenced_files(self, test_db: Session, stored_image: UploadedFile, tmp_path: Path):
+        stats = UploadStoreService.collect_garbage(test_db, tmp_path, include_untracked=True, grace_seconds=0)
+
+        assert stats["deleted_files"] == 0
+        assert (tmp_path / "abc.jpg").exists()
+
+    def test_gc_untracked_files_respects_grace_period(self, test_db: Session, stored_image: UploadedFile, tmp_path: Path):
+        """등록되지 않은 파일은 유예 기간이 지난 경우에만 삭제"""
+        old_file = tmp_path / "legacy.jpg"
+        old_file.write_bytes(b"old")
+        old_time = time.time() - 7200
+        os.utime(old_file, (old_time, old_time))
+        (tmp_path / "uploading.jpg").write_bytes(b"new")
+
+        stats = UploadStoreService.collect_garbage(test_db, tmp_path, include_untracked=True, grace_seconds=3600)
+
+        assert stats["untracked_files"] == 1
+        assert not old_file.exists()
+        assert (tmp_path / "uploading.jpg").exists()
+        assert (tmp_path / "abc.jpg").exists()